@@ -0,0 +1,46 @@
+"""match candidate index
+
+Revision ID: 027_match_candidate_index
+Revises: 026_rls_platform_admin_bypass
+Create Date: 2026-03-09
+
+Eşleştirme aday ön filtresi (matches/prefilter.py) için destek indeksi:
+
+1. ix_customers_office_match_candidates — (office_id) partial,
+   WHERE customer_type IN ('buyer', 'renter'). İlan bazlı eşleştirme
+   ofisin sadece alıcı/kiracı müşterilerini tarar; satıcı/ev sahibi
+   satırları indekse hiç girmez.
+
+İlan tarafında (office_id, status) için mevcut
+ix_properties_office_status_listing yeterlidir.
+
+NOT: desired_districts üzerinde GIN indeksi eklenmedi. İlçe eşleşmesi
+tek başına eşik için zorunlu değildir (konum=0, diğer kriterler 100 →
+skor 70) — kayıpsız filtre GIN indeksini kullanamaz.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "027_match_candidate_index"
+down_revision: str | None = "026_rls_platform_admin_bypass"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # İlan bazlı eşleştirme: office_id + buyer/renter
+    # Kullanım: MatchingService.find_matches_for_property
+    op.create_index(
+        "ix_customers_office_match_candidates",
+        "customers",
+        ["office_id"],
+        postgresql_where=sa.text("customer_type IN ('buyer', 'renter')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_customers_office_match_candidates", table_name="customers")
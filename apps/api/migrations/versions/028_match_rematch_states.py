@@ -0,0 +1,83 @@
+"""match rematch states
+
+Revision ID: 028_match_rematch_states
+Revises: 027_match_candidate_index
+Create Date: 2026-03-09
+
+Ofis bazlı toplu eşleştirme (matches/rematch.py) durum tablosu:
+
+1. CREATE TABLE match_rematch_states — ofis başına tek satır.
+   - scoring_version: ağırlık + eşik özeti (değişirse tam yeniden hesap)
+   - watermark: son başarılı çalıştırmanın başlangıç zamanı
+2. İlan/müşteri updated_at indeksleri — incremental çalıştırmada
+   sadece watermark sonrası değişen satırlar okunur.
+
+NOT: RLS yok — tablo sadece Celery worker tarafından okunur/yazılır,
+API'ye açık değildir.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "028_match_rematch_states"
+down_revision: str | None = "027_match_candidate_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # ================================================================
+    # 1. CREATE TABLE match_rematch_states
+    # ================================================================
+    op.create_table(
+        "match_rematch_states",
+        sa.Column(
+            "office_id",
+            sa.UUID(),
+            sa.ForeignKey("offices.id", ondelete="CASCADE"),
+            nullable=False,
+            comment="Ofis (tenant) ID",
+        ),
+        sa.Column(
+            "scoring_version",
+            sa.String(64),
+            nullable=False,
+            comment="Skor ağırlıkları + eşik özeti",
+        ),
+        sa.Column(
+            "watermark",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Son başarılı çalıştırmanın başlangıç zamanı",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("office_id"),
+    )
+
+    # ================================================================
+    # 2. Watermark sorguları: office_id + updated_at
+    # ================================================================
+    op.create_index(
+        "ix_properties_office_updated",
+        "properties",
+        ["office_id", "updated_at"],
+    )
+    op.create_index(
+        "ix_customers_office_updated",
+        "customers",
+        ["office_id", "updated_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_customers_office_updated", table_name="customers")
+    op.drop_index("ix_properties_office_updated", table_name="properties")
+    op.drop_table("match_rematch_states")
@@ -0,0 +1,39 @@
+"""prediction_log_cache_hit
+
+Revision ID: 029_prediction_log_cache_hit
+Revises: 028_match_rematch_states
+Create Date: 2026-03-10
+
+Değerleme sonuç cache'i (valuations/valuation_cache.py):
+
+1. prediction_logs.cache_hit — tahmin modelden değil Redis cache'inden
+   döndüyse true. Cache hit'ler de kota/audit için loglanmaya devam eder.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "029_prediction_log_cache_hit"
+down_revision: str | None = "028_match_rematch_states"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "prediction_logs",
+        sa.Column(
+            "cache_hit",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+            comment="Sonuç değerleme cache'inden mi döndü",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("prediction_logs", "cache_hit")
@@ -0,0 +1,89 @@
+"""property search keys
+
+Revision ID: 030_property_search_keys
+Revises: 029_prediction_log_cache_hit
+Create Date: 2026-03-11
+
+Emsal arama (valuations/comparable_service.py) ve eşleştirme ön filtresi
+(matches/prefilter.py) her satırda split_part(rooms, '+', 1)::int ve
+lower(district) / lower(property_type) hesaplıyordu; bu ifadeler indeks
+kullanımını engelliyordu.
+
+1. properties.room_count — rooms'tan türetilen ana oda sayısı (STORED
+   generated). Desteklenmeyen biçimde ("stüdyo") NULL; split_part cast'i
+   gibi sorguyu hataya düşürmez.
+2. properties.district_key / property_type_key — Türkçe karakter
+   katlanmış, kırpılmış, küçük harf anahtarlar (STORED generated).
+   turkish_normalize() ile aynı sonuç; yalnızca yerleşik IMMUTABLE
+   fonksiyonlar (translate, btrim, lower).
+3. ix_properties_comparable_search — (district_key, property_type_key,
+   status, net_area, building_age). Emsal sorgusu eşitlik + net_area
+   aralığı ile index range scan yapar.
+
+NOT: STORED generated kolon eklemek tabloyu yeniden yazar (ACCESS
+EXCLUSIVE kilit). Yoğun saatlerde çalıştırılmamalıdır.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "030_property_search_keys"
+down_revision: str | None = "029_prediction_log_cache_hit"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TR_FOLD = "'İIŞĞÜÖÇışğüöç', 'iisguocisguoc'"
+_ROOMS_PATTERN = r"^[ \t\n\r\f\v]*[0-9]{1,3}[ \t\n\r\f\v]*(\+[ \t\n\r\f\v]*[0-9]+)?[ \t\n\r\f\v]*$"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "properties",
+        sa.Column(
+            "room_count",
+            sa.Integer(),
+            sa.Computed(
+                f"CASE WHEN rooms ~ '{_ROOMS_PATTERN}' "
+                "THEN substring(rooms FROM '[0-9]+')::integer END",
+                persisted=True,
+            ),
+            nullable=True,
+            comment="Ana oda sayısı (rooms'tan türetilir; desteklenmeyen biçimde NULL)",
+        ),
+    )
+    op.add_column(
+        "properties",
+        sa.Column(
+            "district_key",
+            sa.String(100),
+            sa.Computed(f"lower(translate(btrim(district), {_TR_FOLD}))", persisted=True),
+            comment="İlçe arama anahtarı (Türkçe karakter katlanmış, küçük harf)",
+        ),
+    )
+    op.add_column(
+        "properties",
+        sa.Column(
+            "property_type_key",
+            sa.String(30),
+            sa.Computed(f"lower(translate(btrim(property_type), {_TR_FOLD}))", persisted=True),
+            comment="Emlak tipi arama anahtarı (Türkçe karakter katlanmış, küçük harf)",
+        ),
+    )
+
+    # Emsal arama: ilçe + tip + durum eşitliği, net_area aralığı
+    # Kullanım: ComparableService._build_base_filters
+    op.create_index(
+        "ix_properties_comparable_search",
+        "properties",
+        ["district_key", "property_type_key", "status", "net_area", "building_age"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_properties_comparable_search", table_name="properties")
+    op.drop_column("properties", "property_type_key")
+    op.drop_column("properties", "district_key")
+    op.drop_column("properties", "room_count")
@@ -0,0 +1,203 @@
+"""valuation snapshots
+
+Revision ID: 031_valuation_snapshots
+Revises: 030_property_search_keys
+Create Date: 2026-03-12
+
+Toplu portföy değerleme (valuations/portfolio_valuation.py):
+
+1. CREATE TABLE valuation_snapshot_runs — çalıştırma başlığı.
+   - status: pending → running → completed | failed
+   - processed_count / skipped_count: ilerleme (her parça commit'inde)
+   - cursor_property_id: keyset imleci — yeniden denemede devam noktası
+2. CREATE TABLE valuation_snapshots — çalıştırma × ilan başına tahmin.
+   PK (run_id, property_id); parça başına tek toplu INSERT.
+3. RLS: tenant_isolation (API okur, Celery worker set_config ile yazar).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "031_valuation_snapshots"
+down_revision: str | None = "030_property_search_keys"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_RLS_TABLES = ("valuation_snapshot_runs", "valuation_snapshots")
+
+
+def upgrade() -> None:
+    # ================================================================
+    # 1. CREATE TABLE valuation_snapshot_runs
+    # ================================================================
+    op.create_table(
+        "valuation_snapshot_runs",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column(
+            "office_id",
+            sa.UUID(),
+            sa.ForeignKey("offices.id", ondelete="CASCADE"),
+            nullable=False,
+            comment="Bağlı ofis (tenant) ID",
+        ),
+        sa.Column(
+            "requested_by",
+            sa.UUID(),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+            comment="Çalıştırmayı başlatan kullanıcı",
+        ),
+        sa.Column(
+            "status",
+            sa.String(20),
+            server_default=sa.text("'pending'"),
+            nullable=False,
+            comment="Durum: pending, running, completed, failed",
+        ),
+        sa.Column(
+            "model_version",
+            sa.String(50),
+            nullable=True,
+            comment="Tahminde kullanılan model versiyonu",
+        ),
+        sa.Column("error", sa.Text(), nullable=True, comment="Hata mesajı (failed)"),
+        sa.Column(
+            "total_count",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+            comment="Başlangıçtaki aktif ilan sayısı",
+        ),
+        sa.Column(
+            "processed_count",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+            comment="Değerlenen ilan sayısı",
+        ),
+        sa.Column(
+            "skipped_count",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+            comment="Eksik özellik nedeniyle atlanan ilan sayısı",
+        ),
+        sa.Column(
+            "cursor_property_id",
+            sa.UUID(),
+            nullable=True,
+            comment="Son işlenen ilan ID (keyset imleci — yeniden denemede devam noktası)",
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_valuation_snapshot_runs_office_created",
+        "valuation_snapshot_runs",
+        ["office_id", "created_at"],
+    )
+
+    # ================================================================
+    # 2. CREATE TABLE valuation_snapshots
+    # ================================================================
+    op.create_table(
+        "valuation_snapshots",
+        sa.Column(
+            "run_id",
+            sa.UUID(),
+            sa.ForeignKey("valuation_snapshot_runs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "property_id",
+            sa.UUID(),
+            sa.ForeignKey("properties.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "office_id",
+            sa.UUID(),
+            sa.ForeignKey("offices.id", ondelete="CASCADE"),
+            nullable=False,
+            comment="Bağlı ofis (tenant) ID — RLS için denormalize",
+        ),
+        sa.Column(
+            "estimated_price",
+            sa.Numeric(15, 2),
+            nullable=False,
+            comment="Tahmini fiyat (TL)",
+        ),
+        sa.Column(
+            "confidence_low",
+            sa.Numeric(15, 2),
+            nullable=False,
+            comment="Güven aralığı alt sınır (TL)",
+        ),
+        sa.Column(
+            "confidence_high",
+            sa.Numeric(15, 2),
+            nullable=False,
+            comment="Güven aralığı üst sınır (TL)",
+        ),
+        sa.Column(
+            "confidence",
+            sa.Numeric(5, 4),
+            nullable=False,
+            comment="Güven skoru 0.0000 - 1.0000",
+        ),
+        sa.Column(
+            "listing_price",
+            sa.Numeric(15, 2),
+            nullable=False,
+            comment="Değerleme anındaki ilan fiyatı (karşılaştırma için)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("run_id", "property_id"),
+    )
+    # İlan geçmişi: bir ilanın çalıştırmalar arası değer değişimi
+    op.create_index(
+        "ix_valuation_snapshots_property",
+        "valuation_snapshots",
+        ["property_id"],
+    )
+
+    # ================================================================
+    # 3. RLS — tenant izolasyonu
+    # ================================================================
+    for table in _RLS_TABLES:
+        op.execute(sa.text(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY"))
+        op.execute(sa.text(f"ALTER TABLE {table} FORCE ROW LEVEL SECURITY"))
+        op.execute(sa.text(
+            f"CREATE POLICY tenant_isolation_{table} ON {table} "
+            f"USING (office_id = current_setting('app.current_office_id', true)::uuid)"
+        ))
+
+
+def downgrade() -> None:
+    for table in _RLS_TABLES:
+        op.execute(sa.text(f"DROP POLICY IF EXISTS tenant_isolation_{table} ON {table}"))
+    op.drop_index("ix_valuation_snapshots_property", table_name="valuation_snapshots")
+    op.drop_table("valuation_snapshots")
+    op.drop_index("ix_valuation_snapshot_runs_office_created", table_name="valuation_snapshot_runs")
+    op.drop_table("valuation_snapshot_runs")
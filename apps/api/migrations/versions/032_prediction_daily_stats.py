@@ -0,0 +1,102 @@
+"""prediction daily stats
+
+Revision ID: 032_prediction_daily_stats
+Revises: 031_valuation_snapshots
+Create Date: 2026-03-13
+
+Drift raporu (ml/drift_monitor.py) son N günün tüm prediction_logs
+satırlarını Python'a yükleyip JSON input_data'yı geziyordu.
+
+1. CREATE TABLE prediction_daily_stats — günlük (UTC) özet: sayılar,
+   toplamlar, kareler toplamı, min/max, oda/ilçe histogramları (JSONB).
+   Celery beat (drift_check.rollup_prediction_stats) 15 dakikada bir
+   son günleri INSERT ... SELECT ... ON CONFLICT ile yeniden hesaplar.
+2. ix_prediction_logs_created_at — rollup yalnızca dün + bugünü tarar;
+   mevcut (model_name, model_version, created_at) indeksi tarih aralığı
+   için kullanılamıyordu.
+3. İlk rollup boş tablo için DRIFT_ROLLUP_BACKFILL_DAYS gün geriye gider;
+   migration veri doldurmaz.
+
+NOT: RLS yok — özet tenant bağımsızdır (model drift'i global),
+ofis bazlı kayıt içermez.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "032_prediction_daily_stats"
+down_revision: str | None = "031_valuation_snapshots"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # ================================================================
+    # 1. CREATE TABLE prediction_daily_stats
+    # ================================================================
+    op.create_table(
+        "prediction_daily_stats",
+        sa.Column("day", sa.Date(), nullable=False, comment="Tahmin günü (UTC)"),
+        sa.Column(
+            "prediction_count",
+            sa.BigInteger(),
+            nullable=False,
+            comment="Toplam tahmin sayısı",
+        ),
+        sa.Column("confidence_count", sa.BigInteger(), nullable=False),
+        sa.Column("confidence_sum", sa.Float(), nullable=False),
+        sa.Column("latency_count", sa.BigInteger(), nullable=False),
+        sa.Column("latency_sum", sa.Float(), nullable=False),
+        sa.Column("net_sqm_count", sa.BigInteger(), nullable=False),
+        sa.Column("net_sqm_sum", sa.Float(), nullable=False),
+        sa.Column("net_sqm_sumsq", sa.Float(), nullable=False),
+        sa.Column("net_sqm_min", sa.Float(), nullable=True),
+        sa.Column("net_sqm_max", sa.Float(), nullable=True),
+        sa.Column("building_age_count", sa.BigInteger(), nullable=False),
+        sa.Column("building_age_sum", sa.Float(), nullable=False),
+        sa.Column("building_age_sumsq", sa.Float(), nullable=False),
+        sa.Column("price_count", sa.BigInteger(), nullable=False),
+        sa.Column("price_sum", sa.Float(), nullable=False),
+        sa.Column("price_min", sa.Float(), nullable=True),
+        sa.Column("price_max", sa.Float(), nullable=True),
+        sa.Column(
+            "room_histogram",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+            comment='Oda tipi → adet ({"3+1": 120, "5+": 8})',
+        ),
+        sa.Column(
+            "district_histogram",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+            comment="İlçe → adet",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Son rollup zamanı",
+        ),
+        sa.PrimaryKeyConstraint("day"),
+    )
+
+    # ================================================================
+    # 2. Rollup tarih aralığı taraması
+    # ================================================================
+    op.create_index(
+        "ix_prediction_logs_created_at",
+        "prediction_logs",
+        ["created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_prediction_logs_created_at", table_name="prediction_logs")
+    op.drop_table("prediction_daily_stats")
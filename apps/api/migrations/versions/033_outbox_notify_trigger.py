@@ -0,0 +1,72 @@
+"""outbox notify trigger
+
+Revision ID: 033_outbox_notify_trigger
+Revises: 032_prediction_daily_stats
+Create Date: 2026-03-14
+
+Outbox event'leri yalnızca Celery beat poll'u (5 sn) ile işleniyordu;
+yeni bir event ortalama 2.5 sn bekliyordu.
+
+1. notify_outbox_event() — pg_notify('outbox_events', '').
+   API worker'larındaki OutboxListener (LISTEN) kuyruğu anında boşaltır.
+   Payload boş: bildirim yalnızca uyandırır, event'ler SKIP LOCKED ile
+   claim edilir. Aynı transaction'daki aynı payload'lı bildirimleri
+   PostgreSQL tek bildirime indirger — toplu INSERT tek uyanış.
+2. trg_outbox_events_notify — AFTER INSERT OR UPDATE OF status, satır
+   işlenmeye hazırsa (pending ve next_retry_at gelmiş). DLQ'dan yeniden
+   kuyruğa alınan event'ler de (DLQService.retry_*) anında işlenir;
+   ileri tarihli retry'lar bildirim üretmez (beat poll'u yakalar).
+
+NOT: NOTIFY commit anında teslim edilir; rollback olan INSERT bildirim
+üretmez.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "033_outbox_notify_trigger"
+down_revision: str | None = "032_prediction_daily_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # ================================================================
+    # 1. Trigger fonksiyonu — LISTEN outbox_events'i uyandırır
+    # ================================================================
+    op.execute(sa.text("""
+        CREATE OR REPLACE FUNCTION notify_outbox_event()
+        RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('outbox_events', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """))
+
+    # ================================================================
+    # 2. Trigger — yalnızca işlenmeye hazır satırlar
+    #
+    #    Worker'ın kendi UPDATE'leri (processing / sent / dead_letter)
+    #    ve ileri tarihli retry (pending + next_retry_at > now())
+    #    WHEN koşulu nedeniyle fonksiyonu hiç çağırmaz.
+    # ================================================================
+    op.execute(sa.text("""
+        CREATE TRIGGER trg_outbox_events_notify
+            AFTER INSERT OR UPDATE OF status
+            ON outbox_events
+            FOR EACH ROW
+            WHEN (
+                NEW.status = 'pending'
+                AND (NEW.next_retry_at IS NULL OR NEW.next_retry_at <= now())
+            )
+            EXECUTE FUNCTION notify_outbox_event()
+    """))
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP TRIGGER IF EXISTS trg_outbox_events_notify ON outbox_events"))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS notify_outbox_event()"))
@@ -0,0 +1,111 @@
+"""archive tables and outbox partial indexes
+
+Revision ID: 034_archive_tables
+Revises: 033_outbox_notify_trigger
+Create Date: 2026-03-15
+
+outbox_events, inbox_events, audit_logs ve prediction_logs yalnızca
+büyüyordu; OutboxMonitor her 60 saniyede tüm outbox'ı GROUP BY status
+ile tarıyordu.
+
+1. {tablo}_archive — kaynak tablonun kolonları (LIKE, aynı sıra),
+   PARTITION BY RANGE (created_at). Aylık partition'ları arşiv job'u
+   (tasks/archive_prune, services/table_archiver) ihtiyaç oldukça
+   oluşturur; eski aylar DROP ile silinir (satır satır DELETE yok).
+   PK (id, created_at) — partition anahtarı PK'da olmak zorunda.
+   FK / RLS / app_user GRANT yok: arşiv uygulama tarafından okunmaz.
+2. Outbox partial index'leri — sorgular yalnızca aktif satırlara dokunur:
+   - ix_outbox_pending_created   (created_at) WHERE status = 'pending'
+     claim (ORDER BY created_at) + lag metrikleri
+   - ix_outbox_processing_locked (locked_at)  WHERE status = 'processing'
+     stuck tespiti
+   - ix_outbox_errors_created    (created_at) WHERE status IN ('failed', 'dead_letter')
+     DLQ listeleme / purge
+   ix_outbox_status_next_retry (tam tablo, sent satırlar dahil) kaldırılır.
+3. ix_inbox_events_processed_created — arşiv taraması (status = 'processed').
+
+NOT: Kaynak tabloya kolon ekleyen migration arşiv tablosuna da aynı
+kolonu eklemelidir (taşıma INSERT ... SELECT * kullanır).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "034_archive_tables"
+down_revision: str | None = "033_outbox_notify_trigger"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_ARCHIVED_TABLES = ("outbox_events", "inbox_events", "audit_logs", "prediction_logs")
+
+
+def upgrade() -> None:
+    # ================================================================
+    # 1. Arşiv tabloları — aylık RANGE partition
+    # ================================================================
+    for table in _ARCHIVED_TABLES:
+        op.execute(sa.text(
+            f"CREATE TABLE {table}_archive (LIKE {table} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE (created_at)"
+        ))
+        op.execute(sa.text(
+            f"ALTER TABLE {table}_archive ADD PRIMARY KEY (id, created_at)"
+        ))
+
+    # KVKK raporlama: ofis + tarih (partition'lara otomatik yayılır)
+    op.execute(sa.text(
+        "CREATE INDEX ix_audit_logs_archive_office_created "
+        "ON audit_logs_archive (office_id, created_at)"
+    ))
+
+    # ================================================================
+    # 2. Outbox partial index'leri
+    # ================================================================
+    op.create_index(
+        "ix_outbox_pending_created",
+        "outbox_events",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_outbox_processing_locked",
+        "outbox_events",
+        ["locked_at"],
+        postgresql_where=sa.text("status = 'processing'"),
+    )
+    op.create_index(
+        "ix_outbox_errors_created",
+        "outbox_events",
+        ["created_at"],
+        postgresql_where=sa.text("status IN ('failed', 'dead_letter')"),
+    )
+    op.drop_index("ix_outbox_status_next_retry", table_name="outbox_events")
+
+    # ================================================================
+    # 3. Inbox arşiv taraması
+    # ================================================================
+    op.create_index(
+        "ix_inbox_events_processed_created",
+        "inbox_events",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'processed'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_inbox_events_processed_created", table_name="inbox_events")
+    op.create_index(
+        "ix_outbox_status_next_retry",
+        "outbox_events",
+        ["status", "next_retry_at"],
+    )
+    op.drop_index("ix_outbox_errors_created", table_name="outbox_events")
+    op.drop_index("ix_outbox_processing_locked", table_name="outbox_events")
+    op.drop_index("ix_outbox_pending_created", table_name="outbox_events")
+    # Arşivdeki satırlar kaynak tabloya geri taşınmaz — downgrade öncesi
+    # gerekiyorsa INSERT INTO {tablo} SELECT * FROM {tablo}_archive
+    for table in reversed(_ARCHIVED_TABLES):
+        op.execute(sa.text(f"DROP TABLE IF EXISTS {table}_archive CASCADE"))
@@ -0,0 +1,55 @@
+"""valuation run active unique index
+
+Revision ID: 035_valuation_run_active_unique
+Revises: 034_archive_tables
+Create Date: 2026-03-16
+
+"Ofis başına tek aktif portföy değerleme" yalnızca API'de
+kontrol-sonra-ekle idi; eşzamanlı iki POST iki çalıştırma açabiliyordu.
+
+1. Mevcut çift aktif kayıtlar: ofis başına en yenisi dışındakiler
+   'failed' yapılır (index oluşturulabilsin diye).
+2. uq_valuation_snapshot_runs_office_active —
+   (office_id) WHERE status IN ('pending', 'running'), UNIQUE.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "035_valuation_run_active_unique"
+down_revision: str | None = "034_archive_tables"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(sa.text("""
+        UPDATE valuation_snapshot_runs r
+        SET status = 'failed',
+            error = 'Aynı ofiste daha yeni bir çalıştırma aktif',
+            finished_at = now()
+        WHERE r.status IN ('pending', 'running')
+          AND EXISTS (
+              SELECT 1 FROM valuation_snapshot_runs n
+              WHERE n.office_id = r.office_id
+                AND n.status IN ('pending', 'running')
+                AND (n.created_at, n.id) > (r.created_at, r.id)
+          )
+    """))
+    op.create_index(
+        "uq_valuation_snapshot_runs_office_active",
+        "valuation_snapshot_runs",
+        ["office_id"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('pending', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "uq_valuation_snapshot_runs_office_active",
+        table_name="valuation_snapshot_runs",
+    )
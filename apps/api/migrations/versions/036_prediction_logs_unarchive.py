@@ -0,0 +1,45 @@
+"""prediction_logs unarchive
+
+Revision ID: 036_prediction_logs_unarchive
+Revises: 035_valuation_run_active_unique
+Create Date: 2026-03-17
+
+prediction_logs yalnızca yazılan bir log değil: değerleme geçmişi
+listesi, detay, emsal ve PDF endpoint'leri bu tablodan okur. Arşive
+taşınan tahminler kullanıcı tarafında kayboluyordu (listeden düşüyor,
+detay/PDF 404). prediction_logs arşivleme kurallarından çıkarıldı.
+
+1. prediction_logs_archive'e taşınmış satırlar kaynak tabloya geri alınır.
+2. prediction_logs_archive (ve aylık partition'ları) kaldırılır.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "036_prediction_logs_unarchive"
+down_revision: str | None = "035_valuation_run_active_unique"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Arşiv LIKE ile kopyalandı — kolon sırası kaynakla aynı
+    op.execute(sa.text(
+        "INSERT INTO prediction_logs SELECT * FROM prediction_logs_archive "
+        "ON CONFLICT (id) DO NOTHING"
+    ))
+    op.execute(sa.text("DROP TABLE prediction_logs_archive CASCADE"))
+
+
+def downgrade() -> None:
+    # 034 ile aynı boş arşiv tablosu; satırlar geri taşınmaz
+    op.execute(sa.text(
+        "CREATE TABLE prediction_logs_archive (LIKE prediction_logs INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    ))
+    op.execute(sa.text(
+        "ALTER TABLE prediction_logs_archive ADD PRIMARY KEY (id, created_at)"
+    ))
@@ -0,0 +1,131 @@
+"""
+Emlak Teknoloji Platformu - WebSocket Bosta Baglanti Yuk Testi
+
+Tek uvicorn worker'ina N bosta WebSocket baglantisi acar ve sure boyunca
+tutar. Istemciler gercek frontend gibi davranir: --heartbeat saniyede bir
+"ping" gonderir, sunucunun "ping"ine "pong" ile yanit verir. Sunucunun
+kapattigi baglantilar close koduyla sayilir (1001 heartbeat, 1013 yavas
+istemci) — bosta baglantilarda ikisi de 0 olmali.
+
+Hedef: worker basina 10.000 bosta baglanti, kapanma 0.
+
+Kullanim:
+    cd apps/api
+    # Sunucu (tek worker; dosya limiti baglanti sayisindan buyuk olmali)
+    ulimit -n 65536
+    uvicorn src.main:app --port 8000 --workers 1
+
+    # Istemci (ayri terminal, ayni JWT_SECRET_KEY)
+    ulimit -n 65536
+    python3 -m scripts.ws_load_test --connections 10000 --duration 300
+
+Not: Tek istemci IP'sinden ~28k ustu baglanti icin yerel port araligi
+(net.ipv4.ip_local_port_range) genisletilmelidir.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import resource
+import time
+import uuid
+
+import websockets
+
+from src.modules.auth.service import create_access_token
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.open = 0
+        self.connect_failed = 0
+        self.server_pings = 0
+        self.close_codes: collections.Counter[int | None] = collections.Counter()
+
+
+async def _client(url: str, token: str, stats: Stats, heartbeat: float, stop: asyncio.Event) -> None:
+    try:
+        ws = await websockets.connect(f"{url}?token={token}", open_timeout=30, ping_interval=None)
+    except Exception:
+        stats.connect_failed += 1
+        return
+
+    stats.open += 1
+
+    async def _heartbeat() -> None:
+        while True:
+            await asyncio.sleep(heartbeat)
+            await ws.send("ping")
+
+    beat = asyncio.create_task(_heartbeat())
+    try:
+        async for message in ws:
+            if message == "ping":
+                stats.server_pings += 1
+                await ws.send("pong")
+    except websockets.ConnectionClosed:
+        pass
+    finally:
+        beat.cancel()
+        stats.open -= 1
+        # Test bitmeden kapanan baglanti → sunucu kapatti
+        if not stop.is_set():
+            stats.close_codes[ws.close_code] += 1
+        await ws.close()
+
+
+async def _report(stats: Stats, started: float, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        await asyncio.sleep(5)
+        rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(
+            f"[{time.monotonic() - started:6.0f}s] acik={stats.open} "
+            f"baglanamayan={stats.connect_failed} sunucu_ping={stats.server_pings} "
+            f"sunucu_kapatti={dict(stats.close_codes)} istemci_rss={rss_mb:.0f}MB",
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="WebSocket bosta baglanti yuk testi")
+    parser.add_argument("--url", default="ws://127.0.0.1:8000/ws")
+    parser.add_argument("--connections", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=2_500, help="farkli JWT sub sayisi (coklu sekme)")
+    parser.add_argument("--ramp", type=int, default=500, help="saniyede acilan baglanti")
+    parser.add_argument("--heartbeat", type=float, default=30.0, help="istemci ping araligi (sn)")
+    parser.add_argument("--duration", type=float, default=300.0, help="tum baglantilar acildiktan sonra")
+    args = parser.parse_args()
+
+    tokens = [create_access_token({"sub": str(uuid.uuid4())}) for _ in range(args.users)]
+    stats = Stats()
+    stop = asyncio.Event()
+    started = time.monotonic()
+    reporter = asyncio.create_task(_report(stats, started, stop))
+
+    clients = []
+    for i in range(args.connections):
+        clients.append(asyncio.create_task(
+            _client(args.url, tokens[i % args.users], stats, args.heartbeat, stop),
+        ))
+        if (i + 1) % args.ramp == 0:
+            await asyncio.sleep(1)
+
+    await asyncio.sleep(args.duration)
+    held = stats.open
+    stop.set()
+    for task in clients:
+        task.cancel()
+    await asyncio.gather(*clients, return_exceptions=True)
+    reporter.cancel()
+
+    print(
+        f"SONUC: hedef={args.connections} tutulan={held} baglanamayan={stats.connect_failed} "
+        f"sunucu_kapatti={dict(stats.close_codes)} sunucu_ping={stats.server_pings}",
+    )
+    if held < args.connections or stats.close_codes:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
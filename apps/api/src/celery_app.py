@@ -125,6 +125,18 @@ celery_app.conf.beat_schedule = {
         ),
         "options": {"queue": "default"},
     },
+    # ── ML: Drift Gunluk Ozet Rollup (15 dakikada bir) ──
+    "rollup-prediction-stats-15min": {
+        "task": "src.tasks.drift_check.rollup_prediction_stats",
+        "schedule": 900,  # 15 dakika
+        "options": {"queue": "default"},
+    },
+    # ── Bakim: Outbox/Inbox/Audit/Prediction arsivleme (saatlik) ──
+    "archive-old-rows-hourly": {
+        "task": "src.tasks.archive_prune.archive_old_rows",
+        "schedule": crontab(minute=17),  # her saat :17 (rollup / drift ile cakismasin)
+        "options": {"queue": "default"},
+    },
     # ── Reporting: Daily Office Report (Gunluk 20:00 TST = 17:00 UTC) ──
     "send-daily-reports-20": {
         "task": "src.tasks.daily_report.send_daily_office_reports",
@@ -140,7 +152,7 @@ celery_app.conf.beat_schedule = {
 }
 
 # ---------- Auto-discover Tasks ----------
-celery_app.autodiscover_tasks(["src.tasks", "src.modules.matches"])
+celery_app.autodiscover_tasks(["src.tasks", "src.modules.matches", "src.modules.valuations"])
 
 # ---------- Signal Handlers ----------
 # Import etmek yeterli: @before_task_publish.connect gibi dekoratorler
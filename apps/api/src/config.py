@@ -116,6 +116,100 @@ class Settings(BaseSettings):
 
     # ---------- OpenAI ----------
     OPENAI_API_KEY: str = ""  # bos → no-op guard (mock response doner)
+    OPENAI_BASE_URL: str = ""  # bos → api.openai.com; test'te yerel stub sunucu
+    OPENAI_TIMEOUT_SECONDS: float = 60.0  # text / vision istek zaman asimi
+    OPENAI_IMAGE_TIMEOUT_SECONDS: float = 180.0  # gorsel uretim / duzenleme zaman asimi
+    OPENAI_CONCURRENCY_TEXT: int = 16  # surec basina eszamanli text istegi
+    OPENAI_CONCURRENCY_VISION: int = 8  # surec basina eszamanli vision istegi
+    OPENAI_CONCURRENCY_IMAGE: int = 4  # surec basina eszamanli gorsel uretim / duzenleme
+
+    # ---------- Property Search ----------
+    # single_pass: FTS/trigram/ILIKE katmanlari tek CTE sorgusunda (1 round trip)
+    # cascade: katman basina ayri count + sayfa sorgusu (eski davranis)
+    SEARCH_ENGINE_MODE: str = "single_pass"
+
+    # ---------- Pagination: Toplam Sayim ----------
+    # exact: her zaman count(*) | estimate: esik ustunde EXPLAIN tahmini
+    # has_more: esik ustunde sayim yok, limit+1 probe (total = alt sinir)
+    # Varsayilan kesin sayim; yalnizca buyuk portfoy listeleri opt-in yapar
+    COUNT_STRATEGY_DEFAULT: str = "exact"
+    COUNT_STRATEGIES: dict[str, str] = {  # endpoint → strateji
+        "search": "estimate",
+        "customers": "estimate",
+        "notifications": "has_more",
+    }
+    COUNT_EXACT_THRESHOLD: int = 1000  # bu sayiya kadar toplam her zaman kesin
+
+    # ---------- Matching: Ofis Bazli Toplu Eslestirme ----------
+    MATCH_REMATCH_CHUNK_SIZE: int = 500  # tek seferde skorlanan ilan sayisi
+    MATCH_UPSERT_BATCH_SIZE: int = 1000  # tek INSERT ... ON CONFLICT ile yazilan satir
+    MATCH_REMATCH_WATERMARK_LAG_SECONDS: int = 300  # gec commit edilen degisiklikler icin pay
+
+    # ---------- Matching: Tetikleyici Debounce ----------
+    MATCH_TRIGGER_DEBOUNCE_SECONDS: int = 15  # 0 → debounce kapali, her tetik aninda kuyruga
+    MATCH_TRIGGER_BATCH_PROPERTIES: bool = True  # ofisin yeni ilanlari tek skor gecisinde
+
+    # ---------- ML Inference: Executor + Mikro-Batch ----------
+    # thread: model tek kopya (LightGBM predict GIL'i birakir)
+    # process: her process modeli kendisi yukler (spawn), bellek x worker
+    INFERENCE_EXECUTOR: str = "thread"
+    INFERENCE_MAX_WORKERS: int = 2
+    INFERENCE_BATCH_WINDOW_MS: int = 5  # 0 → mikro-batch kapali, her istek ayri
+    INFERENCE_MAX_BATCH_SIZE: int = 32  # pencere dolmadan bu sayida istek → hemen calistir
+
+    # ---------- ML Model Registry: Hot Swap + Shadow ----------
+    MODEL_REGISTRY_POLL_SECONDS: int = 60  # 0 → kapali (sadece baslangicta diskten yukleme)
+    MODEL_SHADOW_SAMPLE_RATE: float = 0.1  # status='shadow' aday bu oranda istekte paralel skorlanir
+
+    # ---------- ML Inference: Sehir Bazli Model Yonlendirme ----------
+    DEFAULT_MODEL_CITY: str = "istanbul"  # InferenceService singleton'i (hot swap + shadow)
+    CITY_MODEL_ROOT: str = "src/ml/models/cities/"  # <root>/<sehir>/ — train_model_v1 artifact duzeni
+    CITY_MODEL_MEMORY_BUDGET_MB: int = 512  # worker basina yuklu sehir modelleri toplami (LRU)
+
+    # ---------- ML: Drift Izleme ----------
+    DRIFT_ROLLUP_BACKFILL_DAYS: int = 30  # ozet tablosu bossa geriye donuk hesaplanan gun
+
+    # ---------- ML Inference: Toplu Portfoy Degerleme ----------
+    PORTFOLIO_VALUATION_CHUNK_SIZE: int = 2000  # tek predict_batch + tek toplu INSERT
+    PORTFOLIO_VALUATION_STALE_MINUTES: int = 30  # bu sure ilerleme yazmayan pending/running takilmis sayilir
+
+    # ---------- Valuation Cache ----------
+    # Ayni girdi + ayni model → ayni tahmin; anahtar model parmak izi icerir
+    VALUATION_CACHE_ENABLED: bool = True
+    VALUATION_CACHE_TTL_SECONDS: int = 86400  # 24 saat
+    VALUATION_CACHE_TIMEOUT_SECONDS: float = 0.2  # Redis yavas/kapali → cache atlanir
+
+    # ---------- Realtime: WebSocket Baglantilari ----------
+    WS_SEND_QUEUE_SIZE: int = 64  # baglanti basina bekleyen mesaj; dolarsa yavas tuketici politikasi
+    WS_SLOW_CONSUMER_POLICY: str = "close"  # close: 1013 ile kapat (istemci yeniden baglanir) | drop: mesaji at
+    WS_SEND_TIMEOUT_SECONDS: float = 10.0  # tek soket yazimi; asilirsa baglanti kapatilir
+    WS_HEARTBEAT_INTERVAL_SECONDS: float = 30.0  # bu kadar sessiz baglantiya sunucu "ping" gonderir
+    WS_HEARTBEAT_TIMEOUT_SECONDS: float = 75.0  # bu kadar hic mesaj gelmeyen baglanti kapatilir
+
+    # ---------- Realtime: WebSocket Redis Backplane ----------
+    # emit_event → yerel soketler + Redis PUBLISH (diger uvicorn worker'lari, Celery)
+    WS_BACKPLANE_ENABLED: bool = True  # False → yalnizca bu process'e bagli soketler
+    WS_BACKPLANE_CHANNEL_PREFIX: str = "ws"  # {prefix}:user:{user_id}, {prefix}:broadcast
+    WS_BACKPLANE_TIMEOUT_SECONDS: float = 0.5  # PUBLISH zaman asimi (Redis yok → yalnizca yerel)
+    WS_BACKPLANE_RECONNECT_SECONDS: float = 1.0  # abone koparsa ilk bekleme (ustel, max 30 sn)
+
+    # ---------- Outbox Dispatcher ----------
+    # Yeni event → NOTIFY outbox_events (migration 033) → API worker'indaki listener aninda isler
+    OUTBOX_BATCH_SIZE: int = 100  # tek claim (SKIP LOCKED) + tek toplu durum UPDATE'i
+    OUTBOX_HANDLER_CONCURRENCY: int = 8  # event tipi basina varsayilan eszamanli handler
+    OUTBOX_HANDLER_TIMEOUT_SECONDS: float = 30.0  # asilirsa TimeoutError → retry politikasi
+    OUTBOX_LISTEN_ENABLED: bool = True  # False → yalnizca Celery beat poll'u (5 sn)
+    OUTBOX_LISTEN_FALLBACK_SECONDS: float = 5.0  # bildirim gelmese de kuyruk bu aralikla bosaltilir
+    OUTBOX_DRAIN_MAX_BATCHES: int = 10  # tek uyanista / beat task'inda en fazla batch
+
+    # ---------- Arsivleme: Archive-and-Prune ----------
+    # Eski satirlar {tablo}_archive aylik partition'larina tasinir (migration 034, Celery beat saatlik)
+    OUTBOX_ARCHIVE_AFTER_HOURS: int = 24  # status='sent' outbox event'leri
+    INBOX_ARCHIVE_AFTER_DAYS: int = 30  # status='processed'; event_id tekrar kontrolu bu pencerede kalir
+    AUDIT_LOG_ARCHIVE_AFTER_DAYS: int = 180  # audit API listesi yalnizca bu pencereyi gosterir
+    ARCHIVE_BATCH_SIZE: int = 5000  # tek DELETE ... RETURNING → INSERT ifadesi (ayri commit)
+    ARCHIVE_MAX_BATCHES: int = 50  # tablo basina tek calismada en fazla batch
+    ARCHIVE_DROP_AFTER_MONTHS: int = 0  # 0 → arsiv partition'lari silinmez; audit_logs en az 24 ay (KVKK)
 
     # ---------- Data Pipeline: Genel ----------
     DATA_PIPELINE_TIMEOUT: int = 30  # HTTP istek zaman asimi (saniye)
@@ -0,0 +1,394 @@
+"""
+Emlak Teknoloji Platformu - Keyset (Cursor) Pagination
+
+OFFSET/LIMIT yerine siralama anahtari + id ile sayfalama.
+
+OFFSET derin sayfalarda tum onceki satirlari okuyup atar (maliyet sayfa
+numarasiyla lineer artar). Keyset pagination son satirin siralama degerlerini
+opak bir cursor'a koyar; sonraki sayfa `WHERE (sort_key, id) < (:v, :id)`
+ile indeks uzerinden dogrudan devam eder.
+
+Kullanim:
+    keys = [SortKey(Property.price), SortKey(Property.id)]
+    stmt = stmt.order_by(*order_by_keys(keys))
+    if cursor:
+        stmt = stmt.where(keyset_after(keys, decode_cursor(cursor, "price_desc", len(keys))))
+    rows = (await db.execute(stmt.limit(limit + 1))).scalars().all()
+    items, next_cursor = trim_page(rows, limit, "price_desc", lambda p: [p.price, p.id])
+
+Cursor formati:
+    base64url(JSON{"s": scope, "k": [tipli degerler]}) — scope, cursor'in
+    hangi siralama icin uretildigini tutar; farkli siralamayla kullanilirsa
+    ValidationError firlatilir.
+
+Toplam Sayim Stratejileri (CountStrategy):
+    Buyuk ofis portfoylerinde her sayfa degisiminde tam count(*) gereksiz I/O'dur.
+    Once esik+1 ile sinirli sayim yapilir (LIMIT'li alt sorgu, esikte durur):
+      - exact:    Esikten bagimsiz tam count(*).
+      - estimate: Esik altinda kesin; ustunde EXPLAIN planner tahmini.
+      - has_more: Esik altinda kesin; ustunde sayim yok — total = esik + 1
+                  (alt sinir), sonraki sayfa bilgisi limit+1 probe'dan (has_more).
+    Kesin olmayan toplamlarda Page.total_exact = False.
+
+    Endpoint bazli secim: settings.COUNT_STRATEGIES / COUNT_STRATEGY_DEFAULT.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import enum
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from sqlalchemy import and_, false, func, literal, or_, select, true, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from src.config import settings
+from src.core.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from sqlalchemy import Select
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql.compiler import SQLCompiler
+    from sqlalchemy.sql.elements import ColumnElement
+
+logger = structlog.get_logger(__name__)
+
+_INVALID_CURSOR = "Gecersiz sayfalama imleci (cursor)."
+
+
+# ---------- Sayfa Sonucu ----------
+
+
+@dataclass
+class Page[T]:
+    """
+    Sayfalanmis liste sonucu.
+
+    Attributes:
+        items: Sayfadaki kayitlar.
+        total: Toplam kayit sayisi (cursor'dan bagimsiz, tum filtre sonucu).
+        next_cursor: Sonraki sayfa icin opak cursor; son sayfada None.
+        total_exact: total kesin mi (False → tahmin veya alt sinir).
+        has_more: Sonraki sayfa var mi (limit+1 probe; cursor varsa True).
+    """
+
+    items: list[T]
+    total: int
+    next_cursor: str | None = None
+    total_exact: bool = True
+    has_more: bool = False
+
+    def __post_init__(self) -> None:
+        if self.next_cursor is not None:
+            self.has_more = True
+
+
+# ---------- Siralama Anahtari ----------
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    Keyset siralamasinin tek bir kolonu.
+
+    Attributes:
+        column: Siralama ifadesi (kolon veya hesaplanmis ifade).
+        descending: Azalan siralama mi.
+        nullable: Kolon NULL alabilir mi — NULL'lar icin ayri karsilastirma uretilir.
+        nulls_last: NULL'larin konumu (None → PostgreSQL varsayilani:
+            ASC → NULLS LAST, DESC → NULLS FIRST). Sadece nullable kolonlarda kullanilir.
+    """
+
+    column: ColumnElement[Any]
+    descending: bool = True
+    nullable: bool = False
+    nulls_last: bool | None = None
+
+    @property
+    def _nulls_last(self) -> bool:
+        if self.nulls_last is None:
+            return not self.descending
+        return self.nulls_last
+
+    def order_by(self) -> ColumnElement[Any]:
+        """ORDER BY ifadesi (nullable kolonlarda NULL konumu acikca belirtilir)."""
+        expr = self.column.desc() if self.descending else self.column.asc()
+        if not self.nullable:
+            return expr
+        return expr.nulls_last() if self._nulls_last else expr.nulls_first()
+
+    def after(self, value: Any) -> ColumnElement[bool]:
+        """Siralamada `value`'dan kesin olarak sonra gelen satirlar."""
+        if value is None:
+            # NULLS LAST → NULL'dan sonra (bu kolonda) hicbir sey yok
+            return false() if self._nulls_last else self.column.is_not(None)
+        cmp = self.column < value if self.descending else self.column > value
+        if self.nullable and self._nulls_last:
+            return or_(cmp, self.column.is_(None))
+        return cmp
+
+    def equals(self, value: Any) -> ColumnElement[bool]:
+        """Siralamada `value` ile esit konumdaki satirlar."""
+        if value is None:
+            return self.column.is_(None)
+        return self.column == value
+
+
+def order_by_keys(keys: Sequence[SortKey]) -> list[ColumnElement[Any]]:
+    """SortKey listesinden ORDER BY ifadeleri."""
+    return [key.order_by() for key in keys]
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """
+    Cursor degerlerinden sonra gelen satirlar icin WHERE kosulu.
+
+    Tum anahtarlar ayni yonde ve NULL alamiyorsa row-value karsilastirmasi
+    uretilir (`(a, b) < (:a, :b)`) — PostgreSQL bunu composite B-tree
+    indeksinde range scan olarak kullanir. Aksi halde genel OR zinciri:
+        k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...
+    """
+    if len(keys) != len(values):
+        raise ValidationError(detail=_INVALID_CURSOR)
+
+    directions = {key.descending for key in keys}
+    if (
+        len(directions) == 1
+        and not any(key.nullable for key in keys)
+        and all(v is not None for v in values)
+    ):
+        row = tuple_(*(key.column for key in keys))
+        row_values = tuple_(*values, types=[key.column.type for key in keys])
+        return row < row_values if keys[0].descending else row > row_values
+
+    clauses = []
+    prefix: list[ColumnElement[bool]] = []
+    for key, value in zip(keys, values, strict=True):
+        clauses.append(and_(*prefix, key.after(value)) if prefix else key.after(value))
+        prefix.append(key.equals(value))
+    return or_(*clauses) if clauses else true()
+
+
+# ---------- Cursor Encode / Decode ----------
+
+
+def _encode_value(value: Any) -> Any:
+    """Cursor degerini tip etiketiyle JSON'a uygun hale getir."""
+    if value is None:
+        return None
+    if isinstance(value, uuid.UUID):
+        return {"u": str(value)}
+    if isinstance(value, datetime):
+        return {"t": value.isoformat()}
+    if isinstance(value, date):
+        return {"D": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"d": str(value)}
+    if isinstance(value, bool):
+        return {"b": value}
+    if isinstance(value, int | float):
+        return {"n": value}
+    if isinstance(value, str):
+        return {"s": value}
+    raise TypeError(f"Cursor icin desteklenmeyen deger tipi: {type(value).__name__}")
+
+
+def _decode_value(raw: Any) -> Any:
+    """Tip etiketli JSON degerini Python tipine geri cevir."""
+    if raw is None:
+        return None
+    if not isinstance(raw, dict) or len(raw) != 1:
+        raise ValueError("invalid cursor value")
+    (tag, value), = raw.items()
+    if tag == "u":
+        return uuid.UUID(value)
+    if tag == "t":
+        return datetime.fromisoformat(value)
+    if tag == "D":
+        return date.fromisoformat(value)
+    if tag == "d":
+        return Decimal(value)
+    if tag in ("b", "n") and isinstance(value, bool | int | float):
+        return value
+    if tag == "s" and isinstance(value, str):
+        return value
+    raise ValueError("invalid cursor value")
+
+
+def encode_cursor(scope: str, values: Sequence[Any]) -> str:
+    """
+    Siralama degerlerini opak cursor string'ine cevir.
+
+    Args:
+        scope: Cursor'in ait oldugu siralama (orn: "price_desc", "customers:created_at:desc").
+        values: Son satirin siralama anahtari degerleri (id dahil).
+
+    Returns:
+        URL-safe base64 cursor (padding'siz).
+    """
+    payload = {"s": scope, "k": [_encode_value(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, scope: str, size: int) -> list[Any]:
+    """
+    Opak cursor'i siralama degerlerine geri cevir.
+
+    Args:
+        cursor: encode_cursor() ciktisi.
+        scope: Beklenen siralama — cursor farkli bir siralamaya aitse hata.
+        size: Beklenen anahtar sayisi.
+
+    Raises:
+        ValidationError: Bozuk, farkli siralamaya ait veya eksik cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload.get("s") != scope:
+            raise ValueError("scope mismatch")
+        values = [_decode_value(v) for v in payload["k"]]
+    except (ValueError, TypeError, KeyError, AttributeError, binascii.Error) as exc:
+        raise ValidationError(detail=_INVALID_CURSOR) from exc
+
+    if len(values) != size:
+        raise ValidationError(detail=_INVALID_CURSOR)
+    return values
+
+
+def trim_page[T](
+    rows: Sequence[T],
+    limit: int,
+    scope: str,
+    values: Callable[[T], Sequence[Any]],
+) -> tuple[list[T], str | None]:
+    """
+    `limit + 1` satirla cekilmis sonucu sayfaya indir.
+
+    Fazladan satir varsa sonraki sayfa mevcuttur; son gosterilen satirin
+    siralama degerlerinden cursor uretilir. Aksi halde cursor None.
+
+    Args:
+        rows: limit + 1 ile sorgulanmis satirlar.
+        limit: Sayfa boyutu.
+        scope: Cursor scope'u (decode_cursor ile ayni olmali).
+        values: Satirdan siralama anahtari degerlerini (id dahil) cikaran fonksiyon.
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    return items, encode_cursor(scope, values(items[-1]))
+
+
+# ---------- Toplam Sayim Stratejileri ----------
+
+
+class CountStrategy(enum.StrEnum):
+    """Sayfali listelerde toplam sayinin nasil hesaplanacagi."""
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    HAS_MORE = "has_more"
+
+
+def resolve_count_strategy(endpoint: str) -> CountStrategy:
+    """
+    Endpoint icin yapilandirilmis sayim stratejisi.
+
+    settings.COUNT_STRATEGIES[endpoint] → COUNT_STRATEGY_DEFAULT → exact.
+    Gecersiz deger loglanir ve exact'e dusulur (guvenli taraf).
+    """
+    raw = settings.COUNT_STRATEGIES.get(endpoint, settings.COUNT_STRATEGY_DEFAULT)
+    try:
+        return CountStrategy(raw)
+    except ValueError:
+        logger.warning("count_strategy_invalid", endpoint=endpoint, strategy=raw)
+        return CountStrategy.EXACT
+
+
+class _Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON) <stmt>` — bind parametreleri korunarak derlenir."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def _planner_estimate(db: AsyncSession, stmt: Select) -> int | None:
+    """Planner'in tahmini satir sayisi (EXPLAIN "Plan Rows"). Hata → None."""
+    try:
+        # Savepoint: EXPLAIN hatasi disaridaki transaction'i abort etmesin
+        async with db.begin_nested():
+            result = await db.execute(_Explain(stmt))
+            plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as exc:  # tahmin opsiyonel, sayim fallback'i var
+        logger.warning("count_estimate_failed", error=str(exc))
+        return None
+
+
+async def count_rows(
+    db: AsyncSession,
+    stmt: Select,
+    *,
+    strategy: CountStrategy = CountStrategy.EXACT,
+    threshold: int | None = None,
+) -> tuple[int, bool]:
+    """
+    Filtrelenmis sorgunun toplam satir sayisi, secilen stratejiyle.
+
+    Args:
+        db: Async database session.
+        stmt: Sayilacak satirlari donduren SELECT (ORDER BY / LIMIT olmadan).
+        strategy: Sayim stratejisi.
+        threshold: Kesin sayim esigi (None → settings.COUNT_EXACT_THRESHOLD).
+
+    Returns:
+        (toplam, kesin_mi) tuple'i.
+    """
+    if strategy == CountStrategy.EXACT:
+        result = await db.execute(select(func.count()).select_from(stmt.subquery()))
+        return result.scalar_one(), True
+
+    if threshold is None:
+        threshold = settings.COUNT_EXACT_THRESHOLD
+
+    # Sinirli sayim: esik + 1 satirda durur — kucuk sonuclarda tam sayimla ayni
+    capped = (
+        stmt.with_only_columns(literal(1), maintain_column_froms=True)
+        .order_by(None)
+        .limit(threshold + 1)
+    )
+    result = await db.execute(select(func.count()).select_from(capped.subquery()))
+    capped_total = result.scalar_one()
+    if capped_total <= threshold:
+        return capped_total, True
+
+    if strategy == CountStrategy.ESTIMATE:
+        estimate = await _planner_estimate(db, stmt)
+        if estimate is not None:
+            # Planner tahmini esigin altinda kalamaz — en az esik + 1 satir var
+            return max(estimate, capped_total), False
+
+    # has_more (veya tahmin alinamadi): alt sinir
+    return capped_total, False
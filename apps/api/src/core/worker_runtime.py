@@ -0,0 +1,184 @@
+"""
+Emlak Teknoloji Platformu - Celery Worker Async Runtime
+
+Celery worker process'i basina TEK kalici event loop.
+
+Sorun:
+    Task'lar async kodu asyncio.run() ile cagiriyordu. Her cagri yeni bir
+    event loop kurup kapatir; modul seviyesindeki async engine havuzundaki
+    asyncpg baglantilari kapanmis loop'a bagli kalir (yeniden kullanilamaz),
+    httpx client'lari her cagrida yeniden TCP/TLS kurar. Task suresinin
+    onemli kismi is yerine baglanti kurulumuna gider.
+
+Cozum:
+    - worker_process_init (fork sonrasi, child process'te) → loop kurulur,
+      parent'tan miras kalan engine havuzu birakilir.
+    - run_async(coro) → coroutine process'in kalici loop'unda calisir;
+      async_session_factory baglanti havuzu task'lar arasinda paylasilir.
+    - shared_http_client(key, factory) → loop omru boyunca paylasilan
+      httpx.AsyncClient (BaseAPIClient bunu kullanir).
+    - worker_process_shutdown → HTTP client'lar kapatilir, engine dispose
+      edilir, loop kapatilir.
+
+Neden worker_init degil worker_process_init:
+    worker_init parent process'te, fork'tan ONCE calisir. Event loop ve
+    socket'ler fork'tan sonra, her child'da ayri kurulmalidir.
+
+Worker disinda (eager mode, script, test) run_async ilk cagrida loop'u
+tembel olarak kurar. Loop'u kuran thread disindan yapilan cagrilar
+(threads pool) eski davranisa — asyncio.run() — duser.
+
+Kullanim:
+    from src.core.worker_runtime import run_async
+
+    result = run_async(_run_matching_for_property(property_id, office_id))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Hashable
+
+    import httpx
+
+logger = structlog.get_logger("celery.runtime")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread_id: int | None = None
+_http_clients: dict[Hashable, httpx.AsyncClient] = {}
+
+
+# ================================================================
+# Loop Yonetimi
+# ================================================================
+
+
+def start() -> asyncio.AbstractEventLoop:
+    """Process'in kalici loop'unu dondurur; yoksa (veya kapanmissa) kurar."""
+    global _loop, _loop_thread_id
+
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        _loop_thread_id = threading.get_ident()
+        _http_clients.clear()
+        logger.info("worker_runtime_started", pid=os.getpid())
+    return _loop
+
+
+def init_worker_process() -> None:
+    """
+    Fork sonrasi child process'te cagrilir (worker_process_init).
+
+    Parent'in engine havuzundaki baglantilar child'da KULLANILMAZ —
+    close=False ile soket kapatilmadan birakilir (parent'in baglantisini
+    bozmamak icin), ardindan child'in kendi loop'u kurulur.
+    """
+    from src.database import engine
+
+    engine.sync_engine.dispose(close=False)
+    start()
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Coroutine'i worker'in kalici loop'unda calistirip sonucunu dondurur.
+
+    asyncio.run() yerine kullanilir. Loop ve uzerindeki baglanti havuzlari
+    task'lar arasinda yasamaya devam eder.
+
+    Raises:
+        RuntimeError: Kalici loop'un icinden (async kod icinden) cagrilirsa.
+    """
+    if _loop_thread_id is not None and threading.get_ident() != _loop_thread_id:
+        # Loop baska thread'e ait — paylasilamaz
+        return asyncio.run(coro)
+
+    loop = start()
+    if loop.is_running():
+        coro.close()
+        msg = "run_async() calisan event loop icinden cagrilamaz — await kullanin"
+        raise RuntimeError(msg)
+
+    task = loop.create_task(coro)
+    try:
+        return loop.run_until_complete(task)
+    except BaseException:
+        # SoftTimeLimitExceeded gibi sinyal kaynakli hatalar loop disindan
+        # yukselir — task loop'ta askida kalip sonraki task'la calismasin.
+        if not task.done():
+            task.cancel()
+            with contextlib.suppress(BaseException):
+                loop.run_until_complete(task)
+        raise
+
+
+def shutdown() -> None:
+    """HTTP client'lari ve engine'i kapatir, loop'u sonlandirir."""
+    global _loop, _loop_thread_id
+
+    if _loop is None or _loop.is_closed():
+        return
+
+    loop = _loop
+    try:
+        loop.run_until_complete(_close_resources())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+        _loop = None
+        _loop_thread_id = None
+        logger.info("worker_runtime_stopped", pid=os.getpid())
+
+
+async def _close_resources() -> None:
+    from src.database import engine
+
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        with contextlib.suppress(Exception):
+            await client.aclose()
+
+    await engine.dispose()
+
+
+# ================================================================
+# Paylasilan HTTP Client'lar
+# ================================================================
+
+
+def shared_http_client(
+    key: Hashable,
+    factory: Callable[[], httpx.AsyncClient],
+) -> httpx.AsyncClient | None:
+    """
+    Kalici loop'a bagli, anahtar basina tek httpx.AsyncClient.
+
+    Sadece worker'in kalici loop'u icinden cagrildiginda paylasim yapilir;
+    baska bir loop'ta (FastAPI, asyncio.run fallback) None doner ve cagiran
+    kendi client'ini olusturup kapatir. Paylasilan client'i cagiran KAPATMAZ.
+
+    Args:
+        key: Client kimligi (ornek: kaynak adi + base_url + header'lar).
+        factory: Client yoksa olusturan fonksiyon.
+    """
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    if _loop is None or running is not _loop:
+        return None
+
+    client = _http_clients.get(key)
+    if client is None or client.is_closed:
+        client = factory()
+        _http_clients[key] = client
+    return client
@@ -16,7 +16,8 @@ ONEMLI — Dual-Session Problemi ve Cozumu:
     servis fonksiyonlari kendi icinde platform_admin bypass SET LOCAL yapar.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import Request
 from sqlalchemy import text
@@ -73,21 +74,7 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
     """
     async with async_session_factory() as session:
         try:
-            # --- RLS SET LOCAL: TenantMiddleware bilgileri varsa uygula ---
-            office_id = getattr(request.state, "office_id", None)
-            user_role = getattr(request.state, "user_role", None)
-
-            if office_id:
-                # asyncpg SET LOCAL parameterized query desteklemiyor —
-                # f-string kullanilir (office_id JWT'den gelir, guvenlidir)
-                await session.execute(
-                    text(f"SET LOCAL app.current_office_id = '{office_id}'")
-                )
-            if user_role:
-                await session.execute(
-                    text(f"SET LOCAL app.current_user_role = '{user_role}'")
-                )
-
+            await _apply_tenant_context(session, request)
             yield session
             await session.commit()
         except Exception:
@@ -95,3 +82,51 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
             raise
         finally:
             await session.close()
+
+
+@asynccontextmanager
+async def tenant_session(
+    request: Request,
+    sibling: AsyncSession | None = None,
+) -> AsyncIterator[AsyncSession]:
+    """
+    Request oturumundan bagimsiz, ayni RLS baglamli ek salt-okuma oturumu.
+
+    Bir endpoint birbirinden bagimsiz sorgulari paralel calistirmak
+    istediginde kullanilir (AsyncSession ayni anda tek sorgu yurutebilir).
+    sibling verilirse ayni engine'den acilir (test override'lari korunur).
+    Yazma yapilmaz; oturum sonunda rollback edilir.
+
+    Usage:
+        async with tenant_session(request, sibling=db) as side_db:
+            rows = await side_db.execute(stmt)
+    """
+    session = (
+        async_session_factory()
+        if sibling is None
+        else AsyncSession(bind=sibling.bind, expire_on_commit=False)
+    )
+    async with session:
+        try:
+            await _apply_tenant_context(session, request)
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
+
+
+async def _apply_tenant_context(session: AsyncSession, request: Request) -> None:
+    """TenantMiddleware bilgileri varsa RLS degiskenlerini SET LOCAL ile uygular."""
+    office_id = getattr(request.state, "office_id", None)
+    user_role = getattr(request.state, "user_role", None)
+
+    if office_id:
+        # asyncpg SET LOCAL parameterized query desteklemiyor —
+        # f-string kullanilir (office_id JWT'den gelir, guvenlidir)
+        await session.execute(
+            text(f"SET LOCAL app.current_office_id = '{office_id}'")
+        )
+    if user_role:
+        await session.execute(
+            text(f"SET LOCAL app.current_user_role = '{user_role}'")
+        )
@@ -63,14 +63,23 @@ from src.modules.payments.router import router as payments_router
 from src.modules.payments.transaction_router import router as transactions_router
 from src.modules.properties.router import router as properties_router
 from src.modules.properties.search_router import router as search_router
+from src.modules.realtime import backplane as ws_backplane
+from src.modules.realtime.backplane import BackplaneSubscriber
 from src.modules.realtime.router import manager as ws_manager
 from src.modules.realtime.router import router as ws_router
 from src.modules.showcases.router import router as showcases_router
+from src.modules.valuations import valuation_cache
 from src.modules.valuations.drift_router import router as drift_router
+from src.modules.valuations.inference_executor import shutdown_inference_executor
+from src.modules.valuations.model_watcher import ModelRegistryWatcher
 from src.modules.valuations.pdf_router import router as pdf_router
+from src.modules.valuations.portfolio_router import router as portfolio_valuation_router
 from src.modules.valuations.router import router as valuations_router
 from src.services.dlq_service import DLQService
+from src.services.openai_service import close_client as close_openai_client
+from src.services.outbox_listener import OutboxListener
 from src.services.outbox_monitor import OutboxMonitor
+from src.services.outbox_worker import OutboxWorker
 
 # --- Structured Logging yapilandirmasi (import-time, Sentry'den once) ---
 configure_logging()
@@ -163,13 +172,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.dlq_service = dlq_service
     logger.info("dlq_service_initialized")
 
+    # --- Outbox dispatcher: LISTEN outbox_events → yeni event'ler aninda islenir ---
+    outbox_listener: OutboxListener | None = None
+    if settings.OUTBOX_LISTEN_ENABLED:
+        outbox_listener = OutboxListener(OutboxWorker(async_session_factory))
+        outbox_listener.start()
+
     # --- WebSocket Manager baslatma (stub — varsayilan aktif, env ile kontrol edilir) ---
     app.state.ws_manager = ws_manager
+    ws_manager.start()
     logger.info(
         "ws_manager_initialized",
         detail="WebSocket stub altyapisi hazir (echo + heartbeat)",
     )
 
+    # --- WebSocket Redis backplane: diger worker'lardan / Celery'den gelen event'ler ---
+    ws_subscriber: BackplaneSubscriber | None = None
+    if settings.WS_BACKPLANE_ENABLED:
+        ws_subscriber = BackplaneSubscriber(ws_manager)
+        ws_subscriber.start()
+
+    # --- Model registry: hot swap + shadow ---
+    model_watcher: ModelRegistryWatcher | None = None
+    if settings.MODEL_REGISTRY_POLL_SECONDS > 0:
+        model_watcher = ModelRegistryWatcher()
+        model_watcher.start()
+
     logger.info(
         "application_startup",
         env=settings.APP_ENV,
@@ -181,10 +209,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
     # Shutdown
 
+    # --- Model registry watcher ---
+    if model_watcher is not None:
+        await model_watcher.stop()
+
+    # --- Outbox listener ---
+    if outbox_listener is not None:
+        await outbox_listener.stop()
+
+    # --- WebSocket backplane + baglantilar ---
+    if ws_subscriber is not None:
+        await ws_subscriber.stop()
+    await ws_backplane.close()
+    await ws_manager.stop()
+
     # --- Telegram Adapter cleanup ---
     if telegram_adapter is not None:
         await telegram_adapter.close()
 
+    # --- OpenAI async client cleanup ---
+    await close_openai_client()
+
+    # --- Inference executor cleanup ---
+    shutdown_inference_executor()
+    await valuation_cache.close()
+
     # --- Redis client cleanup ---
     await redis_client.aclose()
     logger.info("redis_client_closed")
@@ -240,6 +289,7 @@ app.include_router(notifications_router)
 app.include_router(payments_router)
 app.include_router(transactions_router)
 app.include_router(valuations_router)
+app.include_router(portfolio_valuation_router)
 app.include_router(areas_router)
 app.include_router(earthquake_router)
 app.include_router(maps_router)
@@ -115,11 +115,15 @@ class ConfidencePredictor:
     def predict_batch_with_confidence(
         self,
         features: pd.DataFrame,
+        predicted: np.ndarray | None = None,
     ) -> list[dict]:
         """Birden fazla mulk icin toplu tahmin + guven araligi.
 
         Args:
             features: Feature engineering sonrasi DataFrame (N satir).
+            predicted: Ana modelin ayni feature'lar uzerindeki tahminleri.
+                Cagiran ana modeli zaten calistirdiysa verilir — ikinci
+                kez calistirilmaz.
 
         Returns:
             N elemanlı list[dict], her biri predict_with_confidence formati.
@@ -127,32 +131,12 @@ class ConfidencePredictor:
         if not self._loaded:
             raise RuntimeError("Modeller yuklenmedi. Once load() cagirin.")
 
-        predicted = self.main_model.predict(features)
+        if predicted is None:
+            predicted = self.main_model.predict(features)
         low_arr = self.q10_model.predict(features)
         high_arr = self.q90_model.predict(features)
 
-        results = []
-        for i in range(len(features)):
-            p, lo, hi = float(predicted[i]), float(low_arr[i]), float(high_arr[i])
-
-            # Guvenlik kontrolleri
-            if lo > hi:
-                lo, hi = hi, lo
-            lo = max(lo, 0.0)
-            hi = max(hi, p * 0.5)
-            if p < lo:
-                p = lo
-            if p > hi:
-                p = hi
-
-            results.append({
-                "predicted": round(p),
-                "low": round(lo),
-                "high": round(hi),
-                "confidence_level": 0.80,
-            })
-
-        return results
+        return confidence_bounds(predicted, low_arr, high_arr)
 
     def evaluate_coverage(
         self,
@@ -204,3 +188,40 @@ class ConfidencePredictor:
             "avg_relative_width": float(np.mean(relative_widths)),
             "median_relative_width": float(np.median(relative_widths)),
         }
+
+
+def confidence_bounds(
+    predicted: np.ndarray,
+    low_arr: np.ndarray,
+    high_arr: np.ndarray,
+) -> list[dict]:
+    """Ham nokta/quantile tahminlerinden guvenlik kontrollu aralik listesi.
+
+    ConfidencePredictor ve serving artifact'i (src.ml.serving_model) ayni
+    kurallari kullanir.
+
+    Returns:
+        N elemanli list[dict], predict_with_confidence formati.
+    """
+    results = []
+    for i in range(len(predicted)):
+        p, lo, hi = float(predicted[i]), float(low_arr[i]), float(high_arr[i])
+
+        # Guvenlik kontrolleri
+        if lo > hi:
+            lo, hi = hi, lo
+        lo = max(lo, 0.0)
+        hi = max(hi, p * 0.5)
+        if p < lo:
+            p = lo
+        if p > hi:
+            p = hi
+
+        results.append({
+            "predicted": round(p),
+            "low": round(lo),
+            "high": round(hi),
+            "confidence_level": 0.80,
+        })
+
+    return results
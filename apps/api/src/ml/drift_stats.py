@@ -0,0 +1,284 @@
+"""
+Emlak Teknoloji Platformu - Drift Gunluk Ozetleri
+
+DriftMonitor onceden son N gunun tum PredictionLog satirlarini Python'a
+yukleyip JSON input_data'yi tek tek geziyordu; rapor suresi tahmin
+hacmiyle dogrusal buyuyordu.
+
+Simdi:
+    1. rollup_prediction_stats (Celery beat, 15 dk) prediction_logs'tan
+       gunluk ozetleri tek INSERT ... SELECT ... ON CONFLICT ile yeniden
+       hesaplar. Sadece son ozetlenen gun ve sonrasi taranir (dun + bugun;
+       gece yarisi civarinda gec commit edilen satirlar da yakalanir).
+    2. Rapor sorgulari prediction_daily_stats uzerinde calisir (en fazla
+       pencere gun sayisi kadar satir):
+           ortalama = SUM(sum) / SUM(count)
+           std      = sqrt((SUM(sumsq) - SUM(sum)^2 / n) / (n - 1))
+           histogram = jsonb_each_text ile gunler arasi toplam
+
+Gun sinirlari UTC'dir; N gunluk pencere bugun dahil son N takvim gunudur.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import BigInteger, Select, func, select, text, true
+
+from src.config import settings
+from src.models.prediction_daily_stats import PredictionDailyStats
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+_S = PredictionDailyStats
+
+# [start, end) araligindaki gunleri yeniden hesaplar (idempotent).
+# Oda tipi: room_count >= 5 → "5+", aksi halde "{room_count}+{living_room_count}".
+# Sayisal olmayan JSON degerleri (orn. "120 m2", "") cast hatasiyla tum
+# rollup'i dusurmesin diye NULL sayilir: moment sayaclarina girmez, oda
+# tipinde eksik deger gibi 0 olur. Ust sinirlar float8/int tasmasini onler.
+_NUMBER_RE = r"^[-+]?([0-9]{1,15}([.][0-9]*)?|[.][0-9]+)([eE][-+]?[0-9]{1,2})?$"
+_ROOM_RE = r"^[0-9]{1,3}([.]0*)?$"
+
+ROLLUP_SQL = text("""
+    WITH raw AS (
+        SELECT
+            (created_at AT TIME ZONE 'UTC')::date AS day,
+            confidence,
+            latency_ms,
+            btrim(input_data->>'net_sqm') AS net_sqm,
+            btrim(input_data->>'building_age') AS building_age,
+            btrim(output_data->>'estimated_price') AS price,
+            input_data->>'district' AS district,
+            btrim(input_data->>'room_count') AS room_count,
+            btrim(input_data->>'living_room_count') AS living_room_count
+        FROM prediction_logs
+        WHERE created_at >= :start AND created_at < :end
+    ),
+    parsed AS (
+        SELECT
+            day,
+            confidence,
+            latency_ms,
+            CASE WHEN net_sqm ~ :number_re THEN net_sqm::float8 END AS net_sqm,
+            CASE WHEN building_age ~ :number_re THEN building_age::float8 END AS building_age,
+            CASE WHEN price ~ :number_re THEN price::float8 END AS price,
+            district,
+            COALESCE(CASE WHEN room_count ~ :room_re THEN room_count::numeric::int END, 0)
+                AS room_count,
+            COALESCE(
+                CASE WHEN living_room_count ~ :room_re THEN living_room_count::numeric::int END, 0
+            ) AS living_room_count
+        FROM raw
+    ),
+    logs AS (
+        SELECT
+            day, confidence, latency_ms, net_sqm, building_age, price, district,
+            CASE
+                WHEN room_count >= 5 THEN '5+'
+                ELSE room_count || '+' || living_room_count
+            END AS room_type
+        FROM parsed
+    ),
+    totals AS (
+        SELECT
+            day,
+            count(*) AS prediction_count,
+            count(confidence) AS confidence_count,
+            COALESCE(sum(confidence), 0) AS confidence_sum,
+            count(latency_ms) AS latency_count,
+            COALESCE(sum(latency_ms), 0) AS latency_sum,
+            count(net_sqm) AS net_sqm_count,
+            COALESCE(sum(net_sqm), 0) AS net_sqm_sum,
+            COALESCE(sum(net_sqm * net_sqm), 0) AS net_sqm_sumsq,
+            min(net_sqm) AS net_sqm_min,
+            max(net_sqm) AS net_sqm_max,
+            count(building_age) AS building_age_count,
+            COALESCE(sum(building_age), 0) AS building_age_sum,
+            COALESCE(sum(building_age * building_age), 0) AS building_age_sumsq,
+            count(price) AS price_count,
+            COALESCE(sum(price), 0) AS price_sum,
+            min(price) AS price_min,
+            max(price) AS price_max
+        FROM logs
+        GROUP BY day
+    ),
+    rooms AS (
+        SELECT day, jsonb_object_agg(room_type, n) AS histogram
+        FROM (SELECT day, room_type, count(*) AS n FROM logs GROUP BY day, room_type) r
+        GROUP BY day
+    ),
+    districts AS (
+        SELECT day, jsonb_object_agg(district, n) AS histogram
+        FROM (
+            SELECT day, district, count(*) AS n
+            FROM logs WHERE district IS NOT NULL
+            GROUP BY day, district
+        ) d
+        GROUP BY day
+    )
+    INSERT INTO prediction_daily_stats (
+        day, prediction_count,
+        confidence_count, confidence_sum, latency_count, latency_sum,
+        net_sqm_count, net_sqm_sum, net_sqm_sumsq, net_sqm_min, net_sqm_max,
+        building_age_count, building_age_sum, building_age_sumsq,
+        price_count, price_sum, price_min, price_max,
+        room_histogram, district_histogram, updated_at
+    )
+    SELECT
+        t.day, t.prediction_count,
+        t.confidence_count, t.confidence_sum, t.latency_count, t.latency_sum,
+        t.net_sqm_count, t.net_sqm_sum, t.net_sqm_sumsq, t.net_sqm_min, t.net_sqm_max,
+        t.building_age_count, t.building_age_sum, t.building_age_sumsq,
+        t.price_count, t.price_sum, t.price_min, t.price_max,
+        COALESCE(r.histogram, '{}'::jsonb), COALESCE(d.histogram, '{}'::jsonb), now()
+    FROM totals t
+    LEFT JOIN rooms r ON r.day = t.day
+    LEFT JOIN districts d ON d.day = t.day
+    ON CONFLICT (day) DO UPDATE SET
+        prediction_count = EXCLUDED.prediction_count,
+        confidence_count = EXCLUDED.confidence_count,
+        confidence_sum = EXCLUDED.confidence_sum,
+        latency_count = EXCLUDED.latency_count,
+        latency_sum = EXCLUDED.latency_sum,
+        net_sqm_count = EXCLUDED.net_sqm_count,
+        net_sqm_sum = EXCLUDED.net_sqm_sum,
+        net_sqm_sumsq = EXCLUDED.net_sqm_sumsq,
+        net_sqm_min = EXCLUDED.net_sqm_min,
+        net_sqm_max = EXCLUDED.net_sqm_max,
+        building_age_count = EXCLUDED.building_age_count,
+        building_age_sum = EXCLUDED.building_age_sum,
+        building_age_sumsq = EXCLUDED.building_age_sumsq,
+        price_count = EXCLUDED.price_count,
+        price_sum = EXCLUDED.price_sum,
+        price_min = EXCLUDED.price_min,
+        price_max = EXCLUDED.price_max,
+        room_histogram = EXCLUDED.room_histogram,
+        district_histogram = EXCLUDED.district_histogram,
+        updated_at = EXCLUDED.updated_at
+""").bindparams(number_re=_NUMBER_RE, room_re=_ROOM_RE)
+
+
+def rollup_prediction_stats(session: Session, now: datetime | None = None) -> dict[str, Any]:
+    """
+    Son ozetlenen gunden (bir gun geriden) bugune kadar ozetleri yeniler.
+
+    Tablo bossa DRIFT_ROLLUP_BACKFILL_DAYS gun geriye gidilir. commit
+    cagirana aittir.
+
+    Returns:
+        dict: start_day, end_day, days_upserted
+    """
+    today = (now or datetime.now(UTC)).date()
+    last_day: date | None = session.execute(select(func.max(_S.day))).scalar()
+    if last_day is None:
+        start_day = today - timedelta(days=settings.DRIFT_ROLLUP_BACKFILL_DAYS)
+    else:
+        start_day = min(last_day, today) - timedelta(days=1)
+
+    result = session.execute(
+        ROLLUP_SQL,
+        {
+            "start": datetime.combine(start_day, time.min, tzinfo=UTC),
+            "end": datetime.combine(today + timedelta(days=1), time.min, tzinfo=UTC),
+        },
+    )
+    return {
+        "start_day": start_day.isoformat(),
+        "end_day": today.isoformat(),
+        "days_upserted": result.rowcount,
+    }
+
+
+# ======================================================================
+# Rapor sorgulari (async DriftMonitor ve sync drift_check ortak)
+# ======================================================================
+
+
+def window_start(days: int, today: date | None = None) -> date:
+    """Bugun dahil son `days` takvim gununun ilki (UTC)."""
+    return (today or datetime.now(UTC).date()) - timedelta(days=days - 1)
+
+
+def _count_total(column: Any) -> Any:
+    """SUM(bigint) PostgreSQL'de numeric doner (Decimal); sayaclar int kalir."""
+    return func.coalesce(func.sum(column), 0).cast(BigInteger)
+
+
+def window_totals_stmt(since: date) -> Select:
+    """Penceredeki gunlerin toplamlari — tek satir."""
+    return select(
+        _count_total(_S.prediction_count).label("prediction_count"),
+        _count_total(_S.confidence_count).label("confidence_count"),
+        func.sum(_S.confidence_sum).label("confidence_sum"),
+        _count_total(_S.latency_count).label("latency_count"),
+        func.sum(_S.latency_sum).label("latency_sum"),
+        _count_total(_S.net_sqm_count).label("net_sqm_count"),
+        func.sum(_S.net_sqm_sum).label("net_sqm_sum"),
+        func.sum(_S.net_sqm_sumsq).label("net_sqm_sumsq"),
+        func.min(_S.net_sqm_min).label("net_sqm_min"),
+        func.max(_S.net_sqm_max).label("net_sqm_max"),
+        _count_total(_S.building_age_count).label("building_age_count"),
+        func.sum(_S.building_age_sum).label("building_age_sum"),
+        func.sum(_S.building_age_sumsq).label("building_age_sumsq"),
+        _count_total(_S.price_count).label("price_count"),
+        func.sum(_S.price_sum).label("price_sum"),
+        func.min(_S.price_min).label("price_min"),
+        func.max(_S.price_max).label("price_max"),
+    ).where(_S.day >= since)
+
+
+def histogram_stmt(column: Any, since: date, limit: int | None = None) -> Select:
+    """JSONB histogram kolonunun pencere toplami: (key, count), coktan aza."""
+    entries = func.jsonb_each_text(column).table_valued("key", "value").lateral()
+    count = _count_total(entries.c.value.cast(BigInteger)).label("count")
+    stmt = (
+        select(entries.c.key, count)
+        .select_from(_S)
+        .join(entries, true())
+        .where(_S.day >= since)
+        .group_by(entries.c.key)
+        .order_by(count.desc(), entries.c.key)
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def daily_confidence_stmt(since: date) -> Select:
+    """Gunluk ortalama confidence serisi (confidence'li tahmini olan gunler)."""
+    return (
+        select(
+            _S.day,
+            (_S.confidence_sum / _S.confidence_count).label("avg_confidence"),
+            _S.confidence_count.label("count"),
+        )
+        .where(_S.day >= since, _S.confidence_count > 0)
+        .order_by(_S.day)
+    )
+
+
+def moment_stats(
+    count: int,
+    total: float | None,
+    sumsq: float | None,
+    minimum: float | None = None,
+    maximum: float | None = None,
+    include_minmax: bool = True,
+) -> dict[str, float]:
+    """
+    Toplam + kareler toplamindan mean/std (orneklem, n-1).
+
+    Eski _compute_stats ile ayni sonuc; degerler tek tek gerekmez.
+    """
+    if not count:
+        return {}
+    mean = total / count
+    variance = (sumsq - total * total / count) / max(count - 1, 1)
+    result = {"mean": round(mean, 2), "std": round(max(variance, 0.0) ** 0.5, 2)}
+    if include_minmax:
+        result["min"] = minimum
+        result["max"] = maximum
+    return result
@@ -2,6 +2,7 @@
 Model Degerlendirme Scripti — v1 LightGBM Konut Fiyat Tahmini
 
 v0 vs v1 karsilastirma, ilce bazli MAPE, guven araligi coverage analizi.
+Ozellik matrisi train_model_v1 ile ortak onbellekten okunur (feature_cache.py).
 
 Kullanim:
     cd apps/api && uv run python -m src.ml.evaluate_model_v1
@@ -12,9 +13,9 @@ from __future__ import annotations
 import json
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 from sklearn.metrics import (
     mean_absolute_error,
     mean_absolute_percentage_error,
@@ -23,7 +24,11 @@ from sklearn.metrics import (
 )
 from sklearn.model_selection import train_test_split
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 from src.ml.confidence_interval import ConfidencePredictor
+from src.ml.feature_cache import load_feature_matrix
 from src.ml.feature_engineering import FeatureEngineer
 from src.ml.trainer import ModelTrainer
 
@@ -137,33 +142,24 @@ def _evaluate_model(
 def evaluate() -> dict:
     """v0 vs v1 karsilastirmali degerlendirme."""
 
-    # 1. CSV oku
-    df_raw = pd.read_csv(CSV_PATH, encoding="utf-8")
-    print(f"[INFO] Veri yuklendi: {len(df_raw)} kayit")
+    # 1. Ozellik matrisi (train_model_v1 ile ayni onbellek; v0 ve v1 ortak)
+    fm = load_feature_matrix(CSV_PATH)
+    print(f"[INFO] Veri yuklendi: {len(fm.X)} kayit (surum {fm.version})")
 
-    # 2. v0 model yukle ve feature engineering
-    fe_v0 = FeatureEngineer()
-    trainer_v0 = ModelTrainer(fe_v0)
+    # 2. v0 ve v1 modelleri yukle
+    trainer_v0 = ModelTrainer(FeatureEngineer())
     trainer_v0.load_model(str(MODEL_DIR_V0))
-
-    X_v0, y_v0 = fe_v0.fit_transform(df_raw)
-    X_train_v0, X_test_v0, y_train_v0, y_test_v0 = train_test_split(
-        X_v0, y_v0, test_size=0.2, random_state=RANDOM_STATE,
-    )
-
-    # 3. v1 model yukle ve feature engineering
-    fe_v1 = FeatureEngineer()
-    trainer_v1 = ModelTrainer(fe_v1)
+    trainer_v1 = ModelTrainer(FeatureEngineer())
     trainer_v1.load_model(str(MODEL_DIR_V1))
 
-    X_v1, y_v1 = fe_v1.fit_transform(df_raw)
+    # 3. Ayni split (v0 ve v1 ayni test seti)
     X_train_v1, X_test_v1, y_train_v1, y_test_v1 = train_test_split(
-        X_v1, y_v1, test_size=0.2, random_state=RANDOM_STATE,
+        fm.X, fm.y, test_size=0.2, random_state=RANDOM_STATE,
     )
+    X_test_v0, y_test_v0 = X_test_v1, y_test_v1
 
     # Ilce bilgisi (ayni split)
-    df_test = df_raw.iloc[y_test_v1.index].copy().reset_index(drop=True)
-    districts = df_test["district"].values
+    districts = fm.districts[y_test_v1.index.to_numpy()]
 
     print(f"[INFO] Train: {len(X_train_v1)}, Test: {len(X_test_v1)}")
 
@@ -186,7 +182,7 @@ def evaluate() -> dict:
     print(f"  Medyan oransal aralik: {ci_metrics['median_relative_width']:.1%}")
 
     # 6. Feature importance (v1)
-    feature_names = fe_v1.get_feature_names()
+    feature_names = fm.fe.get_feature_names()
     importances = trainer_v1.model.feature_importances_.tolist()
     fi_pairs = sorted(
         zip(feature_names, importances), key=lambda x: x[1], reverse=True,
@@ -225,7 +221,7 @@ def evaluate() -> dict:
             {"feature": name, "importance": imp} for name, imp in top_15
         ],
         "data_info": {
-            "total_samples": len(df_raw),
+            "total_samples": len(fm.X),
             "train_size": len(X_train_v1),
             "test_size": len(X_test_v1),
             "feature_count": len(feature_names),
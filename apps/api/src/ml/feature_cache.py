@@ -0,0 +1,162 @@
+"""
+Ozellik Matrisi Onbellegi — Egitim / Degerlendirme Ortak Veri Hatti
+
+train_model_v1 ve evaluate_model_v1 ayni CSV'yi ayri ayri okuyup
+FeatureEngineer.fit_transform calistiriyordu (evaluate v0 ve v1 icin iki
+kez). Matris artik veri surumu basina bir kez uretilip diske yazilir:
+
+    models/feature_cache/<surum>/
+        X.npy                    — float64 ozellik matrisi
+        y.npy                    — hedef (price)
+        district.npy             — ham ilce adlari (ilce bazli degerlendirme)
+        columns.json             — sutun adlari + pandas dtype'lari
+        feature_engineer.joblib  — fit edilmis FeatureEngineer
+
+Surum = CSV iceriginin SHA-256'si + FEATURE_PIPELINE_VERSION. CSV ya da
+feature pipeline degisince yeni dizin olusur (eski dizinler elle silinir).
+
+Diziler np.load(mmap_mode="r") ile acilabilir: paralel Optuna
+process'leri matrisi pickle ile almaz, isletim sisteminin sayfa
+onbellegini paylasir.
+
+Kullanim:
+    fm = load_feature_matrix(CSV_PATH)
+    fm.X, fm.y, fm.fe, fm.districts
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.ml.feature_engineering import FeatureEngineer
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# FeatureEngineer.fit_transform ciktisi degistiginde artirilir (onbellek gecersiz olur)
+FEATURE_PIPELINE_VERSION = 1
+
+CACHE_ROOT = Path(__file__).resolve().parent / "models" / "feature_cache"
+
+
+@dataclass(slots=True)
+class FeatureMatrix:
+    """fit_transform sonucu + ilce etiketleri (CSV satir sirasiyla)."""
+
+    X: pd.DataFrame
+    y: pd.Series
+    fe: FeatureEngineer
+    districts: np.ndarray
+    version: str
+    path: Path
+
+
+def data_version(csv_path: Path) -> str:
+    """CSV icerigi + pipeline surumunden kisa onbellek anahtari."""
+    digest = hashlib.sha256()
+    digest.update(f"fe-v{FEATURE_PIPELINE_VERSION}:".encode())
+    with open(csv_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return f"{csv_path.stem}-{digest.hexdigest()[:16]}"
+
+
+def load_arrays(cache_dir: Path, mmap: bool = True) -> tuple[np.ndarray, np.ndarray, list[str], dict]:
+    """
+    Onbellek dizinindeki ham diziler (DataFrame kurulmadan).
+
+    Returns:
+        (X, y, sutun adlari, sutun dtype'lari)
+    """
+    import numpy as np
+
+    mode = "r" if mmap else None
+    meta = json.loads((cache_dir / "columns.json").read_text(encoding="utf-8"))
+    X = np.load(cache_dir / "X.npy", mmap_mode=mode)
+    y = np.load(cache_dir / "y.npy", mmap_mode=mode)
+    return X, y, meta["columns"], meta["dtypes"]
+
+
+def frame_from_arrays(
+    X: np.ndarray,
+    columns: list[str],
+    dtypes: dict[str, str],
+    rows: np.ndarray | None = None,
+) -> pd.DataFrame:
+    """Diziden fit_transform ile ayni sutun/dtype'li DataFrame (rows: satir alt kumesi)."""
+    import pandas as pd
+
+    values = X if rows is None else X[rows]
+    index = None if rows is None else pd.Index(rows)
+    return pd.DataFrame(values, columns=columns, index=index).astype(dtypes)
+
+
+def _write_cache(csv_path: Path, cache_dir: Path) -> None:
+    """CSV → fit_transform → gecici dizin → atomik rename."""
+    import numpy as np
+    import pandas as pd
+
+    df = pd.read_csv(csv_path, encoding="utf-8")
+    fe = FeatureEngineer()
+    X, y = fe.fit_transform(df)
+
+    tmp_dir = cache_dir.with_name(f".{cache_dir.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    np.save(tmp_dir / "X.npy", X.to_numpy(dtype="float64"))
+    np.save(tmp_dir / "y.npy", y.to_numpy())
+    np.save(tmp_dir / "district.npy", df["district"].astype(str).to_numpy(dtype="U"))
+    (tmp_dir / "columns.json").write_text(
+        json.dumps(
+            {"columns": X.columns.tolist(), "dtypes": {c: str(t) for c, t in X.dtypes.items()}},
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    fe.save(str(tmp_dir))
+
+    try:
+        tmp_dir.rename(cache_dir)
+    except OSError:
+        # Paralel bir calistirma ayni surumu once yazdi
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def load_feature_matrix(csv_path: Path, cache_root: Path = CACHE_ROOT) -> FeatureMatrix:
+    """
+    Veri surumunun ozellik matrisini dondurur; yoksa once uretip yazar.
+
+    Args:
+        csv_path: Egitim CSV'si.
+        cache_root: Surum dizinlerinin ust dizini.
+    """
+    import numpy as np
+    import pandas as pd
+
+    version = data_version(csv_path)
+    cache_dir = cache_root / version
+    if not (cache_dir / "columns.json").exists():
+        print(f"[CACHE] Ozellik matrisi uretiliyor: {cache_dir}")
+        cache_root.mkdir(parents=True, exist_ok=True)
+        _write_cache(csv_path, cache_dir)
+    else:
+        print(f"[CACHE] Ozellik matrisi onbellekten: {cache_dir}")
+
+    X, y, columns, dtypes = load_arrays(cache_dir, mmap=False)
+    fe = FeatureEngineer()
+    fe.load(str(cache_dir))
+    return FeatureMatrix(
+        X=frame_from_arrays(X, columns, dtypes),
+        y=pd.Series(y, name="price"),
+        fe=fe,
+        districts=np.load(cache_dir / "district.npy"),
+        version=version,
+        path=cache_dir,
+    )
@@ -2,6 +2,10 @@
 Feature Engineering Pipeline - Istanbul Konut Fiyat Tahmini
 
 Categorical encoding, turev feature uretimi ve eksik deger yonetimi.
+
+Inference'ta kategori donusumu LabelEncoder.transform yerine onceden
+hesaplanmis kategori -> kod sozlukleriyle (Series.map) vektorel yapilir;
+N satir tek seferde donusturulur.
 """
 
 from __future__ import annotations
@@ -13,6 +17,11 @@ if TYPE_CHECKING:
     import pandas as pd
     from sklearn.preprocessing import LabelEncoder
 
+CATEGORICAL_COLUMNS = ["district", "neighborhood", "property_type", "heating_type"]
+
+# Egitimde gorulmemis kategori kodu
+UNKNOWN_CATEGORY_CODE = -1
+
 
 class FeatureEngineer:
     """Egitim ve inference icin feature donusturme pipeline'i."""
@@ -20,6 +29,8 @@ class FeatureEngineer:
     def __init__(self) -> None:
         self.label_encoders: dict[str, LabelEncoder] = {}
         self.feature_columns: list[str] = []
+        # LabelEncoder.classes_ -> {kategori: kod}; fit/load'da sifirlanir
+        self._category_codes: dict[str, dict[str, int]] = {}
 
     # ------------------------------------------------------------------
     # Egitim
@@ -45,8 +56,8 @@ class FeatureEngineer:
         df = df.fillna(0)
 
         # --- Categorical encoding (Label Encoding) ---
-        categorical_cols = ["district", "neighborhood", "property_type", "heating_type"]
-        for col in categorical_cols:
+        self._category_codes.clear()
+        for col in CATEGORICAL_COLUMNS:
             le = LabelEncoder()
             df[col] = le.fit_transform(df[col].astype(str))
             self.label_encoders[col] = le
@@ -65,7 +76,7 @@ class FeatureEngineer:
     # Inference
     # ------------------------------------------------------------------
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Egitimde ogrenilenlerle yeni veri donustur."""
+        """Egitimde ogrenilenlerle yeni veri donustur (N satir tek seferde)."""
         import numpy as np
 
         df = df.copy()
@@ -78,16 +89,13 @@ class FeatureEngineer:
 
         df = df.fillna(0)
 
-        # --- Categorical encoding ---
-        categorical_cols = ["district", "neighborhood", "property_type", "heating_type"]
-        for col in categorical_cols:
-            le = self.label_encoders[col]
-            # Bilinmeyen kategoriler icin guvenli donusum
-            known = set(le.classes_)
-            df[col] = df[col].astype(str).apply(
-                lambda x, _k=known, _le=le: (
-                    _le.transform([x])[0] if x in _k else -1
-                )
+        # --- Categorical encoding (bilinmeyen kategori -> -1) ---
+        for col in CATEGORICAL_COLUMNS:
+            df[col] = (
+                df[col].astype(str)
+                .map(self._codes_for(col))
+                .fillna(UNKNOWN_CATEGORY_CODE)
+                .astype("int64")
             )
 
         # Sadece egitimde kullanilan sutunlari al (ayni sirada)
@@ -100,6 +108,15 @@ class FeatureEngineer:
     # ------------------------------------------------------------------
     # Yardimcilar
     # ------------------------------------------------------------------
+    def _codes_for(self, col: str) -> dict[str, int]:
+        """LabelEncoder.transform ile ayni kodlar: classes_ icindeki sira."""
+        codes = self._category_codes.get(col)
+        if codes is None:
+            classes = self.label_encoders[col].classes_
+            codes = {str(value): code for code, value in enumerate(classes)}
+            self._category_codes[col] = codes
+        return codes
+
     def get_feature_names(self) -> list[str]:
         return self.feature_columns
 
@@ -124,3 +141,4 @@ class FeatureEngineer:
         data = joblib.load(Path(path) / "feature_engineer.joblib")
         self.label_encoders = data["label_encoders"]
         self.feature_columns = data["feature_columns"]
+        self._category_codes.clear()
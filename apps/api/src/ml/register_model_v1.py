@@ -1,7 +1,8 @@
 """
 Model Registry v1 Kayit Scripti
 
-Egitilmis v1 modelin metriklerini okuyup model_registry_entry_v1.json olusturur.
+Egitilmis v1 modelin metriklerini okuyup model_registry_entry_v1.json olusturur
+ve API'nin yukledigi yalin serving artifact'ini (models/v1/serving/) uretir.
 
 Kullanim:
     cd apps/api && uv run python -m src.ml.register_model_v1
@@ -14,9 +15,12 @@ import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 
+from src.ml.serving_model import SERVING_DIR_NAME, export_serving_artifact
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 EVAL_JSON = SCRIPT_DIR / "evaluation_results_v1.json"
 OUTPUT_JSON = SCRIPT_DIR / "model_registry_entry_v1.json"
+MODEL_DIR = SCRIPT_DIR / "models" / "v1"
 
 
 def main() -> None:
@@ -84,12 +88,17 @@ def main() -> None:
             "lgbm_quantile_q90.joblib",
             "feature_engineer.joblib",
             "tuning_results.json",
+            f"{SERVING_DIR_NAME}/",
         ],
         "status": "active",
         "created_at": datetime.now(UTC).isoformat(),
         "updated_at": datetime.now(UTC).isoformat(),
     }
 
+    # Yalin serving artifact (mmap agac dizileri + JSON kategori haritasi)
+    serving_dir = export_serving_artifact(MODEL_DIR)
+    print(f"\n[OK] Serving artifact olusturuldu: {serving_dir}")
+
     # JSON olarak kaydet
     with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
         json.dump(entry, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,391 @@
+"""
+Yalin Serving Artifact - Istanbul Konut Fiyat Tahmini
+
+Egitim artifact'lari (lgbm_model.joblib, quantile modelleri,
+feature_engineer.joblib) pickle'dir: her uvicorn worker'i hepsini ayri ayri
+unpickle eder, LightGBM/sklearn/pandas import eder ve agaclari kendi
+heap'inde tutar. Serving icin bunlarin hicbiri gerekmez.
+
+Export (egitim ortaminda, bir kez):
+    models/v1/serving/
+        manifest.json            feature sirasi + kategori -> kod sozlukleri
+        {main,q10,q90}.txt       LightGBM native text model (arsiv / debug)
+        {main,q10,q90}/*.npy     agaclarin duz numpy dizileri
+
+Serving (her worker):
+    .npy dosyalari np.load(mmap_mode="r") ile map edilir — sayfalar
+    isletim sisteminin page cache'inden worker'lar arasinda paylasilir,
+    sadece dokunulan sayfalar diske/bellege gelir. Agaclar numpy ile
+    tum agaclar uzerinde ayni anda (N satir x T agac) yurutulur.
+    sklearn, pandas, joblib ve lightgbm import edilmez.
+
+Neden LightGBM native loader degil:
+    lgb.Booster(model_file=...) dosyayi okuyup agaclari process heap'ine
+    parse eder; map edilip paylasilamaz ve lightgbm import'u gerektirir.
+    Native text model yine de yazilir (lightgbm CLI / inceleme icin).
+
+Desteklenen modeller: tek cikisli, sayisal split'li gbdt; ham cikisli
+objective'ler (regression, quantile, ...). Kategorik split veya
+donusumlu objective (poisson, gamma, ...) export'ta reddedilir.
+
+Kullanim:
+    # Export (src/ml/register_model_v1.py)
+    export_serving_artifact("src/ml/models/v1/")
+
+    # Serving
+    model = ServingModel.load("src/ml/models/v1/serving/")
+    features = model.transform(inputs)           # list[dict] -> (N, F)
+    predicted = model.predict(features)          # ana model
+    low, high = model.predict_quantiles(features)
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from src.ml.feature_engineering import CATEGORICAL_COLUMNS, UNKNOWN_CATEGORY_CODE
+
+if TYPE_CHECKING:
+    import lightgbm as lgb
+
+    from src.ml.feature_engineering import FeatureEngineer
+
+SERVING_DIR_NAME = "serving"
+MANIFEST_FILE = "manifest.json"
+ARTIFACT_FORMAT_VERSION = 1
+
+# Ana model + %80 guven araligi quantile modelleri
+MODEL_FILES = {
+    "main": "lgbm_model.joblib",
+    "q10": "lgbm_quantile_q10.joblib",
+    "q90": "lgbm_quantile_q90.joblib",
+}
+
+# Ham skor = tahmin (cikis donusumu olmayan objective'ler)
+_IDENTITY_OBJECTIVES = {"regression", "regression_l1", "huber", "fair", "quantile", "mape"}
+
+# LightGBM missing_type kodlari (tree.h)
+_MISSING_NONE, _MISSING_ZERO, _MISSING_NAN = 0, 1, 2
+_MISSING_TYPES = {"None": _MISSING_NONE, "Zero": _MISSING_ZERO, "NaN": _MISSING_NAN}
+_ZERO_THRESHOLD = 1e-35
+
+_TREE_ARRAYS = (
+    "roots",
+    "split_feature",
+    "threshold",
+    "left_child",
+    "right_child",
+    "default_left",
+    "missing_type",
+    "leaf_value",
+)
+
+
+# ================================================================
+# Agac Toplulugu (mmap)
+# ================================================================
+
+
+class TreeEnsemble:
+    """
+    Duz dizilerle temsil edilen LightGBM agac toplulugu.
+
+    Ic dugumler tum agaclar boyunca tek dizide tutulur. Cocuk indeksi
+    >= 0 ise ic dugum, < 0 ise yaprak (~yaprak_indeksi). Tek yaprakli
+    agacin koku dogrudan yapraktir.
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray]) -> None:
+        for name in _TREE_ARRAYS:
+            # memmap alt sinifi yerine duz ndarray gorunumu (kopya yok)
+            setattr(self, name, arrays[name].view(np.ndarray))
+        self._has_zero_missing = bool((self.missing_type == _MISSING_ZERO).any())
+
+    @property
+    def num_trees(self) -> int:
+        return len(self.roots)
+
+    @classmethod
+    def from_booster(cls, booster: lgb.Booster) -> TreeEnsemble:
+        """Booster.dump_model() JSON'undan duz diziler olusturur."""
+        dump = booster.dump_model()
+        objective = str(dump.get("objective", "")).split()[0]
+        if objective not in _IDENTITY_OBJECTIVES:
+            msg = f"Desteklenmeyen objective: {objective!r}"
+            raise ValueError(msg)
+        if dump.get("num_tree_per_iteration", 1) != 1 or dump.get("average_output"):
+            msg = "Sadece tek cikisli gbdt modelleri desteklenir"
+            raise ValueError(msg)
+
+        nodes: dict[str, list] = {
+            "split_feature": [], "threshold": [], "left_child": [],
+            "right_child": [], "default_left": [], "missing_type": [],
+        }
+        leaf_values: list[float] = []
+
+        def _walk(node: dict[str, Any]) -> int:
+            if "leaf_value" in node:
+                leaf_values.append(float(node["leaf_value"]))
+                return ~(len(leaf_values) - 1)
+            if node.get("decision_type") != "<=":
+                msg = "Kategorik split iceren modeller desteklenmez"
+                raise ValueError(msg)
+
+            index = len(nodes["split_feature"])
+            nodes["split_feature"].append(int(node["split_feature"]))
+            nodes["threshold"].append(float(node["threshold"]))
+            nodes["default_left"].append(bool(node["default_left"]))
+            nodes["missing_type"].append(_MISSING_TYPES[node["missing_type"]])
+            nodes["left_child"].append(0)
+            nodes["right_child"].append(0)
+            nodes["left_child"][index] = _walk(node["left_child"])
+            nodes["right_child"][index] = _walk(node["right_child"])
+            return index
+
+        roots = [_walk(tree["tree_structure"]) for tree in dump["tree_info"]]
+
+        return cls({
+            "roots": np.asarray(roots, dtype=np.int32),
+            "split_feature": np.asarray(nodes["split_feature"], dtype=np.int32),
+            "threshold": np.asarray(nodes["threshold"], dtype=np.float64),
+            "left_child": np.asarray(nodes["left_child"], dtype=np.int32),
+            "right_child": np.asarray(nodes["right_child"], dtype=np.int32),
+            "default_left": np.asarray(nodes["default_left"], dtype=np.bool_),
+            "missing_type": np.asarray(nodes["missing_type"], dtype=np.uint8),
+            "leaf_value": np.asarray(leaf_values, dtype=np.float64),
+        })
+
+    def save(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        for name in _TREE_ARRAYS:
+            np.save(path / f"{name}.npy", getattr(self, name))
+
+    @classmethod
+    def load(cls, path: Path) -> TreeEnsemble:
+        """Dizileri salt-okunur map eder (worker'lar arasi paylasilan sayfalar)."""
+        return cls({name: np.load(path / f"{name}.npy", mmap_mode="r") for name in _TREE_ARRAYS})
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """
+        (N, F) float64 feature matrisi icin ham tahmin (N,).
+
+        LightGBM NumericalDecision ile ayni karar: NaN (missing_type NaN
+        degilse) 0 sayilir; missing ise default_left, degilse
+        deger <= threshold → sol.
+        """
+        n_rows = features.shape[0]
+        if n_rows == 0 or self.num_trees == 0:
+            return np.zeros(n_rows, dtype=np.float64)
+
+        # Duz (N*T) dizi: satir r, agac t → r*T + t; sadece yapraga ulasmamis
+        # pozisyonlar her adimda bir sonraki dugume ilerletilir
+        node = np.tile(self.roots, n_rows)
+        row_offset = np.repeat(np.arange(n_rows) * features.shape[1], self.num_trees)
+        flat = np.ascontiguousarray(features, dtype=np.float64).ravel()
+        # Eksik deger kurali sadece NaN girdi veya Zero-missing split varsa gerekir
+        check_missing = self._has_zero_missing or bool(np.isnan(flat).any())
+
+        pos = np.flatnonzero(node >= 0)
+        while pos.size:
+            idx = node[pos]
+            fval = flat[row_offset[pos] + self.split_feature[idx]]
+            go_left = fval <= self.threshold[idx]
+            if check_missing:
+                go_left = self._missing_decision(idx, fval, go_left)
+
+            next_node = np.where(go_left, self.left_child[idx], self.right_child[idx])
+            node[pos] = next_node
+            pos = pos[next_node >= 0]
+
+        leaf_values = self.leaf_value[~node].reshape(n_rows, self.num_trees)
+        # cumsum soldan saga toplar — LightGBM ile ayni toplama sirasi
+        return np.cumsum(leaf_values, axis=1)[:, -1]
+
+    def _missing_decision(
+        self, idx: np.ndarray, fval: np.ndarray, go_left: np.ndarray,
+    ) -> np.ndarray:
+        missing_type = self.missing_type[idx]
+        is_nan = np.isnan(fval)
+        fval = np.where(is_nan & (missing_type != _MISSING_NAN), 0.0, fval)
+        is_missing = (
+            ((missing_type == _MISSING_ZERO) & (np.abs(fval) <= _ZERO_THRESHOLD))
+            | ((missing_type == _MISSING_NAN) & is_nan)
+        )
+        go_left = np.where(is_nan, fval <= self.threshold[idx], go_left)
+        return np.where(is_missing, self.default_left[idx], go_left)
+
+
+# ================================================================
+# Serving Modeli
+# ================================================================
+
+
+class ServingModel:
+    """Feature donusumu + ana model + (opsiyonel) quantile modelleri."""
+
+    def __init__(
+        self,
+        feature_columns: list[str],
+        category_codes: dict[str, dict[str, int]],
+        main: TreeEnsemble,
+        q10: TreeEnsemble | None = None,
+        q90: TreeEnsemble | None = None,
+    ) -> None:
+        self.feature_columns = feature_columns
+        self.category_codes = category_codes
+        self.main = main
+        self.q10 = q10
+        self.q90 = q90
+
+    @property
+    def has_confidence(self) -> bool:
+        return self.q10 is not None and self.q90 is not None
+
+    @classmethod
+    def load(cls, serving_dir: str | Path) -> ServingModel:
+        p = Path(serving_dir)
+        with open(p / MANIFEST_FILE, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        if manifest.get("format_version") != ARTIFACT_FORMAT_VERSION:
+            msg = f"Desteklenmeyen serving artifact surumu: {manifest.get('format_version')}"
+            raise ValueError(msg)
+
+        models = manifest["models"]
+        return cls(
+            feature_columns=manifest["feature_columns"],
+            category_codes=manifest["category_codes"],
+            main=TreeEnsemble.load(p / "main"),
+            q10=TreeEnsemble.load(p / "q10") if "q10" in models else None,
+            q90=TreeEnsemble.load(p / "q90") if "q90" in models else None,
+        )
+
+    def transform(self, inputs: list[dict]) -> np.ndarray:
+        """
+        FeatureEngineer.transform ile ayni feature matrisi (pandas'siz).
+
+        Turev feature'lar, eksik deger → 0, kategori → kod (bilinmeyen -1),
+        egitimde olmayan sutun → 0.
+        """
+        features = np.zeros((len(inputs), len(self.feature_columns)), dtype=np.float64)
+        for row, input_data in enumerate(inputs):
+            values = dict(input_data)
+            net_sqm = _num(values.get("net_sqm"))
+            total_rooms = _num(values.get("room_count")) + _num(values.get("living_room_count"))
+            values["sqm_ratio"] = _ratio(net_sqm, _num(values.get("gross_sqm")))
+            values["floor_ratio"] = _ratio(_num(values.get("floor")), _num(values.get("total_floors")))
+            values["total_rooms"] = total_rooms
+            values["rooms_per_sqm"] = _ratio(total_rooms, net_sqm)
+
+            for index, col in enumerate(self.feature_columns):
+                value = values.get(col)
+                if col in self.category_codes:
+                    label = "0" if _is_missing(value) else str(value)
+                    features[row, index] = self.category_codes[col].get(
+                        label, UNKNOWN_CATEGORY_CODE,
+                    )
+                else:
+                    number = _num(value)
+                    features[row, index] = 0.0 if math.isnan(number) else number
+        return features
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        return self.main.predict(features)
+
+    def predict_quantiles(self, features: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if not self.has_confidence:
+            raise RuntimeError("Quantile modelleri serving artifact'inda yok.")
+        return self.q10.predict(features), self.q90.predict(features)
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _num(value: Any) -> float:
+    """pandas sayisal kolon semantigi: None/eksik → NaN."""
+    if _is_missing(value):
+        return math.nan
+    return float(value)
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    # pandas: payda 0 → NaN → fillna(0)
+    if denominator == 0 or math.isnan(denominator) or math.isnan(numerator):
+        return math.nan
+    return numerator / denominator
+
+
+# ================================================================
+# Export
+# ================================================================
+
+
+def export_serving_artifact(model_dir: str | Path) -> Path:
+    """
+    Egitim artifact'larindan serving artifact'i uretir.
+
+    Args:
+        model_dir: lgbm_model.joblib + feature_engineer.joblib (+ quantile
+            modelleri) iceren dizin.
+
+    Returns:
+        Yazilan serving dizini (model_dir/serving).
+    """
+    import joblib
+
+    from src.ml.feature_engineering import FeatureEngineer
+
+    p = Path(model_dir)
+    out = p / SERVING_DIR_NAME
+    out.mkdir(parents=True, exist_ok=True)
+
+    fe = FeatureEngineer()
+    fe.load(str(p))
+
+    exported: dict[str, dict[str, Any]] = {}
+    for name, filename in MODEL_FILES.items():
+        if not (p / filename).exists():
+            continue
+        model = joblib.load(p / filename)
+        booster = model.booster_
+        # LGBMRegressor.predict early stopping varsa best_iteration'a kadar kullanir
+        num_iteration = getattr(model, "best_iteration_", None) or None
+
+        booster.save_model(str(out / f"{name}.txt"), num_iteration=num_iteration)
+        ensemble = TreeEnsemble.from_booster(_truncated(booster, num_iteration))
+        ensemble.save(out / name)
+        exported[name] = {"source": filename, "num_trees": ensemble.num_trees}
+
+    if "main" not in exported:
+        msg = f"Ana model bulunamadi: {p / MODEL_FILES['main']}"
+        raise FileNotFoundError(msg)
+
+    manifest = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "feature_columns": fe.feature_columns,
+        "category_codes": _category_code_map(fe),
+        "models": exported,
+    }
+    with open(out / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    return out
+
+
+def _truncated(booster: lgb.Booster, num_iteration: int | None) -> lgb.Booster:
+    if num_iteration is None:
+        return booster
+    import lightgbm as lgb
+
+    return lgb.Booster(model_str=booster.model_to_string(num_iteration=num_iteration))
+
+
+def _category_code_map(fe: FeatureEngineer) -> dict[str, dict[str, int]]:
+    """LabelEncoder.classes_ sirasi → {kategori: kod} (FeatureEngineer._codes_for ile ayni)."""
+    return {col: fe._codes_for(col) for col in CATEGORICAL_COLUMNS if col in fe.label_encoders}
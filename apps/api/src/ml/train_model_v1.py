@@ -8,6 +8,15 @@ v0'dan farklar:
   - Quantile regression modelleri (guven araligi icin q=0.10, q=0.90)
   - v0 modeli korunur, v1 ayri dizine kaydedilir
 
+Egitim suresi:
+  - Ozellik matrisi veri surumu basina bir kez uretilir (feature_cache.py);
+    evaluate_model_v1 ayni onbellegi okur.
+  - Optuna trial'lari process havuzunda paralel calisir (ask/tell).
+    Worker'lar matrisi onbellekten mmap ile acar; LightGBM thread sayisi
+    trial basina LGBM_THREADS ile sinirlanir (oversubscription yok).
+  - Final model ve q10/q90 quantile modelleri thread havuzunda ayni anda
+    egitilir (LightGBM fit sirasinda GIL'i birakir).
+
 Kullanim:
     cd apps/api && uv run python -m src.ml.train_model_v1
 """
@@ -15,7 +24,16 @@ Kullanim:
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
 import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
 
 import joblib
@@ -31,7 +49,7 @@ from sklearn.metrics import (
 )
 from sklearn.model_selection import KFold, cross_val_score, train_test_split
 
-from src.ml.feature_engineering import FeatureEngineer
+from src.ml.feature_cache import frame_from_arrays, load_arrays, load_feature_matrix
 
 # Optuna log seviyesi — sadece en iyi sonuclari goster
 optuna.logging.set_verbosity(optuna.logging.WARNING)
@@ -48,45 +66,107 @@ TEST_SIZE = 0.2
 N_FOLDS = 3  # 3-fold CV hiz icin (5-fold cok yavas)
 N_TRIALS = 10  # 10 TPE trial — yakinsamaya yeterli, makul sure
 
+# Paralellik — toplam LightGBM thread'i CPU sayisini asmaz
+CPU_COUNT = os.cpu_count() or 1
+N_PARALLEL_TRIALS = max(1, min(4, CPU_COUNT // 2))  # es zamanli Optuna trial (process)
+LGBM_THREADS = max(1, CPU_COUNT // N_PARALLEL_TRIALS)  # trial basina LightGBM thread
+FINAL_THREADS = max(1, CPU_COUNT // 3)  # final + q10 + q90 ayni anda
+
+# Trial worker process'inin egitim verisi (_init_trial_worker doldurur)
+_worker_data: dict[str, pd.DataFrame | pd.Series] = {}
+
+
+def _trial_params(trial: optuna.Trial) -> dict:
+    """Optuna arama uzayi → LGBMRegressor parametreleri."""
+    return {
+        "objective": "regression",
+        "metric": "mae",
+        "boosting_type": "gbdt",
+        "verbose": -1,
+        "random_state": RANDOM_STATE,
+        "n_jobs": LGBM_THREADS,
+        # Tuning parametreleri
+        "num_leaves": trial.suggest_int("num_leaves", 31, 127),
+        "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.1, log=True),
+        "n_estimators": trial.suggest_int("n_estimators", 300, 800, step=100),
+        "min_child_samples": trial.suggest_int("min_child_samples", 5, 30),
+        "subsample": trial.suggest_float("subsample", 0.6, 0.95),
+        "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 0.95),
+        "reg_alpha": trial.suggest_float("reg_alpha", 1e-3, 10.0, log=True),
+        "reg_lambda": trial.suggest_float("reg_lambda", 1e-3, 10.0, log=True),
+    }
+
+
+def _init_trial_worker(cache_dir: str, train_idx: np.ndarray) -> None:
+    """Worker process baslangici: egitim satirlari onbellekten (mmap) bir kez okunur."""
+    X, y, columns, dtypes = load_arrays(Path(cache_dir), mmap=True)
+    _worker_data["X"] = frame_from_arrays(X, columns, dtypes, rows=train_idx)
+    _worker_data["y"] = pd.Series(y[train_idx], index=train_idx, name="price")
 
-def _create_objective(
-    X_train: pd.DataFrame,
-    y_train: pd.Series,
-) -> callable:
-    """Optuna objective factory — closure ile veri yakala."""
 
+def _cv_mape(params: dict) -> float:
+    """Tek trial: egitim seti uzerinde K-fold CV MAPE (worker process'te)."""
     kf = KFold(n_splits=N_FOLDS, shuffle=True, random_state=RANDOM_STATE)
+    cv_scores = cross_val_score(
+        lgb.LGBMRegressor(**params),
+        _worker_data["X"],
+        _worker_data["y"],
+        cv=kf,
+        scoring="neg_mean_absolute_percentage_error",
+    )
+    return float(-cv_scores.mean())
 
-    def objective(trial: optuna.Trial) -> float:
-        params = {
-            "objective": "regression",
-            "metric": "mae",
-            "boosting_type": "gbdt",
-            "verbose": -1,
-            "random_state": RANDOM_STATE,
-            # Tuning parametreleri
-            "num_leaves": trial.suggest_int("num_leaves", 31, 127),
-            "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.1, log=True),
-            "n_estimators": trial.suggest_int("n_estimators", 300, 800, step=100),
-            "min_child_samples": trial.suggest_int("min_child_samples", 5, 30),
-            "subsample": trial.suggest_float("subsample", 0.6, 0.95),
-            "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 0.95),
-            "reg_alpha": trial.suggest_float("reg_alpha", 1e-3, 10.0, log=True),
-            "reg_lambda": trial.suggest_float("reg_lambda", 1e-3, 10.0, log=True),
-        }
-
-        # 5-fold CV ile MAPE hesapla
-        cv_scores = cross_val_score(
-            lgb.LGBMRegressor(**params),
-            X_train,
-            y_train,
-            cv=kf,
-            scoring="neg_mean_absolute_percentage_error",
-        )
-        cv_mape = -cv_scores.mean()
-        return cv_mape
 
-    return objective
+def _run_study(study: optuna.Study, cache_dir: Path, train_idx: np.ndarray) -> None:
+    """
+    N_TRIALS trial'i en fazla N_PARALLEL_TRIALS es zamanli calistirir.
+
+    ask/tell: ornekleme ana process'te (tek study, tek sampler), CV
+    worker'larda. Biten her trial hemen tell edilir, yerine yenisi istenir.
+    """
+    # spawn: OpenMP kullanan process'i fork etmek LightGBM'i kilitleyebilir
+    with ProcessPoolExecutor(
+        max_workers=N_PARALLEL_TRIALS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_trial_worker,
+        initargs=(str(cache_dir), train_idx),
+    ) as pool:
+        pending: dict[Future, optuna.Trial] = {}
+        asked = 0
+        while asked < N_TRIALS or pending:
+            while asked < N_TRIALS and len(pending) < N_PARALLEL_TRIALS:
+                trial = study.ask()
+                pending[pool.submit(_cv_mape, _trial_params(trial))] = trial
+                asked += 1
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                trial = pending.pop(future)
+                cv_mape = future.result()
+                study.tell(trial, cv_mape)
+                print(f"  trial {trial.number:3d}: CV MAPE {cv_mape:.4%}")
+
+
+def _fit_with_early_stopping(
+    params: dict,
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_test: pd.DataFrame,
+    y_test: pd.Series,
+) -> lgb.LGBMRegressor:
+    """Sinirli thread ile early-stopping fit; kaydedilen model varsayilan n_jobs'a doner."""
+    model = lgb.LGBMRegressor(**params, n_jobs=FINAL_THREADS)
+    model.fit(
+        X_train, y_train,
+        eval_set=[(X_test, y_test)],
+        callbacks=[
+            lgb.early_stopping(stopping_rounds=50, verbose=False),
+            lgb.log_evaluation(period=0),
+        ],
+    )
+    # Inference (serving_model) egitimdeki thread sinirini devralmasin
+    model.set_params(n_jobs=None)
+    return model
 
 
 def _train_quantile_model(
@@ -111,17 +191,7 @@ def _train_quantile_model(
         "alpha": alpha,
         "metric": "quantile",
     }
-
-    model = lgb.LGBMRegressor(**q_params)
-    model.fit(
-        X_train, y_train,
-        eval_set=[(X_test, y_test)],
-        callbacks=[
-            lgb.early_stopping(stopping_rounds=50),
-            lgb.log_evaluation(period=0),
-        ],
-    )
-    return model
+    return _fit_with_early_stopping(q_params, X_train, y_train, X_test, y_test)
 
 
 def train_v1() -> dict:
@@ -134,14 +204,12 @@ def train_v1() -> dict:
     print("  Optuna Hyperparameter Tuning + Quantile Regression")
     print("=" * 60)
 
-    # 1. Veri yukle
-    df = pd.read_csv(CSV_PATH, encoding="utf-8")
-    print(f"\n[INFO] Veri yuklendi: {len(df)} kayit, {len(df.columns)} sutun")
-
-    # 2. Feature engineering
-    fe = FeatureEngineer()
-    X, y = fe.fit_transform(df)
+    # 1-2. Veri + feature engineering (veri surumu basina onbellekli)
+    fm = load_feature_matrix(CSV_PATH)
+    X, y, fe = fm.X, fm.y, fm.fe
+    print(f"\n[INFO] Veri yuklendi: {len(X)} kayit (surum {fm.version})")
     print(f"[INFO] Feature sayisi: {len(fe.get_feature_names())}")
+    prepare_seconds = time.time() - start_time
 
     # 3. Train/test split (v0 ile ayni seed)
     X_train, X_test, y_train, y_test = train_test_split(
@@ -154,8 +222,10 @@ def train_v1() -> dict:
     # ==========================================================
     print(f"\n{'='*60}")
     print(f"[OPTUNA] {N_TRIALS} trial ile hyperparameter tuning baslatiliyor...")
-    print("  5-fold CV, Bayesian optimization (TPE sampler)")
+    print(f"  {N_FOLDS}-fold CV, Bayesian optimization (TPE sampler)")
+    print(f"  {N_PARALLEL_TRIALS} paralel trial x {LGBM_THREADS} LightGBM thread")
     print(f"{'='*60}")
+    optuna_start = time.time()
 
     study = optuna.create_study(
         direction="minimize",
@@ -163,11 +233,12 @@ def train_v1() -> dict:
         study_name="lgbm_konut_fiyat_v1",
     )
 
-    objective = _create_objective(X_train, y_train)
-    study.optimize(objective, n_trials=N_TRIALS, show_progress_bar=True)
+    # X ve y RangeIndex: train index'i = onbellekteki satir pozisyonlari
+    _run_study(study, fm.path, X_train.index.to_numpy())
 
     best_params = study.best_params
     best_cv_mape = study.best_value
+    optuna_seconds = time.time() - optuna_start
 
     print("\n[OPTUNA SONUC]")
     print(f"  En iyi CV MAPE: {best_cv_mape:.4%}")
@@ -176,11 +247,13 @@ def train_v1() -> dict:
         print(f"    {k:25s}: {v}")
 
     # ==========================================================
-    # 5. FINAL MODEL EGITIMI (en iyi parametrelerle)
+    # 5. FINAL MODEL + QUANTILE MODELLER (ayni anda)
     # ==========================================================
     print(f"\n{'='*60}")
-    print("[FINAL] En iyi parametrelerle final model egitiliyor...")
+    print("[FINAL] Final model ve q=0.10 / q=0.90 modeller paralel egitiliyor...")
+    print("  %80 guven araligi icin alt/ust sinir modelleri")
     print(f"{'='*60}")
+    final_start = time.time()
 
     final_params = {
         "objective": "regression",
@@ -190,16 +263,28 @@ def train_v1() -> dict:
         "random_state": RANDOM_STATE,
         **best_params,
     }
+    # Quantile parametreleri: final regression params'i baz al
+    q_base_params = {
+        "boosting_type": "gbdt",
+        "verbose": -1,
+        "random_state": RANDOM_STATE,
+        **best_params,
+    }
 
-    model = lgb.LGBMRegressor(**final_params)
-    model.fit(
-        X_train, y_train,
-        eval_set=[(X_test, y_test)],
-        callbacks=[
-            lgb.early_stopping(stopping_rounds=50),
-            lgb.log_evaluation(period=0),
-        ],
-    )
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        main_future = pool.submit(
+            _fit_with_early_stopping, final_params, X_train, y_train, X_test, y_test,
+        )
+        q10_future = pool.submit(
+            _train_quantile_model, X_train, y_train, X_test, y_test, q_base_params, 0.10,
+        )
+        q90_future = pool.submit(
+            _train_quantile_model, X_train, y_train, X_test, y_test, q_base_params, 0.90,
+        )
+        model = main_future.result()
+        model_q10 = q10_future.result()
+        model_q90 = q90_future.result()
+    final_seconds = time.time() - final_start
 
     # 6. Test metrikleri
     y_pred = model.predict(X_test)
@@ -216,13 +301,14 @@ def train_v1() -> dict:
     print(f"  R2:         {r2:>15.4f}")
     print(f"  MAPE:       {mape:>15.2%}")
 
-    # 7. 5-fold CV (final model, best_iteration ile)
-    cv_params = {**final_params, "n_estimators": model.best_iteration_}
+    # 7. 5-fold CV (final model, best_iteration ile) — fold'lar paralel
+    cv_params = {**final_params, "n_estimators": model.best_iteration_, "n_jobs": LGBM_THREADS}
     cv_scores = cross_val_score(
         lgb.LGBMRegressor(**cv_params),
         X, y,
         cv=N_FOLDS,
         scoring="neg_mean_absolute_percentage_error",
+        n_jobs=min(N_FOLDS, N_PARALLEL_TRIALS),
     )
     cv_mape = -cv_scores.mean()
     cv_std = float(cv_scores.std())
@@ -244,31 +330,8 @@ def train_v1() -> dict:
         print(f"  {name:25s} {imp:6d}")
 
     # ==========================================================
-    # 9. QUANTILE REGRESSION MODELLERI (guven araligi)
+    # 9. QUANTILE MODELLER — coverage kontrolu (guven araligi)
     # ==========================================================
-    print(f"\n{'='*60}")
-    print("[QUANTILE] q=0.10 ve q=0.90 modeller egitiliyor...")
-    print("  %80 guven araligi icin alt/ust sinir modelleri")
-    print(f"{'='*60}")
-
-    # Quantile parametreleri: final regression params'i baz al
-    q_base_params = {
-        "boosting_type": "gbdt",
-        "verbose": -1,
-        "random_state": RANDOM_STATE,
-        **best_params,
-    }
-
-    model_q10 = _train_quantile_model(
-        X_train, y_train, X_test, y_test,
-        q_base_params, alpha=0.10,
-    )
-    model_q90 = _train_quantile_model(
-        X_train, y_train, X_test, y_test,
-        q_base_params, alpha=0.90,
-    )
-
-    # Quantile modellerin coverage kontrolu
     q10_pred = model_q10.predict(X_test)
     q90_pred = model_q90.predict(X_test)
     y_test_arr = y_test.values
@@ -307,7 +370,9 @@ def train_v1() -> dict:
         "best_cv_mape": best_cv_mape,
         "n_trials": N_TRIALS,
         "n_folds": N_FOLDS,
+        "n_parallel_trials": N_PARALLEL_TRIALS,
         "best_iteration": model.best_iteration_,
+        "data_version": fm.version,
     }
     with open(MODEL_DIR_V1 / "tuning_results.json", "w", encoding="utf-8") as f:
         json.dump(tuning_results, f, indent=2, ensure_ascii=False)
@@ -349,6 +414,12 @@ def train_v1() -> dict:
             "confidence_level": 0.80,
         },
         "training_time_seconds": round(elapsed, 1),
+        "stage_seconds": {
+            "prepare": round(prepare_seconds, 1),
+            "optuna": round(optuna_seconds, 1),
+            "final_and_quantile": round(final_seconds, 1),
+        },
+        "data_version": fm.version,
     }
 
     # Hedef kontrol
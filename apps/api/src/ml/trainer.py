@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 
 from src.ml.feature_engineering import FeatureEngineer  # noqa: TC001 — runtime
 
+# Basit sabit guven skoru (ileride gelistirilebilir)
+DEFAULT_CONFIDENCE = 0.85
+
 
 class ModelTrainer:
     """LightGBM regresyon modeli egitim ve tahmin sinifi."""
@@ -157,7 +160,7 @@ class ModelTrainer:
 
         return {
             "estimated_price": round(float(prediction)),
-            "confidence": 0.85,  # Basit sabit guven skoru (ileride gelistirilebilir)
+            "confidence": DEFAULT_CONFIDENCE,
         }
 
     def save_model(self, path: str) -> None:
@@ -13,13 +13,14 @@ from src.models.customer import Customer
 from src.models.customer_note import CustomerNote
 from src.models.deprem_risk import DepremRisk
 from src.models.inbox_event import InboxEvent
-from src.models.match import PropertyCustomerMatch
+from src.models.match import MatchRematchState, PropertyCustomerMatch
 from src.models.message import Conversation, Message
 from src.models.model_registry import ModelRegistry
 from src.models.notification import Notification
 from src.models.office import Office
 from src.models.outbox_event import OutboxEvent
 from src.models.payment import Payment
+from src.models.prediction_daily_stats import PredictionDailyStats
 from src.models.prediction_log import PredictionLog
 from src.models.price_history import PriceHistory
 from src.models.property import Property
@@ -28,6 +29,7 @@ from src.models.showcase import Showcase
 from src.models.subscription import Subscription
 from src.models.user import User
 from src.models.valuation import PropertyValuation
+from src.models.valuation_snapshot import ValuationSnapshot, ValuationSnapshotRun
 from src.modules.valuations.models.usage_quota import UsageQuota
 
 __all__ = [
@@ -40,12 +42,14 @@ __all__ = [
     "CustomerNote",
     "DepremRisk",
     "InboxEvent",
+    "MatchRematchState",
     "Message",
     "ModelRegistry",
     "Notification",
     "Office",
     "OutboxEvent",
     "Payment",
+    "PredictionDailyStats",
     "PredictionLog",
     "PriceHistory",
     "Property",
@@ -58,4 +62,6 @@ __all__ = [
     "TenantMixin",
     "UsageQuota",
     "User",
+    "ValuationSnapshot",
+    "ValuationSnapshotRun",
 ]
@@ -30,6 +30,13 @@ class Customer(BaseModel, TenantMixin):
         Index("ix_customers_office_id_lead_status", "office_id", "lead_status"),
         Index("ix_customers_agent_id", "agent_id"),
         Index("ix_customers_customer_type", "customer_type"),
+        Index("ix_customers_office_updated", "office_id", "updated_at"),
+        # Eşleştirme adayları: ofis bazlı sadece buyer/renter taraması
+        Index(
+            "ix_customers_office_match_candidates",
+            "office_id",
+            postgresql_where=text("customer_type IN ('buyer', 'renter')"),
+        ),
     )
 
     # ---------- Tenant ----------
@@ -10,7 +10,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, text
+from sqlalchemy import DateTime, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -26,6 +26,14 @@ class InboxEvent(BaseModel):
     """
 
     __tablename__ = "inbox_events"
+    __table_args__ = (
+        # Arşivleme taraması: yalnızca işlenmiş event'ler taşınır
+        Index(
+            "ix_inbox_events_processed_created",
+            "created_at",
+            postgresql_where=text("status = 'processed'"),
+        ),
+    )
 
     # ---------- Tenant (NULLABLE) ----------
     office_id: Mapped[uuid.UUID | None] = mapped_column(
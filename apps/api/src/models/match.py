@@ -3,6 +3,8 @@ Emlak Teknoloji Platformu - Property-Customer Match Model
 
 İlan-Müşteri eşleştirme entity'si — ofis bazlı multi-tenant.
 Score tabanlı eşleştirme ve durum takibi.
+
+MatchRematchState: Ofis bazlı toplu eşleştirmenin watermark kaydı.
 """
 
 from __future__ import annotations
@@ -23,6 +25,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from src.database import Base
 from src.models.base import BaseModel, TenantMixin
 
 
@@ -100,3 +103,37 @@ class PropertyCustomerMatch(BaseModel, TenantMixin):
     property = relationship("Property", lazy="selectin")
     customer = relationship("Customer", lazy="selectin")
     office = relationship("Office", lazy="selectin")
+
+
+class MatchRematchState(Base):
+    """
+    Ofis bazlı toplu eşleştirme durumu (rematch_office).
+
+    Bir sonraki çalıştırma sadece watermark'tan sonra güncellenen
+    ilan/müşterileri yeniden skorlar. scoring_version ağırlık/eşik
+    özetidir; değiştiyse tam yeniden hesaplama yapılır.
+
+    BaseModel kullanılmaz — ofis başına tek satır, PK = office_id.
+    """
+
+    __tablename__ = "match_rematch_states"
+
+    office_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("offices.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Ofis (tenant) ID",
+    )
+    scoring_version: Mapped[str] = mapped_column(
+        String(64), nullable=False,
+        comment="Skor ağırlıkları + eşik özeti",
+    )
+    watermark: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False,
+        comment="Son başarılı çalıştırmanın başlangıç zamanı",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False,
+        server_default=text("now()"),
+        onupdate=text("now()"),
+    )
@@ -18,7 +18,9 @@ class ModelRegistry(BaseModel):
     ML model kayıt defteri.
 
     Her model + versiyon kombinasyonu benzersizdir (uq_model_registry_name_version).
-    Durumlar (status): active, archived, deprecated
+    Durumlar (status): active, shadow, archived, deprecated
+      - active: API'nin kullandığı model (hot swap — valuations/model_watcher.py)
+      - shadow: aday model; trafiğin bir kısmı paralel skorlanır, fark loglanır
     """
 
     __tablename__ = "model_registry"
@@ -27,7 +27,25 @@ class OutboxEvent(BaseModel, TenantMixin):
 
     __tablename__ = "outbox_events"
     __table_args__ = (
-        Index("ix_outbox_status_next_retry", "status", "next_retry_at"),
+        # Partial index'ler: yalnızca aktif durumlar (sent satırlar arşive taşınır)
+        # Claim (ORDER BY created_at) + lag metrikleri
+        Index(
+            "ix_outbox_pending_created",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # Stuck event tespiti
+        Index(
+            "ix_outbox_processing_locked",
+            "locked_at",
+            postgresql_where=text("status = 'processing'"),
+        ),
+        # DLQ listeleme / purge
+        Index(
+            "ix_outbox_errors_created",
+            "created_at",
+            postgresql_where=text("status IN ('failed', 'dead_letter')"),
+        ),
         Index("ix_outbox_aggregate", "aggregate_type", "aggregate_id"),
     )
 
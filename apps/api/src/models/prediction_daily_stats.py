@@ -0,0 +1,77 @@
+"""
+Emlak Teknoloji Platformu - Prediction Daily Stats Model
+
+prediction_logs'un günlük (UTC) özet tablosu — drift raporu bu tablodan
+okunur, ham log taranmaz. Toplamlar ve kareler toplamı günler arasında
+toplanabilir: ortalama/standart sapma herhangi bir pencere için SQL'de
+hesaplanır.
+
+Bakım: src/ml/drift_stats.py rollup_prediction_stats (Celery beat).
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Date, DateTime, Float, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+
+
+class PredictionDailyStats(Base):
+    """
+    Günlük tahmin özeti (tüm ofisler).
+
+    BaseModel kullanılmaz — gün başına tek satır, PK = day. Tenant
+    bağımsızdır (model drift'i global), RLS yok.
+    """
+
+    __tablename__ = "prediction_daily_stats"
+
+    day: Mapped[date] = mapped_column(
+        Date, primary_key=True, comment="Tahmin günü (UTC)",
+    )
+    prediction_count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, comment="Toplam tahmin sayısı",
+    )
+
+    # ---------- Model metrikleri ----------
+    confidence_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    confidence_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    latency_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    latency_sum: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # ---------- Girdi dağılımı (toplam + kareler toplamı) ----------
+    net_sqm_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    net_sqm_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    net_sqm_sumsq: Mapped[float] = mapped_column(Float, nullable=False)
+    net_sqm_min: Mapped[float | None] = mapped_column(Float, nullable=True)
+    net_sqm_max: Mapped[float | None] = mapped_column(Float, nullable=True)
+    building_age_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    building_age_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    building_age_sumsq: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # ---------- Tahmin fiyatı ----------
+    price_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    price_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    price_min: Mapped[float | None] = mapped_column(Float, nullable=True)
+    price_max: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    # ---------- Histogramlar ----------
+    room_histogram: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, server_default=text("'{}'::jsonb"),
+        comment='Oda tipi → adet ({"3+1": 120, "5+": 8})',
+    )
+    district_histogram: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, server_default=text("'{}'::jsonb"),
+        comment="İlçe → adet",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+        comment="Son rollup zamanı",
+    )
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import Float, ForeignKey, Index, Integer, String
+from sqlalchemy import Boolean, Float, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -27,6 +27,8 @@ class PredictionLog(TenantMixin, BaseModel):
     __table_args__ = (
         Index("ix_prediction_logs_model_time", "model_name", "model_version", "created_at"),
         Index("ix_prediction_logs_office_id", "office_id"),
+        # Günlük drift özeti rollup'ı (drift_stats.py) — tarih aralığı taraması
+        Index("ix_prediction_logs_created_at", "created_at"),
     )
 
     # ---------- Tenant ----------
@@ -60,3 +62,7 @@ class PredictionLog(TenantMixin, BaseModel):
     latency_ms: Mapped[int | None] = mapped_column(
         Integer, nullable=True,
     )
+    cache_hit: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=text("false"),
+        comment="Sonuç değerleme cache'inden mi döndü",
+    )
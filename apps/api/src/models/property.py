@@ -6,15 +6,64 @@ Emlak ilanı entity'si — platformun ana veri modeli.
 
 from __future__ import annotations
 
+import re
 import uuid
+from typing import Any
 
 from geoalchemy2 import Geography
-from sqlalchemy import Boolean, ForeignKey, Index, Integer, Numeric, String, Text, text
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    Computed,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import BaseModel, TenantMixin
 
+# Türkçe karakterleri ASCII'ye katlayan arama anahtarı. turkish_normalize()
+# (migration 013) ile aynı sonucu verir ama yalnızca yerleşik IMMUTABLE
+# fonksiyonlar kullanır — generated column'da ve create_all ile kurulan
+# veritabanlarında da çalışır.
+TR_FOLD_FROM = "İIŞĞÜÖÇışğüöç"
+TR_FOLD_TO = "iisguocisguoc"
+
+# matching_service.parse_room_count'un kabul ettiği biçimlerin ASCII alt
+# kümesi ("3+1", " 4 "). Bu regex'e uyan her değeri Python da aynı sayıya
+# parse eder. Ana sayı en fazla 3 hane: rooms serbest metin (20 karakter);
+# "12345678901" gibi değerler ::integer taşması yerine NULL olur.
+ROOMS_PATTERN = r"^[ \t\n\r\f\v]*[0-9]{1,3}[ \t\n\r\f\v]*(\+[ \t\n\r\f\v]*[0-9]+)?[ \t\n\r\f\v]*$"
+_ROOMS_RE = re.compile(ROOMS_PATTERN)
+
+
+def _search_key_sql(column: str) -> str:
+    return f"lower(translate(btrim({column}), '{TR_FOLD_FROM}', '{TR_FOLD_TO}'))"
+
+
+def search_key(value: Any) -> ColumnElement[str]:
+    """Aranan ilçe / emlak tipi için Property.district_key ile aynı ifade."""
+    return func.lower(func.translate(func.btrim(value), TR_FOLD_FROM, TR_FOLD_TO))
+
+
+def parse_rooms(value: str | None) -> tuple[int, int | None] | None:
+    """
+    Property.room_count ile aynı kural: "3+1" → (3, 1), " 4 " → (4, None).
+
+    ROOMS_PATTERN'e uymayan değerler (ör. "stüdyo", 4+ haneli sayı) None.
+    """
+    if not value or _ROOMS_RE.match(value) is None:
+        return None
+    numbers = re.findall(r"[0-9]+", value)
+    return int(numbers[0]), int(numbers[1]) if len(numbers) > 1 else None
+
 
 class Property(BaseModel, TenantMixin):
     """
@@ -31,6 +80,12 @@ class Property(BaseModel, TenantMixin):
         Index("ix_properties_office_status_listing", "office_id", "status", "listing_type"),
         Index("ix_properties_price", "price"),
         Index("ix_properties_city_district", "city", "district"),
+        Index("ix_properties_office_updated", "office_id", "updated_at"),
+        # Emsal arama: ilçe + tip + durum eşitliği, net_area aralık taraması
+        Index(
+            "ix_properties_comparable_search",
+            "district_key", "property_type_key", "status", "net_area", "building_age",
+        ),
         # GIN indeksler
         Index("ix_properties_search_vector", "search_vector", postgresql_using="gin"),
         Index("ix_properties_features", "features", postgresql_using="gin"),
@@ -63,6 +118,11 @@ class Property(BaseModel, TenantMixin):
         String(30), nullable=False,
         comment="Emlak tipi: daire, villa, arsa, dükkan, ofis vb.",
     )
+    property_type_key: Mapped[str] = mapped_column(
+        String(30),
+        Computed(_search_key_sql("property_type"), persisted=True),
+        comment="Emlak tipi arama anahtarı (Türkçe karakter katlanmış, küçük harf)",
+    )
     listing_type: Mapped[str] = mapped_column(
         String(10), nullable=False,
         comment="İlan tipi: sale (satılık), rent (kiralık)",
@@ -82,6 +142,16 @@ class Property(BaseModel, TenantMixin):
     rooms: Mapped[str | None] = mapped_column(
         String(20), nullable=True, comment="Oda sayısı (ör: 3+1)"
     )
+    room_count: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed(
+            f"CASE WHEN rooms ~ '{ROOMS_PATTERN}' "
+            "THEN substring(rooms FROM '[0-9]+')::integer END",
+            persisted=True,
+        ),
+        nullable=True,
+        comment="Ana oda sayısı (rooms'tan türetilir; desteklenmeyen biçimde NULL)",
+    )
     gross_area: Mapped[float | None] = mapped_column(
         Numeric(8, 2), nullable=True, comment="Brüt alan (m²)"
     )
@@ -131,6 +201,11 @@ class Property(BaseModel, TenantMixin):
     district: Mapped[str] = mapped_column(
         String(100), nullable=False, comment="İlçe"
     )
+    district_key: Mapped[str] = mapped_column(
+        String(100),
+        Computed(_search_key_sql("district"), persisted=True),
+        comment="İlçe arama anahtarı (Türkçe karakter katlanmış, küçük harf)",
+    )
     neighborhood: Mapped[str | None] = mapped_column(
         String(100), nullable=True, comment="Mahalle"
     )
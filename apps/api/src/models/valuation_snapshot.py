@@ -0,0 +1,158 @@
+"""
+Emlak Teknoloji Platformu - Portföy Değerleme Snapshot Modelleri
+
+Ofisin tüm aktif ilanlarının toplu (offline) değerlemesi.
+
+- ValuationSnapshotRun: Çalıştırma başlığı — durum, ilerleme, keyset imleci.
+- ValuationSnapshot: Çalıştırma × ilan başına tek tahmin satırı (immutable).
+
+Toplu iş: src/modules/valuations/portfolio_valuation.py
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+from src.models.base import BaseModel, TenantMixin
+
+RUN_STATUSES = ("pending", "running", "completed", "failed")
+ACTIVE_RUN_STATUSES = ("pending", "running")
+
+
+class ValuationSnapshotRun(TenantMixin, BaseModel):
+    """
+    Portföy değerleme çalıştırması.
+
+    processed_count / cursor_property_id her parça ile aynı transaction'da
+    güncellenir; task yeniden denenirse kaldığı ilandan devam eder.
+
+    Ofis başına en fazla bir aktif (pending / running) çalıştırma —
+    eşzamanlı başlatma isteklerini unique partial index ayırır.
+    """
+
+    __tablename__ = "valuation_snapshot_runs"
+    __table_args__ = (
+        Index("ix_valuation_snapshot_runs_office_created", "office_id", "created_at"),
+        Index(
+            "uq_valuation_snapshot_runs_office_active",
+            "office_id",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+
+    # ---------- Tenant ----------
+    office_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("offices.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Bağlı ofis (tenant) ID",
+    )
+    requested_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        comment="Çalıştırmayı başlatan kullanıcı",
+    )
+
+    # ---------- Durum ----------
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="pending",
+        server_default=text("'pending'"),
+        comment="Durum: pending, running, completed, failed",
+    )
+    model_version: Mapped[str | None] = mapped_column(
+        String(50), nullable=True,
+        comment="Tahminde kullanılan model versiyonu",
+    )
+    error: Mapped[str | None] = mapped_column(
+        Text, nullable=True, comment="Hata mesajı (failed)",
+    )
+
+    # ---------- İlerleme ----------
+    total_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0"),
+        comment="Başlangıçtaki aktif ilan sayısı",
+    )
+    processed_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0"),
+        comment="Değerlenen ilan sayısı",
+    )
+    skipped_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0"),
+        comment="Eksik özellik nedeniyle atlanan ilan sayısı",
+    )
+    cursor_property_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True,
+        comment="Son işlenen ilan ID (keyset imleci — yeniden denemede devam noktası)",
+    )
+
+    # ---------- Zaman ----------
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True,
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True,
+    )
+
+
+class ValuationSnapshot(Base):
+    """
+    Tek ilanın portföy değerleme sonucu.
+
+    BaseModel kullanılmaz — PK (run_id, property_id); toplu INSERT'te
+    UUID üretimi ve updated_at gerekmez.
+    """
+
+    __tablename__ = "valuation_snapshots"
+    __table_args__ = (
+        Index("ix_valuation_snapshots_property", "property_id"),
+    )
+
+    run_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("valuation_snapshot_runs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    property_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("properties.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    office_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("offices.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Bağlı ofis (tenant) ID — RLS için denormalize",
+    )
+
+    # ---------- Tahmin ----------
+    estimated_price: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2), nullable=False, comment="Tahmini fiyat (TL)",
+    )
+    confidence_low: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2), nullable=False, comment="Güven aralığı alt sınır (TL)",
+    )
+    confidence_high: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2), nullable=False, comment="Güven aralığı üst sınır (TL)",
+    )
+    confidence: Mapped[Decimal] = mapped_column(
+        Numeric(5, 4), nullable=False, comment="Güven skoru 0.0000 - 1.0000",
+    )
+    listing_price: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2), nullable=False,
+        comment="Değerleme anındaki ilan fiyatı (karşılaştırma için)",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
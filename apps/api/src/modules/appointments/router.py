@@ -27,6 +27,7 @@ from datetime import datetime
 from fastapi import APIRouter, Query, status
 
 from src.core.exceptions import NotFoundError
+from src.core.pagination import resolve_count_strategy
 from src.dependencies import DBSession
 from src.modules.appointments.schemas import (
     AppointmentCreate,
@@ -128,15 +129,18 @@ async def list_appointments(
     status: str | None = Query(default=None, description="Durum filtresi: scheduled, completed, cancelled, no_show"),
     date_from: datetime | None = Query(default=None, description="Başlangıç tarihi filtresi (ISO 8601)"),
     date_to: datetime | None = Query(default=None, description="Bitiş tarihi filtresi (ISO 8601)"),
+    cursor: str | None = Query(
+        default=None, description="Keyset cursor (önceki yanıtın next_cursor değeri, skip yerine)"
+    ),
 ) -> AppointmentListResponse:
     """
     Ofise ait randevuları listeler.
 
     - Sonuçlar varsayılan olarak en yeni randevudan en eskiye sıralanır
-    - Pagination: skip + limit
+    - Pagination: skip + limit veya cursor (keyset)
     - Filtreler: status, date_from, date_to
     """
-    appointments, total = await AppointmentService.list_appointments(
+    result = await AppointmentService.list_appointments(
         db=db,
         office_id=current_user.office_id,
         skip=skip,
@@ -144,13 +148,18 @@ async def list_appointments(
         status_filter=status,
         date_from=date_from,
         date_to=date_to,
+        cursor=cursor,
+        count_strategy=resolve_count_strategy("appointments"),
     )
 
     return AppointmentListResponse(
-        items=[_to_response(a) for a in appointments],
-        total=total,
+        items=[_to_response(a) for a in result.items],
+        total=result.total,
+        total_exact=result.total_exact,
+        has_more=result.has_more,
         skip=skip,
         limit=limit,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -131,5 +131,12 @@ class AppointmentListResponse(BaseModel):
 
     items: list[AppointmentResponse] = Field(description="Randevu listesi")
     total: int = Field(description="Toplam randevu sayısı")
+    total_exact: bool = Field(
+        default=True, description="total kesin mi (false → tahmin veya alt sınır)"
+    )
+    has_more: bool = Field(default=False, description="Sonraki sayfa var mı")
     skip: int = Field(description="Atlanan kayıt sayısı")
     limit: int = Field(description="Sayfa başına kayıt limiti")
+    next_cursor: str | None = Field(
+        default=None, description="Sonraki sayfa cursor'ı (son sayfada null)"
+    )
@@ -9,7 +9,7 @@ Güvenlik:
 
 Kullanım:
     appointment = await AppointmentService.create_appointment(db, office_id, user_id, data)
-    appointments, total = await AppointmentService.list_appointments(db, office_id)
+    result = await AppointmentService.list_appointments(db, office_id)
 """
 
 from __future__ import annotations
@@ -18,10 +18,20 @@ import uuid
 from datetime import UTC, datetime
 
 import structlog
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import NotFoundError
+from src.core.pagination import (
+    CountStrategy,
+    Page,
+    SortKey,
+    count_rows,
+    decode_cursor,
+    keyset_after,
+    order_by_keys,
+    trim_page,
+)
 from src.models.appointment import Appointment
 
 logger = structlog.get_logger(__name__)
@@ -99,10 +109,15 @@ class AppointmentService:
         status_filter: str | None = None,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
-    ) -> tuple[list[Appointment], int]:
+        cursor: str | None = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[Appointment]:
         """
         Ofise ait randevuları sayfalama ve filtrelerle listeler.
 
+        Sayfalama: skip/limit (OFFSET) veya cursor (keyset, (appointment_date, id)
+        azalan). Cursor verildiğinde skip yok sayılır.
+
         Args:
             db: Async database session.
             office_id: Tenant (ofis) UUID.
@@ -111,9 +126,14 @@ class AppointmentService:
             status_filter: Randevu durumuna göre filtre (opsiyonel).
             date_from: Başlangıç tarihi filtresi (opsiyonel).
             date_to: Bitiş tarihi filtresi (opsiyonel).
+            cursor: Keyset cursor (opsiyonel).
+            count_strategy: Toplam sayım stratejisi (exact, estimate, has_more).
 
         Returns:
-            (randevu listesi, toplam sayı) tuple'ı.
+            Page[Appointment] — randevu listesi, toplam sayı, sonraki sayfa cursor'ı.
+
+        Raises:
+            ValidationError: Geçersiz cursor.
         """
         base_filter = [Appointment.office_id == office_id]
 
@@ -125,22 +145,32 @@ class AppointmentService:
             base_filter.append(Appointment.appointment_date <= date_to)
 
         # Total count
-        count_query = select(func.count(Appointment.id)).where(*base_filter)
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
+        total, total_exact = await count_rows(
+            db, select(Appointment.id).where(*base_filter), strategy=count_strategy
+        )
 
         # Paginated results (en yeniden en eskiye)
-        query = (
-            select(Appointment)
-            .where(*base_filter)
-            .order_by(Appointment.appointment_date.desc())
-            .limit(limit)
-            .offset(skip)
-        )
+        keys = [SortKey(Appointment.appointment_date), SortKey(Appointment.id)]
+        query = select(Appointment).where(*base_filter)
+        if cursor:
+            query = query.where(
+                keyset_after(keys, decode_cursor(cursor, "appointments", len(keys)))
+            )
+        else:
+            query = query.offset(skip)
+
+        query = query.order_by(*order_by_keys(keys)).limit(limit + 1)
         result = await db.execute(query)
-        appointments = list(result.scalars().all())
+        appointments, next_cursor = trim_page(
+            result.scalars().all(),
+            limit,
+            "appointments",
+            lambda a: [a.appointment_date, a.id],
+        )
 
-        return appointments, total
+        return Page(
+            items=appointments, total=total, next_cursor=next_cursor, total_exact=total_exact
+        )
 
     # ---------- Get Upcoming ----------
 
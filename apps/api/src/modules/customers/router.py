@@ -31,6 +31,7 @@ from fastapi import APIRouter, Query, Request, status
 from sqlalchemy import select
 
 from src.core.exceptions import PermissionDenied
+from src.core.pagination import resolve_count_strategy
 from src.core.plan_policy import get_customer_quota
 from src.dependencies import DBSession
 from src.models.subscription import Subscription
@@ -201,17 +202,20 @@ async def list_customers(
     tag: str | None = Query(default=None, description="Etiket filtresi (tags JSONB)"),
     sort_by: str | None = Query(default=None, description="Sıralama: created_at, last_contact_at, full_name"),
     sort_order: str | None = Query(default=None, description="Sıralama yönü: asc, desc"),
+    cursor: str | None = Query(
+        default=None, description="Keyset cursor (önceki yanıtın next_cursor değeri, page yerine)"
+    ),
 ) -> CustomerListResponse:
     """
     Ofise ait müşterileri listeler.
 
     - Sonuçlar varsayılan olarak en yeniden en eskiye sıralanır
-    - Pagination: page + per_page
+    - Pagination: page + per_page veya cursor (keyset, derin sayfalarda sabit maliyet)
     - Filtreler: lead_status, customer_type, search (ad/telefon/email)
     - Gelişmiş filtreler: budget_min_from, budget_min_to, desired_district, tag
     - Sıralama: sort_by + sort_order
     """
-    customers, total = await CustomerService.list_customers(
+    result = await CustomerService.list_customers(
         db=db,
         office_id=current_user.office_id,
         page=page,
@@ -225,13 +229,18 @@ async def list_customers(
         tag=tag,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
+        count_strategy=resolve_count_strategy("customers"),
     )
 
     return CustomerListResponse(
-        items=[_to_response(c) for c in customers],
-        total=total,
+        items=[_to_response(c) for c in result.items],
+        total=result.total,
+        total_exact=result.total_exact,
+        has_more=result.has_more,
         page=page,
         per_page=per_page,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -445,12 +454,13 @@ async def list_notes(
     - En yeniden en eskiye sıralanır
     - Pagination: page + per_page
     """
-    notes, total = await CustomerService.list_notes(
+    result = await CustomerService.list_notes(
         db=db,
         customer_id=customer_id,
         office_id=current_user.office_id,
         page=page,
         per_page=per_page,
+        count_strategy=resolve_count_strategy("notes"),
     )
 
     return NoteListResponse(
@@ -462,9 +472,11 @@ async def list_notes(
                 user_id=str(n.user_id) if n.user_id else None,
                 created_at=n.created_at,
             )
-            for n in notes
+            for n in result.items
         ],
-        total=total,
+        total=result.total,
+        total_exact=result.total_exact,
+        has_more=result.has_more,
     )
 
 
@@ -205,8 +205,15 @@ class CustomerListResponse(BaseModel):
 
     items: list[CustomerResponse] = Field(description="Müşteri listesi")
     total: int = Field(description="Toplam müşteri sayısı")
+    total_exact: bool = Field(
+        default=True, description="total kesin mi (false → tahmin veya alt sınır)"
+    )
+    has_more: bool = Field(default=False, description="Sonraki sayfa var mı")
     page: int = Field(description="Mevcut sayfa numarası")
     per_page: int = Field(description="Sayfa başına kayıt sayısı")
+    next_cursor: str | None = Field(
+        default=None, description="Sonraki sayfa cursor'ı (son sayfada null)"
+    )
 
 
 # ================================================================
@@ -244,6 +251,10 @@ class NoteListResponse(BaseModel):
 
     items: list[NoteResponse] = Field(description="Not listesi")
     total: int = Field(description="Toplam not sayısı")
+    total_exact: bool = Field(
+        default=True, description="total kesin mi (false → tahmin veya alt sınır)"
+    )
+    has_more: bool = Field(default=False, description="Sonraki sayfa var mı")
 
 
 # ================================================================
@@ -10,7 +10,7 @@ Güvenlik:
 
 Kullanım:
     customer = await CustomerService.create(db, office_id, data)
-    customers, total = await CustomerService.list_customers(db, office_id, page, per_page)
+    result = await CustomerService.list_customers(db, office_id, page, per_page)
 """
 
 from __future__ import annotations
@@ -24,6 +24,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import noload
 
 from src.core.exceptions import NotFoundError, ValidationError
+from src.core.pagination import (
+    CountStrategy,
+    Page,
+    SortKey,
+    count_rows,
+    decode_cursor,
+    keyset_after,
+    order_by_keys,
+    trim_page,
+)
 from src.models.customer import Customer
 from src.models.customer_note import CustomerNote
 from src.models.match import PropertyCustomerMatch
@@ -124,10 +134,15 @@ class CustomerService:
         tag: str | None = None,
         sort_by: str | None = None,
         sort_order: str | None = None,
-    ) -> tuple[list[Customer], int]:
+        cursor: str | None = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[Customer]:
         """
         Ofise ait müşterileri sayfalama ile listeler.
 
+        Sayfalama: page/per_page (OFFSET) veya cursor (keyset). Cursor bir önceki
+        sayfanın next_cursor değeridir; verildiğinde page yok sayılır.
+
         Args:
             db: Async database session.
             office_id: Tenant (ofis) UUID.
@@ -142,9 +157,14 @@ class CustomerService:
             tag: Etiket filtresi — JSONB @> ile arama (opsiyonel).
             sort_by: Sıralama alanı: created_at, last_contact_at, full_name (opsiyonel).
             sort_order: Sıralama yönü: asc, desc (opsiyonel).
+            cursor: Keyset cursor (opsiyonel).
+            count_strategy: Toplam sayım stratejisi (exact, estimate, has_more).
 
         Returns:
-            (müşteri listesi, toplam sayı) tuple'ı.
+            Page[Customer] — müşteri listesi, toplam sayı, sonraki sayfa cursor'ı.
+
+        Raises:
+            ValidationError: Geçersiz veya başka sıralamaya ait cursor.
         """
         base_filter = [Customer.office_id == office_id]
 
@@ -176,33 +196,48 @@ class CustomerService:
                 Customer.tags.op("@>")(f'["{tag}"]')
             )
 
-        # Total count
-        count_query = select(func.count(Customer.id)).where(*base_filter)
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
+        # Total count (strateji: büyük portföylerde tahmin / alt sınır)
+        total, total_exact = await count_rows(
+            db, select(Customer.id).where(*base_filter), strategy=count_strategy
+        )
 
-        # Sıralama
+        # Sıralama (id ile sonlanır — keyset cursor için deterministik sıra)
         sort_column = Customer.created_at  # varsayılan
+        nullable = False
         if sort_by == "last_contact_at":
             sort_column = Customer.last_contact_at
+            nullable = True
         elif sort_by == "full_name":
             sort_column = Customer.full_name
+        else:
+            sort_by = "created_at"
 
-        order = sort_column.asc() if sort_order == "asc" else sort_column.desc()
+        descending = sort_order != "asc"
+        keys = [
+            SortKey(sort_column, descending=descending, nullable=nullable),
+            SortKey(Customer.id, descending=descending),
+        ]
+        scope = f"customers:{sort_by}:{'desc' if descending else 'asc'}"
 
-        # Paginated results
-        offset = (page - 1) * per_page
-        query = (
-            select(Customer)
-            .where(*base_filter)
-            .order_by(order)
-            .limit(per_page)
-            .offset(offset)
-        )
+        query = select(Customer).where(*base_filter)
+        if cursor:
+            query = query.where(keyset_after(keys, decode_cursor(cursor, scope, len(keys))))
+        else:
+            query = query.offset((page - 1) * per_page)
+
+        # Paginated results (per_page + 1 → sonraki sayfa var mı)
+        query = query.order_by(*order_by_keys(keys)).limit(per_page + 1)
         result = await db.execute(query)
-        customers = list(result.scalars().all())
+        customers, next_cursor = trim_page(
+            result.scalars().all(),
+            per_page,
+            scope,
+            lambda c: [getattr(c, sort_by), c.id],
+        )
 
-        return customers, total
+        return Page(
+            items=customers, total=total, next_cursor=next_cursor, total_exact=total_exact
+        )
 
     # ---------- Get by ID ----------
 
@@ -445,7 +480,8 @@ class CustomerService:
         office_id: uuid.UUID,
         page: int = 1,
         per_page: int = 20,
-    ) -> tuple[list[CustomerNote], int]:
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[CustomerNote]:
         """
         Müşteriye ait notları sayfalama ile listeler.
 
@@ -455,9 +491,10 @@ class CustomerService:
             office_id: Tenant (ofis) UUID.
             page: Sayfa numarası (1-based).
             per_page: Sayfa başına kayıt sayısı.
+            count_strategy: Toplam sayım stratejisi (exact, estimate, has_more).
 
         Returns:
-            (not listesi, toplam sayı) tuple'ı.
+            Page[CustomerNote] — not listesi, toplam sayı, has_more.
 
         Raises:
             NotFoundError: Müşteri bulunamadı.
@@ -471,11 +508,11 @@ class CustomerService:
         ]
 
         # Total count
-        count_query = select(func.count(CustomerNote.id)).where(*base_filter)
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
+        total, total_exact = await count_rows(
+            db, select(CustomerNote.id).where(*base_filter), strategy=count_strategy
+        )
 
-        # Paginated results (en yeniden en eskiye)
+        # Paginated results (en yeniden en eskiye, per_page + 1 → has_more)
         # noload("*") — ilişkili nesneler yüklenmez, sadece not alanları döner
         offset = (page - 1) * per_page
         query = (
@@ -483,13 +520,18 @@ class CustomerService:
             .options(noload("*"))
             .where(*base_filter)
             .order_by(CustomerNote.created_at.desc())
-            .limit(per_page)
+            .limit(per_page + 1)
             .offset(offset)
         )
         result = await db.execute(query)
         notes = list(result.scalars().all())
 
-        return notes, total
+        return Page(
+            items=notes[:per_page],
+            total=total,
+            total_exact=total_exact,
+            has_more=len(notes) > per_page,
+        )
 
     # ---------- Timeline ----------
 
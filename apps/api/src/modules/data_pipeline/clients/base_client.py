@@ -9,6 +9,8 @@ Ozellikler:
 - Yapilandirabilir timeout ve max_retries
 - structlog ile yapilandirilmis loglama
 - Context manager (async with) destegi
+- Celery worker'da HTTP client process omru boyunca paylasilir
+  (src.core.worker_runtime — baglanti havuzu task'lar arasinda korunur)
 - Ortak hata yonetimi (HTTP error, timeout, connection error)
 """
 
@@ -20,6 +22,8 @@ from typing import Any
 import httpx
 import structlog
 
+from src.core import worker_runtime
+
 logger = structlog.get_logger("data_pipeline")
 
 
@@ -77,10 +81,10 @@ class BaseAPIClient:
         self.max_retries = max_retries
         self._default_headers = headers or {}
         self._client: httpx.AsyncClient | None = None
+        self._owns_client = True
 
-    async def __aenter__(self) -> BaseAPIClient:
-        """Async context manager — client olustur."""
-        self._client = httpx.AsyncClient(
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
             base_url=self.base_url,
             timeout=httpx.Timeout(self.timeout),
             headers={
@@ -90,7 +94,24 @@ class BaseAPIClient:
             },
             follow_redirects=True,
         )
-        logger.debug("api_client_opened", source=self.SOURCE_NAME, base_url=self.base_url)
+
+    async def __aenter__(self) -> BaseAPIClient:
+        """Async context manager — client olustur (worker'da paylasilani kullan)."""
+        shared_key = (
+            type(self).__name__,
+            self.base_url,
+            self.timeout,
+            tuple(sorted(self._default_headers.items())),
+        )
+        shared = worker_runtime.shared_http_client(shared_key, self._build_client)
+        self._owns_client = shared is None
+        self._client = self._build_client() if shared is None else shared
+        logger.debug(
+            "api_client_opened",
+            source=self.SOURCE_NAME,
+            base_url=self.base_url,
+            shared=not self._owns_client,
+        )
         return self
 
     async def __aexit__(
@@ -99,11 +120,12 @@ class BaseAPIClient:
         exc_val: BaseException | None,
         exc_tb: Any,
     ) -> None:
-        """Async context manager — client kapat."""
+        """Async context manager — client kapat (paylasilan client acik kalir)."""
         if self._client:
-            await self._client.aclose()
+            if self._owns_client:
+                await self._client.aclose()
+                logger.debug("api_client_closed", source=self.SOURCE_NAME)
             self._client = None
-            logger.debug("api_client_closed", source=self.SOURCE_NAME)
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -0,0 +1,184 @@
+"""
+Emlak Teknoloji Platformu - Eşleştirme Tetikleyici Debounce / Batch
+
+Aynı ilan/müşteri için kısa aralıkta gelen tekrar tetikleri (fotoğraf
+ekleme, fiyat düzeltme...) tek eşleştirme çalıştırmasında birleştirir.
+
+İki mod:
+    Debounce (varlık bazlı):
+        İlk tetik Redis'te işaret koyar (SET NX EX) ve task'ı
+        MATCH_TRIGGER_DEBOUNCE_SECONDS gecikmeyle kuyruğa atar. Pencere
+        içindeki sonraki tetikler işaret mevcut olduğu için kuyruğa
+        HİÇBİR ŞEY atmaz. Task başlarken işareti siler, DB'den güncel
+        veriyi okur — pencere içindeki tüm değişiklikler dahil olur.
+
+    Batch (ofis bazlı, sadece ilanlar):
+        İlan id'leri ofisin bekleyen kümesine eklenir (SADD); ofis için
+        planlanmış task yoksa bir tane planlanır. Task kümeyi atomik
+        olarak boşaltır ve tüm ilanları tek skor geçişinde işler
+        (müşteriler bir kez yüklenir).
+
+Redis anahtarları (cache DB — settings.REDIS_URL):
+    matching:debounce:{kind}:{entity_id}  → planlanmış task işareti
+    matching:batch:{office_id}:scheduled  → ofis batch task'ı planlandı
+    matching:batch:{office_id}:properties → bekleyen ilan id'leri (SET)
+
+Yarış güvenliği:
+    Boşaltma (SMEMBERS + DEL küme + DEL işaret) tek MULTI içindedir.
+    Boşaltmadan sonra gelen tetik işareti yeniden koyup yeni task planlar;
+    hiçbir id kaybolmaz (en kötü ihtimalle boş küme bulan bir task çalışır).
+
+Redis erişilemezse fonksiyonlar None döner; çağıran task'ı hemen kuyruğa
+atar (fail-open — eşleştirme debounce yüzünden kaybolmaz).
+
+Task kaybolursa (worker çökmesi) işaret pencere + _MARKER_GRACE_SECONDS
+sonra düşer; sonraki tetik yeniden planlar.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Literal
+
+import redis
+import structlog
+
+from src.config import settings
+
+logger = structlog.get_logger(__name__)
+
+EntityKind = Literal["property", "customer"]
+
+_KEY_PREFIX = "matching"
+
+# İşaret task gecikmesinden uzun yaşar — kuyruk gecikmesinde çift task planlanmasın
+_MARKER_GRACE_SECONDS = 300
+
+# Bekleyen küme: batch task kaybolsa bile id'ler bir sonraki tetikte işlenir
+_PENDING_TTL_SECONDS = 86400
+
+_client: redis.Redis | None = None
+
+
+def _redis() -> redis.Redis:
+    """Senkron Redis client (trigger helper'ları ve Celery task'ları senkron)."""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=1,
+            socket_timeout=1,
+            decode_responses=True,
+        )
+    return _client
+
+
+def _entity_key(kind: EntityKind, entity_id: uuid.UUID | str) -> str:
+    return f"{_KEY_PREFIX}:debounce:{kind}:{entity_id}"
+
+
+def _batch_keys(office_id: uuid.UUID | str) -> tuple[str, str]:
+    base = f"{_KEY_PREFIX}:batch:{office_id}"
+    return f"{base}:scheduled", f"{base}:properties"
+
+
+# ================================================================
+# Debounce (varlık bazlı)
+# ================================================================
+
+
+def claim(kind: EntityKind, entity_id: uuid.UUID, window: int) -> bool | None:
+    """
+    Varlık için pencere işaretini almaya çalışır.
+
+    Returns:
+        True: işaret alındı → task gecikmeyle planlanmalı.
+        False: pencere içinde planlanmış task var → tetik birleştirildi.
+        None: Redis erişilemedi → çağıran task'ı hemen kuyruğa atmalı.
+    """
+    try:
+        acquired = _redis().set(
+            _entity_key(kind, entity_id), "1",
+            nx=True, ex=window + _MARKER_GRACE_SECONDS,
+        )
+    except redis.RedisError:
+        logger.warning("matching_debounce_unavailable", kind=kind, exc_info=True)
+        return None
+    return bool(acquired)
+
+
+def release(kind: EntityKind, entity_id: uuid.UUID | str) -> None:
+    """Task başlarken işareti siler; sonraki tetik yeni çalıştırma planlar."""
+    try:
+        _redis().delete(_entity_key(kind, entity_id))
+    except redis.RedisError:
+        # İşaret TTL ile düşer; en kötü ihtimalle bir tetik gecikir
+        logger.warning("matching_debounce_release_failed", kind=kind, exc_info=True)
+
+
+# ================================================================
+# Batch (ofis bazlı ilanlar)
+# ================================================================
+
+
+def enqueue_office_property(
+    office_id: uuid.UUID,
+    property_id: uuid.UUID,
+    window: int,
+) -> bool | None:
+    """
+    İlanı ofisin bekleyen kümesine ekler.
+
+    Returns:
+        True: ofis için yeni batch task planlanmalı.
+        False: planlanmış batch task var, ilan ona eklendi.
+        None: Redis erişilemedi → çağıran tekil task'ı hemen kuyruğa atmalı.
+    """
+    marker, pending = _batch_keys(office_id)
+    try:
+        pipe = _redis().pipeline()
+        pipe.sadd(pending, str(property_id))
+        pipe.expire(pending, _PENDING_TTL_SECONDS)
+        pipe.set(marker, "1", nx=True, ex=window + _MARKER_GRACE_SECONDS)
+        _, _, scheduled = pipe.execute()
+    except redis.RedisError:
+        logger.warning("matching_batch_unavailable", office_id=str(office_id), exc_info=True)
+        return None
+    return bool(scheduled)
+
+
+def drain_office_properties(office_id: uuid.UUID | str) -> list[uuid.UUID]:
+    """
+    Ofisin bekleyen ilanlarını atomik olarak alır ve kümeyi/işareti siler.
+
+    Raises:
+        redis.RedisError: Redis erişilemedi (task retry ile tekrar dener).
+    """
+    marker, pending = _batch_keys(office_id)
+    pipe = _redis().pipeline()
+    pipe.smembers(pending)
+    pipe.delete(pending, marker)
+    members, _ = pipe.execute()
+    return sorted(uuid.UUID(m) for m in members)
+
+
+def restore_office_properties(
+    office_id: uuid.UUID | str,
+    property_ids: list[uuid.UUID],
+) -> None:
+    """Başarısız batch'in ilanlarını kümeye geri koyar (retry tekrar boşaltır)."""
+    if not property_ids:
+        return
+    _, pending = _batch_keys(office_id)
+    try:
+        pipe = _redis().pipeline()
+        pipe.sadd(pending, *(str(pid) for pid in property_ids))
+        pipe.expire(pending, _PENDING_TTL_SECONDS)
+        pipe.execute()
+    except redis.RedisError:
+        logger.error(
+            "matching_batch_restore_failed",
+            office_id=str(office_id),
+            property_count=len(property_ids),
+            exc_info=True,
+        )
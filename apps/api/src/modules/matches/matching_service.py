@@ -32,6 +32,7 @@ from sqlalchemy import select, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import noload
 
+from src.config import settings
 from src.core.exceptions import NotFoundError
 from src.models.customer import Customer
 from src.models.match import PropertyCustomerMatch
@@ -273,34 +274,20 @@ def _calculate_area_score(
 # ================================================================
 
 
-def calculate_match_score(
-    prop: Property,
-    customer: Customer,
+def compose_match_score(
+    raw_scores: dict[str, float | None],
 ) -> tuple[float, dict]:
     """
-    İlan-müşteri çifti için bileşik skor hesaplar.
+    Kriter skorlarından bileşik skor ve detay sözlüğü üretir.
 
-    Eksik kriterler atlanır, kalan ağırlıklar oransal normalize edilir.
+    Eksik kriterler (None) atlanır, kalan ağırlıklar oransal normalize edilir.
+    Skaler (calculate_match_score) ve vektörel (vector_scorer) yollar
+    aynı yuvarlama ve detay formatını bu fonksiyondan alır.
 
     Returns:
         (final_score, details_dict) tuple.
         details_dict: price_score, location_score, room_score, area_score, weights_used
     """
-    raw_scores: dict[str, float | None] = {
-        "price": _calculate_price_score(
-            prop.price, customer.budget_min, customer.budget_max,
-        ),
-        "location": _calculate_location_score(
-            prop.district, customer.desired_districts,
-        ),
-        "room": _calculate_room_score(
-            prop.rooms, customer.desired_rooms,
-        ),
-        "area": _calculate_area_score(
-            prop.net_area, customer.desired_area_min, customer.desired_area_max,
-        ),
-    }
-
     # Aktif kriterleri filtrele (None olmayanlar)
     active_criteria = {k: v for k, v in raw_scores.items() if v is not None}
 
@@ -337,6 +324,81 @@ def calculate_match_score(
     return final_score, details
 
 
+def calculate_match_score(
+    prop: Property,
+    customer: Customer,
+) -> tuple[float, dict]:
+    """
+    İlan-müşteri çifti için bileşik skor hesaplar.
+
+    Eksik kriterler atlanır, kalan ağırlıklar oransal normalize edilir.
+    Toplu eşleştirme vector_scorer ile yapılır; bu fonksiyon tekil
+    çiftler ve referans semantik içindir.
+
+    Returns:
+        (final_score, details_dict) tuple.
+        details_dict: price_score, location_score, room_score, area_score, weights_used
+    """
+    raw_scores: dict[str, float | None] = {
+        "price": _calculate_price_score(
+            prop.price, customer.budget_min, customer.budget_max,
+        ),
+        "location": _calculate_location_score(
+            prop.district, customer.desired_districts,
+        ),
+        "room": _calculate_room_score(
+            prop.rooms, customer.desired_rooms,
+        ),
+        "area": _calculate_area_score(
+            prop.net_area, customer.desired_area_min, customer.desired_area_max,
+        ),
+    }
+    return compose_match_score(raw_scores)
+
+
+# ================================================================
+# Persistence
+# ================================================================
+
+
+async def upsert_match_records(
+    db: AsyncSession,
+    records: list[dict],
+    batch_size: int | None = None,
+) -> int:
+    """
+    Eşleştirme kayıtlarını parça parça upsert eder (ON CONFLICT DO UPDATE).
+
+    Mevcut çiftin skoru ve notları güncellenir; status korunur.
+    Parçalama asyncpg bind parametre limitini (32767) aşmamak içindir.
+
+    Args:
+        db: Async database session (commit çağrılmaz).
+        records: office_id, property_id, customer_id, score, status, notes.
+        batch_size: Tek INSERT'teki satır sayısı (varsayılan: settings).
+
+    Returns:
+        Yazılan kayıt sayısı.
+    """
+    if not records:
+        return 0
+
+    size = batch_size or settings.MATCH_UPSERT_BATCH_SIZE
+    for i in range(0, len(records), size):
+        stmt = insert(PropertyCustomerMatch).values(records[i:i + size])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_matches_property_customer",
+            set_={
+                "score": stmt.excluded.score,
+                "notes": stmt.excluded.notes,
+                "updated_at": text("now()"),
+            },
+        )
+        await db.execute(stmt)
+    await db.flush()
+    return len(records)
+
+
 # ================================================================
 # Matching Service
 # ================================================================
@@ -346,7 +408,8 @@ class MatchingService:
     """
     Kural tabanlı eşleştirme motoru.
 
-    İlan veya müşteri bazlı eşleştirme çalıştırır.
+    İlan veya müşteri bazlı eşleştirme çalıştırır. Adaylar kolon dizileri
+    olarak yüklenir ve vector_scorer ile tek geçişte skorlanır.
     Skor eşiği (70) üstündeki eşleşmeleri DB'ye batch upsert eder.
     Tenant izolasyonu: Sadece aynı office_id içinde çalışır.
     """
@@ -392,45 +455,40 @@ class MatchingService:
                 resource="Aktif ilan", resource_id=str(property_id),
             )
 
-        # 2. Uygun müşterileri getir (buyer/renter, aynı ofis)
+        # 2. Uygun müşterileri kolon olarak getir (buyer/renter, aynı ofis)
+        # ORM nesnesi yerine sadece skor kolonları — binlerce aday için hafif.
+        # customer_candidate_filter eşiğe ulaşamayacak müşterileri SQL'de eler.
+        from src.modules.matches.prefilter import customer_candidate_filter
+        from src.modules.matches.vector_scorer import (
+            CustomerColumns,
+            score_customers_for_property,
+        )
+
         result = await db.execute(
-            select(Customer)
-            .options(noload("*"))
+            select(*(getattr(Customer, c) for c in CustomerColumns.COLUMNS))
             .where(
                 Customer.office_id == office_id,
                 Customer.customer_type.in_(["buyer", "renter"]),
+                customer_candidate_filter(prop),
             )
         )
-        customers = list(result.scalars().all())
-
-        # 3. Her müşteri için skor hesapla
-        match_records: list[dict] = []
-        for customer in customers:
-            score, details = calculate_match_score(prop, customer)
-
-            if score >= SCORE_THRESHOLD:
-                match_records.append({
-                    "office_id": office_id,
-                    "property_id": property_id,
-                    "customer_id": customer.id,
-                    "score": score,
-                    "status": "pending",
-                    "notes": json.dumps(details, ensure_ascii=False),
-                })
+        customers = CustomerColumns.from_rows(result.all())
+
+        # 3. Tüm müşterileri tek vektörel geçişte skorla, eşik üstünü al
+        match_records: list[dict] = [
+            {
+                "office_id": office_id,
+                "property_id": property_id,
+                "customer_id": customer_id,
+                "score": score,
+                "status": "pending",
+                "notes": json.dumps(details, ensure_ascii=False),
+            }
+            for customer_id, score, details in score_customers_for_property(prop, customers)
+        ]
 
         # 4. Batch upsert (ON CONFLICT DO UPDATE)
-        if match_records:
-            stmt = insert(PropertyCustomerMatch).values(match_records)
-            stmt = stmt.on_conflict_do_update(
-                constraint="uq_matches_property_customer",
-                set_={
-                    "score": stmt.excluded.score,
-                    "notes": stmt.excluded.notes,
-                    "updated_at": text("now()"),
-                },
-            )
-            await db.execute(stmt)
-            await db.flush()
+        await upsert_match_records(db, match_records)
 
         elapsed_ms = int((time.monotonic() - start_time) * 1000)
 
@@ -486,45 +544,40 @@ class MatchingService:
                 resource="Musteri (buyer/renter)", resource_id=str(customer_id),
             )
 
-        # 2. Aktif ilanları getir (aynı ofis)
+        # 2. Aktif ilanları kolon olarak getir (aynı ofis, eşiğe ulaşabilenler)
+        from src.modules.matches.prefilter import property_candidate_filter
+        from src.modules.matches.vector_scorer import (
+            PropertyColumns,
+            score_properties_for_customer,
+        )
+
         result = await db.execute(
-            select(Property)
-            .options(noload("*"))
+            select(*(getattr(Property, c) for c in PropertyColumns.COLUMNS))
             .where(
                 Property.office_id == office_id,
                 Property.status == "active",
+                property_candidate_filter(customer),
             )
         )
-        properties = list(result.scalars().all())
-
-        # 3. Her ilan için skor hesapla
-        match_records: list[dict] = []
-        for prop in properties:
-            score, details = calculate_match_score(prop, customer)
-
-            if score >= SCORE_THRESHOLD:
-                match_records.append({
-                    "office_id": office_id,
-                    "property_id": prop.id,
-                    "customer_id": customer_id,
-                    "score": score,
-                    "status": "pending",
-                    "notes": json.dumps(details, ensure_ascii=False),
-                })
+        properties = PropertyColumns.from_rows(result.all())
+
+        # 3. Tüm ilanları tek vektörel geçişte skorla, eşik üstünü al
+        match_records: list[dict] = [
+            {
+                "office_id": office_id,
+                "property_id": property_id,
+                "customer_id": customer_id,
+                "score": score,
+                "status": "pending",
+                "notes": json.dumps(details, ensure_ascii=False),
+            }
+            for property_id, score, details in score_properties_for_customer(
+                customer, properties,
+            )
+        ]
 
         # 4. Batch upsert (ON CONFLICT DO UPDATE)
-        if match_records:
-            stmt = insert(PropertyCustomerMatch).values(match_records)
-            stmt = stmt.on_conflict_do_update(
-                constraint="uq_matches_property_customer",
-                set_={
-                    "score": stmt.excluded.score,
-                    "notes": stmt.excluded.notes,
-                    "updated_at": text("now()"),
-                },
-            )
-            await db.execute(stmt)
-            await db.flush()
+        await upsert_match_records(db, match_records)
 
         elapsed_ms = int((time.monotonic() - start_time) * 1000)
 
@@ -539,6 +592,98 @@ class MatchingService:
 
         return match_records
 
+    @staticmethod
+    async def find_matches_for_properties(
+        db: AsyncSession,
+        property_ids: list[uuid.UUID],
+        office_id: uuid.UUID,
+    ) -> list[dict]:
+        """
+        Bir ofisin birden fazla ilanını tek skor geçişinde eşleştirir.
+
+        Debounce batch'i için: müşteriler ilan başına değil BİR kez yüklenir
+        (ön filtresiz — tek sorgu, N ön filtreli sorgudan ucuz), her ilan
+        vektörel skorlanır, tüm kayıtlar tek upsert ile yazılır.
+
+        Aktif olmayan / silinmiş ilanlar sessizce atlanır (tetik ile task
+        arasında durum değişmiş olabilir).
+
+        Args:
+            db: Async database session.
+            property_ids: İlan UUID listesi.
+            office_id: Tenant (ofis) UUID.
+
+        Returns:
+            Oluşturulan/güncellenen eşleştirme kayıtları (dict listesi).
+        """
+        start_time = time.monotonic()
+
+        from src.modules.matches.vector_scorer import (
+            CustomerColumns,
+            PropertyColumns,
+            score_customers_for_property,
+        )
+
+        # 1. Aktif ilanları kolon olarak getir
+        result = await db.execute(
+            select(*(getattr(Property, c) for c in PropertyColumns.COLUMNS))
+            .where(
+                Property.id.in_(property_ids),
+                Property.office_id == office_id,
+                Property.status == "active",
+            )
+        )
+        properties = result.all()
+
+        if not properties:
+            logger.info(
+                "matching_batch_no_active_properties",
+                office_id=str(office_id),
+                requested=len(property_ids),
+            )
+            return []
+
+        # 2. Müşteriler bir kez (buyer/renter, aynı ofis)
+        result = await db.execute(
+            select(*(getattr(Customer, c) for c in CustomerColumns.COLUMNS))
+            .where(
+                Customer.office_id == office_id,
+                Customer.customer_type.in_(["buyer", "renter"]),
+            )
+        )
+        customers = CustomerColumns.from_rows(result.all())
+
+        # 3. Her ilan aynı kolon dizisine karşı vektörel skorlanır
+        match_records: list[dict] = [
+            {
+                "office_id": office_id,
+                "property_id": prop.id,
+                "customer_id": customer_id,
+                "score": score,
+                "status": "pending",
+                "notes": json.dumps(details, ensure_ascii=False),
+            }
+            for prop in properties
+            for customer_id, score, details in score_customers_for_property(prop, customers)
+        ]
+
+        # 4. Batch upsert (ON CONFLICT DO UPDATE)
+        await upsert_match_records(db, match_records)
+
+        elapsed_ms = int((time.monotonic() - start_time) * 1000)
+
+        logger.info(
+            "matching_completed_for_property_batch",
+            office_id=str(office_id),
+            requested=len(property_ids),
+            properties=len(properties),
+            candidates=len(customers),
+            matches_created=len(match_records),
+            elapsed_ms=elapsed_ms,
+        )
+
+        return match_records
+
 
 # ================================================================
 # Trigger Helpers (Celery .delay() wrappers)
@@ -548,21 +693,51 @@ class MatchingService:
 def trigger_matching_after_property_create(
     property_id: uuid.UUID,
     office_id: uuid.UUID,
-) -> AsyncResult:
+) -> AsyncResult | None:
     """
-    İlan oluşturulduktan sonra eşleştirme tetikler.
+    İlan oluşturulduktan/güncellendikten sonra eşleştirme tetikler.
 
-    Celery task'ını kuyruğa atar (.delay()).
-    İleride property CRUD router POST'una eklenecek.
+    MATCH_TRIGGER_DEBOUNCE_SECONDS > 0 ise tetikler birleştirilir
+    (bkz. debounce.py):
+        - MATCH_TRIGGER_BATCH_PROPERTIES → ilan ofisin bekleyen kümesine
+          eklenir, ofis başına tek batch task planlanır.
+        - Aksi halde ilan başına debounce: pencere içinde tek task.
+    Debounce kapalıysa veya Redis erişilemezse task hemen kuyruğa atılır.
 
     Args:
-        property_id: Yeni oluşturulan ilan UUID.
+        property_id: İlan UUID.
         office_id: Tenant UUID.
 
     Returns:
-        Celery AsyncResult — task takip için.
+        Celery AsyncResult — task takip için. Tetik bekleyen bir task'a
+        birleştirildiyse None.
     """
-    from src.modules.matches.tasks import trigger_matching_for_property
+    from src.modules.matches import debounce
+    from src.modules.matches.tasks import (
+        trigger_matching_for_office_properties,
+        trigger_matching_for_property,
+    )
+
+    window = settings.MATCH_TRIGGER_DEBOUNCE_SECONDS
+    if window > 0:
+        if settings.MATCH_TRIGGER_BATCH_PROPERTIES:
+            scheduled = debounce.enqueue_office_property(office_id, property_id, window)
+            task, args = trigger_matching_for_office_properties, (str(office_id),)
+        else:
+            scheduled = debounce.claim("property", property_id, window)
+            task, args = trigger_matching_for_property, (str(property_id), str(office_id))
+
+        if scheduled is not None:
+            logger.info(
+                "matching_triggered_for_property",
+                property_id=str(property_id),
+                office_id=str(office_id),
+                coalesced=not scheduled,
+                batched=settings.MATCH_TRIGGER_BATCH_PROPERTIES,
+            )
+            if not scheduled:
+                return None
+            return task.apply_async(args, countdown=window)
 
     logger.info(
         "matching_triggered_for_property",
@@ -575,25 +750,45 @@ def trigger_matching_after_property_create(
         str(office_id),
     )
 
+
 def trigger_matching_after_customer_create(
     customer_id: uuid.UUID,
     office_id: uuid.UUID,
-) -> AsyncResult:
+) -> AsyncResult | None:
     """
-    Müşteri oluşturulduktan sonra eşleştirme tetikler.
+    Müşteri oluşturulduktan/güncellendikten sonra eşleştirme tetikler.
 
-    Celery task'ını kuyruğa atar (.delay()).
-    customers/router.py POST endpoint'ine entegre edilecek.
+    MATCH_TRIGGER_DEBOUNCE_SECONDS > 0 ise müşteri başına debounce:
+    pencere içindeki tekrar tetikler tek task'ta birleştirilir.
+    Debounce kapalıysa veya Redis erişilemezse task hemen kuyruğa atılır.
 
     Args:
-        customer_id: Yeni oluşturulan müşteri UUID.
+        customer_id: Müşteri UUID.
         office_id: Tenant UUID.
 
     Returns:
-        Celery AsyncResult — task takip için.
+        Celery AsyncResult — task takip için. Tetik bekleyen bir task'a
+        birleştirildiyse None.
     """
+    from src.modules.matches import debounce
     from src.modules.matches.tasks import trigger_matching_for_customer
 
+    window = settings.MATCH_TRIGGER_DEBOUNCE_SECONDS
+    if window > 0:
+        scheduled = debounce.claim("customer", customer_id, window)
+        if scheduled is not None:
+            logger.info(
+                "matching_triggered_for_customer",
+                customer_id=str(customer_id),
+                office_id=str(office_id),
+                coalesced=not scheduled,
+            )
+            if not scheduled:
+                return None
+            return trigger_matching_for_customer.apply_async(
+                (str(customer_id), str(office_id)), countdown=window,
+            )
+
     logger.info(
         "matching_triggered_for_customer",
         customer_id=str(customer_id),
@@ -604,4 +799,3 @@ def trigger_matching_after_customer_create(
         str(customer_id),
         str(office_id),
     )
-
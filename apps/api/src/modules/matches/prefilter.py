@@ -0,0 +1,299 @@
+"""
+Emlak Teknoloji Platformu - Eşleştirme Aday Ön Filtresi (SQL)
+
+Ofisteki tüm müşteri/ilan satırlarını çekmek yerine, SCORE_THRESHOLD'a
+hiç ulaşamayacak adayları sorgu içinde eler.
+
+Neden kaba pencerelerin AND'i değil:
+    Dört kriter de aktifken tek bir kriterin 0 olması skoru en fazla
+    70'e düşürür (ör. fiyat=0, diğerleri 100 → 70.0 ≥ 70). Yani
+    "bütçe ±%20 VE ilçe eşleşmesi VE ..." kayıplı olurdu.
+
+Bunun yerine her kriter için skorun üst sınırı (0 veya 100) alınır ve
+bileşik skorun ulaşabileceği en yüksek değer eşikle karşılaştırılır:
+
+    Σ_aktif w_k · (u_k − eşik) ≥ 0     (u_k ∈ {0, 100})
+
+u_k = 0 sadece skaler yolda kriter skoru kesin 0 olduğunda seçilir:
+    - Fiyat/alan: alt sınırın %80'i altında veya üst sınırın %120'si üstünde
+    - Oda: fark > 2
+    - Konum: hiçbir tercih edilen ilçe eşleşmiyor
+
+Belirsiz her durumda (SQL'de parse edilemeyen oda, NULL karşılaştırma,
+beklenmedik JSON tipi) kriter aktif ve ulaşılabilir (u_k = 100) sayılır;
+filtre sadece gevşer, eşleşme kaybı olmaz.
+
+İlçe karşılaştırması: Veritabanı tr_TR locale ile kurulur; lower('I')
+orada 'ı' döner, Python'da 'i'. Bu yüzden iki taraf da turkish_normalize()
+(migration 013) ile katlanır ve eşitlik yerine içerme (strpos) kullanılır —
+Python'daki lower().strip() eşitliğinin üst kümesi. İlan tarafında katlanmış
+değer Property.district_key generated kolonundadır (migration 030).
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Numeric,
+    and_,
+    case,
+    false,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+)
+
+from src.models.customer import Customer
+from src.models.property import ROOMS_PATTERN, Property, search_key
+from src.modules.matches.matching_service import (
+    DEFAULT_WEIGHTS,
+    SCORE_THRESHOLD,
+    parse_room_count,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Ağırlıklar yüzde tamsayıya çevrilir — SQL tarafında kesin aritmetik
+_WEIGHTS: dict[str, int] = {k: round(w * 100) for k, w in DEFAULT_WEIGHTS.items()}
+
+_LOWER_BOUND = Decimal("0.8")
+_UPPER_BOUND = Decimal("1.2")
+
+
+# ================================================================
+# SQL Helpers
+# ================================================================
+
+
+def _room_count(column: Any) -> ColumnElement[Decimal]:
+    """
+    Oda string'inden ana oda sayısı; desteklenmeyen biçimde NULL.
+
+    İlan tarafında aynı ifade Property.room_count generated kolonu olarak
+    saklanır; bu yardımcı müşteri tarafı (desired_rooms) için kullanılır.
+    """
+    return case(
+        (column.op("~")(ROOMS_PATTERN), func.substring(column, "[0-9]+").cast(Numeric)),
+        else_=None,
+    )
+
+
+def _has_rooms(column: Any) -> ColumnElement[bool]:
+    """Boş olmayan oda değeri (Python: rooms_str.strip() truthy)."""
+    return and_(column.is_not(None), func.btrim(column) != "")
+
+
+def _range_zero(value: Any, low: Any, high: Any) -> ColumnElement[bool]:
+    """
+    _calculate_price_score / _calculate_area_score'un kesin 0 döndüğü koşul.
+
+    value/low/high'tan biri SQL kolonu, diğerleri Decimal sabit olabilir.
+    None sabitler dalı tamamen devre dışı bırakır; nullable kolonlar için
+    IS NOT NULL kontrolü eklenir.
+    """
+    def _present(bound: Any) -> ColumnElement[bool] | None:
+        if bound is None:
+            return None
+        if isinstance(bound, Decimal):
+            return true()
+        return bound.is_not(None)
+
+    parts: list[ColumnElement[bool]] = []
+
+    below: ColumnElement[bool] | None = None
+    if (low_present := _present(low)) is not None:
+        below = and_(low_present, value < low)
+        parts.append(and_(below, value <= low * _LOWER_BOUND))
+
+    if (high_present := _present(high)) is not None:
+        above = and_(high_present, value > high)
+        if below is not None:
+            # Skaler yolda alt sınır kontrolü önce yapılır
+            above = and_(~below, above)
+        parts.append(and_(above, value >= high * _UPPER_BOUND))
+
+    return or_(false(), *parts)
+
+
+def _term(
+    weight: int,
+    active: ColumnElement[bool] | bool,
+    zero: ColumnElement[bool] | bool,
+    threshold: float,
+) -> ColumnElement[Any] | None:
+    """Bir kriterin üst sınır katkısı: w·(100−eşik) veya −w·eşik, pasifse 0."""
+    if active is False:
+        return None
+    reach = literal(weight * (100 - threshold))
+    miss = literal(-weight * threshold)
+    if zero is True:
+        scored: ColumnElement[Any] = miss
+    elif zero is False:
+        scored = reach
+    else:
+        # NULL koşul ELSE'e düşer → ulaşılabilir (muhafazakâr)
+        scored = case((zero, miss), else_=reach)
+    if active is True:
+        return scored
+    return case((active, scored), else_=literal(0))
+
+
+def _reachable(
+    terms: Sequence[tuple[str, ColumnElement[bool] | bool, ColumnElement[bool] | bool]],
+    threshold: float,
+) -> ColumnElement[bool]:
+    """Aktif kriterlerin üst sınır skoru eşiğe ulaşabiliyor mu."""
+    contributions = [
+        c for name, active, zero in terms
+        if (c := _term(_WEIGHTS[name], active, zero, threshold)) is not None
+    ]
+    if not contributions:
+        # Hiç aktif kriter yok → skor 0
+        return false()
+
+    bound = contributions[0]
+    for c in contributions[1:]:
+        bound = bound + c
+
+    actives = [active for _, active, _ in terms if active is not False]
+    if any(active is True for active in actives):
+        return bound >= 0
+    return and_(bound >= 0, or_(*actives))
+
+
+def _as_decimal(value: Any) -> Decimal | None:
+    """ORM değeri (Decimal/int/float) → Decimal bind parametresi."""
+    return None if value is None else Decimal(str(value))
+
+
+# ================================================================
+# Public API
+# ================================================================
+
+
+def customer_candidate_filter(
+    prop: Any,
+    threshold: float = SCORE_THRESHOLD,
+) -> ColumnElement[bool]:
+    """
+    İlan için eşiğe ulaşabilecek müşterileri seçen WHERE koşulu.
+
+    Args:
+        prop: price, district, rooms, net_area alanları olan ilan.
+        threshold: Minimum skor.
+
+    Returns:
+        Customer kolonları üzerinde boolean SQL ifadesi.
+    """
+    price = _as_decimal(prop.price)
+    net_area = _as_decimal(prop.net_area)
+    prop_rooms = parse_room_count(prop.rooms)
+
+    districts = Customer.desired_districts
+    is_array = func.jsonb_typeof(districts) == "array"
+    element = func.jsonb_array_elements_text(districts).table_valued("value")
+    needle = func.turkish_normalize(literal(prop.district.strip()))
+    district_hit = (
+        select(element.c.value)
+        .where(func.strpos(func.turkish_normalize(element.c.value), needle) > 0)
+        .exists()
+    )
+
+    terms: list[tuple[str, Any, Any]] = [
+        (
+            "price",
+            False if price is None else or_(
+                Customer.budget_min.is_not(None), Customer.budget_max.is_not(None),
+            ),
+            False if price is None else _range_zero(
+                price, Customer.budget_min, Customer.budget_max,
+            ),
+        ),
+        (
+            "location",
+            # JSON dizi değilse belirsiz → aktif ve ulaşılabilir
+            case((~is_array, true()), else_=func.jsonb_array_length(districts) > 0),
+            case((~is_array, false()), else_=~district_hit),
+        ),
+        (
+            "room",
+            False if prop_rooms is None else _has_rooms(Customer.desired_rooms),
+            False if prop_rooms is None else func.abs(
+                _room_count(Customer.desired_rooms) - prop_rooms
+            ) > 2,
+        ),
+        (
+            "area",
+            False if net_area is None else or_(
+                Customer.desired_area_min.is_not(None), Customer.desired_area_max.is_not(None),
+            ),
+            False if net_area is None else _range_zero(
+                net_area, Customer.desired_area_min, Customer.desired_area_max,
+            ),
+        ),
+    ]
+    return _reachable(terms, threshold)
+
+
+def property_candidate_filter(
+    customer: Any,
+    threshold: float = SCORE_THRESHOLD,
+) -> ColumnElement[bool]:
+    """
+    Müşteri için eşiğe ulaşabilecek ilanları seçen WHERE koşulu.
+
+    Args:
+        customer: budget_min/max, desired_* alanları olan müşteri.
+        threshold: Minimum skor.
+
+    Returns:
+        Property kolonları üzerinde boolean SQL ifadesi.
+    """
+    budget_min = _as_decimal(customer.budget_min)
+    budget_max = _as_decimal(customer.budget_max)
+    area_min = _as_decimal(customer.desired_area_min)
+    area_max = _as_decimal(customer.desired_area_max)
+    desired_rooms = parse_room_count(customer.desired_rooms)
+
+    desired = customer.desired_districts
+    wanted = [d.strip() for d in desired or [] if isinstance(d, str)]
+    location_zero: Any = True
+    if wanted:
+        location_zero = ~or_(
+            *(func.strpos(Property.district_key, search_key(literal(d))) > 0 for d in wanted)
+        )
+
+    has_budget = budget_min is not None or budget_max is not None
+    has_area = area_min is not None or area_max is not None
+
+    terms: list[tuple[str, Any, Any]] = [
+        (
+            "price",
+            has_budget,
+            has_budget and _range_zero(Property.price, budget_min, budget_max),
+        ),
+        (
+            "location",
+            bool(desired),
+            location_zero,
+        ),
+        (
+            "room",
+            False if desired_rooms is None else _has_rooms(Property.rooms),
+            False if desired_rooms is None else func.abs(
+                Property.room_count - desired_rooms
+            ) > 2,
+        ),
+        (
+            "area",
+            False if not has_area else Property.net_area.is_not(None),
+            has_area and _range_zero(Property.net_area, area_min, area_max),
+        ),
+    ]
+    return _reachable(terms, threshold)
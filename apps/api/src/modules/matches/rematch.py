@@ -0,0 +1,288 @@
+"""
+Emlak Teknoloji Platformu - Ofis Bazlı Toplu Eşleştirme
+
+Bir ofisin tüm aktif ilanları × tüm buyer/renter müşterileri için
+eşleştirmeyi tek işte yeniden hesaplar.
+
+Akış:
+    1. Müşteriler bir kez kolon dizisi olarak yüklenir (CustomerColumns).
+    2. İlanlar id keyset'i ile parça parça okunur; her parça vektörel
+       skorlanır, eşik üstü çiftler parça parça upsert edilir ve commit
+       edilir (uzun transaction yok).
+    3. Watermark: Sonraki çalıştırma sadece watermark'tan sonra güncellenen
+       ilan/müşterileri işler:
+           değişen ilanlar    × tüm müşteriler
+           değişen müşteriler × değişmeyen ilanlar
+    4. scoring_version (ağırlık + eşik özeti) değiştiyse ya da full=True ise
+       tam yeniden hesaplama yapılır.
+
+Watermark çalıştırmanın başlangıç zamanıdır (DB now()). O anda açık olan
+transaction'ların geç commit ettiği satırları kaçırmamak için bir sonraki
+çalıştırma MATCH_REMATCH_WATERMARK_LAG_SECONDS kadar geriden başlar —
+upsert idempotent olduğundan tekrar işlenen çiftler zararsızdır.
+
+Eşik altına düşen mevcut eşleşmeler silinmez (ilan/müşteri bazlı
+eşleştirme ile aynı davranış). Bildirim gönderilmez.
+
+Kullanım:
+    stats = await rematch_office(db, office_id)
+    stats = await rematch_office(db, office_id, full=True)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from sqlalchemy import Row, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.config import settings
+from src.models.customer import Customer
+from src.models.match import MatchRematchState
+from src.models.property import Property
+from src.modules.matches.matching_service import (
+    DEFAULT_WEIGHTS,
+    SCORE_THRESHOLD,
+    upsert_match_records,
+)
+from src.modules.matches.vector_scorer import (
+    CustomerColumns,
+    PropertyColumns,
+    score_customers_for_property,
+    score_properties_for_customer,
+)
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import AsyncIterator, Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = structlog.get_logger(__name__)
+
+# Skor fonksiyonlarının semantiği değişirse artırılır → tüm ofisler tam yeniden hesaplanır
+SCORING_ENGINE_VERSION = 1
+
+_BUYER_TYPES = ("buyer", "renter")
+
+
+def scoring_version() -> str:
+    """Ağırlıklar, eşik ve motor sürümünün özeti (hex)."""
+    payload = json.dumps(
+        {
+            "engine": SCORING_ENGINE_VERSION,
+            "weights": DEFAULT_WEIGHTS,
+            "threshold": SCORE_THRESHOLD,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass(slots=True)
+class RematchStats:
+    """Toplu eşleştirme çalıştırma metrikleri."""
+
+    office_id: str
+    mode: str  # "full" | "incremental"
+    properties_scanned: int = 0
+    customers_scanned: int = 0
+    changed_properties: int = 0
+    changed_customers: int = 0
+    pairs_scored: int = 0
+    matches_upserted: int = 0
+    elapsed_ms: int = 0
+
+    @property
+    def pairs_per_second(self) -> float:
+        if self.elapsed_ms <= 0:
+            return 0.0
+        return round(self.pairs_scored * 1000 / self.elapsed_ms, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "pairs_per_second": self.pairs_per_second}
+
+
+def _record(
+    office_id: uuid.UUID,
+    property_id: uuid.UUID,
+    customer_id: uuid.UUID,
+    score: float,
+    details: dict,
+) -> dict:
+    return {
+        "office_id": office_id,
+        "property_id": property_id,
+        "customer_id": customer_id,
+        "score": score,
+        "status": "pending",
+        "notes": json.dumps(details, ensure_ascii=False),
+    }
+
+
+async def _property_chunks(
+    db: AsyncSession,
+    office_id: uuid.UUID,
+    *,
+    since: datetime | None,
+    chunk_size: int,
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    Aktif ilanları id keyset'i ile parça parça döndürür.
+
+    Server-side cursor yerine keyset: parçalar arasında commit yapılabilir.
+    """
+    last_id: uuid.UUID | None = None
+    while True:
+        stmt = (
+            select(*(getattr(Property, c) for c in PropertyColumns.COLUMNS))
+            .where(
+                Property.office_id == office_id,
+                Property.status == "active",
+            )
+            .order_by(Property.id)
+            .limit(chunk_size)
+        )
+        if since is not None:
+            stmt = stmt.where(Property.updated_at > since)
+        if last_id is not None:
+            stmt = stmt.where(Property.id > last_id)
+
+        rows = (await db.execute(stmt)).all()
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+        last_id = rows[-1].id
+
+
+async def _load_customers(
+    db: AsyncSession,
+    office_id: uuid.UUID,
+    since: datetime | None = None,
+) -> Sequence[Row]:
+    stmt = select(*(getattr(Customer, c) for c in CustomerColumns.COLUMNS)).where(
+        Customer.office_id == office_id,
+        Customer.customer_type.in_(_BUYER_TYPES),
+    )
+    if since is not None:
+        stmt = stmt.where(Customer.updated_at > since)
+    return (await db.execute(stmt)).all()
+
+
+async def _save_watermark(
+    db: AsyncSession,
+    office_id: uuid.UUID,
+    version: str,
+    watermark: datetime,
+) -> None:
+    stmt = insert(MatchRematchState).values(
+        office_id=office_id,
+        scoring_version=version,
+        watermark=watermark,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MatchRematchState.office_id],
+        set_={
+            "scoring_version": stmt.excluded.scoring_version,
+            "watermark": stmt.excluded.watermark,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def rematch_office(
+    db: AsyncSession,
+    office_id: uuid.UUID,
+    *,
+    full: bool = False,
+    chunk_size: int | None = None,
+) -> RematchStats:
+    """
+    Ofisin eşleştirmelerini toplu olarak yeniden hesaplar.
+
+    Args:
+        db: Async database session. Parçalar arasında commit edilir.
+        office_id: Tenant (ofis) UUID.
+        full: True ise watermark yok sayılır, tüm çiftler skorlanır.
+        chunk_size: Tek seferde skorlanan ilan sayısı (varsayılan: settings).
+
+    Returns:
+        RematchStats — taranan satırlar, skorlanan çiftler, throughput.
+    """
+    start_time = time.monotonic()
+    chunk_size = chunk_size or settings.MATCH_REMATCH_CHUNK_SIZE
+    version = scoring_version()
+
+    # Watermark DB saatine göre tutulur (uygulama sunucusu saatine değil)
+    run_started: datetime = (await db.execute(select(func.now()))).scalar_one()
+    state = await db.get(MatchRematchState, office_id)
+
+    since: datetime | None = None
+    if not full and state is not None and state.scoring_version == version:
+        since = state.watermark - timedelta(
+            seconds=settings.MATCH_REMATCH_WATERMARK_LAG_SECONDS,
+        )
+
+    stats = RematchStats(
+        office_id=str(office_id),
+        mode="full" if since is None else "incremental",
+    )
+
+    customers = CustomerColumns.from_rows(await _load_customers(db, office_id))
+    stats.customers_scanned = len(customers)
+
+    # ── 1. (Değişen) ilanlar × tüm müşteriler ──
+    changed_property_ids: set[uuid.UUID] = set()
+    async for rows in _property_chunks(db, office_id, since=since, chunk_size=chunk_size):
+        records = [
+            _record(office_id, prop.id, customer_id, score, details)
+            for prop in rows
+            for customer_id, score, details in score_customers_for_property(prop, customers)
+        ]
+        stats.properties_scanned += len(rows)
+        stats.pairs_scored += len(rows) * len(customers)
+        stats.matches_upserted += await upsert_match_records(db, records)
+        await db.commit()
+        if since is not None:
+            changed_property_ids.update(row.id for row in rows)
+
+    stats.changed_properties = len(changed_property_ids)
+
+    # ── 2. Değişen müşteriler × değişmeyen ilanlar (sadece incremental) ──
+    if since is not None:
+        changed_customers = await _load_customers(db, office_id, since=since)
+        stats.changed_customers = len(changed_customers)
+
+        if changed_customers:
+            async for rows in _property_chunks(db, office_id, since=None, chunk_size=chunk_size):
+                properties = PropertyColumns.from_rows(
+                    [row for row in rows if row.id not in changed_property_ids],
+                )
+                records = [
+                    _record(office_id, property_id, customer.id, score, details)
+                    for customer in changed_customers
+                    for property_id, score, details in score_properties_for_customer(
+                        customer, properties,
+                    )
+                ]
+                stats.properties_scanned += len(properties)
+                stats.pairs_scored += len(properties) * len(changed_customers)
+                stats.matches_upserted += await upsert_match_records(db, records)
+                await db.commit()
+
+    # ── 3. Watermark — sadece başarılı tamamlanınca ilerler ──
+    await _save_watermark(db, office_id, version, run_started)
+    await db.commit()
+
+    stats.elapsed_ms = int((time.monotonic() - start_time) * 1000)
+    logger.info("office_rematch_completed", **stats.as_dict())
+    return stats
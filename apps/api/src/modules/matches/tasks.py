@@ -6,12 +6,18 @@ Emlak Teknoloji Platformu - Matching Celery Tasks
 Tasks:
     trigger_matching_for_property  — Yeni ilan için eşleştirme + bildirim
     trigger_matching_for_customer  — Yeni müşteri için eşleştirme + bildirim
+    trigger_matching_for_office_properties — Ofisin bekleyen ilanları tek geçişte
+                                     (debounce batch modu)
+    rematch_office                 — Ofis bazlı toplu eşleştirme (watermark, bildirim yok)
 
 Mimari Kararlar:
-    - asyncio.run() ile async MatchingService çağrılır (Celery prefork → event loop yok)
+    - run_async() ile async MatchingService worker'ın kalıcı loop'unda çağrılır
+      (src.core.worker_runtime — asyncpg havuzu task'lar arasında korunur)
     - async_session_factory kullanılır (asyncpg)
     - Bildirim hataları matching'i BOZMAZ (ayrı try/except, ayrı transaction)
     - Idempotent: UPSERT sayesinde aynı ID ile tekrar çağrılabilir
+    - Debounce: Task başlarken Redis işaretini siler / bekleyen kümeyi boşaltır
+      (debounce.py) — bundan sonraki tetikler yeni çalıştırma planlar
     - TelegramAdapter task başına oluşturulur/kapatılır (HTTP session leak yok)
 
 Kuyruğu: default
@@ -22,7 +28,6 @@ Referans: TASK-111, S7.7, S7.8
 
 from __future__ import annotations
 
-import asyncio
 import contextlib
 import time
 import uuid as uuid_mod
@@ -31,6 +36,8 @@ from typing import TYPE_CHECKING, Any
 import structlog
 
 from src.celery_app import celery_app
+from src.core.worker_runtime import run_async
+from src.modules.matches import debounce
 from src.tasks.base import BaseTask
 
 if TYPE_CHECKING:
@@ -307,6 +314,62 @@ async def _run_matching_for_customer(
         }
 
 
+async def _run_matching_for_office_properties(
+    property_ids: list[uuid_mod.UUID],
+    office_id: uuid_mod.UUID,
+) -> dict[str, Any]:
+    """
+    Ofisin bekleyen ilanları için tek geçişte eşleştirme + bildirim.
+
+    İki ayrı transaction (ilan bazlı task ile aynı):
+        1. Matching → commit (kalıcı)
+        2. Notifications → commit (hata olsa bile matching korunur)
+    """
+    from src.database import async_session_factory
+    from src.modules.matches.matching_service import MatchingService
+
+    async with async_session_factory() as db:
+        # ── 1. Matching (ana iş) ──
+        matches = await MatchingService.find_matches_for_properties(
+            db, property_ids, office_id,
+        )
+        await db.commit()
+
+        # ── 2. Bildirimler (ayrı transaction) ──
+        notification_count = 0
+        if matches:
+            try:
+                notification_count = await _send_match_notifications(
+                    db, matches, office_id,
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                logger.exception(
+                    "match_notification_batch_error",
+                    office_id=str(office_id),
+                    property_count=len(property_ids),
+                )
+
+        return {
+            "matches_count": len(matches),
+            "notification_count": notification_count,
+        }
+
+
+async def _run_rematch_office(
+    office_id: uuid_mod.UUID,
+    full: bool,
+) -> dict[str, Any]:
+    """Ofis bazlı toplu eşleştirme (async worker). Parça bazlı commit rematch içinde."""
+    from src.database import async_session_factory
+    from src.modules.matches.rematch import rematch_office as run_rematch
+
+    async with async_session_factory() as db:
+        stats = await run_rematch(db, office_id, full=full)
+        return stats.as_dict()
+
+
 # ================================================================
 # Celery Tasks
 # ================================================================
@@ -348,7 +411,10 @@ def trigger_matching_for_property(
         trigger="property",
     )
 
-    result = asyncio.run(
+    # Debounce işareti: bundan sonraki tetikler yeni çalıştırma planlar
+    debounce.release("property", property_id)
+
+    result = run_async(
         _run_matching_for_property(
             uuid_mod.UUID(property_id),
             uuid_mod.UUID(office_id),
@@ -410,7 +476,10 @@ def trigger_matching_for_customer(
         trigger="customer",
     )
 
-    result = asyncio.run(
+    # Debounce işareti: bundan sonraki tetikler yeni çalıştırma planlar
+    debounce.release("customer", customer_id)
+
+    result = run_async(
         _run_matching_for_customer(
             uuid_mod.UUID(customer_id),
             uuid_mod.UUID(office_id),
@@ -434,3 +503,129 @@ def trigger_matching_for_customer(
         "customer_id": customer_id,
         "office_id": office_id,
     }
+
+
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    queue="default",
+    name="src.modules.matches.tasks.trigger_matching_for_office_properties",
+    max_retries=2,
+)
+def trigger_matching_for_office_properties(
+    self: BaseTask,
+    office_id: str,
+) -> dict[str, Any]:
+    """
+    Ofisin bekleyen ilanları için toplu eşleştirme Celery task'ı.
+
+    Debounce batch modunda trigger_matching_after_property_create
+    tarafından gecikmeyle planlanır. Pencere içinde eklenen/güncellenen
+    tüm ilanlar Redis kümesinden atomik olarak alınır ve tek skor
+    geçişinde işlenir. Hata olursa ilanlar kümeye geri konur; retry
+    onları tekrar alır.
+
+    Args:
+        office_id: Tenant UUID (string — JSON serialization).
+
+    Returns:
+        dict: properties_count, matches_count, notification_count, elapsed_ms
+    """
+    start_time = time.monotonic()
+    property_ids = debounce.drain_office_properties(office_id)
+
+    self.log.info(
+        "matching_task_started",
+        office_id=office_id,
+        property_count=len(property_ids),
+        trigger="property_batch",
+    )
+
+    if not property_ids:
+        return {
+            "properties_count": 0,
+            "matches_count": 0,
+            "notification_count": 0,
+            "elapsed_ms": 0,
+            "office_id": office_id,
+        }
+
+    try:
+        result = run_async(
+            _run_matching_for_office_properties(
+                property_ids,
+                uuid_mod.UUID(office_id),
+            ),
+        )
+    except Exception:
+        debounce.restore_office_properties(office_id, property_ids)
+        raise
+
+    elapsed_ms = int((time.monotonic() - start_time) * 1000)
+
+    self.log.info(
+        "matching_task_completed",
+        office_id=office_id,
+        property_count=len(property_ids),
+        matches_count=result["matches_count"],
+        notification_count=result["notification_count"],
+        elapsed_ms=elapsed_ms,
+    )
+
+    return {
+        **result,
+        "properties_count": len(property_ids),
+        "elapsed_ms": elapsed_ms,
+        "office_id": office_id,
+    }
+
+
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    queue="default",
+    name="src.modules.matches.tasks.rematch_office",
+    max_retries=2,
+)
+def rematch_office(
+    self: BaseTask,
+    office_id: str,
+    full: bool = False,
+) -> dict[str, Any]:
+    """
+    Ofis bazlı toplu eşleştirme Celery task'ı.
+
+    Ağırlık/eşik değişikliğinden sonra veya periyodik olarak çağrılır.
+    Watermark'tan sonra değişen ilan/müşteri çiftlerini yeniden skorlar;
+    skor sürümü değiştiyse tüm ofisi baştan hesaplar. Bildirim göndermez.
+
+    Idempotent: Yarıda kalırsa watermark ilerlemez, tekrar çalıştırılabilir.
+
+    Args:
+        office_id: Tenant UUID (string — JSON serialization).
+        full: True ise watermark yok sayılır.
+
+    Returns:
+        dict: RematchStats alanları + pairs_per_second
+    """
+    self.log.info(
+        "office_rematch_task_started",
+        office_id=office_id,
+        full=full,
+    )
+
+    result = run_async(
+        _run_rematch_office(uuid_mod.UUID(office_id), full),
+    )
+
+    self.log.info(
+        "office_rematch_task_completed",
+        office_id=office_id,
+        mode=result["mode"],
+        pairs_scored=result["pairs_scored"],
+        matches_upserted=result["matches_upserted"],
+        pairs_per_second=result["pairs_per_second"],
+        elapsed_ms=result["elapsed_ms"],
+    )
+
+    return result
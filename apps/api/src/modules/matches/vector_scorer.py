@@ -0,0 +1,369 @@
+"""
+Emlak Teknoloji Platformu - Vektörel Eşleştirme Skorlayıcı
+
+calculate_match_score ile birebir aynı skor semantiğini NumPy kolon
+dizileri üzerinde uygular. Bir ilan tüm müşterilere (veya bir müşteri
+tüm ilanlara) tek geçişte skorlanır; Python seviyesinde sadece eşiği
+geçen satırlar için detay sözlüğü üretilir.
+
+Akış:
+    1. Adaylar ORM nesnesi yerine kompakt kolonlar olarak yüklenir
+       (CustomerColumns / PropertyColumns). Oda sayısı ve ilçe adları
+       yükleme sırasında bir kez parse / normalize edilir.
+    2. Dört kriter skoru vektörel hesaplanır (eksik kriter = NaN).
+    3. Ağırlık normalizasyonu ve bileşik skor vektörel hesaplanır.
+    4. Eşik adayları compose_match_score ile yeniden bileştirilir —
+       yuvarlama ve details içeriği skaler yol ile aynıdır.
+
+Kullanım:
+    columns = CustomerColumns.from_rows(rows)
+    hits = score_customers_for_property(prop, columns)
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from src.modules.matches.matching_service import (
+    DEFAULT_WEIGHTS,
+    SCORE_THRESHOLD,
+    compose_match_score,
+    parse_room_count,
+)
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Iterable, Sequence
+
+# Bileşik skor round(x, 2) ile karşılaştırılır; vektörel ön filtre
+# yuvarlama sınırındaki adayları kaçırmamak için bu kadar pay bırakır.
+_ROUND_SLACK = 0.01
+
+_ROOM_SCORES = (100.0, 50.0, 20.0)
+
+# "3+1" gibi değerler çok az çeşitlidir — her satır için regex çalıştırmaya gerek yok
+_parse_rooms = lru_cache(maxsize=512)(parse_room_count)
+
+
+def _normalize_district(value: str) -> str:
+    return value.lower().strip()
+
+
+def _float_array(values: Iterable[Any], count: int) -> np.ndarray:
+    """None → NaN; Decimal/int → float (skaler yoldaki float() ile aynı)."""
+    return np.fromiter(
+        (math.nan if v is None else float(v) for v in values),
+        dtype=np.float64,
+        count=count,
+    )
+
+
+def _room_array(values: Iterable[str | None], count: int) -> np.ndarray:
+    return np.fromiter(
+        (math.nan if (n := _parse_rooms(v)) is None else float(n) for v in values),
+        dtype=np.float64,
+        count=count,
+    )
+
+
+# ================================================================
+# Candidate Columns
+# ================================================================
+
+
+@dataclass(slots=True)
+class CustomerColumns:
+    """
+    Buyer/renter müşterilerin skor kolonları.
+
+    desired_districts JSON dizileri (satır indeksi, ilçe kodu) çiftlerine
+    açılır; bir ilanın ilçesi için maske tek bir karşılaştırma ile çıkar.
+    """
+
+    ids: list[uuid.UUID]
+    budget_min: np.ndarray
+    budget_max: np.ndarray
+    rooms: np.ndarray
+    area_min: np.ndarray
+    area_max: np.ndarray
+    has_districts: np.ndarray
+    district_rows: np.ndarray
+    district_codes: np.ndarray
+    vocabulary: dict[str, int]
+
+    COLUMNS = (
+        "id",
+        "budget_min",
+        "budget_max",
+        "desired_rooms",
+        "desired_area_min",
+        "desired_area_max",
+        "desired_districts",
+    )
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]]) -> CustomerColumns:
+        """COLUMNS sırasındaki satırlardan kolon dizileri oluşturur."""
+        n = len(rows)
+        cols = list(zip(*rows, strict=True)) if rows else [()] * len(cls.COLUMNS)
+        ids, bmin, bmax, rooms, amin, amax, districts = cols
+
+        vocabulary: dict[str, int] = {}
+        pair_rows: list[int] = []
+        pair_codes: list[int] = []
+        has_districts = np.zeros(n, dtype=bool)
+        for i, desired in enumerate(districts):
+            if not desired:
+                continue
+            has_districts[i] = True
+            for d in desired:
+                if isinstance(d, str):
+                    code = vocabulary.setdefault(_normalize_district(d), len(vocabulary))
+                    pair_rows.append(i)
+                    pair_codes.append(code)
+
+        return cls(
+            ids=list(ids),
+            budget_min=_float_array(bmin, n),
+            budget_max=_float_array(bmax, n),
+            rooms=_room_array(rooms, n),
+            area_min=_float_array(amin, n),
+            area_max=_float_array(amax, n),
+            has_districts=has_districts,
+            district_rows=np.asarray(pair_rows, dtype=np.int64),
+            district_codes=np.asarray(pair_codes, dtype=np.int64),
+            vocabulary=vocabulary,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def location_scores(self, district: str) -> np.ndarray:
+        """İlan ilçesi için müşteri başına konum skoru (100 / 0 / NaN)."""
+        wants = np.zeros(len(self), dtype=bool)
+        code = self.vocabulary.get(_normalize_district(district))
+        if code is not None:
+            wants[self.district_rows[self.district_codes == code]] = True
+        return np.where(self.has_districts, np.where(wants, 100.0, 0.0), np.nan)
+
+
+@dataclass(slots=True)
+class PropertyColumns:
+    """Aktif ilanların skor kolonları; ilçeler tamsayı koduna çevrilir."""
+
+    ids: list[uuid.UUID]
+    price: np.ndarray
+    rooms: np.ndarray
+    net_area: np.ndarray
+    district_codes: np.ndarray
+    vocabulary: dict[str, int]
+
+    COLUMNS = ("id", "price", "rooms", "net_area", "district")
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Any]]) -> PropertyColumns:
+        """COLUMNS sırasındaki satırlardan kolon dizileri oluşturur."""
+        n = len(rows)
+        cols = list(zip(*rows, strict=True)) if rows else [()] * len(cls.COLUMNS)
+        ids, price, rooms, net_area, districts = cols
+
+        vocabulary: dict[str, int] = {}
+        codes = np.fromiter(
+            (
+                vocabulary.setdefault(_normalize_district(d), len(vocabulary))
+                for d in districts
+            ),
+            dtype=np.int64,
+            count=n,
+        )
+
+        return cls(
+            ids=list(ids),
+            price=_float_array(price, n),
+            rooms=_room_array(rooms, n),
+            net_area=_float_array(net_area, n),
+            district_codes=codes,
+            vocabulary=vocabulary,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def location_scores(self, desired_districts: list | None) -> np.ndarray:
+        """Müşteri ilçe tercihi için ilan başına konum skoru (100 / 0 / NaN)."""
+        if not desired_districts:
+            return np.full(len(self), np.nan)
+        wanted = [
+            code
+            for d in desired_districts
+            if isinstance(d, str)
+            and (code := self.vocabulary.get(_normalize_district(d))) is not None
+        ]
+        return np.where(np.isin(self.district_codes, wanted), 100.0, 0.0)
+
+
+# ================================================================
+# Vectorized Criteria
+# ================================================================
+
+
+def _range_scores(value: Any, low: Any, high: Any) -> np.ndarray:
+    """
+    _calculate_price_score / _calculate_area_score vektörel karşılığı.
+
+    Aralık içi 100, alt sınırın %80'i / üst sınırın %120'si dışı 0,
+    arası lineer. Değer veya iki sınır birden NaN ise NaN (kriter atlanır).
+    """
+    value, low, high = np.broadcast_arrays(
+        np.asarray(value, dtype=np.float64),
+        np.asarray(low, dtype=np.float64),
+        np.asarray(high, dtype=np.float64),
+    )
+    lower = low * 0.8
+    upper = high * 1.2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        below_score = np.maximum(0.0, 100.0 * (value - lower) / (low - lower))
+        above_score = np.maximum(0.0, 100.0 * (upper - value) / (upper - high))
+
+    # Skaler yolda alt sınır kontrolü önce yapılır (ters girilmiş bütçelerde önemli)
+    below = value < low
+    above = ~below & (value > high)
+
+    scores = np.full(value.shape, 100.0)
+    scores = np.where(below, np.where(value <= lower, 0.0, below_score), scores)
+    scores = np.where(above, np.where(value >= upper, 0.0, above_score), scores)
+    missing = np.isnan(value) | (np.isnan(low) & np.isnan(high))
+    return np.where(missing, np.nan, scores)
+
+
+def _room_scores(property_rooms: Any, desired_rooms: Any) -> np.ndarray:
+    """_calculate_room_score vektörel karşılığı: fark 0/1/2 → 100/50/20, fazlası 0."""
+    diff = np.abs(np.asarray(property_rooms) - np.asarray(desired_rooms))
+    scores = np.select([diff == i for i in range(len(_ROOM_SCORES))], _ROOM_SCORES, 0.0)
+    return np.where(np.isnan(diff), np.nan, scores)
+
+
+def _composite(raw: dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Eksik kriterleri atlayarak ağırlıklı ortalama (yuvarlanmamış).
+
+    Toplama sırası compose_match_score ile aynıdır; sonuç aynı
+    kayan nokta değerine çıkar.
+    """
+    active = {k: ~np.isnan(raw[k]) for k in DEFAULT_WEIGHTS}
+    total_weight = np.zeros_like(raw["price"])
+    for k, weight in DEFAULT_WEIGHTS.items():
+        total_weight = total_weight + np.where(active[k], weight, 0.0)
+
+    final = np.zeros_like(total_weight)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k, weight in DEFAULT_WEIGHTS.items():
+            final = final + np.where(active[k], raw[k] * (weight / total_weight), 0.0)
+    return np.where(total_weight > 0, final, 0.0)
+
+
+def _materialize(
+    raw: dict[str, np.ndarray],
+    ids: list[uuid.UUID],
+    threshold: float,
+) -> list[tuple[uuid.UUID, float, dict]]:
+    """Eşiği geçen adaylar için (id, skor, details) üretir."""
+    candidates = np.flatnonzero(_composite(raw) >= threshold - _ROUND_SLACK)
+
+    results: list[tuple[uuid.UUID, float, dict]] = []
+    for i in candidates.tolist():
+        scores = {
+            k: None if math.isnan(v := float(raw[k][i])) else v
+            for k in DEFAULT_WEIGHTS
+        }
+        score, details = compose_match_score(scores)
+        if score >= threshold:
+            results.append((ids[i], score, details))
+    return results
+
+
+# ================================================================
+# Public API
+# ================================================================
+
+
+def score_customers_for_property(
+    prop: Any,
+    customers: CustomerColumns,
+    threshold: float = SCORE_THRESHOLD,
+) -> list[tuple[uuid.UUID, float, dict]]:
+    """
+    Tek bir ilanı tüm müşteri kolonlarına karşı skorlar.
+
+    Args:
+        prop: price, district, rooms, net_area alanları olan ilan.
+        customers: Aday müşteri kolonları.
+        threshold: Minimum skor (dahil).
+
+    Returns:
+        Eşiği geçen (customer_id, score, details) listesi.
+    """
+    if not len(customers):
+        return []
+
+    prop_rooms = _parse_rooms(prop.rooms)
+    raw = {
+        "price": _range_scores(
+            math.nan if prop.price is None else float(prop.price),
+            customers.budget_min,
+            customers.budget_max,
+        ),
+        "location": customers.location_scores(prop.district),
+        "room": _room_scores(
+            math.nan if prop_rooms is None else float(prop_rooms), customers.rooms,
+        ),
+        "area": _range_scores(
+            math.nan if prop.net_area is None else float(prop.net_area),
+            customers.area_min,
+            customers.area_max,
+        ),
+    }
+    return _materialize(raw, customers.ids, threshold)
+
+
+def score_properties_for_customer(
+    customer: Any,
+    properties: PropertyColumns,
+    threshold: float = SCORE_THRESHOLD,
+) -> list[tuple[uuid.UUID, float, dict]]:
+    """
+    Tek bir müşteriyi tüm ilan kolonlarına karşı skorlar.
+
+    Args:
+        customer: budget_min/max, desired_* alanları olan müşteri.
+        properties: Aday ilan kolonları.
+        threshold: Minimum skor (dahil).
+
+    Returns:
+        Eşiği geçen (property_id, score, details) listesi.
+    """
+    if not len(properties):
+        return []
+
+    def _f(value: Any) -> float:
+        return math.nan if value is None else float(value)
+
+    desired_rooms = _parse_rooms(customer.desired_rooms)
+    raw = {
+        "price": _range_scores(
+            properties.price, _f(customer.budget_min), _f(customer.budget_max),
+        ),
+        "location": properties.location_scores(customer.desired_districts),
+        "room": _room_scores(properties.rooms, _f(desired_rooms)),
+        "area": _range_scores(
+            properties.net_area,
+            _f(customer.desired_area_min),
+            _f(customer.desired_area_max),
+        ),
+    }
+    return _materialize(raw, properties.ids, threshold)
@@ -718,7 +718,7 @@ class TelegramBotHandler:
             1. Parametreleri parse et (5 adet, virgul ile ayrılmis)
             2. Oda formatini ayristir (3+1 → room=3, living=1)
             3. Eksik feature'lar icin makul varsayilan deger ata
-            4. InferenceService.predict_quick() cagir
+            4. InferenceService.predict_cached() cagir (cache → event loop disi model)
             5. Sonucu formatla ve gonder
         """
         content = incoming.content.strip()
@@ -789,7 +789,7 @@ class TelegramBotHandler:
             from src.modules.valuations.inference_service import InferenceService
 
             service = InferenceService.get_instance()
-            result = service.predict_quick(input_data)
+            result, _ = await service.predict_cached(input_data)
 
             estimated = _format_price(result["estimated_price"])
             low = _format_price(result["confidence_low"])
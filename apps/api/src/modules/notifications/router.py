@@ -23,6 +23,7 @@ from fastapi import APIRouter, Query, status
 from sqlalchemy import select
 
 from src.core.exceptions import NotFoundError
+from src.core.pagination import resolve_count_strategy
 from src.dependencies import DBSession
 from src.models.notification import Notification
 from src.modules.auth.dependencies import ActiveUser
@@ -73,18 +74,13 @@ async def list_notifications(
     - Sonuclar en yeniden en eskiye siralanir
     - Pagination: limit + offset
     """
-    notifications = await NotificationService.list_for_user(
+    result = await NotificationService.list_page_for_user(
         db=db,
         user_id=current_user.id,
         unread_only=unread_only,
         limit=limit,
         offset=offset,
-    )
-
-    total = await NotificationService.count_for_user(
-        db=db,
-        user_id=current_user.id,
-        unread_only=unread_only,
+        count_strategy=resolve_count_strategy("notifications"),
     )
 
     return NotificationListResponse(
@@ -98,9 +94,11 @@ async def list_notifications(
                 data=n.data,
                 created_at=n.created_at,
             )
-            for n in notifications
+            for n in result.items
         ],
-        total=total,
+        total=result.total,
+        total_exact=result.total_exact,
+        has_more=result.has_more,
     )
 
 
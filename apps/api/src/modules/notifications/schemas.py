@@ -35,6 +35,10 @@ class NotificationListResponse(BaseModel):
 
     items: list[NotificationResponse] = Field(description="Bildirim listesi")
     total: int = Field(description="Toplam bildirim sayisi")
+    total_exact: bool = Field(
+        default=True, description="total kesin mi (false → alt sinir)"
+    )
+    has_more: bool = Field(default=False, description="Sonraki sayfa var mi")
 
 
 class UnreadCountResponse(BaseModel):
@@ -10,6 +10,7 @@ Guvenlik:
 
 Kullanim:
     notifications = await NotificationService.list_for_user(db, user_id)
+    page = await NotificationService.list_page_for_user(db, user_id, count_strategy=strategy)
     await NotificationService.mark_read(db, notification_id, user_id)
 """
 
@@ -22,6 +23,7 @@ import structlog
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.pagination import CountStrategy, Page, count_rows
 from src.models.notification import Notification
 from src.modules.realtime.event_emitter import emit_event
 from src.modules.realtime.events import EventType
@@ -147,6 +149,54 @@ class NotificationService:
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    # ---------- Page (items + total, for pagination) ----------
+
+    @staticmethod
+    async def list_page_for_user(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        unread_only: bool = False,
+        limit: int = 20,
+        offset: int = 0,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[Notification]:
+        """
+        Kullanicinin bildirimlerini toplam sayi ile birlikte listeler.
+
+        Sayfa limit + 1 satirla cekilir (has_more probe); toplam sayi
+        count_strategy ile hesaplanir — has_more stratejisinde esik ustu
+        toplam sayilmaz, total alt sinirdir (total_exact=False).
+
+        Args:
+            db: Async database session.
+            user_id: Hedef kullanici UUID.
+            unread_only: True ise sadece okunmamis bildirimler.
+            limit: Sayfa basi kayit sayisi.
+            offset: Atlanacak kayit sayisi.
+            count_strategy: Toplam sayim stratejisi.
+
+        Returns:
+            Page[Notification] — items, total, total_exact, has_more.
+        """
+        notifications = await NotificationService.list_for_user(
+            db, user_id, unread_only=unread_only, limit=limit + 1, offset=offset
+        )
+
+        count_query = select(Notification.id).where(
+            Notification.user_id == user_id,
+            Notification.is_deleted == False,  # noqa: E712
+        )
+        if unread_only:
+            count_query = count_query.where(Notification.is_read == False)  # noqa: E712
+        total, total_exact = await count_rows(db, count_query, strategy=count_strategy)
+
+        return Page(
+            items=notifications[:limit],
+            total=total,
+            total_exact=total_exact,
+            has_more=len(notifications) > limit,
+        )
+
     # ---------- Count (total, for pagination) ----------
 
     @staticmethod
@@ -13,18 +13,50 @@ Turkce Normalizasyon (migration 013 ile eklendi):
   - turkish_normalize() SQL fonksiyonu: I->i, I->i, S->s, G->g, U->u, O->o, C->c
   - idx_properties_turkish_search: normalized text uzerinde trigram GIN indeksi
   - Python tarafi: src.core.turkish.normalize_turkish() (ayni donusum mantigi)
+
+Motor Modlari (settings.SEARCH_ENGINE_MODE):
+  - single_pass: Uc katman tek CTE sorgusunda degerlendirilir; katman secimi
+    SQL tarafinda yapilir, toplam sayi count(*) OVER () ile sayfayla birlikte doner.
+  - cascade: Katman basina ayri count + sayfa sorgusu (en fazla 6 round trip).
 """
 
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
-
-from sqlalchemy import Select, func, literal_column, select
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    Float,
+    Select,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    null,
+    select,
+    union_all,
+)
 
 if TYPE_CHECKING:
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from collections.abc import Sequence
 
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql.elements import ColumnElement
+    from sqlalchemy.sql.selectable import CTE, ScalarSelect
+
+from src.config import settings
+from src.core.pagination import (
+    CountStrategy,
+    Page,
+    SortKey,
+    count_rows,
+    decode_cursor,
+    keyset_after,
+    order_by_keys,
+    trim_page,
+)
 from src.core.turkish import normalize_turkish
 from src.models.property import Property
 
@@ -53,6 +85,11 @@ FTS_MIN_RESULTS_FOR_FALLBACK: int = 3
 #: Gecerli siralama secenekleri
 VALID_SORT_OPTIONS: set[str] = {"relevance", "price_asc", "price_desc", "newest", "area"}
 
+#: Arama motoru modlari
+SEARCH_MODE_SINGLE_PASS: str = "single_pass"
+SEARCH_MODE_CASCADE: str = "cascade"
+VALID_SEARCH_MODES: set[str] = {SEARCH_MODE_SINGLE_PASS, SEARCH_MODE_CASCADE}
+
 
 # ---------- Turkce Normalizasyon ----------
 # Merkezi utility: src.core.turkish.normalize_turkish()
@@ -159,20 +196,100 @@ def _apply_filters(
     return stmt
 
 
-def _apply_sort(stmt: Select, sort: str, *, has_rank: bool = False) -> Select:
-    """Siralama secenegini SELECT ifadesine uygula."""
+def _sort_keys(
+    sort: str,
+    *,
+    score: ColumnElement[Any] | None = None,
+    score_nullable: bool = False,
+) -> list[SortKey]:
+    """
+    Siralama seceneginin keyset anahtarlari (ORDER BY + cursor icin ortak).
+
+    Her siralama id ile sonlanir — esit degerlerde deterministik sira ve
+    cursor'in tek bir satiri gostermesi icin gerekli.
+
+    relevance: skor varsa (skor, created_at, id), yoksa newest'a duser.
+    """
     if sort == "price_asc":
-        return stmt.order_by(Property.price.asc())
+        return [SortKey(Property.price, descending=False), SortKey(Property.id, descending=False)]
     if sort == "price_desc":
-        return stmt.order_by(Property.price.desc())
-    if sort == "newest":
-        return stmt.order_by(Property.created_at.desc())
+        return [SortKey(Property.price), SortKey(Property.id)]
     if sort == "area":
-        return stmt.order_by(Property.net_area.desc().nulls_last())
-    # "relevance" — FTS rank varsa zaten uygulanmis, yoksa newest'a dussun
-    if not has_rank:
-        return stmt.order_by(Property.created_at.desc())
-    return stmt
+        return [SortKey(Property.net_area, nullable=True, nulls_last=True), SortKey(Property.id)]
+    if sort == "relevance" and score is not None:
+        return [
+            SortKey(score, nullable=score_nullable, nulls_last=True),
+            SortKey(Property.created_at),
+            SortKey(Property.id),
+        ]
+    # "newest" ve skorsuz "relevance"
+    return [SortKey(Property.created_at), SortKey(Property.id)]
+
+
+def _cursor_values(sort: str, prop: Property, score: float | None, *, has_score: bool) -> list[Any]:
+    """_sort_keys() sirasiyla ayni: son satirin cursor degerleri."""
+    if sort in ("price_asc", "price_desc"):
+        return [prop.price, prop.id]
+    if sort == "area":
+        return [prop.net_area, prop.id]
+    if sort == "relevance" and has_score:
+        return [score, prop.created_at, prop.id]
+    return [prop.created_at, prop.id]
+
+
+def _apply_sort(
+    stmt: Select,
+    sort: str,
+    *,
+    score: ColumnElement[Any] | None = None,
+    score_nullable: bool = False,
+) -> Select:
+    """Siralama secenegini SELECT ifadesine uygula."""
+    return stmt.order_by(
+        *order_by_keys(_sort_keys(sort, score=score, score_nullable=score_nullable))
+    )
+
+
+def _apply_cursor(
+    stmt: Select,
+    sort: str,
+    cursor: str | None,
+    *,
+    score: ColumnElement[Any] | None = None,
+    score_nullable: bool = False,
+) -> Select:
+    """Cursor varsa keyset kosulunu (`WHERE (anahtar, id) > cursor`) uygula."""
+    if not cursor:
+        return stmt
+    keys = _sort_keys(sort, score=score, score_nullable=score_nullable)
+    values = decode_cursor(cursor, f"search:{sort}", len(keys))
+    return stmt.where(keyset_after(keys, values))
+
+
+def _build_page(
+    rows: Sequence[Any],
+    total: int,
+    *,
+    sort: str,
+    limit: int,
+    has_score: bool,
+    total_exact: bool = True,
+) -> Page[Property]:
+    """(Property, skor) satirlarindan (limit + 1 ile cekilmis) Page olustur."""
+    page_rows, next_cursor = trim_page(
+        rows,
+        limit,
+        f"search:{sort}",
+        lambda row: _cursor_values(
+            sort, row[0], row[1] if has_score else None, has_score=has_score
+        ),
+    )
+    return Page(
+        items=[row[0] for row in page_rows],
+        total=total,
+        next_cursor=next_cursor,
+        total_exact=total_exact,
+    )
 
 
 # ---------- FTS Search ----------
@@ -193,7 +310,10 @@ async def search_properties(
     sort: str = "relevance",
     limit: int = DEFAULT_LIMIT,
     offset: int = 0,
-) -> tuple[list[Property], int]:
+    cursor: str | None = None,
+    mode: str | None = None,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+) -> Page[Property]:
     """
     Hibrit property arama — FTS + trigram + ILIKE fallback.
 
@@ -204,6 +324,19 @@ async def search_properties(
       2. Sonuc FTS_MIN_RESULTS_FOR_FALLBACK altindaysa pg_trgm fallback
       3. Trigram da sonuc vermezse ILIKE substring fallback
 
+    single_pass modunda ayni secim kurallari tek SQL ifadesinde uygulanir
+    (bkz. _single_pass_search); cascade modunda katmanlar sirayla sorgulanir.
+
+    Sayfalama: offset/limit veya cursor (keyset). Cursor bir onceki sayfanin
+    next_cursor degeridir ve ayni sort ile kullanilmalidir; cursor verildiginde
+    offset uygulanmaz.
+
+    Toplam sayi: filtre-only ve cascade yollarinda count_strategy uygulanir.
+    single_pass yolunda toplam count(*) OVER () ile zaten sayfayla birlikte
+    gelir (siralama tum eslesmeleri gerektirdigi icin ek maliyeti yok) — her
+    zaman kesindir. Katman secimi yalnizca kucuk sayilari karsilastirdigindan
+    (< esik) tahmini toplamlar cascade kararini degistirmez.
+
     Args:
         session: AsyncSession (SQLAlchemy)
         query: Kullanici arama metni (orn: "3+1 daire kadikoy"), None ise FTS bypass
@@ -219,15 +352,25 @@ async def search_properties(
         sort: Siralama: relevance, price_asc, price_desc, newest, area
         limit: Sayfa boyutu (max 100)
         offset: Sayfa offseti
+        cursor: Keyset cursor (opsiyonel, offset yerine)
+        mode: Motor modu: single_pass, cascade (None → settings.SEARCH_ENGINE_MODE)
+        count_strategy: Toplam sayim stratejisi (bkz. src.core.pagination)
 
     Returns:
-        (properties, total_count) tuple
+        Page[Property] — items, total, next_cursor
+
+    Raises:
+        ValidationError: Gecersiz veya baska siralamaya ait cursor.
     """
     # Girdi dogrulama
     limit = min(max(1, limit), MAX_LIMIT)
-    offset = max(0, offset)
+    offset = 0 if cursor else max(0, offset)
     if sort not in VALID_SORT_OPTIONS:
         sort = "relevance"
+    if mode is None:
+        mode = settings.SEARCH_ENGINE_MODE
+    if mode not in VALID_SEARCH_MODES:
+        mode = SEARCH_MODE_SINGLE_PASS
 
     filter_kwargs = {
         "city": city,
@@ -240,45 +383,52 @@ async def search_properties(
         "min_area": min_area,
         "max_area": max_area,
     }
+    page_kwargs = {"sort": sort, "limit": limit, "offset": offset, "cursor": cursor}
+    count_kwargs = {"count_strategy": count_strategy}
 
     # --- query yoksa: sadece filtre + siralama ---
     if not query or not query.strip():
         return await _filter_only_search(
-            session, sort=sort, limit=limit, offset=offset, **filter_kwargs
+            session, **page_kwargs, **count_kwargs, **filter_kwargs
         )
 
     ts_query_str = build_ts_query(query)
     if not ts_query_str:
         return await _filter_only_search(
-            session, sort=sort, limit=limit, offset=offset, **filter_kwargs
+            session, **page_kwargs, **count_kwargs, **filter_kwargs
+        )
+
+    if mode == SEARCH_MODE_SINGLE_PASS:
+        return await _single_pass_search(
+            session, query, ts_query_str, **page_kwargs, **filter_kwargs
         )
 
     # ---- 1. FTS sorgulama ----
-    fts_results, fts_count = await _fts_search(
-        session, ts_query_str, sort=sort, limit=limit, offset=offset, **filter_kwargs
+    fts_page = await _fts_search(
+        session, ts_query_str, **page_kwargs, **count_kwargs, **filter_kwargs
     )
 
-    if fts_count >= FTS_MIN_RESULTS_FOR_FALLBACK:
-        return fts_results, fts_count
+    if fts_page.total >= FTS_MIN_RESULTS_FOR_FALLBACK:
+        return fts_page
 
     # ---- 2. Trigram fallback ----
-    trgm_results, trgm_count = await search_properties_by_similarity(
-        session, query, sort=sort, limit=limit, offset=offset, **filter_kwargs
+    trgm_page = await search_properties_by_similarity(
+        session, query, **page_kwargs, **count_kwargs, **filter_kwargs
     )
 
-    if trgm_count > fts_count:
-        return trgm_results, trgm_count
+    if trgm_page.total > fts_page.total:
+        return trgm_page
 
     # ---- 3. ILIKE fallback (son care) ----
-    if fts_count == 0 and trgm_count == 0:
-        ilike_results, ilike_count = await _ilike_search(
-            session, query, sort=sort, limit=limit, offset=offset, **filter_kwargs
+    if fts_page.total == 0 and trgm_page.total == 0:
+        ilike_page = await _ilike_search(
+            session, query, **page_kwargs, **count_kwargs, **filter_kwargs
         )
-        if ilike_count > 0:
-            return ilike_results, ilike_count
+        if ilike_page.total > 0:
+            return ilike_page
 
     # FTS sonuclari (en az bir sonuc var ama threshold altinda)
-    return fts_results, fts_count
+    return fts_page
 
 
 async def _filter_only_search(
@@ -287,22 +437,25 @@ async def _filter_only_search(
     sort: str = "relevance",
     limit: int = DEFAULT_LIMIT,
     offset: int = 0,
+    cursor: str | None = None,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
     **filter_kwargs: str | int | float | None,
-) -> tuple[list[Property], int]:
+) -> Page[Property]:
     """Query olmadan sadece filtre + siralama ile listeleme."""
     stmt = select(Property)
     stmt = _apply_filters(stmt, **filter_kwargs)
-    stmt = _apply_sort(stmt, sort, has_rank=False)
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await session.execute(count_stmt)
-    total_count = total_result.scalar_one()
+    total_count, total_exact = await count_rows(session, stmt, strategy=count_strategy)
 
-    paginated = stmt.offset(offset).limit(limit)
+    stmt = _apply_cursor(stmt, sort, cursor)
+    stmt = _apply_sort(stmt, sort)
+    paginated = stmt.offset(offset).limit(limit + 1)
     result = await session.execute(paginated)
-    properties = list(result.scalars().all())
 
-    return properties, total_count
+    return _build_page(
+        result.all(), total_count, sort=sort, limit=limit, has_score=False,
+        total_exact=total_exact,
+    )
 
 
 async def _fts_search(
@@ -312,35 +465,34 @@ async def _fts_search(
     sort: str = "relevance",
     limit: int = DEFAULT_LIMIT,
     offset: int = 0,
+    cursor: str | None = None,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
     **filter_kwargs: str | int | float | None,
-) -> tuple[list[Property], int]:
+) -> Page[Property]:
     """FTS (full-text search) ile arama."""
     ts_query = func.to_tsquery("simple", literal_column(f"'{ts_query_str}'"))
 
     rank_expr = func.ts_rank_cd(
-        Property.search_vector, ts_query, 32
-    ).label("fts_rank")
+        Property.search_vector, ts_query, 32, type_=Float
+    )
 
     stmt = (
-        select(Property)
+        select(Property, rank_expr.label("fts_rank"))
         .where(Property.search_vector.op("@@")(ts_query))
     )
     stmt = _apply_filters(stmt, **filter_kwargs)
 
-    if sort == "relevance":
-        stmt = stmt.order_by(rank_expr.desc())
-    else:
-        stmt = _apply_sort(stmt, sort, has_rank=True)
-
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await session.execute(count_stmt)
-    total_count = total_result.scalar_one()
+    total_count, total_exact = await count_rows(session, stmt, strategy=count_strategy)
 
-    paginated = stmt.offset(offset).limit(limit)
+    stmt = _apply_cursor(stmt, sort, cursor, score=rank_expr)
+    stmt = _apply_sort(stmt, sort, score=rank_expr)
+    paginated = stmt.offset(offset).limit(limit + 1)
     result = await session.execute(paginated)
-    properties = list(result.scalars().all())
 
-    return properties, total_count
+    return _build_page(
+        result.all(), total_count, sort=sort, limit=limit, has_score=True,
+        total_exact=total_exact,
+    )
 
 
 def _build_fts_query(
@@ -390,6 +542,149 @@ def _build_fts_query(
     return stmt
 
 
+# ---------- Single-Pass Hibrit Arama ----------
+
+def _build_single_pass_query(
+    query: str,
+    ts_query_str: str,
+    *,
+    sort: str = "relevance",
+    cursor: str | None = None,
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    **filter_kwargs: str | int | float | None,
+) -> tuple[Select, Select]:
+    """
+    FTS + trigram + ILIKE katmanlarini tek SELECT ifadesinde birlestir.
+
+    Yapi:
+      - fts_hits / trgm_hits / ilike_hits CTE'leri: her katman kendi indeksini
+        kullanir, (id, score) dondurur.
+      - tier_choice CTE: search_properties() cascade kurallarinin SQL karsiligi.
+        Karar icin sayimlar FTS_MIN_RESULTS_FOR_FALLBACK ile sinirlanir
+        (LIMIT'li probe) — karar tam sayim gerektirmez. CASE dallari lazy
+        degerlendirilir; FTS yeterliyse trigram/ILIKE CTE'leri hic calismaz.
+      - Birlesim: her dal `tier_choice = N` one-time filtresiyle korunur,
+        secilmeyen katman taranmaz.
+      - ranked: count(*) OVER () keyset filtresinden ONCE hesaplanir; toplam
+        sayi cursor'dan bagimsiz olarak sayfa satirlariyla ayni round trip'te gelir.
+
+    ILIKE katmaninda score NULL'dir; relevance siralamasi created_at'e duser
+    (cascade modundaki _ilike_search ile ayni).
+
+    Returns:
+        (sayfa sorgusu, bos sayfa icin toplam sayim sorgusu)
+    """
+    normalized_query = normalize_turkish(_sanitize_input(query))
+    pattern = f"%{normalized_query}%"
+
+    ts_query = func.to_tsquery("simple", literal_column(f"'{ts_query_str}'"))
+    normalized_title = func.turkish_normalize(Property.title)
+    normalized_desc = func.turkish_normalize(func.coalesce(Property.description, ""))
+    title_sim = func.similarity(normalized_title, normalized_query, type_=Float)
+    desc_sim = func.coalesce(func.similarity(normalized_desc, normalized_query, type_=Float), 0.0)
+
+    fts_hits = _apply_filters(
+        select(
+            Property.id,
+            func.ts_rank_cd(Property.search_vector, ts_query, 32, type_=Float).label("score"),
+        ).where(Property.search_vector.op("@@")(ts_query)),
+        **filter_kwargs,
+    ).cte("fts_hits")
+
+    trgm_hits = _apply_filters(
+        select(
+            Property.id,
+            (title_sim * 2 + desc_sim).label("score"),
+        ).where((title_sim >= threshold) | (desc_sim >= threshold)),
+        **filter_kwargs,
+    ).cte("trgm_hits")
+
+    ilike_hits = _apply_filters(
+        select(
+            Property.id,
+            cast(null(), Float).label("score"),
+        ).where(normalized_title.ilike(pattern) | normalized_desc.ilike(pattern)),
+        **filter_kwargs,
+    ).cte("ilike_hits")
+
+    def _probe(cte: CTE) -> ScalarSelect[int]:
+        """Esik karari icin sinirli sayim (en fazla FTS_MIN_RESULTS_FOR_FALLBACK)."""
+        capped = select(cte.c.id).limit(FTS_MIN_RESULTS_FOR_FALLBACK).subquery()
+        return select(func.count()).select_from(capped).scalar_subquery()
+
+    fts_n = _probe(fts_hits)
+    trgm_n = _probe(trgm_hits)
+    ilike_any = select(ilike_hits.c.id).exists()
+
+    # search_properties() cascade kurallari:
+    #   FTS >= esik → FTS | trgm > FTS → trgm | ikisi de 0 ve ILIKE var → ILIKE | FTS
+    tier_choice = select(
+        case(
+            (fts_n >= FTS_MIN_RESULTS_FOR_FALLBACK, 1),
+            (trgm_n > fts_n, 2),
+            (and_(fts_n == 0, trgm_n == 0, ilike_any), 3),
+            else_=1,
+        ).label("tier")
+    ).cte("tier_choice")
+    chosen_tier = select(tier_choice.c.tier).scalar_subquery()
+
+    hits = union_all(
+        select(fts_hits.c.id, fts_hits.c.score).where(chosen_tier == literal(1)),
+        select(trgm_hits.c.id, trgm_hits.c.score).where(chosen_tier == literal(2)),
+        select(ilike_hits.c.id, ilike_hits.c.score).where(chosen_tier == literal(3)),
+    ).subquery("hits")
+
+    ranked = select(
+        hits.c.id,
+        hits.c.score,
+        func.count().over().label("total_count"),
+    ).subquery("ranked")
+
+    stmt = select(Property, ranked.c.score, ranked.c.total_count).join(
+        ranked, ranked.c.id == Property.id
+    )
+    stmt = _apply_cursor(stmt, sort, cursor, score=ranked.c.score, score_nullable=True)
+    stmt = _apply_sort(stmt, sort, score=ranked.c.score, score_nullable=True)
+
+    count_stmt = select(func.count()).select_from(hits)
+    return stmt, count_stmt
+
+
+async def _single_pass_search(
+    session: AsyncSession,
+    query: str,
+    ts_query_str: str,
+    *,
+    sort: str = "relevance",
+    limit: int = DEFAULT_LIMIT,
+    offset: int = 0,
+    cursor: str | None = None,
+    **filter_kwargs: str | int | float | None,
+) -> Page[Property]:
+    """
+    Hibrit arama — tek round trip (FTS + trigram + ILIKE tek CTE sorgusunda).
+
+    Sayfa bos donerse (offset/cursor toplam sonucun otesinde) count(*) OVER ()
+    deger tasimaz; yalnizca bu durumda toplam ayri bir sayim sorgusuyla alinir.
+    """
+    stmt, count_stmt = _build_single_pass_query(
+        query, ts_query_str, sort=sort, cursor=cursor, **filter_kwargs
+    )
+
+    result = await session.execute(stmt.offset(offset).limit(limit + 1))
+    rows = result.all()
+
+    if rows:
+        total_count = rows[0].total_count
+    elif offset == 0 and not cursor:
+        total_count = 0
+    else:
+        total_result = await session.execute(count_stmt)
+        total_count = total_result.scalar_one()
+
+    return _build_page(rows, total_count, sort=sort, limit=limit, has_score=True)
+
+
 # ---------- Similarity (pg_trgm) Search ----------
 
 async def search_properties_by_similarity(
@@ -409,7 +704,9 @@ async def search_properties_by_similarity(
     sort: str = "relevance",
     limit: int = DEFAULT_LIMIT,
     offset: int = 0,
-) -> tuple[list[Property], int]:
+    cursor: str | None = None,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+) -> Page[Property]:
     """
     pg_trgm similarity ile fuzzy arama.
 
@@ -439,16 +736,18 @@ async def search_properties_by_similarity(
         sort: Siralama secenegi
         limit: Maksimum sonuc sayisi
         offset: Sayfa offseti
+        cursor: Keyset cursor (opsiyonel, offset yerine)
+        count_strategy: Toplam sayim stratejisi
 
     Returns:
-        (properties, total_count) tuple
+        Page[Property] — items, total, next_cursor
     """
     limit = min(max(1, limit), MAX_LIMIT)
-    offset = max(0, offset)
+    offset = 0 if cursor else max(0, offset)
 
     sanitized = _sanitize_input(query)
     if not sanitized:
-        return [], 0
+        return Page(items=[], total=0)
 
     # Normalize: hem Python hem SQL tarafinda ayni donusum
     normalized_query = normalize_turkish(sanitized)
@@ -460,16 +759,16 @@ async def search_properties_by_similarity(
 
     # similarity() fonksiyonu — pg_trgm'den gelir
     # Normalized text uzerinde karsilastirma yapilir
-    title_sim = func.similarity(normalized_title, normalized_query)
+    title_sim = func.similarity(normalized_title, normalized_query, type_=Float)
     desc_sim = func.coalesce(
-        func.similarity(normalized_desc, normalized_query), 0.0
+        func.similarity(normalized_desc, normalized_query, type_=Float), 0.0
     )
 
     # Title 2x agirlikli, description 1x
-    combined_score = (title_sim * 2 + desc_sim).label("relevance_score")
+    combined_score = title_sim * 2 + desc_sim
 
     stmt = (
-        select(Property)
+        select(Property, combined_score.label("relevance_score"))
         .where(
             # En az birinin threshold'u gecmesi gerekir
             (title_sim >= threshold) | (desc_sim >= threshold),
@@ -489,22 +788,19 @@ async def search_properties_by_similarity(
     }
     stmt = _apply_filters(stmt, **filter_kwargs)
 
-    if sort == "relevance":
-        stmt = stmt.order_by(combined_score.desc())
-    else:
-        stmt = _apply_sort(stmt, sort, has_rank=True)
-
     # Count
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await session.execute(count_stmt)
-    total_count = total_result.scalar_one()
+    total_count, total_exact = await count_rows(session, stmt, strategy=count_strategy)
 
     # Results (paginated)
-    paginated_stmt = stmt.offset(offset).limit(limit)
+    stmt = _apply_cursor(stmt, sort, cursor, score=combined_score)
+    stmt = _apply_sort(stmt, sort, score=combined_score)
+    paginated_stmt = stmt.offset(offset).limit(limit + 1)
     result = await session.execute(paginated_stmt)
-    properties = list(result.scalars().all())
 
-    return properties, total_count
+    return _build_page(
+        result.all(), total_count, sort=sort, limit=limit, has_score=True,
+        total_exact=total_exact,
+    )
 
 
 # ---------- ILIKE Fallback ----------
@@ -516,8 +812,10 @@ async def _ilike_search(
     sort: str = "relevance",
     limit: int = DEFAULT_LIMIT,
     offset: int = 0,
+    cursor: str | None = None,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
     **filter_kwargs: str | int | float | None,
-) -> tuple[list[Property], int]:
+) -> Page[Property]:
     """
     ILIKE substring arama — son care fallback.
 
@@ -526,7 +824,7 @@ async def _ilike_search(
     """
     sanitized = _sanitize_input(query)
     if not sanitized:
-        return [], 0
+        return Page(items=[], total=0)
 
     normalized_query = normalize_turkish(sanitized)
     pattern = f"%{normalized_query}%"
@@ -541,17 +839,18 @@ async def _ilike_search(
         )
     )
     stmt = _apply_filters(stmt, **filter_kwargs)
-    stmt = _apply_sort(stmt, sort, has_rank=False)
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await session.execute(count_stmt)
-    total_count = total_result.scalar_one()
+    total_count, total_exact = await count_rows(session, stmt, strategy=count_strategy)
 
-    paginated = stmt.offset(offset).limit(limit)
+    stmt = _apply_cursor(stmt, sort, cursor)
+    stmt = _apply_sort(stmt, sort)
+    paginated = stmt.offset(offset).limit(limit + 1)
     result = await session.execute(paginated)
-    properties = list(result.scalars().all())
 
-    return properties, total_count
+    return _build_page(
+        result.all(), total_count, sort=sort, limit=limit, has_score=False,
+        total_exact=total_exact,
+    )
 
 
 # ---------- Utility ----------
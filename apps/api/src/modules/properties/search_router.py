@@ -22,6 +22,7 @@ import structlog
 from fastapi import APIRouter, Query
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.core.pagination import resolve_count_strategy
 from src.dependencies import DBSession
 from src.modules.auth.dependencies import ActiveUser
 from src.modules.properties.search import (
@@ -72,10 +73,17 @@ class SearchResponse(BaseModel):
 
     items: list[PropertySearchItem] = Field(description="Arama sonuclari")
     total: int = Field(description="Toplam sonuc sayisi")
+    total_exact: bool = Field(
+        default=True, description="total kesin mi (false → tahmin veya alt sinir)"
+    )
+    has_more: bool = Field(default=False, description="Sonraki sayfa var mi")
     page: int = Field(description="Mevcut sayfa numarasi")
     per_page: int = Field(description="Sayfa basina sonuc sayisi")
     total_pages: int = Field(description="Toplam sayfa sayisi")
     query: str | None = Field(default=None, description="Arama terimi")
+    next_cursor: str | None = Field(
+        default=None, description="Sonraki sayfa cursor'i (son sayfada null)"
+    )
 
 
 class SuggestionResponse(BaseModel):
@@ -125,11 +133,18 @@ async def search(
     ),
     page: int = Query(default=1, ge=1, description="Sayfa numarasi"),
     per_page: int = Query(default=20, ge=1, le=MAX_LIMIT, description="Sayfa basina sonuc"),
+    cursor: str | None = Query(
+        default=None,
+        description=(
+            "Keyset cursor (onceki yanitin next_cursor degeri). "
+            "Verildiginde page yok sayilir; ayni sort ile kullanilmalidir."
+        ),
+    ),
 ) -> SearchResponse:
     """Hibrit ilan arama endpoint'i."""
     offset = (page - 1) * per_page
 
-    properties, total = await search_properties(
+    result = await search_properties(
         db,
         q,
         city=city,
@@ -144,8 +159,11 @@ async def search(
         sort=sort,
         limit=per_page,
         offset=offset,
+        cursor=cursor,
+        count_strategy=resolve_count_strategy("search"),
     )
 
+    total = result.total
     total_pages = math.ceil(total / per_page) if total > 0 else 0
 
     logger.info(
@@ -154,16 +172,20 @@ async def search(
         total=total,
         page=page,
         per_page=per_page,
+        cursor=bool(cursor),
         user_id=str(user.id),
     )
 
     return SearchResponse(
-        items=[PropertySearchItem.model_validate(p) for p in properties],
+        items=[PropertySearchItem.model_validate(p) for p in result.items],
         total=total,
+        total_exact=result.total_exact,
+        has_more=result.has_more,
         page=page,
         per_page=per_page,
         total_pages=total_pages,
         query=q,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -4,16 +4,19 @@ Emlak Teknoloji Platformu - Realtime Module
 WebSocket tabanli gercek zamanli iletisim altyapisi.
 
 Durum: STUB — temel altyapi hazir, varsayilan KAPALI.
+Coklu worker / Celery: event'ler Redis PubSub backplane'i ile yayilir
+(backplane.py).
 Gelecekte genisletilecek alanlar:
-    - Redis PubSub ile coklu worker senkronizasyonu
     - Canli mesajlasma (bidirectional)
     - Eslesme alert'leri
 """
 
+from src.modules.realtime.backplane import BackplaneSubscriber
 from src.modules.realtime.events import EventType, WebSocketEvent
 from src.modules.realtime.websocket_manager import ConnectionManager
 
 __all__ = [
+    "BackplaneSubscriber",
     "ConnectionManager",
     "EventType",
     "WebSocketEvent",
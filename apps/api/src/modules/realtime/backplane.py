@@ -0,0 +1,309 @@
+"""
+Emlak Teknoloji Platformu - WebSocket Redis Backplane
+
+ConnectionManager process ici bir dict'tir; production'da iki uvicorn
+worker'i calisir. Worker A'daki istekten gelen emit_event, worker B'ye
+bagli soketi goremez; Celery task'lari hic gonderemez. Event'ler Redis
+PubSub uzerinden diger process'lere yayilir.
+
+Kanallar (cache DB — settings.REDIS_URL):
+    {prefix}:user:{user_id}  → kullaniciya ozel event
+    {prefix}:broadcast       → tum bagli kullanicilar
+
+Zarf (JSON):
+    {"origin": "<host>:<pid>", "user_id": "..." | null, "event": {...}}
+
+Akis:
+    emit_event (herhangi bir process)
+        1. Yerel soketlere dogrudan gonderilir (fast path — Redis turu yok)
+        2. Kullanici kanalina PUBLISH (diger worker'lar, ayni kullanicinin
+           baska sekmeleri)
+    BackplaneSubscriber (her uvicorn worker'inda, lifespan)
+        - Yalnizca bu worker'a bagli kullanicilarin kanallarina abone olur
+          (ilk baglantida SUBSCRIBE, son baglanti kapaninca UNSUBSCRIBE)
+        - Kendi yayinladigi zarfi atlar (origin) — yerelde zaten gonderildi
+
+Celery:
+    Subscriber yoktur; emit_event (run_async icinde) veya senkron
+    publish_sync yalnizca PUBLISH yapar.
+
+Redis erisilemezse PUBLISH atlanir (fail-open): event yalnizca yerel
+soketlere gider, uygulama akisi kesilmez. Abone baglantisi koparsa
+ustel bekleme ile yeniden baglanir ve bagli kullanicilara yeniden abone
+olur; kopukluk suresindeki event'ler kaybolur (fire-and-forget).
+
+Kullanim:
+    # lifespan
+    subscriber = BackplaneSubscriber(manager)
+    subscriber.start()
+    ...
+    await subscriber.stop()
+
+    # Celery (senkron)
+    publish_sync(user_id, event.to_dict())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import socket
+from typing import TYPE_CHECKING, Any
+
+import redis
+import redis.asyncio as aioredis
+import structlog
+
+from src.config import settings
+
+if TYPE_CHECKING:
+    from src.modules.realtime.websocket_manager import ConnectionManager
+
+logger = structlog.get_logger(__name__)
+
+_MAX_RECONNECT_SECONDS = 30.0
+
+
+def worker_id() -> str:
+    """Yayinlayan process'in kimligi (fork sonrasi pid degisir)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def user_channel(user_id: str) -> str:
+    return f"{settings.WS_BACKPLANE_CHANNEL_PREFIX}:user:{user_id}"
+
+
+def broadcast_channel() -> str:
+    return f"{settings.WS_BACKPLANE_CHANNEL_PREFIX}:broadcast"
+
+
+def encode(user_id: str | None, event: dict[str, Any]) -> str:
+    """Zarf → JSON. user_id None ise broadcast."""
+    return json.dumps(
+        {"origin": worker_id(), "user_id": user_id, "event": event},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def decode(raw: str | bytes) -> dict[str, Any] | None:
+    """JSON → zarf. Bozuk mesaj → None (abone dongusu durmaz)."""
+    try:
+        envelope = json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(envelope, dict) or not isinstance(envelope.get("event"), dict):
+        return None
+    return envelope
+
+
+# ================================================================
+# Yayinlama
+# ================================================================
+
+# Client olusturuldugu event loop'a baglidir (FastAPI worker / Celery runtime)
+_client: aioredis.Redis | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_sync_client: redis.Redis | None = None
+
+
+def _redis() -> aioredis.Redis:
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = aioredis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=settings.WS_BACKPLANE_TIMEOUT_SECONDS,
+            socket_timeout=settings.WS_BACKPLANE_TIMEOUT_SECONDS,
+        )
+        _client_loop = loop
+    return _client
+
+
+def _redis_sync() -> redis.Redis:
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=settings.WS_BACKPLANE_TIMEOUT_SECONDS,
+            socket_timeout=settings.WS_BACKPLANE_TIMEOUT_SECONDS,
+        )
+    return _sync_client
+
+
+async def close() -> None:
+    """Uygulama kapanisinda yayin client'ini kapatir (lifespan)."""
+    global _client, _client_loop
+    if _client is not None:
+        client, _client, _client_loop = _client, None, None
+        await client.aclose()
+
+
+async def publish(user_id: str | None, event: dict[str, Any]) -> int | None:
+    """
+    Event'i diger process'lere yayar.
+
+    Args:
+        user_id: Hedef kullanici; None → broadcast kanali.
+        event: WebSocketEvent.to_dict() ciktisi.
+
+    Returns:
+        Mesaji alan abone (worker) sayisi. Backplane kapali veya Redis
+        erisilemez → None.
+    """
+    if not settings.WS_BACKPLANE_ENABLED:
+        return None
+    channel = user_channel(user_id) if user_id is not None else broadcast_channel()
+    try:
+        return await _redis().publish(channel, encode(user_id, event))
+    except (redis.RedisError, OSError):
+        logger.warning("ws_backplane_publish_failed", channel=channel, exc_info=True)
+        return None
+
+
+def publish_sync(user_id: str | None, event: dict[str, Any]) -> int | None:
+    """publish'in senkron karsiligi (Celery task'lari, senkron callback'ler)."""
+    if not settings.WS_BACKPLANE_ENABLED:
+        return None
+    channel = user_channel(user_id) if user_id is not None else broadcast_channel()
+    try:
+        return _redis_sync().publish(channel, encode(user_id, event))
+    except (redis.RedisError, OSError):
+        logger.warning("ws_backplane_publish_failed", channel=channel, exc_info=True)
+        return None
+
+
+# ================================================================
+# Abone (uvicorn worker)
+# ================================================================
+
+
+class BackplaneSubscriber:
+    """
+    Redis kanallarindan gelen event'leri yerel soketlere iletir.
+
+    Abonelikler ConnectionManager'daki kullanicilarla esitlenir:
+    manager.presence_hook her ilk baglanti / son kopmada cagrilir,
+    esitleme task'i farki SUBSCRIBE / UNSUBSCRIBE eder.
+
+    Attributes:
+        subscribed: Su an abone olunan kullanici id'leri.
+    """
+
+    def __init__(self, manager: ConnectionManager, client: aioredis.Redis | None = None) -> None:
+        self.manager = manager
+        self.subscribed: set[str] = set()
+        self._client = client
+        self._origin = worker_id()
+        self._presence_changed = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Abone dongusunu baslatir ve manager'a presence hook'u baglar."""
+        if self._task is not None:
+            return
+        self.manager.presence_hook = self.presence_changed
+        self._task = asyncio.create_task(self._run(), name="ws-backplane-subscriber")
+        logger.info("ws_backplane_subscriber_started", origin=self._origin)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self.manager.presence_hook = None
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+        logger.info("ws_backplane_subscriber_stopped")
+
+    def presence_changed(self) -> None:
+        """ConnectionManager hook'u — esitleme task'ini uyandirir (senkron)."""
+        self._presence_changed.set()
+
+    def _new_client(self) -> aioredis.Redis:
+        # Abone baglantisi uzun sure bloklanir: okuma zaman asimi yok
+        return aioredis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=settings.WS_BACKPLANE_TIMEOUT_SECONDS,
+            socket_keepalive=True,
+        )
+
+    async def _run(self) -> None:
+        delay = settings.WS_BACKPLANE_RECONNECT_SECONDS
+        while True:
+            if self._client is None:
+                self._client = self._new_client()
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            self.subscribed = set()
+            tasks: list[asyncio.Task] = []
+            try:
+                await pubsub.subscribe(broadcast_channel())
+                await self._sync(pubsub)
+                delay = settings.WS_BACKPLANE_RECONNECT_SECONDS
+                tasks = [
+                    asyncio.create_task(self._listen(pubsub)),
+                    asyncio.create_task(self._sync_loop(pubsub)),
+                ]
+                await asyncio.gather(*tasks)
+            except (redis.RedisError, OSError):
+                logger.warning("ws_backplane_disconnected", retry_in=delay, exc_info=True)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _MAX_RECONNECT_SECONDS)
+
+    async def _sync_loop(self, pubsub: aioredis.client.PubSub) -> None:
+        while True:
+            await self._presence_changed.wait()
+            await self._sync(pubsub)
+
+    async def _sync(self, pubsub: aioredis.client.PubSub) -> None:
+        """Abonelikleri bagli kullanicilarla esitler."""
+        self._presence_changed.clear()
+        wanted = set(self.manager.active_connections)
+        added = wanted - self.subscribed
+        removed = self.subscribed - wanted
+        if added:
+            await pubsub.subscribe(*(user_channel(u) for u in added))
+            self.subscribed |= added
+        if removed:
+            await pubsub.unsubscribe(*(user_channel(u) for u in removed))
+            self.subscribed -= removed
+
+    async def _listen(self, pubsub: aioredis.client.PubSub) -> None:
+        async for message in pubsub.listen():
+            if message["type"] == "message":
+                await self.deliver(message["data"])
+
+    async def deliver(self, raw: str | bytes) -> int:
+        """
+        Zarfi yerel soketlere iletir.
+
+        Returns:
+            Basarili gonderim sayisi (kendi yayini / bozuk mesaj → 0).
+        """
+        envelope = decode(raw)
+        if envelope is None:
+            logger.warning("ws_backplane_bad_message")
+            return 0
+        if envelope.get("origin") == self._origin:
+            return 0
+        user_id = envelope.get("user_id")
+        try:
+            if user_id is None:
+                return await self.manager.broadcast(envelope["event"])
+            return await self.manager.send_personal(str(user_id), envelope["event"])
+        except Exception:
+            # Tek kullanicinin hatasi abone dongusunu durdurmaz
+            logger.error("ws_backplane_deliver_failed", user_id=user_id, exc_info=True)
+            return 0
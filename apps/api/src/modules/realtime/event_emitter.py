@@ -3,6 +3,13 @@ Emlak Teknoloji Platformu - WebSocket Event Emitter
 
 Uygulama katmanindan WebSocket event'lerini gondermek icin yardimci fonksiyonlar.
 
+Teslim (backplane.py):
+    1. Bu process'e bagli soketler → dogrudan (fast path)
+    2. Redis PUBLISH → diger uvicorn worker'lari (kullanici kanali)
+    Celery task'larinda yerel soket yoktur; yalnizca PUBLISH yapilir.
+    Senkron kod (Celery task govdesi, ilerleme callback'leri) icin
+    emit_event_sync / broadcast_event_sync.
+
 Temel prensip: GRACEFUL DEGRADATION
     - Kullanici bagli degilse sessizce gec (fire-and-forget)
     - WebSocket hatasi uygulama akisini KESMEZ
@@ -26,7 +33,6 @@ Kullanim:
     )
 
 Gelecek genisleme:
-    - Redis PubSub ile coklu worker'a event yayma
     - Event batching (yuksek hacimli senaryolar)
     - Event persistence (offline kullanicilar icin kuyruk)
 """
@@ -37,6 +43,7 @@ from typing import Any
 
 import structlog
 
+from src.modules.realtime import backplane
 from src.modules.realtime.events import EventType, WebSocketEvent
 
 logger = structlog.get_logger(__name__)
@@ -82,33 +89,32 @@ async def emit_event(
         payload: Event verisi (opsiyonel).
 
     Returns:
-        True: En az bir baglantiya basariyla gonderildi.
-        False: Kullanici bagli degil veya hata olustu.
+        True: En az bir yerel baglantiya gonderildi veya event en az bir
+            worker'in kullanici kanalina ulasti.
+        False: Kullanici hicbir worker'a bagli degil veya hata olustu.
     """
     try:
-        mgr = _get_manager()
-        if mgr is None:
-            return False
-
-        if not mgr.is_connected(user_id):
-            return False
-
         event = WebSocketEvent(
             type=event_type,
             payload=payload or {},
         )
+        data = event.to_dict()
 
-        sent = await mgr.send_personal(user_id, event.to_dict())
+        mgr = _get_manager()
+        sent = await mgr.send_personal(user_id, data) if mgr is not None else 0
+        # Yerelde gonderilmediyse abone sayisi yalnizca diger worker'lardir
+        remote = await backplane.publish(user_id, data)
 
-        if sent > 0:
+        if sent > 0 or remote:
             logger.debug(
                 "ws_event_emitted",
                 user_id=user_id,
                 event_type=event_type.value,
                 sent_count=sent,
+                remote_workers=remote,
             )
 
-        return sent > 0
+        return sent > 0 or bool(remote)
 
     except Exception as exc:
         # KRITIK: Bu fonksiyon ASLA uygulama akisini kesmez
@@ -135,25 +141,26 @@ async def broadcast_event(
         payload: Event verisi (opsiyonel).
 
     Returns:
-        Basarili gonderim sayisi. Hata durumunda 0.
+        Bu process'teki basarili gonderim sayisi (diger worker'lar
+        sayilmaz). Hata durumunda 0.
     """
     try:
-        mgr = _get_manager()
-        if mgr is None:
-            return 0
-
         event = WebSocketEvent(
             type=event_type,
             payload=payload or {},
         )
+        data = event.to_dict()
 
-        sent = await mgr.broadcast(event.to_dict())
+        mgr = _get_manager()
+        sent = await mgr.broadcast(data) if mgr is not None else 0
+        remote = await backplane.publish(None, data)
 
-        if sent > 0:
+        if sent > 0 or remote:
             logger.info(
                 "ws_event_broadcast",
                 event_type=event_type.value,
                 sent_count=sent,
+                remote_workers=remote,
             )
 
         return sent
@@ -165,3 +172,52 @@ async def broadcast_event(
             error=str(exc),
         )
         return 0
+
+
+def emit_event_sync(
+    user_id: str,
+    event_type: EventType,
+    payload: dict[str, Any] | None = None,
+) -> bool:
+    """
+    emit_event'in senkron karsiligi — Celery task'lari icin.
+
+    Yerel soket yoktur; event yalnizca Redis uzerinden yayilir.
+    Bu fonksiyon ASLA exception firlatmaz.
+
+    Returns:
+        True: Kullanicinin bagli oldugu en az bir worker event'i aldi.
+    """
+    try:
+        event = WebSocketEvent(type=event_type, payload=payload or {})
+        return bool(backplane.publish_sync(user_id, event.to_dict()))
+    except Exception as exc:
+        logger.error(
+            "ws_event_emit_failed",
+            user_id=user_id,
+            event_type=event_type.value,
+            error=str(exc),
+        )
+        return False
+
+
+def broadcast_event_sync(
+    event_type: EventType,
+    payload: dict[str, Any] | None = None,
+) -> int:
+    """
+    broadcast_event'in senkron karsiligi — Celery task'lari icin.
+
+    Returns:
+        Event'i alan worker sayisi. Hata durumunda 0.
+    """
+    try:
+        event = WebSocketEvent(type=event_type, payload=payload or {})
+        return backplane.publish_sync(None, event.to_dict()) or 0
+    except Exception as exc:
+        logger.error(
+            "ws_event_broadcast_failed",
+            event_type=event_type.value,
+            error=str(exc),
+        )
+        return 0
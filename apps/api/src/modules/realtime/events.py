@@ -33,6 +33,7 @@ class EventType(enum.StrEnum):
     NOTIFICATION = "notification"
     MATCH_UPDATE = "match_update"
     VALUATION_COMPLETE = "valuation_complete"
+    JOB_PROGRESS = "job_progress"
     SYSTEM = "system"
 
 
@@ -7,7 +7,7 @@ Akis:
     1. Query param'dan JWT token al
     2. Token'i decode et (dogrulama + user_id cikarma)
     3. ConnectionManager'a baglan
-    4. Heartbeat ping-pong destegi
+    4. Heartbeat ping-pong destegi (iki yonlu)
     5. Basit echo (stub) — gelecekte event dispatch'e donusecek
 
 Guvenlik:
@@ -22,7 +22,8 @@ Public Path Notu:
 
 Heartbeat:
     - Client "ping" text mesaji gonderdikçe server "pong" ile yanit verir
-    - Baglanti saglik kontrolu icin kullanilir
+    - Sessiz baglantiya server "ping" gonderir, client "pong" ile yanitlar
+    - Hic mesaj gelmeyen baglanti WS_HEARTBEAT_TIMEOUT_SECONDS sonra kapatilir
 
 Durum: STUB — echo + heartbeat, ileriki sprintlerde event dispatch eklenecek.
 """
@@ -36,7 +37,7 @@ from starlette.websockets import WebSocketState
 
 from src.config import settings
 from src.modules.realtime.events import EventType, WebSocketEvent
-from src.modules.realtime.websocket_manager import ConnectionManager
+from src.modules.realtime.websocket_manager import PING, PONG, ConnectionManager
 
 logger = structlog.get_logger(__name__)
 
@@ -91,6 +92,7 @@ async def websocket_endpoint(websocket: WebSocket, token: str | None = None) ->
     Mesaj protokolu (stub):
         Client → Server:
             - "ping"       → Server "pong" ile yanit verir (heartbeat)
+            - "pong"       → Server ping'inin yaniti (yalnizca canlilik)
             - herhangi JSON → Server echo olarak geri gonderir
 
         Server → Client:
@@ -99,7 +101,9 @@ async def websocket_endpoint(websocket: WebSocket, token: str | None = None) ->
     Close Codes:
         - 4401: JWT token eksik veya gecersiz
         - 1000: Normal kapanis
-        - 1011: Server hatasi
+        - 1001: Heartbeat zaman asimi
+        - 1011: Server hatasi / gonderim hatasi
+        - 1013: Yavas istemci (gonderim kuyrugu doldu) — yeniden baglanmali
     """
     # --- JWT dogrulama ---
     if not token:
@@ -114,9 +118,9 @@ async def websocket_endpoint(websocket: WebSocket, token: str | None = None) ->
     user_id: str = payload["sub"]
 
     # --- Baglanti kabul ---
-    await manager.connect(user_id, websocket)
+    conn = await manager.connect(user_id, websocket)
 
-    # Hosgeldin mesaji gonder
+    # Hosgeldin mesaji gonder (tum gonderimler baglantinin kuyrugundan)
     welcome_event = WebSocketEvent(
         type=EventType.SYSTEM,
         payload={
@@ -124,21 +128,20 @@ async def websocket_endpoint(websocket: WebSocket, token: str | None = None) ->
             "user_id": user_id,
         },
     )
-    try:
-        await websocket.send_json(welcome_event.to_dict())
-    except Exception:
-        manager.disconnect(user_id, websocket)
-        return
+    manager.send(conn, welcome_event.to_dict())
 
     # --- Mesaj dongusu ---
     try:
         while True:
             data = await websocket.receive_text()
+            conn.touch()
+            message = data.strip().lower()
 
-            # Heartbeat: ping → pong
-            if data.strip().lower() == "ping":
-                if websocket.client_state == WebSocketState.CONNECTED:
-                    await websocket.send_text("pong")
+            # Heartbeat: istemci ping → pong; sunucu ping'inin yaniti yalnizca canlilik
+            if message == PING:
+                manager.send(conn, PONG)
+                continue
+            if message == PONG:
                 continue
 
             # Stub: Echo — gelen mesaji geri gonder
@@ -146,8 +149,7 @@ async def websocket_endpoint(websocket: WebSocket, token: str | None = None) ->
                 type=EventType.SYSTEM,
                 payload={"echo": data},
             )
-            if websocket.client_state == WebSocketState.CONNECTED:
-                await websocket.send_json(echo_event.to_dict())
+            manager.send(conn, echo_event.to_dict())
 
     except WebSocketDisconnect:
         manager.disconnect(user_id, websocket)
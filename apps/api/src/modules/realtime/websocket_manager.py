@@ -3,17 +3,36 @@ Emlak Teknoloji Platformu - WebSocket Connection Manager
 
 Aktif WebSocket baglantilarini yonetir: connect, disconnect, mesaj gonderme.
 
-Durum: STUB — tek process, in-memory dict.
-Gelecek genisleme:
-    - Redis PubSub ile coklu worker senkronizasyonu
-    - Connection pooling
-    - Heartbeat monitoring (stale connection temizleme)
+Process ici, in-memory dict. Diger uvicorn worker'larina ve Celery'den
+gelen event'ler backplane.py (Redis PubSub) ile bu manager'a iletilir.
+
+Gonderim (back-pressure):
+    Her baglantinin sinirli bir kuyrugu (WS_SEND_QUEUE_SIZE) ve kendi
+    yazici task'i vardir. send_personal / broadcast mesaji bir kez JSON'a
+    cevirip kuyruklara birakir, soketi BEKLEMEZ — yavas bir istemci
+    digerlerini durdurmaz, yazicilar eszamanli calisir.
+    Kuyruk doluysa (yavas tuketici) WS_SLOW_CONSUMER_POLICY:
+        close → baglanti 1013 ile kapatilir, istemci yeniden baglanir
+        drop  → yeni mesaj atilir, baglanti acik kalir
+    Tek send_text WS_SEND_TIMEOUT_SECONDS'i asarsa baglanti kapatilir.
+
+Heartbeat:
+    Istemciden gelen her mesaj (istemci "ping"i, sunucu ping'ine "pong"
+    yaniti, JSON) baglantiyi canli isaretler. WS_HEARTBEAT_INTERVAL_SECONDS
+    boyunca sessiz baglantiya sunucu "ping" gonderir;
+    WS_HEARTBEAT_TIMEOUT_SECONDS boyunca hic mesaj gelmezse baglanti
+    kapatilir (kopuk TCP, uyuyan sekme).
+
+Sayaclar (total_connections, connected_users) O(1) tutulur.
 
 Kullanim:
     manager = ConnectionManager()
+    manager.start()  # heartbeat (lifespan)
 
     # Baglanti
-    await manager.connect(user_id, websocket)
+    conn = await manager.connect(user_id, websocket)
+    manager.send(conn, {"type": "system", ...})  # tek baglantiya yanit
+    conn.touch()  # istemciden mesaj geldi
 
     # Kisisel mesaj
     await manager.send_personal(user_id, {"type": "notification", ...})
@@ -26,22 +45,71 @@ Kullanim:
 
 Thread Safety:
     FastAPI WebSocket handler'lari asyncio event loop'ta calisir.
-    dict islemleri GIL tarafindan korunur — ek lock gereksiz (tek process).
-    Coklu worker senaryosunda Redis PubSub'a gecirilecek.
+    dict islemleri GIL tarafindan korunur — ek lock gereksiz (process ici).
+    Coklu worker: BackplaneSubscriber (backplane.py).
 """
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import json
+import time
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from src.config import settings
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from fastapi import WebSocket
 
 logger = structlog.get_logger(__name__)
 
+PING = "ping"
+PONG = "pong"
+
+# RFC 6455 close kodlari
+CLOSE_GOING_AWAY = 1001
+CLOSE_INTERNAL_ERROR = 1011
+CLOSE_TRY_AGAIN_LATER = 1013
+
+SLOW_CONSUMER_POLICIES = ("close", "drop")
+
+
+def _dumps(data: dict[str, Any] | str) -> str:
+    """Mesaj → metin (Starlette send_json ile ayni bicim); str oldugu gibi."""
+    if isinstance(data, str):
+        return data
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class Connection:
+    """
+    Tek WebSocket baglantisi: sinirli gonderim kuyrugu + yazici task.
+
+    Attributes:
+        last_seen: Istemciden son mesajin zamani (time.monotonic).
+        dropped: drop politikasinda atilan mesaj sayisi.
+    """
+
+    __slots__ = ("closed", "dropped", "last_seen", "queue", "user_id", "websocket", "writer")
+
+    def __init__(self, user_id: str, websocket: WebSocket, queue_size: int) -> None:
+        self.user_id = user_id
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.writer: asyncio.Task | None = None
+        self.last_seen = time.monotonic()
+        self.dropped = 0
+        self.closed = False
+
+    def touch(self) -> None:
+        """Istemciden mesaj geldi — heartbeat sayaci sifirlanir."""
+        self.last_seen = time.monotonic()
+
 
 class ConnectionManager:
     """
@@ -51,35 +119,86 @@ class ConnectionManager:
     Baglantilar user_id bazinda gruplandiriliyor.
 
     Attributes:
-        active_connections: user_id → [WebSocket, ...] eslesmesi.
+        active_connections: user_id → {WebSocket: Connection} eslesmesi.
     """
 
-    def __init__(self) -> None:
-        self.active_connections: dict[str, list[WebSocket]] = {}
+    def __init__(
+        self,
+        queue_size: int | None = None,
+        slow_consumer_policy: str | None = None,
+        send_timeout: float | None = None,
+        heartbeat_interval: float | None = None,
+        heartbeat_timeout: float | None = None,
+    ) -> None:
+        self.queue_size = queue_size or settings.WS_SEND_QUEUE_SIZE
+        self.slow_consumer_policy = slow_consumer_policy or settings.WS_SLOW_CONSUMER_POLICY
+        if self.slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Gecersiz WS_SLOW_CONSUMER_POLICY: {self.slow_consumer_policy!r}")
+        self.send_timeout = send_timeout or settings.WS_SEND_TIMEOUT_SECONDS
+        self.heartbeat_interval = heartbeat_interval or settings.WS_HEARTBEAT_INTERVAL_SECONDS
+        self.heartbeat_timeout = heartbeat_timeout or settings.WS_HEARTBEAT_TIMEOUT_SECONDS
+
+        self.active_connections: dict[str, dict[WebSocket, Connection]] = {}
+        self._total_connections = 0
+        # Kullanici ilk kez baglaninca / son baglantisi kopunca cagrilir
+        # (BackplaneSubscriber kanal aboneliklerini esitler)
+        self.presence_hook: Callable[[], None] | None = None
+        self._heartbeat: asyncio.Task | None = None
+        self._closing: set[asyncio.Task] = set()
 
     @property
     def total_connections(self) -> int:
         """Toplam aktif baglanti sayisi."""
-        return sum(len(conns) for conns in self.active_connections.values())
+        return self._total_connections
 
     @property
     def connected_users(self) -> int:
         """Bagli kullanici sayisi (unique)."""
         return len(self.active_connections)
 
-    async def connect(self, user_id: str, websocket: WebSocket) -> None:
+    # ---------- Yasam dongusu ----------
+
+    def start(self) -> None:
+        """Heartbeat task'ini baslatir (lifespan)."""
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop(), name="ws-heartbeat")
+
+    async def stop(self) -> None:
+        """Heartbeat'i ve tum yazicilari durdurur (lifespan kapanisi)."""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._heartbeat
+            self._heartbeat = None
+        for conns in list(self.active_connections.values()):
+            for conn in list(conns.values()):
+                self.disconnect(conn.user_id, conn.websocket)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    async def connect(self, user_id: str, websocket: WebSocket) -> Connection:
         """
-        WebSocket baglantisinini kabul eder ve aktif listesine ekler.
+        WebSocket baglantisinini kabul eder, yazici task'ini baslatir.
 
         Args:
             user_id: Kullanici UUID (str).
             websocket: FastAPI WebSocket instance.
+
+        Returns:
+            Baglanti (router yanitlari send() ile, heartbeat touch() ile).
         """
         await websocket.accept()
 
-        if user_id not in self.active_connections:
-            self.active_connections[user_id] = []
-        self.active_connections[user_id].append(websocket)
+        conn = Connection(user_id, websocket, self.queue_size)
+        conn.writer = asyncio.create_task(self._write_loop(conn))
+
+        conns = self.active_connections.get(user_id)
+        if conns is None:
+            conns = self.active_connections[user_id] = {}
+            if self.presence_hook is not None:
+                self.presence_hook()
+        conns[websocket] = conn
+        self._total_connections += 1
 
         logger.info(
             "ws_connected",
@@ -87,26 +206,36 @@ class ConnectionManager:
             total_connections=self.total_connections,
             connected_users=self.connected_users,
         )
+        return conn
 
     def disconnect(self, user_id: str, websocket: WebSocket) -> None:
         """
-        WebSocket baglantisinini aktif listesinden cikarir.
+        WebSocket baglantisinini aktif listesinden cikarir, yazicisini durdurur.
 
         Kullanicinin son baglantisi ise user_id key'i de silinir.
+        Ayni baglanti icin tekrar cagrilabilir (idempotent).
 
         Args:
             user_id: Kullanici UUID (str).
             websocket: Kapatilan WebSocket instance.
         """
-        connections = self.active_connections.get(user_id)
-        if connections is None:
+        conns = self.active_connections.get(user_id)
+        if conns is None:
+            return
+        conn = conns.pop(websocket, None)
+        if conn is None:
             return
 
-        with contextlib.suppress(ValueError):
-            connections.remove(websocket)
+        self._total_connections -= 1
+        conn.closed = True
+        # Yazici kendi hatasinda disconnect cagirir — kendini iptal etmez
+        if conn.writer is not None and conn.writer is not asyncio.current_task():
+            conn.writer.cancel()
 
-        if not connections:
+        if not conns:
             del self.active_connections[user_id]
+            if self.presence_hook is not None:
+                self.presence_hook()
 
         logger.info(
             "ws_disconnected",
@@ -115,73 +244,154 @@ class ConnectionManager:
             connected_users=self.connected_users,
         )
 
+    # ---------- Gonderim ----------
+
+    def send(self, conn: Connection, data: dict[str, Any] | str) -> bool:
+        """Tek baglantinin kuyruguna mesaj birakir (bloklamaz)."""
+        return self._enqueue(conn, _dumps(data))
+
     async def send_personal(self, user_id: str, data: dict[str, Any]) -> int:
         """
         Belirli bir kullanicinin TUM baglantilarina mesaj gonderir.
 
-        Bozuk baglantilari otomatik temizler (stale connection handling).
+        Mesaj kuyruklara birakilir; soket yazimi beklenmez. Bozuk
+        baglantilar yazici task'larinda temizlenir.
 
         Args:
             user_id: Hedef kullanici UUID (str).
             data: JSON-serializable mesaj verisi.
 
         Returns:
-            Basarili gonderim sayisi.
+            Kuyruga alinan baglanti sayisi.
         """
-        connections = self.active_connections.get(user_id)
-        if not connections:
+        conns = self.active_connections.get(user_id)
+        if not conns:
             return 0
-
-        sent = 0
-        stale: list[WebSocket] = []
-
-        for ws in connections:
-            try:
-                await ws.send_json(data)
-                sent += 1
-            except Exception:
-                # Baglanti kopuk — temizlenecek
-                stale.append(ws)
-                logger.warning(
-                    "ws_send_failed_stale",
-                    user_id=user_id,
-                )
-
-        # Bozuk baglantilari temizle
-        for ws in stale:
-            self.disconnect(user_id, ws)
-
-        return sent
+        text = _dumps(data)
+        return sum(self._enqueue(conn, text) for conn in list(conns.values()))
 
     async def broadcast(self, data: dict[str, Any]) -> int:
         """
         Tum bagli kullanicilara mesaj gonderir.
 
+        JSON bir kez uretilir; her baglantinin kuyruguna birakilir,
+        yazicilar eszamanli gonderir.
+
         Args:
             data: JSON-serializable mesaj verisi.
 
         Returns:
-            Basarili gonderim sayisi (toplam baglanti bazinda).
+            Kuyruga alinan baglanti sayisi.
         """
-        total_sent = 0
-
-        # Iteration sirasinda dict degisebilir — snapshot al
-        user_ids = list(self.active_connections.keys())
+        if not self._total_connections:
+            return 0
 
-        for user_id in user_ids:
-            sent = await self.send_personal(user_id, data)
-            total_sent += sent
+        text = _dumps(data)
+        total_sent = 0
+        # Yavas tuketici kapatilirken dict degisebilir — snapshot al
+        for conns in list(self.active_connections.values()):
+            for conn in list(conns.values()):
+                total_sent += self._enqueue(conn, text)
 
         if total_sent > 0:
             logger.info(
                 "ws_broadcast",
                 total_sent=total_sent,
-                total_users=len(user_ids),
+                total_users=self.connected_users,
             )
 
         return total_sent
 
     def is_connected(self, user_id: str) -> bool:
         """Kullanicinin aktif baglantisi var mi?"""
-        connections = self.active_connections.get(user_id)
-        return bool(connections)
+        return user_id in self.active_connections
+
+    def _enqueue(self, conn: Connection, text: str) -> bool:
+        if conn.closed:
+            return False
+        try:
+            conn.queue.put_nowait(text)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.slow_consumer_policy == "drop":
+            conn.dropped += 1
+            if conn.dropped == 1 or conn.dropped % 100 == 0:
+                logger.warning(
+                    "ws_slow_consumer_dropped",
+                    user_id=conn.user_id,
+                    dropped=conn.dropped,
+                )
+            return False
+
+        logger.warning("ws_slow_consumer_closed", user_id=conn.user_id, queue_size=self.queue_size)
+        self._close_later(conn, CLOSE_TRY_AGAIN_LATER, "Istemci mesajlari yetistiremiyor")
+        return False
+
+    async def _write_loop(self, conn: Connection) -> None:
+        ws = conn.websocket
+        try:
+            while True:
+                text = await conn.queue.get()
+                await asyncio.wait_for(ws.send_text(text), self.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Baglanti kopuk veya gonderim zaman asimi — temizlenir
+            logger.warning("ws_send_failed_stale", user_id=conn.user_id, error=type(exc).__name__)
+            self.disconnect(conn.user_id, ws)
+            await self._close(conn, CLOSE_INTERNAL_ERROR, "Gonderim hatasi")
+
+    # ---------- Kapatma ----------
+
+    def _close_later(self, conn: Connection, code: int, reason: str) -> None:
+        """Baglantiyi hemen listeden cikarir; soket kapatma arka planda."""
+        self.disconnect(conn.user_id, conn.websocket)
+        task = asyncio.create_task(self._close(conn, code, reason))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, conn: Connection, code: int, reason: str) -> None:
+        # Baglanti zaten kopmus olabilir
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(
+                conn.websocket.close(code=code, reason=reason), self.send_timeout,
+            )
+
+    # ---------- Heartbeat ----------
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval / 2)
+            try:
+                self.sweep()
+            except Exception:
+                logger.error("ws_heartbeat_failed", exc_info=True)
+
+    def sweep(self, now: float | None = None) -> tuple[int, int]:
+        """
+        Sessiz baglantilara ping gonderir, zaman asimina ugrayanlari kapatir.
+
+        Returns:
+            (ping gonderilen, kapatilan) baglanti sayisi.
+        """
+        now = time.monotonic() if now is None else now
+        pinged = reaped = 0
+        for conns in list(self.active_connections.values()):
+            for conn in list(conns.values()):
+                idle = now - conn.last_seen
+                if idle >= self.heartbeat_timeout:
+                    self._close_later(conn, CLOSE_GOING_AWAY, "Heartbeat zaman asimi")
+                    reaped += 1
+                elif idle >= self.heartbeat_interval:
+                    pinged += self._enqueue(conn, PING)
+
+        if reaped:
+            logger.info(
+                "ws_heartbeat_reaped",
+                reaped=reaped,
+                pinged=pinged,
+                total_connections=self.total_connections,
+            )
+        return pinged, reaped
@@ -27,10 +27,11 @@ from typing import TYPE_CHECKING
 import structlog
 import uuid
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 
 from sqlalchemy import text
 
+from src.core.pagination import resolve_count_strategy
 from src.dependencies import DBSession
 from src.modules.auth.dependencies import ActiveUser
 from src.modules.showcases.schemas import (
@@ -376,21 +377,34 @@ async def create_showcase(
 async def list_showcases(
     db: DBSession,
     current_user: ActiveUser,
+    limit: int | None = Query(
+        default=None, ge=1, le=100, description="Sayfa boyutu (bos → tum vitrinler)"
+    ),
+    cursor: str | None = Query(
+        default=None, description="Keyset cursor (onceki yanitin next_cursor degeri)"
+    ),
 ) -> ShowcaseListResponse:
     """
     Kullanicinin kendi vitrinlerini listeler.
 
     - Sadece kendi ofisinin ve kendi olusturdugu vitrinler doner
     - En yeniden en eskiye siralanir
+    - Opsiyonel keyset sayfalama: limit + cursor
     """
-    showcases, total = await ShowcaseService.list_by_agent(
+    result = await ShowcaseService.list_by_agent(
         db=db,
         office_id=current_user.office_id,
         agent_id=current_user.id,
+        limit=limit,
+        cursor=cursor,
+        count_strategy=resolve_count_strategy("showcases"),
     )
     return ShowcaseListResponse(
-        items=[_to_list_item(s) for s in showcases],
-        total=total,
+        items=[_to_list_item(s) for s in result.items],
+        total=result.total,
+        total_exact=result.total_exact,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor,
     )
 
 
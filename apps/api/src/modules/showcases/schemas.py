@@ -139,6 +139,13 @@ class ShowcaseListResponse(BaseModel):
 
     items: list[ShowcaseListItem] = Field(description="Vitrin listesi")
     total: int = Field(description="Toplam vitrin sayisi")
+    total_exact: bool = Field(
+        default=True, description="total kesin mi (false → tahmin veya alt sinir)"
+    )
+    has_more: bool = Field(default=False, description="Sonraki sayfa var mi")
+    next_cursor: str | None = Field(
+        default=None, description="Sonraki sayfa cursor'i (son sayfada null)"
+    )
 
 
 class PropertySummary(BaseModel):
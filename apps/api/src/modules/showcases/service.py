@@ -10,7 +10,7 @@ Guvenlik:
 
 Kullanim:
     showcase = await ShowcaseService.create(db, office_id, agent_id, data)
-    showcases, total = await ShowcaseService.list_by_agent(db, office_id, agent_id)
+    result = await ShowcaseService.list_by_agent(db, office_id, agent_id)
 """
 
 from __future__ import annotations
@@ -28,6 +28,16 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import NotFoundError
+from src.core.pagination import (
+    CountStrategy,
+    Page,
+    SortKey,
+    count_rows,
+    decode_cursor,
+    keyset_after,
+    order_by_keys,
+    trim_page,
+)
 from src.core.turkish import normalize_turkish
 from src.models.property import Property
 from src.models.showcase import Showcase
@@ -173,17 +183,30 @@ class ShowcaseService:
         db: AsyncSession,
         office_id: uuid.UUID,
         agent_id: uuid.UUID,
-    ) -> tuple[list[Showcase], int]:
+        limit: int | None = None,
+        cursor: str | None = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[Showcase]:
         """
         Danismanin ofise ait vitrinlerini listeler.
 
+        limit verilmezse tum vitrinler doner (geriye donuk uyumlu). limit ile
+        keyset sayfalama: (created_at, id) azalan, cursor bir onceki sayfanin
+        next_cursor degeri.
+
         Args:
             db: Async database session.
             office_id: Tenant (ofis) UUID.
             agent_id: Danisman UUID.
+            limit: Sayfa boyutu (opsiyonel).
+            cursor: Keyset cursor (opsiyonel).
+            count_strategy: Toplam sayim stratejisi (exact, estimate, has_more).
 
         Returns:
-            (vitrin listesi, toplam sayi) tuple'i.
+            Page[Showcase] — vitrin listesi, toplam sayi, sonraki sayfa cursor'i.
+
+        Raises:
+            ValidationError: Gecersiz cursor.
         """
         base_filter = [
             Showcase.office_id == office_id,
@@ -191,16 +214,31 @@ class ShowcaseService:
         ]
 
         # Total count
-        count_query = select(func.count(Showcase.id)).where(*base_filter)
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
+        total, total_exact = await count_rows(
+            db, select(Showcase.id).where(*base_filter), strategy=count_strategy
+        )
 
         # Results (en yeniden en eskiye)
-        query = select(Showcase).where(*base_filter).order_by(Showcase.created_at.desc())
+        keys = [SortKey(Showcase.created_at), SortKey(Showcase.id)]
+        query = select(Showcase).where(*base_filter).order_by(*order_by_keys(keys))
+        if cursor:
+            query = query.where(
+                keyset_after(keys, decode_cursor(cursor, "showcases", len(keys)))
+            )
+        if limit is not None:
+            query = query.limit(limit + 1)
+
         result = await db.execute(query)
-        showcases = list(result.scalars().all())
+        rows = result.scalars().all()
+        if limit is None:
+            return Page(items=list(rows), total=total, total_exact=total_exact)
 
-        return showcases, total
+        showcases, next_cursor = trim_page(
+            rows, limit, "showcases", lambda s: [s.created_at, s.id]
+        )
+        return Page(
+            items=showcases, total=total, next_cursor=next_cursor, total_exact=total_exact
+        )
 
     # ---------- Update ----------
 
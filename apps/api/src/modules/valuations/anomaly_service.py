@@ -47,6 +47,14 @@ class AnomalyResult(BaseModel):
     )
 
 
+class DistrictSqmStats(BaseModel):
+    """Ilce m2 fiyat istatistikleri (tahminden bagimsiz; paralel cekilebilir)."""
+
+    avg_sqm_price: float | None = None
+    std_sqm_price: float | None = None
+    source: str = "area_analysis"
+
+
 # =====================================================================
 # Z-Score Esik Degeri
 # =====================================================================
@@ -86,21 +94,50 @@ async def check_price_anomaly(
     Returns:
         AnomalyResult: Anomali durumu, z-score ve aciklama.
     """
-    predicted_sqm_price = predicted_price / max(net_sqm, 1.0)
+    stats = await get_district_sqm_stats(district, session)
+    return evaluate_price_anomaly(predicted_price, district, net_sqm, stats)
+
+
+async def get_district_sqm_stats(
+    district: str,
+    session: AsyncSession,
+) -> DistrictSqmStats:
+    """
+    Ilce m2 fiyat ortalamasi ve standart sapmasi.
 
+    Once AreaAnalysis, yoksa PredictionLog fallback. Tahmin edilen fiyata
+    ihtiyac duymaz — degerleme pipeline'i bu adimi tahminle paralel calistirir.
+    """
     # --- 1. AreaAnalysis'ten ilce ortalama m2 fiyatini cek ---
     avg_sqm_price, std_sqm_price = await _get_area_stats(district, session)
-
-    source = "area_analysis"
+    if avg_sqm_price is not None:
+        return DistrictSqmStats(avg_sqm_price=avg_sqm_price, std_sqm_price=std_sqm_price)
 
     # --- 2. Fallback: PredictionLog ---
-    if avg_sqm_price is None:
-        avg_sqm_price, std_sqm_price = await _get_prediction_log_stats(
-            district, session
-        )
-        source = "prediction_log"
+    avg_sqm_price, std_sqm_price = await _get_prediction_log_stats(district, session)
+    return DistrictSqmStats(
+        avg_sqm_price=avg_sqm_price,
+        std_sqm_price=std_sqm_price,
+        source="prediction_log",
+    )
+
+
+def evaluate_price_anomaly(
+    predicted_price: float,
+    district: str,
+    net_sqm: float,
+    stats: DistrictSqmStats,
+) -> AnomalyResult:
+    """
+    Tahmin edilen m2 fiyatini ilce istatistikleriyle karsilastirir (DB erisimi yok).
+
+    Z-score: |predicted_sqm - avg_sqm| / std_sqm; |z| > 2.0 → anomali.
+    """
+    predicted_sqm_price = predicted_price / max(net_sqm, 1.0)
+    avg_sqm_price, std_sqm_price = stats.avg_sqm_price, stats.std_sqm_price
+    source = stats.source
 
-    # --- 3. Veri yoksa anomali tespit edilemez ---
+    # --- Veri yoksa anomali tespit edilemez ---
     if avg_sqm_price is None or avg_sqm_price <= 0:
         logger.info(
             "anomaly_check_no_data",
@@ -12,6 +12,11 @@ Algoritma:
 Adaptive Radius (v2):
     Konum mevcut ise min_comparables saglanamazsa yaricap genisletilir:
     1km → 3km → 5km → ilce bazli (mesafe filtresi kaldirilir)
+
+    Mesafe filtreli adimlar tek sorguda calisir: ST_DWithin(5km) + KNN
+    (<->) ile adaylar alinir, min_comparables'i saglayan en kucuk yaricap
+    SQL icinde secilir. Ilce bazli adim yalnizca 5km yetmezse calisir
+    (en fazla 2 sorgu; onceden 4).
 """
 
 from __future__ import annotations
@@ -20,12 +25,10 @@ from typing import TYPE_CHECKING
 
 import structlog
 from geoalchemy2 import WKTElement
-from sqlalchemy import Integer as SAInteger
 from sqlalchemy import and_, case, func, literal, select
-from sqlalchemy import cast as sa_cast
 
 from src.models.area_analysis import AreaAnalysis
-from src.models.property import Property
+from src.models.property import Property, search_key
 
 
 def _pg_lower(s: str) -> str:
@@ -42,6 +45,11 @@ logger = structlog.get_logger()
 # Son adim None = ilce bazli (mesafe filtresi yok).
 _ADAPTIVE_RADII: list[float | None] = [1.0, 3.0, 5.0, None]
 
+# Tek sorguda KNN (<->) ile en yakin kac aday degerlendirilir. En genis
+# yaricap icinde bundan fazla aday varsa en uzaktakiler elenir; degerleme
+# icin 5 emsal aranirken pratikte sonuc degismez.
+_KNN_CANDIDATE_LIMIT = 200
+
 
 class ComparableService:
     """Emsal mulk bulma servisi."""
@@ -135,57 +143,85 @@ class ComparableService:
             - address ve rooms alanlari eklenir.
 
         Adaptive radius mantigi:
-            Konum varsa 1km → 3km → 5km → ilce bazli (mesafe filtresi yok).
-            Her adimda min_comparables saglanip saglanmadigi kontrol edilir.
+            Konum varsa 1km → 3km → 5km → ilce bazli (mesafe filtresi yok);
+            min_comparables'i saglayan ilk adimin sonucu doner
+            (bkz. _execute_adaptive_radius_query).
             Konum yoksa tek adimda ilce bazli sorgu yapilir.
         """
-        has_location = lat is not None and lon is not None
-        rows: list = []
+        rows = await self.find_comparable_rows(
+            district=district,
+            property_type=property_type,
+            net_sqm=net_sqm,
+            room_count=room_count,
+            building_age=building_age,
+            lat=lat,
+            lon=lon,
+            limit=limit,
+            min_comparables=min_comparables,
+        )
+        return self.format_enriched_results(rows, estimated_price)
 
-        if has_location:
-            for radius in _ADAPTIVE_RADII:
-                rows = await self._execute_enriched_query(
-                    district=district,
-                    property_type=property_type,
-                    net_sqm=net_sqm,
-                    room_count=room_count,
-                    building_age=building_age,
-                    lat=lat,
-                    lon=lon,
-                    limit=limit,
-                    max_distance_km=radius,
-                )
+    async def find_comparable_rows(
+        self,
+        district: str,
+        property_type: str,
+        net_sqm: float,
+        room_count: int,
+        building_age: int,
+        lat: float | None = None,
+        lon: float | None = None,
+        limit: int = 5,
+        min_comparables: int = 3,
+    ) -> list:
+        """
+        Adaptive radius emsal sorgusu — tahmin fiyatindan bagimsiz.
 
-                if len(rows) >= min_comparables:
-                    logger.info(
-                        "comparables_enriched_found",
-                        radius_km=radius,
-                        found=len(rows),
-                        min_required=min_comparables,
-                    )
-                    break
+        Degerleme pipeline'i bu adimi tahminle paralel calistirir;
+        price_diff_percent fiyat belli olunca format_enriched_results ile
+        eklenir.
+        """
+        has_location = lat is not None and lon is not None
 
-                logger.info(
-                    "comparables_enriched_expanding",
-                    current_radius_km=radius,
-                    found=len(rows),
-                    min_required=min_comparables,
-                )
-        else:
-            # Konum yok → ilce bazli tek sorgu
-            rows = await self._execute_enriched_query(
+        if has_location:
+            rows, radius = await self._execute_adaptive_radius_query(
                 district=district,
                 property_type=property_type,
                 net_sqm=net_sqm,
                 room_count=room_count,
                 building_age=building_age,
-                lat=None,
-                lon=None,
+                lat=lat,
+                lon=lon,
                 limit=limit,
-                max_distance_km=None,
+                min_comparables=min_comparables,
+            )
+            if rows:
+                logger.info(
+                    "comparables_enriched_found",
+                    radius_km=radius,
+                    found=len(rows),
+                    min_required=min_comparables,
+                )
+                return rows
+
+            logger.info(
+                "comparables_enriched_expanding",
+                current_radius_km=_ADAPTIVE_RADII[-2],
+                min_required=min_comparables,
             )
 
-        return self._format_enriched_results(rows, estimated_price)
+        # Konum yok veya 5km icinde yeterli emsal yok → ilce bazli tek sorgu
+        # (konum varsa distance_km yine hesaplanir, filtre uygulanmaz)
+        return await self._execute_enriched_query(
+            district=district,
+            property_type=property_type,
+            net_sqm=net_sqm,
+            room_count=room_count,
+            building_age=building_age,
+            lat=lat,
+            lon=lon,
+            limit=limit,
+            max_distance_km=None,
+        )
 
     # ------------------------------------------------------------------
     # Public: Ilce istatistikleri
@@ -241,12 +277,14 @@ class ComparableService:
         room_min = max(1, room_count - 1)
         room_max = room_count + 1
 
-        # rooms alani "3+1" formatinda string — ilk parcayi int'e ceviriyoruz
-        room_int = sa_cast(func.split_part(Property.rooms, "+", 1), SAInteger)
+        # rooms "3+1" formatinda string — ana oda sayisi generated kolonda
+        room_int = Property.room_count
 
+        # district_key / property_type_key esitligi + net_area araligi:
+        # ix_properties_comparable_search uzerinde index range scan
         filters = [
-            func.lower(Property.district) == _pg_lower(district),
-            func.lower(Property.property_type) == _pg_lower(property_type),
+            Property.district_key == search_key(district),
+            Property.property_type_key == search_key(property_type),
             Property.status == "active",
             Property.net_area.isnot(None),
             Property.net_area >= sqm_min,
@@ -254,7 +292,6 @@ class ComparableService:
             Property.building_age.isnot(None),
             Property.building_age >= age_min,
             Property.building_age <= age_max,
-            Property.rooms.isnot(None),
             room_int >= room_min,
             room_int <= room_max,
         ]
@@ -419,8 +456,112 @@ class ComparableService:
         result = await self.session.execute(stmt)
         return result.all()
 
+    async def _execute_adaptive_radius_query(
+        self,
+        district: str,
+        property_type: str,
+        net_sqm: float,
+        room_count: int,
+        building_age: int,
+        lat: float,
+        lon: float,
+        limit: int,
+        min_comparables: int,
+    ) -> tuple[list, float | None]:
+        """
+        Adaptive radius'in mesafe filtreli adimlari tek sorguda.
+
+        1. Aday CTE: temel filtreler + ST_DWithin(en genis yaricap) — geography
+           GiST index; KNN (<->) sirasiyla en yakin _KNN_CANDIDATE_LIMIT aday.
+        2. Secim CTE: min_comparables'i saglayan en kucuk yaricap
+           (count(*) FILTER (distance < r) >= min_comparables).
+        3. Secilen yaricap icindeki adaylar, o yaricapa gore benzerlik skoru
+           ile siralanir (adim adim sorgularla ayni skor ve sonuc).
+
+        Returns:
+            (rows, radius_km) — hicbir yaricap yetmezse ([], None).
+        """
+        radii = [r for r in _ADAPTIVE_RADII if r is not None]
+
+        (
+            filters,
+            sqm_similarity,
+            age_similarity,
+            room_similarity,
+            room_int,
+        ) = self._build_base_filters(district, property_type, net_sqm, room_count, building_age)
+
+        # Acik geography: ST_DWithin / <-> geography GiST index'ini kullanir
+        ref_point = func.ST_GeogFromText(f"SRID=4326;POINT({lon} {lat})")
+        distance_meters = func.ST_Distance(Property.location, ref_point)
+
+        candidates = (
+            select(
+                Property.id.label("property_id"),
+                Property.net_area.label("net_sqm"),
+                Property.price,
+                Property.rooms,
+                Property.address,
+                room_int.label("room_count"),
+                distance_meters.label("distance_m"),
+                (
+                    sqm_similarity * 0.3 + age_similarity * 0.2 + room_similarity * 0.2
+                ).label("base_score"),
+            )
+            .where(
+                and_(*filters),
+                func.ST_DWithin(Property.location, ref_point, radii[-1] * 1000),
+            )
+            .order_by(Property.location.op("<->")(ref_point))
+            .limit(_KNN_CANDIDATE_LIMIT)
+            .cte("candidates")
+        )
+
+        chosen_radius = case(
+            *(
+                (
+                    func.count().filter(candidates.c.distance_m < radius * 1000)
+                    >= min_comparables,
+                    literal(radius),
+                )
+                for radius in radii
+            ),
+            else_=None,
+        )
+        chosen = select(chosen_radius.label("radius_km")).select_from(candidates).cte("chosen")
+
+        distance_km = candidates.c.distance_m / 1000.0
+        similarity = (
+            candidates.c.base_score + (1.0 - distance_km / chosen.c.radius_km) * 0.3
+        ) * 100.0
+        similarity_label = similarity.label("similarity_score")
+
+        stmt = (
+            select(
+                candidates.c.property_id,
+                candidates.c.net_sqm,
+                candidates.c.price,
+                candidates.c.rooms,
+                candidates.c.address,
+                candidates.c.room_count,
+                distance_km.label("distance_km"),
+                similarity_label,
+                chosen.c.radius_km,
+            )
+            .select_from(
+                candidates.join(chosen, candidates.c.distance_m < chosen.c.radius_km * 1000)
+            )
+            .order_by(similarity_label.desc())
+            .limit(limit)
+        )
+
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            return [], None
+        return rows, float(rows[0].radius_km)
+
     @staticmethod
-    def _format_enriched_results(rows: list, estimated_price: int) -> list[dict]:
+    def format_enriched_results(rows: list, estimated_price: int) -> list[dict]:
         """
         Sorgu satirlarini ComparableResult-uyumlu dict listesine donusturur.
 
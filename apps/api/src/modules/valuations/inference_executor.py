@@ -0,0 +1,253 @@
+"""
+Emlak Teknoloji Platformu - Inference Executor + Mikro-Batcher
+
+LightGBM tahmini CPU-bound ve senkron. async route icinde dogrudan
+cagrildiginda uvicorn event loop'u tahmin suresince bloklanir; ayni
+worker'daki ilgisiz istekler (login, liste, websocket...) bekler.
+
+InferenceExecutor:
+    Tahminler event loop disinda, ayri bir havuzda calisir
+    (settings.INFERENCE_EXECUTOR):
+      - thread (varsayilan): model tek kopya; LightGBM predict GIL'i
+        biraktigi icin gercek paralellik saglanir.
+      - process: her process modeli kendisi yukler (spawn — fork edilmis
+        uvicorn thread'leri miras alinmaz). GIL cekismesi yok, bellek
+        process sayisi kadar artar. Hot swap sonrasi yeni model her
+        process'te ilk istekte yuklenir.
+
+MicroBatcher:
+    Eszamanli istekleri INFERENCE_BATCH_WINDOW_MS boyunca toplar ve tek
+    predict_batch cagrisi olarak havuza gonderir (en fazla
+    INFERENCE_MAX_BATCH_SIZE istek; dolunca pencere beklenmez).
+    Batch hata verirse istekler tek tek yeniden denenir — bir istegin
+    hatali girdisi digerlerini dusurmez.
+
+Kullanim:
+    prediction = await InferenceService.get_instance().predict_async(input_data)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import structlog
+
+from src.config import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from concurrent.futures import Executor
+
+    from src.modules.valuations.inference_service import InferenceService
+
+logger = structlog.get_logger()
+
+_EXECUTOR_KINDS = ("thread", "process")
+
+
+# ================================================================
+# Havuz tarafi (thread veya process icinde calisir)
+# ================================================================
+
+
+# Process havuzunda: artifact dizini → servis (aktif + shadow/yeni model)
+_process_services: dict[str, InferenceService] = {}
+_PROCESS_SERVICE_LIMIT = 2
+
+
+def _load_process_model() -> None:
+    """Process havuzu initializer: modeli ilk istekten once yukle."""
+    from src.modules.valuations.inference_service import InferenceService
+
+    service = InferenceService.get_instance()
+    _process_services[str(service.model_dir)] = service
+
+
+def _predict_batch_in_process(
+    inputs: list[dict],
+    model_dir: str,
+    version: str,
+    city: str | None = None,
+) -> list[dict]:
+    """
+    Process havuzunda calisir — parent'taki servisle ayni artifact'i kullanir.
+
+    Hot swap sonrasi parent yeni model_dir gonderir; process modeli ilk
+    istekte kendisi yukler (en fazla _PROCESS_SERVICE_LIMIT model tutulur).
+    Sehir modelleri process'in kendi ModelRouter LRU'sundan gelir.
+    """
+    from src.modules.valuations.inference_service import InferenceService
+
+    if city is not None:
+        from src.modules.valuations.model_router import get_model_router
+
+        return get_model_router().get_service(city).predict_batch(inputs)
+
+    service = _process_services.get(model_dir)
+    if service is None:
+        service = InferenceService.from_artifact(model_dir, version)
+        if len(_process_services) >= _PROCESS_SERVICE_LIMIT:
+            _process_services.pop(next(iter(_process_services)))
+        _process_services[model_dir] = service
+    return service.predict_batch(inputs)
+
+
+# ================================================================
+# Executor
+# ================================================================
+
+
+class InferenceExecutor:
+    """predict_batch cagrilarini event loop disinda calistiran havuz."""
+
+    def __init__(self, kind: str, max_workers: int) -> None:
+        if kind not in _EXECUTOR_KINDS:
+            msg = f"Gecersiz INFERENCE_EXECUTOR: {kind!r} (thread | process)"
+            raise ValueError(msg)
+
+        self.kind = kind
+        self._pool: Executor
+        if kind == "process":
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_load_process_model,
+            )
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="inference",
+            )
+
+        logger.info("inference_executor_started", kind=kind, max_workers=max_workers)
+
+    async def run(self, service: InferenceService, inputs: list[dict]) -> list[dict]:
+        """service.predict_batch(inputs) — havuzda calistirir, sonucu bekler."""
+        loop = asyncio.get_running_loop()
+        if self.kind == "process":
+            return await loop.run_in_executor(
+                self._pool,
+                _predict_batch_in_process,
+                inputs,
+                str(service.model_dir),
+                service._model_version,
+                service.city,
+            )
+        return await loop.run_in_executor(self._pool, service.predict_batch, inputs)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("inference_executor_stopped", kind=self.kind)
+
+
+_executor: InferenceExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_inference_executor() -> InferenceExecutor:
+    """Process basina tek executor (ilk kullanimda settings'ten olusturulur)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = InferenceExecutor(
+                    kind=settings.INFERENCE_EXECUTOR,
+                    max_workers=settings.INFERENCE_MAX_WORKERS,
+                )
+    return _executor
+
+
+def shutdown_inference_executor() -> None:
+    """Uygulama kapanisinda havuzu kapatir (lifespan)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+# ================================================================
+# Mikro-Batcher
+# ================================================================
+
+
+class MicroBatcher:
+    """
+    Kisa pencerede gelen tekil istekleri tek batch'te toplar.
+
+    Bir event loop'a baglidir (asyncio.Future); loop basina ayri ornek
+    olusturulmalidir.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[dict]], Awaitable[list[dict]]],
+        window_ms: int,
+        max_batch_size: int,
+    ) -> None:
+        self._run_batch = run_batch
+        self._window = window_ms / 1000
+        self._max_batch_size = max(1, max_batch_size)
+        self._pending: list[tuple[dict, asyncio.Future[dict]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._running: set[asyncio.Task[None]] = set()
+
+    async def submit(self, input_data: dict) -> dict:
+        """Girdiyi siradaki batch'e ekler, kendi sonucunu bekler."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict] = loop.create_future()
+        self._pending.append((input_data, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        # Task referansi tutulur — GC tamamlanmadan toplamasin
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: list[tuple[dict, asyncio.Future[dict]]]) -> None:
+        inputs = [input_data for input_data, _ in batch]
+        try:
+            results = await self._run_batch(inputs)
+        except Exception as exc:
+            if len(batch) == 1:
+                _set_exception(batch[0][1], exc)
+                return
+            # Hata izolasyonu: tek hatali girdi tum batch'i dusurmesin
+            logger.warning(
+                "inference_batch_failed_retrying_individually",
+                batch_size=len(batch),
+                error=str(exc),
+            )
+            await asyncio.gather(*(self._run([item]) for item in batch))
+            return
+
+        if len(batch) > 1:
+            logger.debug("inference_micro_batch_completed", batch_size=len(batch))
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future[dict], exc: Exception) -> None:
+    # Istemci baglantisi koptuysa future iptal edilmis olabilir
+    if not future.done():
+        future.set_exception(exc)
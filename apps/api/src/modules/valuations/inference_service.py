@@ -8,10 +8,43 @@ v1 yenilikler:
   - Quantile regression tabanli %80 guven araligi (confidence_low, confidence_high)
   - Model version fallback: v1 → v0 otomatik gecis
   - 3 model dosyasi: main + quantile_q10 + quantile_q90
+
+Toplu inference (predict_batch):
+  N girdi tek DataFrame'de bir kez donusturulur; ana model ve q10/q90
+  quantile modelleri ayni feature matrisi uzerinde birer kez calisir.
+  predict (HTTP router) ve predict_quick (Telegram) tek elemanli batch'tir.
+
+Yalin serving artifact (v1/serving/, src.ml.serving_model):
+  Varsa joblib/pickle yerine tercih edilir. Agaclar mmap ile yuklenir
+  (uvicorn worker'lari ayni sayfalari paylasir); sklearn, pandas ve
+  lightgbm import edilmez. register_model_v1 ile uretilir.
+
+Sonuc cache'i (predict_cached, valuation_cache):
+  Ayni girdi + ayni model dosyalari → Redis'teki tahmin doner. Anahtar
+  model parmak izini (yuklenen dosyalarin icerik ozeti) icerir; model
+  degisince eski kayitlar kendiliginden gecersiz kalir.
+
+Event loop disi inference (predict_async):
+  Tahmin inference_executor havuzunda (thread | process) calisir; async
+  route'lar tahmin suresince event loop'u bloklamaz. Eszamanli istekler
+  INFERENCE_BATCH_WINDOW_MS penceresinde mikro-batch'e toplanir.
+
+Hot swap + shadow (model_watcher):
+  model_registry'deki aktif kayit degisince yeni artifact arka planda
+  yuklenir, isitilir ve swap_instance() ile atomik olarak devreye girer.
+  status='shadow' kaydi varsa aday model trafigin MODEL_SHADOW_SAMPLE_RATE
+  kadarini paralel skorlar; fark loglanir, yanit etkilenmez.
+
+Sehir modelleri (model_router):
+  Bu singleton varsayilan sehri (DEFAULT_MODEL_CITY) sunar. Diger sehirler
+  from_artifact ile ilk istekte yuklenir ve bayt butceli LRU'da tutulur.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import random
 import threading
 import time
 from pathlib import Path
@@ -20,9 +53,15 @@ from typing import TYPE_CHECKING
 import structlog
 
 if TYPE_CHECKING:
+    import numpy as np
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.ml.confidence_interval import ConfidencePredictor
+    from src.ml.serving_model import ServingModel
+    from src.modules.valuations.inference_executor import MicroBatcher
+from src.config import settings
+from src.ml.serving_model import MANIFEST_FILE, SERVING_DIR_NAME
+from src.ml.trainer import DEFAULT_CONFIDENCE
 from src.models.prediction_log import PredictionLog
 
 logger = structlog.get_logger()
@@ -31,6 +70,23 @@ logger = structlog.get_logger()
 MODEL_DIR_V1 = "src/ml/models/v1/"
 MODEL_DIR_V0 = "src/ml/models/v0/"
 MODEL_NAME = "lgbm_konut_fiyat"
+SERVING_DIR_V1 = "src/ml/models/v1/serving/"
+
+# Shadow skorlama task referanslari — GC tamamlanmadan toplamasin
+_shadow_tasks: set[asyncio.Task[None]] = set()
+
+
+def _fingerprint(paths: list[Path]) -> str:
+    """Model dosyalarinin icerik ozeti — sonuc cache anahtarinda kullanilir."""
+    digest = hashlib.sha256()
+    for path in paths:
+        if not path.is_file():
+            continue
+        digest.update(path.name.encode())
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()[:16]
 
 
 class InferenceService:
@@ -46,6 +102,8 @@ class InferenceService:
 
     _instance: InferenceService | None = None
     _lock = threading.Lock()
+    # Model registry'de status='shadow' olan aday (model_watcher yonetir)
+    _shadow: InferenceService | None = None
 
     def __init__(self) -> None:
         from src.ml.feature_engineering import FeatureEngineer
@@ -53,9 +111,18 @@ class InferenceService:
 
         self.trainer = ModelTrainer(FeatureEngineer())
         self.confidence_predictor: ConfidencePredictor | None = None
+        self._serving: ServingModel | None = None
         self._model_loaded = False
         self._model_version = "unknown"
+        self._model_fingerprint = "unknown"
         self._has_confidence = False
+        # Yuklenen artifact dizini (hot swap karsilastirmasi, process executor)
+        self.model_dir: Path | None = None
+        # Sehir modeli ise anahtari (model_router); None → varsayilan singleton
+        self.city: str | None = None
+        # Mikro-batcher asyncio.Future kullanir → olusturuldugu loop'a bagli
+        self._batcher: MicroBatcher | None = None
+        self._batcher_loop: asyncio.AbstractEventLoop | None = None
 
     @classmethod
     def get_instance(cls) -> InferenceService:
@@ -68,37 +135,43 @@ class InferenceService:
                     cls._instance = instance
         return cls._instance
 
-    def _load_model(self) -> None:
-        """Model dosyalarini diskten yukle. v1 → v0 fallback."""
+    @classmethod
+    def from_artifact(cls, model_dir: str | Path, version: str) -> InferenceService:
+        """
+        Belirli bir artifact dizininden yeni (singleton olmayan) servis.
 
-        # --- v1 deneme ---
-        v1_path = Path(MODEL_DIR_V1)
-        if (v1_path / "lgbm_model.joblib").exists():
-            try:
-                self.trainer.load_model(MODEL_DIR_V1)
-                self._model_version = "v1"
-                self._model_loaded = True
+        Model registry hot swap ve shadow adaylari icin kullanilir;
+        fallback yoktur — yuklenemezse hata firlatir.
+        """
+        instance = cls()
+        instance._load_artifact(Path(model_dir), version)
+        return instance
+
+    @classmethod
+    def swap_instance(cls, instance: InferenceService) -> InferenceService | None:
+        """
+        Singleton'i atomik olarak degistirir, oncekini dondurur.
 
-                # Quantile modelleri yukle
-                from src.ml.confidence_interval import ConfidencePredictor
+        Devam eden istekler eski ornegi kullanarak tamamlanir; sonraki
+        get_instance() cagrilari yeni modeli gorur.
+        """
+        with cls._lock:
+            previous, cls._instance = cls._instance, instance
+        return previous
 
-                q10_path = v1_path / "lgbm_quantile_q10.joblib"
-                q90_path = v1_path / "lgbm_quantile_q90.joblib"
-                if q10_path.exists() and q90_path.exists():
-                    self.confidence_predictor = ConfidencePredictor()
-                    self.confidence_predictor.load(MODEL_DIR_V1)
-                    self._has_confidence = True
-                    logger.info(
-                        "inference_confidence_models_loaded",
-                        model_dir=MODEL_DIR_V1,
-                    )
+    @classmethod
+    def set_shadow(cls, instance: InferenceService | None) -> None:
+        """Shadow aday modeli ayarlar (None → shadow kapali)."""
+        cls._shadow = instance
 
-                logger.info(
-                    "inference_model_loaded",
-                    model_dir=MODEL_DIR_V1,
-                    model_name=MODEL_NAME,
-                    model_version=self._model_version,
-                )
+    def _load_model(self) -> None:
+        """Model dosyalarini diskten yukle. v1 serving → v1 joblib → v0 fallback."""
+
+        # --- v1 (serving artifact → joblib) ---
+        v1_path = Path(MODEL_DIR_V1)
+        if (Path(SERVING_DIR_V1) / MANIFEST_FILE).exists() or (v1_path / "lgbm_model.joblib").exists():
+            try:
+                self._load_artifact(v1_path, "v1", serving_dir=Path(SERVING_DIR_V1))
                 return
 
             except Exception as exc:
@@ -115,6 +188,8 @@ class InferenceService:
             self._model_loaded = True
             self._has_confidence = False
             self.confidence_predictor = None
+            self._model_fingerprint = _fingerprint(sorted(Path(MODEL_DIR_V0).glob("*.joblib")))
+            self.model_dir = Path(MODEL_DIR_V0).resolve()
 
             logger.info(
                 "inference_model_loaded",
@@ -136,6 +211,163 @@ class InferenceService:
                 f"ML model yuklenemedi (v1: {MODEL_DIR_V1}, v0: {MODEL_DIR_V0}): {exc}"
             ) from exc
 
+    def _load_artifact(
+        self,
+        model_dir: Path,
+        version: str,
+        serving_dir: Path | None = None,
+    ) -> None:
+        """
+        Tek artifact dizininden yukleme: serving artifact varsa o, yoksa joblib.
+
+        Raises:
+            Exception: Ana model yuklenemezse (cagiran fallback'e karar verir).
+        """
+        serving_dir = serving_dir or model_dir / SERVING_DIR_NAME
+
+        # --- Yalin serving artifact ---
+        if (serving_dir / MANIFEST_FILE).exists():
+            try:
+                from src.ml.serving_model import ServingModel
+
+                self._serving = ServingModel.load(serving_dir)
+                self._model_version = version
+                self._model_loaded = True
+                self._has_confidence = self._serving.has_confidence
+                self._model_fingerprint = _fingerprint(sorted(serving_dir.rglob("*")))
+                self.model_dir = model_dir.resolve()
+
+                logger.info(
+                    "inference_model_loaded",
+                    model_dir=str(serving_dir),
+                    model_name=MODEL_NAME,
+                    model_version=self._model_version,
+                    artifact="serving",
+                    num_trees=self._serving.main.num_trees,
+                )
+                return
+
+            except Exception as exc:
+                self._serving = None
+                logger.warning(
+                    "inference_serving_artifact_load_failed_fallback_to_joblib",
+                    error=str(exc),
+                    model_dir=str(serving_dir),
+                )
+
+        # --- joblib ---
+        self.trainer.load_model(str(model_dir))
+        self._model_version = version
+        self._model_loaded = True
+
+        # Quantile modelleri yukle
+        from src.ml.confidence_interval import ConfidencePredictor
+
+        q10_path = model_dir / "lgbm_quantile_q10.joblib"
+        q90_path = model_dir / "lgbm_quantile_q90.joblib"
+        if q10_path.exists() and q90_path.exists():
+            self.confidence_predictor = ConfidencePredictor()
+            self.confidence_predictor.load(str(model_dir))
+            self._has_confidence = True
+            logger.info(
+                "inference_confidence_models_loaded",
+                model_dir=str(model_dir),
+            )
+
+        self._model_fingerprint = _fingerprint(sorted(model_dir.glob("*.joblib")))
+        self.model_dir = model_dir.resolve()
+
+        logger.info(
+            "inference_model_loaded",
+            model_dir=str(model_dir),
+            model_name=MODEL_NAME,
+            model_version=self._model_version,
+        )
+
+    def predict_batch(self, inputs: list[dict]) -> list[dict]:
+        """
+        N mulk icin tek geciste fiyat tahmini + guven araligi (DB kaydi yok).
+
+        Feature donusumu bir kez yapilir; ana model bir kez calisir ve
+        tahminleri quantile modellerine aktarilir (ikinci ana model gecisi yok).
+
+        Args:
+            inputs: Mulk ozellikleri listesi (district, net_sqm, vb.)
+
+        Returns:
+            Girdi sirasiyla: estimated_price, confidence_low, confidence_high,
+            confidence_level, confidence
+        """
+        if not self._model_loaded:
+            raise RuntimeError("Model yuklenmedi. Inference servisi hazir degil.")
+        if not inputs:
+            return []
+
+        if self._serving is not None:
+            return self._build_results(*self._predict_serving(inputs))
+
+        import pandas as pd
+
+        features_df = self.trainer.fe.transform(pd.DataFrame(inputs))
+        predicted = self.trainer.model.predict(features_df)
+
+        intervals: list[dict] | None = None
+        if self._has_confidence and self.confidence_predictor is not None:
+            intervals = self.confidence_predictor.predict_batch_with_confidence(
+                features_df, predicted=predicted,
+            )
+
+        return self._build_results(predicted, intervals)
+
+    def _predict_serving(
+        self, inputs: list[dict],
+    ) -> tuple[np.ndarray, list[dict] | None]:
+        """Yalin artifact ile ana model + quantile tahminleri (pandas'siz)."""
+        from src.ml.confidence_interval import confidence_bounds
+
+        features = self._serving.transform(inputs)
+        predicted = self._serving.predict(features)
+
+        intervals: list[dict] | None = None
+        if self._has_confidence:
+            intervals = confidence_bounds(predicted, *self._serving.predict_quantiles(features))
+        return predicted, intervals
+
+    @staticmethod
+    def _build_results(
+        predicted: np.ndarray, intervals: list[dict] | None,
+    ) -> list[dict]:
+        """Ham tahminler → API sonuc formati (v1 quantile / v0 margin)."""
+        results: list[dict] = []
+        for i, raw_price in enumerate(predicted):
+            estimated_price = round(float(raw_price))
+
+            if intervals is not None:
+                # v1: Quantile regression ile data-driven guven araligi
+                confidence_low = intervals[i]["low"]
+                confidence_high = intervals[i]["high"]
+                confidence_level = intervals[i]["confidence_level"]
+                # Adaptive confidence skoru: aralik ne kadar darsa, o kadar guvenliyiz
+                interval_ratio = (confidence_high - confidence_low) / max(estimated_price, 1)
+                confidence = round(max(0.5, min(0.99, 1.0 - interval_ratio)), 2)
+            else:
+                # v0 fallback: sabit margin-based aralik
+                confidence = DEFAULT_CONFIDENCE
+                margin = (5 - 4 * confidence) / 12
+                confidence_low = round(estimated_price * (1 - margin))
+                confidence_high = round(estimated_price * (1 + margin))
+                confidence_level = 0.80
+
+            results.append({
+                "estimated_price": estimated_price,
+                "confidence_low": confidence_low,
+                "confidence_high": confidence_high,
+                "confidence_level": confidence_level,
+                "confidence": confidence,
+            })
+
+        return results
+
     def predict_quick(self, input_data: dict) -> dict:
         """
         Hafif fiyat tahmini — DB kaydi gerektirmez.
@@ -147,35 +379,84 @@ class InferenceService:
             input_data: Mulk ozellikleri (district, net_sqm, vb.)
 
         Returns:
-            estimated_price, confidence_low, confidence_high, confidence_level
+            estimated_price, confidence_low, confidence_high, confidence_level,
+            confidence
+        """
+        return self.predict_batch([input_data])[0]
+
+    async def predict_async(self, input_data: dict) -> dict:
+        """
+        predict_quick'in event loop'u bloklamayan karsiligi.
+
+        Tahmin inference executor havuzunda calisir. INFERENCE_BATCH_WINDOW_MS
+        > 0 ise ayni pencerede gelen istekler tek predict_batch cagrisinda
+        birlestirilir.
+
+        Args:
+            input_data: Mulk ozellikleri (district, net_sqm, vb.)
+
+        Returns:
+            predict_quick ile ayni alanlar.
         """
+        from src.modules.valuations.inference_executor import (
+            MicroBatcher,
+            get_inference_executor,
+        )
+
         if not self._model_loaded:
             raise RuntimeError("Model yuklenmedi. Inference servisi hazir degil.")
 
-        result = self.trainer.predict(input_data)
-        estimated_price = result["estimated_price"]
+        if settings.INFERENCE_BATCH_WINDOW_MS <= 0:
+            return (await get_inference_executor().run(self, [input_data]))[0]
 
-        if self._has_confidence and self.confidence_predictor is not None:
-            import pandas as pd
-
-            features_df = self.trainer.fe.transform(pd.DataFrame([input_data]))
-            ci_result = self.confidence_predictor.predict_with_confidence(features_df)
-            confidence_low = ci_result["low"]
-            confidence_high = ci_result["high"]
-            confidence_level = ci_result["confidence_level"]
-        else:
-            confidence = result["confidence"]
-            margin = (5 - 4 * confidence) / 12
-            confidence_low = round(estimated_price * (1 - margin))
-            confidence_high = round(estimated_price * (1 + margin))
-            confidence_level = 0.80
+        loop = asyncio.get_running_loop()
+        if self._batcher is None or self._batcher_loop is not loop:
+            self._batcher = MicroBatcher(
+                # Executor her batch'te yeniden alinir: shutdown sonrasi yeni havuz
+                run_batch=lambda inputs: get_inference_executor().run(self, inputs),
+                window_ms=settings.INFERENCE_BATCH_WINDOW_MS,
+                max_batch_size=settings.INFERENCE_MAX_BATCH_SIZE,
+            )
+            self._batcher_loop = loop
+        return await self._batcher.submit(input_data)
 
-        return {
-            "estimated_price": estimated_price,
-            "confidence_low": confidence_low,
-            "confidence_high": confidence_high,
-            "confidence_level": confidence_level,
-        }
+    async def predict_cached(self, input_data: dict) -> tuple[dict, bool]:
+        """
+        predict_async + Redis sonuc cache'i.
+
+        Returns:
+            (tahmin, cache_hit) — tahmin predict_quick ile ayni alanlar.
+        """
+        from src.modules.valuations import valuation_cache
+
+        if not self._model_loaded:
+            raise RuntimeError("Model yuklenmedi. Inference servisi hazir degil.")
+
+        key = valuation_cache.cache_key(input_data, self._model_version, self._model_fingerprint)
+        cached = await valuation_cache.get_prediction(key)
+        if cached is not None:
+            self._schedule_shadow(input_data, cached)
+            return cached, True
+
+        prediction = await self.predict_async(input_data)
+        await valuation_cache.store_prediction(key, prediction)
+        self._schedule_shadow(input_data, prediction)
+        return prediction, False
+
+    def _schedule_shadow(self, input_data: dict, prediction: dict) -> None:
+        """Shadow aday varsa ornekleme oraninda arka planda skorlatir (beklenmez)."""
+        shadow = InferenceService._shadow
+        # Shadow aday varsayilan sehrin modeli — sehir modellerini karsilastirmaz
+        if shadow is None or shadow is self or self.city is not None:
+            return
+        if random.random() >= settings.MODEL_SHADOW_SAMPLE_RATE:
+            return
+
+        task = asyncio.get_running_loop().create_task(
+            _score_shadow(shadow, self._model_version, input_data, prediction),
+        )
+        _shadow_tasks.add(task)
+        task.add_done_callback(_shadow_tasks.discard)
 
     async def predict(
         self,
@@ -195,37 +476,17 @@ class InferenceService:
             Tahmin sonucu: estimated_price, min/max, confidence, latency vb.
             v1'de ek: confidence_low, confidence_high, confidence_level
         """
-        if not self._model_loaded:
-            raise RuntimeError("Model yuklenmedi. Inference servisi hazir degil.")
-
         # 1. Zamanlama baslat
         start_time = time.perf_counter()
 
-        # 2. Model tahmini
-        result = self.trainer.predict(input_data)
-        estimated_price = result["estimated_price"]
-
-        # 3. Guven araligi (v1 quantile, v0 margin-based fallback)
-        if self._has_confidence and self.confidence_predictor is not None:
-            # v1: Quantile regression ile data-driven guven araligi
-            import pandas as pd
-
-            features_df = self.trainer.fe.transform(pd.DataFrame([input_data]))
-            ci_result = self.confidence_predictor.predict_with_confidence(features_df)
-
-            confidence_low = ci_result["low"]
-            confidence_high = ci_result["high"]
-            confidence_level = ci_result["confidence_level"]
-            # Adaptive confidence skoru: aralik ne kadar darsa, o kadar guvenliyiz
-            interval_ratio = (confidence_high - confidence_low) / max(estimated_price, 1)
-            confidence = round(max(0.5, min(0.99, 1.0 - interval_ratio)), 2)
-        else:
-            # v0 fallback: sabit margin-based aralik
-            confidence = result["confidence"]
-            margin = (5 - 4 * confidence) / 12
-            confidence_low = round(estimated_price * (1 - margin))
-            confidence_high = round(estimated_price * (1 + margin))
-            confidence_level = 0.80
+        # 2-3. Model tahmini + guven araligi (v1 quantile, v0 margin-based fallback)
+        #      Ayni girdi daha once tahmin edildiyse cache'ten
+        prediction, cache_hit = await self.predict_cached(input_data)
+        estimated_price = prediction["estimated_price"]
+        confidence_low = prediction["confidence_low"]
+        confidence_high = prediction["confidence_high"]
+        confidence_level = prediction["confidence_level"]
+        confidence = prediction["confidence"]
 
         # min/max backward compatibility (v0 API uyumu)
         min_price = confidence_low
@@ -258,6 +519,7 @@ class InferenceService:
             output_data=output_data,
             confidence=confidence,
             latency_ms=latency_ms,
+            cache_hit=cache_hit,
         )
         session.add(prediction_log)
         await session.flush()
@@ -271,6 +533,7 @@ class InferenceService:
             confidence_high=confidence_high,
             latency_ms=latency_ms,
             model_version=self._model_version,
+            cache_hit=cache_hit,
             office_id=office_id,
         )
 
@@ -288,3 +551,34 @@ class InferenceService:
             "model_version": self._model_version,
             "prediction_id": str(prediction_log.id),
         }
+
+
+async def _score_shadow(
+    shadow: InferenceService,
+    primary_version: str,
+    input_data: dict,
+    primary: dict,
+) -> None:
+    """Aday modelin tahmini ile aktif modelin tahmini arasindaki farki loglar."""
+    try:
+        candidate = await shadow.predict_async(input_data)
+    except Exception as exc:
+        logger.warning(
+            "inference_shadow_failed",
+            shadow_version=shadow._model_version,
+            error=str(exc),
+        )
+        return
+
+    primary_price = primary["estimated_price"]
+    diff = candidate["estimated_price"] - primary_price
+    logger.info(
+        "inference_shadow_diff",
+        primary_version=primary_version,
+        shadow_version=shadow._model_version,
+        primary_price=primary_price,
+        shadow_price=candidate["estimated_price"],
+        diff=diff,
+        diff_pct=round(diff / max(primary_price, 1) * 100, 2),
+        district=input_data.get("district"),
+    )
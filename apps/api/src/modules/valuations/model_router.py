@@ -0,0 +1,244 @@
+"""
+Emlak Teknoloji Platformu - Sehir Bazli Model Yonlendirici
+
+InferenceService tek model sunar (Istanbul). Ankara ve Izmir icin ayri
+egitim verisi hazirlaniyor; her worker'in tum sehir modellerini bastan
+yuklemesi resident bellegi sehir sayisiyla carpar.
+
+ModelRouter:
+    - Varsayilan sehir (settings.DEFAULT_MODEL_CITY) ve sehirsiz istek →
+      InferenceService singleton'i. Hot swap + shadow (model_watcher) aynen
+      calisir; LRU'ya dahil degildir, dusurulmez.
+    - Diger sehirler → CITY_MODEL_ROOT/<sehir>/ artifact'i (train_model_v1
+      duzeni: serving/ veya joblib) ilk istekte yuklenir.
+    - Yuklu sehir modelleri LRU'da tutulur; toplam boyut
+      CITY_MODEL_MEMORY_BUDGET_MB'yi asarsa en uzun suredir kullanilmayan
+      dusurulur. Son yuklenen model butceden buyuk olsa da tutulur.
+    - Ayni sehir icin eszamanli ilk istekler modeli bir kez yukler
+      (sehir basina kilit); diger sehirlerin istekleri beklemez.
+
+Boyut = yuklenen artifact dosyalarinin toplami (joblib → yaklasik heap,
+serving → mmap sayfalari icin ust sinir).
+
+Sehir anahtari normalize_turkish ile uretilir ("İzmir" → "izmir"); dizin
+adi olarak kullanildigi icin yalnizca [a-z_] kabul edilir.
+
+Process executor: worker process'ler kendi router'larini kullanir —
+sehir modeli her process'te ilk istekte, ayni butceyle yuklenir.
+
+Kullanim:
+    service = await get_model_router().get_service_async(city)
+    prediction = await service.predict_async(input_data)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import NoReturn
+
+import structlog
+
+from src.config import settings
+from src.core.exceptions import ValidationError
+from src.core.turkish import normalize_turkish
+from src.ml.serving_model import MANIFEST_FILE, SERVING_DIR_NAME
+from src.modules.valuations.inference_service import InferenceService
+
+logger = structlog.get_logger()
+
+# Sehir artifact'lari train_model_v1 ciktisi (PredictionLog.model_version: "<sehir>-v1")
+CITY_MODEL_VERSION = "v1"
+
+_CITY_KEY_RE = re.compile(r"^[a-z][a-z_]*$")
+
+# Desteklenen sehir listesi (422 mesaji) bu sure boyunca diskten yeniden okunmaz
+_AVAILABLE_CITIES_TTL_SECONDS = 60.0
+
+
+def city_key(city: str | None) -> str:
+    """
+    Istekteki sehir adi → model anahtari (bos → varsayilan sehir).
+
+    Raises:
+        ValidationError: Dizin adi olamayacak deger verilirse.
+    """
+    if city is None or not city.strip():
+        return settings.DEFAULT_MODEL_CITY
+    key = normalize_turkish(city.strip()).replace(" ", "_")
+    if not _CITY_KEY_RE.match(key):
+        raise ValidationError(detail=f"Gecersiz sehir: {city!r}")
+    return key
+
+
+def has_artifact(model_dir: Path) -> bool:
+    """Dizinde yuklenebilir model var mi (serving manifest veya joblib)."""
+    return (model_dir / SERVING_DIR_NAME / MANIFEST_FILE).exists() or (
+        model_dir / "lgbm_model.joblib"
+    ).exists()
+
+
+def artifact_bytes(service: InferenceService) -> int:
+    """Servisin yukledigi artifact dosyalarinin toplam boyutu."""
+    model_dir = service.model_dir
+    if model_dir is None:
+        return 0
+    if service._serving is not None:
+        files = (model_dir / SERVING_DIR_NAME).rglob("*")
+    else:
+        files = model_dir.glob("*.joblib")
+    return sum(path.stat().st_size for path in files if path.is_file())
+
+
+class ModelRouter:
+    """Sehir → InferenceService; sehir modelleri lazy yuklenir, bayt butceli LRU."""
+
+    def __init__(self, root: str | Path | None = None, budget_bytes: int | None = None) -> None:
+        self.root = Path(root if root is not None else settings.CITY_MODEL_ROOT)
+        self.budget_bytes = (
+            budget_bytes
+            if budget_bytes is not None
+            else settings.CITY_MODEL_MEMORY_BUDGET_MB * 1024 * 1024
+        )
+        # sehir → (servis, boyut); sondaki en son kullanilan
+        self._models: OrderedDict[str, tuple[InferenceService, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Yalnizca diskte artifact'i olan sehirler icin olusturulur (sinirli)
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._available: tuple[float, list[str]] | None = None
+
+    @property
+    def loaded_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes()
+
+    def _total_bytes(self) -> int:
+        return sum(size for _, size in self._models.values())
+
+    def loaded_cities(self) -> list[str]:
+        """Bellekteki sehir modelleri (eskiden yeniye)."""
+        with self._lock:
+            return list(self._models)
+
+    def available_cities(self) -> list[str]:
+        """
+        Varsayilan sehir + diskte artifact'i olan sehirler.
+
+        Dizin taramasi _AVAILABLE_CITIES_TTL_SECONDS boyunca cache'lenir;
+        bilinmeyen sehir istekleri her seferinde diski taramaz.
+        """
+        now = time.monotonic()
+        cached = self._available
+        if cached is not None and now - cached[0] < _AVAILABLE_CITIES_TTL_SECONDS:
+            return cached[1]
+
+        cities = {settings.DEFAULT_MODEL_CITY}
+        if self.root.is_dir():
+            cities.update(
+                path.name for path in self.root.iterdir()
+                if _CITY_KEY_RE.match(path.name) and has_artifact(path)
+            )
+        self._available = (now, sorted(cities))
+        return self._available[1]
+
+    def _cached(self, key: str) -> InferenceService | None:
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is None:
+                return None
+            self._models.move_to_end(key)
+            return entry[0]
+
+    def get_service(self, city: str | None) -> InferenceService:
+        """
+        Sehrin servisi; yuklu degilse diskten yukler (senkron, bloklayici).
+
+        Raises:
+            ValidationError: Sehir icin model yoksa.
+        """
+        key = city_key(city)
+        if key == settings.DEFAULT_MODEL_CITY:
+            return InferenceService.get_instance()
+
+        service = self._cached(key)
+        if service is not None:
+            return service
+
+        # Kilit olusturmadan once: istek girdisi kalici kilit birakmasin
+        if not has_artifact(self.root / key):
+            self._raise_unsupported(key, city)
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            # Ayni sehri bekleyen diger istek yuklemis olabilir
+            service = self._cached(key)
+            if service is not None:
+                return service
+            service = self._load(key, city)
+            size = artifact_bytes(service)
+            evicted = self._store(key, service, size)
+
+        logger.info(
+            "city_model_loaded",
+            city=key,
+            model_version=service._model_version,
+            size_mb=round(size / 1024 / 1024, 1),
+            loaded_cities=self.loaded_cities(),
+            evicted=evicted,
+        )
+        return service
+
+    async def get_service_async(self, city: str | None) -> InferenceService:
+        """get_service; yukleme gerekiyorsa event loop disinda (thread) yapilir."""
+        key = city_key(city)
+        if key == settings.DEFAULT_MODEL_CITY:
+            return InferenceService.get_instance()
+        service = self._cached(key)
+        if service is not None:
+            return service
+        return await asyncio.to_thread(self.get_service, key)
+
+    def _raise_unsupported(self, key: str, city: str | None) -> NoReturn:
+        supported = ", ".join(self.available_cities())
+        raise ValidationError(
+            detail=f"{city or key} icin degerleme modeli yok. Desteklenen sehirler: {supported}",
+        )
+
+    def _load(self, key: str, city: str | None) -> InferenceService:
+        model_dir = self.root / key
+        if not has_artifact(model_dir):
+            # Kontrol ile yukleme arasinda artifact silinmis olabilir
+            self._raise_unsupported(key, city)
+        service = InferenceService.from_artifact(model_dir, f"{key}-{CITY_MODEL_VERSION}")
+        service.city = key
+        return service
+
+    def _store(self, key: str, service: InferenceService, size: int) -> list[str]:
+        """LRU'ya ekler; butce asilirsa en eskileri dusurur (yeni eklenen kalir)."""
+        evicted: list[str] = []
+        with self._lock:
+            self._models[key] = (service, size)
+            self._models.move_to_end(key)
+            while self._total_bytes() > self.budget_bytes and len(self._models) > 1:
+                old_key, _ = self._models.popitem(last=False)
+                evicted.append(old_key)
+        return evicted
+
+
+_router: ModelRouter | None = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """Process basina tek router (ilk cagrida olusturulur)."""
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = ModelRouter()
+    return _router
@@ -0,0 +1,252 @@
+"""
+Emlak Teknoloji Platformu - Model Registry Watcher (Hot Swap + Shadow)
+
+InferenceService process omru boyunca tek ornek; yeni model yayinlamak
+API'yi yeniden baslatmayi gerektiriyordu. Bu modul model_registry
+tablosunu izler ve modeli calisan worker'da degistirir.
+
+Akis (her uvicorn worker'inda ayri, MODEL_REGISTRY_POLL_SECONDS aralikla):
+    1. model_registry'de MODEL_NAME icin en guncel status='active' ve
+       status='shadow' kayitlari okunur (id + updated_at = kayit anahtari).
+    2. Aktif kayit degistiyse:
+         - artifact_url'deki model arka plan thread'inde yuklenir
+           (InferenceService.from_artifact — fallback yok),
+         - ornek bir batch ile isitilir (mmap sayfalari, ilk cagri
+           maliyetleri) ve tahminler dogrulanir (sonlu, pozitif),
+         - InferenceService.swap_instance() ile atomik olarak devreye alinir.
+       Devam eden istekler eski modelle tamamlanir. Sonuc cache anahtari
+       model parmak izi icerdiginden eski cache kayitlari okunmaz.
+    3. Shadow kaydi varsa ayni sekilde yuklenir ve InferenceService.set_shadow()
+       ile ayarlanir; istekler MODEL_SHADOW_SAMPLE_RATE oraninda aday modelle
+       de skorlanir, fark loglanir (inference_shadow_diff).
+
+Yukleme basarisiz olursa mevcut model calismaya devam eder; ayni kayit
+tekrar denenmez (kayit guncellenirse — updated_at — yeniden denenir).
+
+artifact_url: mutlak yol ya da src/ paketine gore goreli yol
+(register_model_v1: "ml/models/v1/"). Uzak URL'ler (s3:// vb.) desteklenmez.
+
+Kullanim (FastAPI lifespan):
+    watcher = ModelRegistryWatcher()
+    watcher.start()
+    ...
+    await watcher.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+from pathlib import Path
+from typing import Any
+
+import structlog
+from sqlalchemy import select
+
+from src.config import settings
+from src.database import async_session_factory
+from src.models.model_registry import ModelRegistry
+from src.modules.valuations.inference_service import MODEL_NAME, InferenceService
+
+logger = structlog.get_logger()
+
+SRC_DIR = Path(__file__).resolve().parents[2]
+
+STATUS_ACTIVE = "active"
+STATUS_SHADOW = "shadow"
+
+# Isitma + dogrulama icin ornek girdiler (farkli ilce/tip/boyut)
+WARMUP_INPUTS: list[dict[str, Any]] = [
+    {
+        "district": "Kadikoy", "neighborhood": "Moda", "property_type": "Daire",
+        "net_sqm": 120, "gross_sqm": 140, "room_count": 3, "living_room_count": 1,
+        "floor": 3, "total_floors": 8, "building_age": 10, "heating_type": "Dogalgaz Kombi",
+    },
+    {
+        "district": "Besiktas", "neighborhood": "Levent", "property_type": "Daire",
+        "net_sqm": 75, "gross_sqm": 90, "room_count": 2, "living_room_count": 1,
+        "floor": 1, "total_floors": 5, "building_age": 25, "heating_type": "Merkezi",
+    },
+    {
+        "district": "Sariyer", "neighborhood": "Zekeriyakoy", "property_type": "Villa",
+        "net_sqm": 260, "gross_sqm": 320, "room_count": 5, "living_room_count": 2,
+        "floor": 0, "total_floors": 3, "building_age": 5, "heating_type": "Yerden Isitma",
+    },
+]
+
+
+def resolve_artifact_dir(artifact_url: str) -> Path:
+    """
+    Registry artifact_url → yerel dizin.
+
+    Raises:
+        ValueError: Uzak URL (scheme iceren) verilirse.
+    """
+    if "://" in artifact_url:
+        msg = f"Uzak artifact desteklenmiyor: {artifact_url}"
+        raise ValueError(msg)
+    path = Path(artifact_url)
+    if not path.is_absolute():
+        path = SRC_DIR / path
+    return path.resolve()
+
+
+def load_candidate(model_dir: Path, version: str) -> InferenceService:
+    """
+    Artifact'i yukler, ornek batch ile isitir ve dogrular.
+
+    Senkron — event loop disinda (thread) cagrilmalidir.
+
+    Raises:
+        RuntimeError: Isitma tahminleri gecersizse (NaN, sonsuz, <= 0).
+    """
+    candidate = InferenceService.from_artifact(model_dir, version)
+    predictions = candidate.predict_batch(WARMUP_INPUTS)
+
+    prices = [p["estimated_price"] for p in predictions]
+    if len(prices) != len(WARMUP_INPUTS) or not all(
+        math.isfinite(price) and price > 0 for price in prices
+    ):
+        msg = f"Aday model gecersiz isitma tahmini uretti: {prices}"
+        raise RuntimeError(msg)
+    return candidate
+
+
+def _registry_key(entry: ModelRegistry) -> tuple[str, str]:
+    return str(entry.id), entry.updated_at.isoformat()
+
+
+class ModelRegistryWatcher:
+    """model_registry'yi periyodik okuyup aktif/shadow modeli gunceller."""
+
+    def __init__(self, poll_seconds: int | None = None) -> None:
+        self.poll_seconds = poll_seconds or settings.MODEL_REGISTRY_POLL_SECONDS
+        self._active_key: tuple[str, str] | None = None
+        self._shadow_key: tuple[str, str] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    # ------------------------------------------------------------------
+    # Yasam dongusu
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info("model_watcher_started", poll_seconds=self.poll_seconds)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll_once()
+            except Exception:
+                logger.warning("model_watcher_poll_failed", exc_info=True)
+            await asyncio.sleep(self.poll_seconds)
+
+    # ------------------------------------------------------------------
+    # Tek tur
+    # ------------------------------------------------------------------
+
+    async def poll_once(self) -> None:
+        """Registry'yi okur; aktif/shadow degistiyse yukler ve devreye alir."""
+        active, shadow = await self._fetch_entries()
+
+        if active is not None and _registry_key(active) != self._active_key:
+            self._active_key = _registry_key(active)
+            await self._promote(active)
+
+        shadow_key = _registry_key(shadow) if shadow is not None else None
+        if shadow_key != self._shadow_key:
+            self._shadow_key = shadow_key
+            await self._set_shadow(shadow)
+
+    async def _fetch_entries(self) -> tuple[ModelRegistry | None, ModelRegistry | None]:
+        async with async_session_factory() as db:
+            rows = (
+                await db.execute(
+                    select(ModelRegistry)
+                    .where(
+                        ModelRegistry.model_name == MODEL_NAME,
+                        ModelRegistry.status.in_((STATUS_ACTIVE, STATUS_SHADOW)),
+                    )
+                    .order_by(ModelRegistry.updated_at.desc())
+                )
+            ).scalars().all()
+
+        active = next((r for r in rows if r.status == STATUS_ACTIVE), None)
+        shadow = next((r for r in rows if r.status == STATUS_SHADOW), None)
+        return active, shadow
+
+    async def _promote(self, entry: ModelRegistry) -> None:
+        try:
+            model_dir = resolve_artifact_dir(entry.artifact_url)
+        except ValueError as exc:
+            logger.error("model_swap_skipped", version=entry.version, error=str(exc))
+            return
+
+        current = InferenceService._instance
+        if (
+            current is not None
+            and current.model_dir == model_dir
+            and current._model_version == entry.version
+        ):
+            # Baslangicta diskten yuklenen model zaten bu kayit
+            return
+
+        try:
+            candidate = await asyncio.to_thread(load_candidate, model_dir, entry.version)
+        except Exception as exc:
+            logger.error(
+                "model_swap_failed",
+                version=entry.version,
+                model_dir=str(model_dir),
+                error=str(exc),
+                exc_info=True,
+            )
+            return
+
+        previous = InferenceService.swap_instance(candidate)
+        logger.info(
+            "model_swapped",
+            registry_id=str(entry.id),
+            previous_version=previous._model_version if previous else None,
+            version=entry.version,
+            fingerprint=candidate._model_fingerprint,
+            model_dir=str(model_dir),
+        )
+
+    async def _set_shadow(self, entry: ModelRegistry | None) -> None:
+        if entry is None:
+            if InferenceService._shadow is not None:
+                InferenceService.set_shadow(None)
+                logger.info("model_shadow_cleared")
+            return
+
+        try:
+            model_dir = resolve_artifact_dir(entry.artifact_url)
+            candidate = await asyncio.to_thread(load_candidate, model_dir, entry.version)
+        except Exception as exc:
+            # Onceki aday artik registry'de shadow degil — birakilir
+            InferenceService.set_shadow(None)
+            logger.error(
+                "model_shadow_load_failed",
+                version=entry.version,
+                error=str(exc),
+                exc_info=True,
+            )
+            return
+
+        InferenceService.set_shadow(candidate)
+        logger.info(
+            "model_shadow_loaded",
+            registry_id=str(entry.id),
+            version=entry.version,
+            sample_rate=settings.MODEL_SHADOW_SAMPLE_RATE,
+        )
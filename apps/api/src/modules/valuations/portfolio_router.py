@@ -0,0 +1,149 @@
+"""
+Emlak Teknoloji Platformu - Portfoy Degerleme Router
+
+Ofisin tum aktif ilanlarini toplu degerleme (Celery) endpoint'leri.
+Kota uygulanmaz, PredictionLog yazilmaz — sonuclar valuation_snapshots.
+
+Prefix: /api/v1/valuations/portfolio-runs
+Guvenlik: JWT + office_admin / office_owner rolu.
+
+Endpoint'ler:
+    POST /api/v1/valuations/portfolio-runs            -> Calistirma baslat (202)
+    GET  /api/v1/valuations/portfolio-runs/{run_id}   -> Durum + ilerleme
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Annotated
+
+import structlog
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from src.core.exceptions import NotFoundError
+from src.dependencies import DBSession
+from src.models.user import User
+from src.models.valuation_snapshot import ValuationSnapshotRun
+from src.modules.auth.dependencies import require_role
+from src.modules.valuations.portfolio_valuation import (
+    active_run,
+    expire_stale_runs,
+    mark_run_failed,
+)
+from src.modules.valuations.schemas import PortfolioValuationRunResponse
+
+logger = structlog.get_logger()
+
+router = APIRouter(
+    prefix="/api/v1/valuations/portfolio-runs",
+    tags=["valuations"],
+)
+
+OfficeAdmin = Annotated[User, Depends(require_role("office_admin", "office_owner"))]
+
+
+def _to_response(run: ValuationSnapshotRun) -> PortfolioValuationRunResponse:
+    return PortfolioValuationRunResponse(
+        id=str(run.id),
+        status=run.status,
+        model_version=run.model_version,
+        total_count=run.total_count,
+        processed_count=run.processed_count,
+        skipped_count=run.skipped_count,
+        error=run.error,
+        created_at=run.created_at,
+        started_at=run.started_at,
+        finished_at=run.finished_at,
+    )
+
+
+@router.post(
+    "",
+    response_model=PortfolioValuationRunResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Portfoy degerleme baslat",
+    description=(
+        "Ofisin tum aktif ilanlarini arka planda toplu olarak degerler. "
+        "Ofiste devam eden bir calistirma varsa yenisi acilmaz, o dondurulur. "
+        "Uzun suredir ilerleme yazmayan calistirma takilmis sayilir ve kapatilir."
+    ),
+)
+async def start_portfolio_valuation(
+    db: DBSession,
+    user: OfficeAdmin,
+) -> PortfolioValuationRunResponse:
+    """
+    Bekleyen/calisan calistirma yoksa yeni kayit acar ve task'i kuyruga atar.
+
+    Eszamanli iki istek: unique partial index ikincisinin INSERT'ini reddeder,
+    o istek kazanan calistirmayi dondurur. Kuyruga ekleme basarisizsa kayit
+    'failed' yapilir (aktif kalip ofisi kilitlemesin).
+    """
+    from src.modules.valuations.tasks import run_portfolio_valuation
+
+    await expire_stale_runs(db, user.office_id)
+    active = await active_run(db, user.office_id)
+    if active is not None:
+        return _to_response(active)
+
+    run = ValuationSnapshotRun(office_id=user.office_id, requested_by=user.id)
+    try:
+        # Savepoint: catismada disaridaki transaction (RLS baglami) korunur
+        async with db.begin_nested():
+            db.add(run)
+            await db.flush()
+    except IntegrityError:
+        active = await active_run(db, user.office_id)
+        if active is None:
+            raise
+        return _to_response(active)
+    await db.refresh(run)
+    response = _to_response(run)
+    # Task kaydi gorebilsin diye kuyruga atmadan once commit
+    await db.commit()
+
+    try:
+        run_portfolio_valuation.delay(str(run.id), str(user.office_id), str(user.id))
+    except Exception as exc:
+        await mark_run_failed(db, run.id, user.office_id, f"Kuyruga eklenemedi: {exc}")
+        logger.exception("portfolio_valuation_enqueue_failed", run_id=str(run.id))
+        raise
+    logger.info(
+        "portfolio_valuation_queued",
+        run_id=str(run.id),
+        office_id=str(user.office_id),
+        user_id=str(user.id),
+    )
+    return response
+
+
+@router.get(
+    "/{run_id}",
+    response_model=PortfolioValuationRunResponse,
+    summary="Portfoy degerleme durumu",
+    responses={404: {"description": "Calistirma bulunamadi"}},
+)
+async def get_portfolio_valuation(
+    run_id: uuid.UUID,
+    db: DBSession,
+    user: OfficeAdmin,
+) -> PortfolioValuationRunResponse:
+    """
+    Calistirma durumu ve ilerleme sayaclari (her parca commit'inde guncellenir).
+
+    Raises:
+        NotFoundError: Kayit yoksa veya baska ofise aitse 404.
+    """
+    run = (
+        await db.execute(
+            select(ValuationSnapshotRun).where(
+                ValuationSnapshotRun.id == run_id,
+                ValuationSnapshotRun.office_id == user.office_id,
+            ),
+        )
+    ).scalar_one_or_none()
+    if run is None:
+        raise NotFoundError(resource="Portfoy degerleme", resource_id=str(run_id))
+    return _to_response(run)
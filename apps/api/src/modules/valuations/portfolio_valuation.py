@@ -0,0 +1,467 @@
+"""
+Emlak Teknoloji Platformu - Toplu Portfoy Degerleme
+
+Piyasa hareketlerinden sonra ofisin tum aktif ilanlarini tek iste yeniden
+degerler. POST /valuations kota/PredictionLog yolunu KULLANMAZ; sonuclar
+valuation_snapshots tablosuna yazilir.
+
+Akis (parca basina, settings.PORTFOLIO_VALUATION_CHUNK_SIZE ilan):
+    1. Ilanlar id keyset'i ile okunur (yalnizca model kolonlari).
+    2. Parca tek predict_batch cagrisi olarak inference havuzunda calisir;
+       bu sirada event loop bir sonraki parcayi DB'den okur.
+    3. Tahminler tek INSERT (executemany → cok satirli VALUES) ile yazilir;
+       ayni transaction'da calistirma sayaclari ve keyset imleci
+       guncellenir, commit edilir (uzun transaction yok).
+    4. on_progress(stats) cagrilir (Celery task'i ilerleme durumunu yayar).
+
+Yeniden deneme: imlec (cursor_property_id) parcanin satirlariyla ayni
+transaction'da ilerler; task tekrar calisirsa kaldigi ilandan devam eder,
+ayni ilan iki kez yazilmaz.
+
+Eksik zorunlu ozellik (net_area, gecerli rooms) → ilan atlanir
+(skipped_count), calistirma durmaz.
+
+Sehir modelleri: ilanin city alani model_router ile sehir modeline
+yonlendirilir (parca icinde sehir basina tek predict_batch). Sehir icin
+model yoksa ilan atlanir.
+
+Tek aktif calistirma: ofis basina en fazla bir pending/running kayit
+(uq_valuation_snapshot_runs_office_active). PORTFOLIO_VALUATION_STALE_MINUTES
+boyunca ilerleme yazmayan aktif kayit takilmis sayilir (kuyruga
+eklenemedi, worker oldu) ve yeni istek geldiginde 'failed' yapilir.
+Takilmis sayilan calistirmanin worker'i hala calisiyorsa bir sonraki
+parcada durumun degistigini gorur ve durur; iki calistirma ayni anda
+snapshot yazmaz.
+
+RLS: Worker oturumu tenant baglamini kendisi kurar (set_config, her
+transaction basinda — SET LOCAL commit ile sifirlanir).
+
+Kullanim:
+    stats = await run_portfolio_valuation(db, run_id, office_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from sqlalchemy import Row, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from src.config import settings
+from src.core.exceptions import NotFoundError, ValidationError
+from src.models.property import Property, parse_rooms
+from src.models.valuation_snapshot import (
+    ACTIVE_RUN_STATUSES,
+    ValuationSnapshot,
+    ValuationSnapshotRun,
+)
+from src.modules.valuations.inference_executor import get_inference_executor
+from src.modules.valuations.inference_service import InferenceService
+from src.modules.valuations.model_router import get_model_router
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Callable, Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.modules.valuations.inference_executor import InferenceExecutor
+    from src.modules.valuations.model_router import ModelRouter
+
+logger = structlog.get_logger(__name__)
+
+# Model girdisi icin okunan kolonlar (ORM nesnesi olusturulmaz)
+_PROPERTY_COLUMNS = (
+    Property.id,
+    Property.price,
+    Property.rooms,
+    Property.net_area,
+    Property.gross_area,
+    Property.floor_number,
+    Property.total_floors,
+    Property.building_age,
+    Property.heating_type,
+    Property.city,
+    Property.district,
+    Property.neighborhood,
+    Property.property_type,
+)
+
+
+@dataclass(slots=True)
+class PortfolioValuationStats:
+    """Toplu degerleme calistirma metrikleri (yeniden denemede kaldigi yerden)."""
+
+    run_id: str
+    office_id: str
+    total_count: int = 0
+    processed_count: int = 0
+    skipped_count: int = 0
+    resumed_count: int = 0  # onceki denemelerde islenmis (throughput'a dahil degil)
+    elapsed_ms: int = 0
+
+    @property
+    def properties_per_second(self) -> float:
+        if self.elapsed_ms <= 0:
+            return 0.0
+        scanned = self.processed_count + self.skipped_count - self.resumed_count
+        return round(scanned * 1000 / self.elapsed_ms, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "properties_per_second": self.properties_per_second}
+
+
+def property_to_model_input(row: Any) -> dict | None:
+    """
+    Ilan satiri → ValuationRequest.to_model_input() ile ayni alanlar.
+
+    net_area veya gecerli rooms yoksa None (ilan atlanir). Diger eksik
+    alanlar model egitimindeki fillna(0) davranisina uygun doldurulur.
+    """
+    rooms = parse_rooms(row.rooms)
+    if rooms is None or not row.net_area:
+        return None
+    room_count, living_rooms = rooms
+
+    net_sqm = float(row.net_area)
+    floor = row.floor_number or 0
+    return {
+        "district": row.district,
+        "neighborhood": row.neighborhood or "",
+        "property_type": row.property_type,
+        "net_sqm": net_sqm,
+        "gross_sqm": float(row.gross_area) if row.gross_area else net_sqm,
+        "room_count": room_count,
+        # Tek sayi icin salon 1 varsayilir (Telegram bot _parse_room_format ile ayni)
+        "living_room_count": 1 if living_rooms is None else living_rooms,
+        "floor": floor,
+        "total_floors": row.total_floors or max(floor, 1),
+        "building_age": row.building_age or 0,
+        "heating_type": row.heating_type or "",
+    }
+
+
+def snapshot_records(
+    run_id: uuid.UUID,
+    office_id: uuid.UUID,
+    rows: Sequence[Any],
+    predictions: Sequence[dict],
+) -> list[dict]:
+    """Ilan satirlari + predict_batch sonuclari (ayni sira) → INSERT parametreleri."""
+    return [
+        {
+            "run_id": run_id,
+            "property_id": row.id,
+            "office_id": office_id,
+            "estimated_price": prediction["estimated_price"],
+            "confidence_low": prediction["confidence_low"],
+            "confidence_high": prediction["confidence_high"],
+            "confidence": prediction["confidence"],
+            "listing_price": row.price,
+        }
+        for row, prediction in zip(rows, predictions, strict=True)
+    ]
+
+
+async def _city_service(
+    router: ModelRouter,
+    services: dict[str | None, InferenceService | None],
+    city: str | None,
+) -> InferenceService | None:
+    """Ilanin sehir modeli (calistirma boyunca onbellekli); model yoksa None."""
+    if city not in services:
+        try:
+            services[city] = await router.get_service_async(city)
+        except ValidationError as exc:
+            logger.warning("portfolio_valuation_city_model_missing", city=city, detail=exc.detail)
+            services[city] = None
+    return services[city]
+
+
+async def _predict_grouped(
+    executor: InferenceExecutor,
+    services: Sequence[InferenceService],
+    inputs: Sequence[dict],
+) -> list[dict]:
+    """Sehir modeli basina tek predict_batch (eszamanli); sonuclar girdi sirasiyla."""
+    positions: dict[int, list[int]] = {}
+    by_id: dict[int, InferenceService] = {}
+    for i, service in enumerate(services):
+        positions.setdefault(id(service), []).append(i)
+        by_id[id(service)] = service
+
+    batches = await asyncio.gather(*(
+        executor.run(by_id[key], [inputs[i] for i in idx]) for key, idx in positions.items()
+    ))
+    results: list[dict] = [{}] * len(inputs)
+    for idx, predictions in zip(positions.values(), batches, strict=True):
+        for i, prediction in zip(idx, predictions, strict=True):
+            results[i] = prediction
+    return results
+
+
+async def _apply_tenant(db: AsyncSession, office_id: uuid.UUID) -> None:
+    """Transaction basina RLS baglami (set_config is_local=true ≙ SET LOCAL)."""
+    await db.execute(select(func.set_config("app.current_office_id", str(office_id), True)))
+
+
+async def _fetch_chunk(
+    db: AsyncSession,
+    office_id: uuid.UUID,
+    *,
+    after: uuid.UUID | None,
+    chunk_size: int,
+) -> Sequence[Row]:
+    """
+    Aktif ilanlarin bir sonraki parcasi (id keyset'i).
+
+    Server-side cursor yerine keyset: parcalar arasinda commit yapilabilir.
+    """
+    stmt = (
+        select(*_PROPERTY_COLUMNS)
+        .where(
+            Property.office_id == office_id,
+            Property.status == "active",
+        )
+        .order_by(Property.id)
+        .limit(chunk_size)
+    )
+    if after is not None:
+        stmt = stmt.where(Property.id > after)
+    return (await db.execute(stmt)).all()
+
+
+async def _start_run(
+    db: AsyncSession,
+    run: ValuationSnapshotRun,
+    model_version: str,
+) -> None:
+    """Ilk calistirmada sayaclari kurar; yeniden denemede sadece durumu gunceller."""
+    if run.started_at is None:
+        run.total_count = (
+            await db.execute(
+                select(func.count()).select_from(Property).where(
+                    Property.office_id == run.office_id,
+                    Property.status == "active",
+                ),
+            )
+        ).scalar_one()
+        run.started_at = func.now()
+    run.status = "running"
+    run.model_version = model_version
+    run.error = None
+
+
+async def active_run(db: AsyncSession, office_id: uuid.UUID) -> ValuationSnapshotRun | None:
+    """Ofisin bekleyen / calisan calistirmasi (unique index → en fazla bir)."""
+    return (
+        await db.execute(
+            select(ValuationSnapshotRun).where(
+                ValuationSnapshotRun.office_id == office_id,
+                ValuationSnapshotRun.status.in_(ACTIVE_RUN_STATUSES),
+            ),
+        )
+    ).scalar_one_or_none()
+
+
+async def expire_stale_runs(db: AsyncSession, office_id: uuid.UUID) -> int:
+    """
+    PORTFOLIO_VALUATION_STALE_MINUTES boyunca guncellenmeyen aktif kaydi 'failed' yapar.
+
+    updated_at her parca commit'inde ilerler; durmus kayit ya hic kuyruga
+    girmemis ya da worker'i olmustur. Commit cagirana aittir.
+
+    Returns:
+        Takilmis sayilip kapatilan kayit sayisi.
+    """
+    stale_minutes = settings.PORTFOLIO_VALUATION_STALE_MINUTES
+    result = await db.execute(
+        update(ValuationSnapshotRun)
+        .where(
+            ValuationSnapshotRun.office_id == office_id,
+            ValuationSnapshotRun.status.in_(ACTIVE_RUN_STATUSES),
+            ValuationSnapshotRun.updated_at < func.now() - timedelta(minutes=stale_minutes),
+        )
+        .values(
+            status="failed",
+            error=f"Takildi: {stale_minutes} dakikadir ilerleme yok",
+            finished_at=func.now(),
+        ),
+    )
+    expired = result.rowcount or 0
+    if expired:
+        logger.warning(
+            "portfolio_valuation_stale_expired",
+            office_id=str(office_id),
+            count=expired,
+            stale_minutes=stale_minutes,
+        )
+    return expired
+
+
+async def mark_run_failed(
+    db: AsyncSession,
+    run_id: uuid.UUID,
+    office_id: uuid.UUID,
+    error: str,
+) -> None:
+    """Calistirmayi 'failed' yapar (kendi transaction'i; hata yutulur ve log'lanir)."""
+    try:
+        await db.rollback()
+        await _apply_tenant(db, office_id)
+        await db.execute(
+            update(ValuationSnapshotRun)
+            .where(ValuationSnapshotRun.id == run_id)
+            .values(status="failed", error=error[:1000]),
+        )
+        await db.commit()
+    except Exception:
+        logger.warning("portfolio_valuation_mark_failed_error", run_id=str(run_id), exc_info=True)
+
+
+async def run_portfolio_valuation(
+    db: AsyncSession,
+    run_id: uuid.UUID,
+    office_id: uuid.UUID,
+    *,
+    chunk_size: int | None = None,
+    on_progress: Callable[[PortfolioValuationStats], None] | None = None,
+) -> PortfolioValuationStats:
+    """
+    Ofisin aktif ilanlarini parca parca degerler, snapshot tablosuna yazar.
+
+    Args:
+        db: Async database session. Parcalar arasinda commit edilir.
+        run_id: valuation_snapshot_runs kaydi (API tarafindan 'pending' acilir).
+        office_id: Tenant (ofis) UUID.
+        chunk_size: Tek predict_batch / INSERT satir sayisi (varsayilan: settings).
+        on_progress: Her parca commit edildikten sonra cagrilir.
+
+    Returns:
+        PortfolioValuationStats — islenen/atlanan ilan, throughput.
+
+    Raises:
+        NotFoundError: Calistirma kaydi yoksa.
+    """
+    start_time = time.monotonic()
+    chunk_size = chunk_size or settings.PORTFOLIO_VALUATION_CHUNK_SIZE
+    service = InferenceService.get_instance()
+    executor = get_inference_executor()
+    router = get_model_router()
+    city_services: dict[str | None, InferenceService | None] = {}
+
+    await _apply_tenant(db, office_id)
+    run = await db.get(ValuationSnapshotRun, run_id)
+    if run is None:
+        raise NotFoundError(resource="Portfoy degerleme", resource_id=str(run_id))
+
+    stats = PortfolioValuationStats(run_id=str(run_id), office_id=str(office_id))
+    if run.status == "completed":
+        logger.info("portfolio_valuation_already_completed", run_id=str(run_id))
+        stats.total_count = run.total_count
+        stats.processed_count = run.processed_count
+        stats.skipped_count = run.skipped_count
+        return stats
+
+    try:
+        await _start_run(db, run, service._model_version)
+        try:
+            await db.commit()
+        except IntegrityError:
+            # Takilmis sayilan eski calistirma: ofiste yenisi aktif
+            await db.rollback()
+            logger.warning("portfolio_valuation_superseded", run_id=str(run_id))
+            return stats
+        stats.total_count = run.total_count
+        stats.processed_count = run.processed_count
+        stats.skipped_count = run.skipped_count
+        stats.resumed_count = run.processed_count + run.skipped_count
+
+        await _apply_tenant(db, office_id)
+        rows = await _fetch_chunk(db, office_id, after=run.cursor_property_id, chunk_size=chunk_size)
+        while rows:
+            valued: list[Row] = []
+            inputs: list[dict] = []
+            services: list[InferenceService] = []
+            for row in rows:
+                model_input = property_to_model_input(row)
+                if model_input is None:
+                    continue
+                city_service = await _city_service(router, city_services, row.city)
+                if city_service is not None:
+                    valued.append(row)
+                    inputs.append(model_input)
+                    services.append(city_service)
+
+            # Tahmin havuzda calisirken sonraki parca okunur
+            predict = (
+                asyncio.ensure_future(_predict_grouped(executor, services, inputs))
+                if inputs else None
+            )
+            try:
+                next_rows: Sequence[Row] = []
+                if len(rows) == chunk_size:
+                    next_rows = await _fetch_chunk(
+                        db, office_id, after=rows[-1].id, chunk_size=chunk_size,
+                    )
+                predictions = await predict if predict is not None else []
+            except BaseException:
+                if predict is not None:
+                    predict.cancel()
+                raise
+
+            if valued:
+                await db.execute(
+                    insert(ValuationSnapshot),
+                    snapshot_records(run_id, office_id, valued, predictions),
+                )
+            stats.processed_count += len(valued)
+            stats.skipped_count += len(rows) - len(valued)
+            progressed = await db.execute(
+                update(ValuationSnapshotRun)
+                .where(
+                    ValuationSnapshotRun.id == run_id,
+                    ValuationSnapshotRun.status == "running",
+                )
+                .values(
+                    processed_count=stats.processed_count,
+                    skipped_count=stats.skipped_count,
+                    cursor_property_id=rows[-1].id,
+                ),
+            )
+            if progressed.rowcount == 0:
+                # Takilmis sayilip kapatildi — parcanin snapshot'lari da geri alinir
+                await db.rollback()
+                logger.warning("portfolio_valuation_superseded", run_id=str(run_id))
+                return stats
+            await db.commit()
+            await _apply_tenant(db, office_id)
+
+            stats.elapsed_ms = int((time.monotonic() - start_time) * 1000)
+            if on_progress is not None:
+                on_progress(stats)
+            rows = next_rows
+
+        completed = await db.execute(
+            update(ValuationSnapshotRun)
+            .where(ValuationSnapshotRun.id == run_id, ValuationSnapshotRun.status == "running")
+            .values(status="completed", finished_at=func.now()),
+        )
+        if completed.rowcount == 0:
+            # Son parcadan sonra takilmis sayilip kapatildi — failed durumu ezilmez
+            await db.rollback()
+            logger.warning("portfolio_valuation_superseded", run_id=str(run_id))
+            return stats
+        await db.commit()
+    except Exception as exc:
+        await mark_run_failed(db, run_id, office_id, str(exc))
+        raise
+
+    stats.elapsed_ms = int((time.monotonic() - start_time) * 1000)
+    logger.info("portfolio_valuation_completed", **stats.as_dict())
+    return stats
@@ -26,9 +26,8 @@ from src.models.prediction_log import PredictionLog
 from src.models.subscription import Subscription
 from src.modules.audit.audit_service import AuditService
 from src.modules.auth.dependencies import ActiveUser
-from src.modules.valuations.anomaly_service import check_price_anomaly
 from src.modules.valuations.comparable_service import ComparableService
-from src.modules.valuations.inference_service import InferenceService
+from src.modules.valuations.model_router import get_model_router
 from src.modules.valuations.schemas import (
     ComparableRequest,
     ComparableResponse,
@@ -39,6 +38,7 @@ from src.modules.valuations.schemas import (
     ValuationRequest,
     ValuationResponse,
 )
+from src.modules.valuations.valuation_pipeline import run_valuation_pipeline
 
 logger = structlog.get_logger()
 
@@ -196,68 +196,39 @@ async def create_valuation(
 
     Akis:
         1. Kota kontrolu (plan bazli)
-        2. InferenceService singleton'dan model al
-        3. Input verisini model'e gonder
-        4. Tahmin sonucunu PredictionLog'a kaydet (ayni transaction)
-        5. Emsal mulkleri bul (adaptive radius)
-        6. Kota kullanimi artir
-        7. ValuationResponse olarak dondur (comparables + kota bilgisi)
+        2. ML tahmin + PredictionLog kaydi (ayni transaction)
+        3. Paralel: emsal mulkler (adaptive radius) + ilce m2 istatistikleri
+           (valuation_pipeline — ayri oturumlar); fark yuzdesi ve anomali
+           tahmin fiyati belli olunca hesaplanir
+        4. Kota kullanimi artir
+        5. ValuationResponse olarak dondur (comparables + kota bilgisi)
     """
-    # 1. Kota kontrolu
-    plan_type, quota_limit, used = await _check_and_get_quota(
-        db=db, office_id=str(user.office_id)
-    )
-
-    # 2. ML tahmin
-    inference = InferenceService.get_instance()
-
-    result = await inference.predict(
-        input_data=body.to_model_input(),
-        session=db,
-        office_id=str(user.office_id),
-    )
-
-    # 3. Emsal mulkleri bul (adaptive radius ile)
-    model_input = body.to_model_input()
-    comparable_svc = ComparableService(db)
-    comparables_raw = await comparable_svc.find_comparables_enriched(
-        district=body.district,
-        property_type=body.property_type,
-        net_sqm=body.net_sqm,
-        room_count=body.room_count,
-        building_age=body.building_age,
-        estimated_price=result["estimated_price"],
-        lat=model_input.get("lat"),
-        lon=model_input.get("lon"),
-        limit=5,
-        min_comparables=3,
-    )
-
-    comparables = [ComparableResult(**c) for c in comparables_raw]
-
-    # 4. Anomali tespiti (basarisiz olursa degerleme yine doner)
-    anomaly_warning: str | None = None
-    try:
-        anomaly_result = await check_price_anomaly(
-            predicted_price=float(result["estimated_price"]),
-            district=body.district,
-            net_sqm=body.net_sqm,
+    office_id = str(user.office_id)
+    quota: tuple[str, int, int] = ("", 0, 0)
+
+    async def _quota_then_predict() -> dict:
+        # 1-2. Kota kontrolu + ML tahmin (request oturumu, PredictionLog ayni transaction)
+        nonlocal quota
+        quota = await _check_and_get_quota(db=db, office_id=office_id)
+        service = await get_model_router().get_service_async(body.city)
+        return await service.predict(
+            input_data=body.to_model_input(),
             session=db,
+            office_id=office_id,
         )
-        if anomaly_result.is_anomaly:
-            anomaly_warning = anomaly_result.anomaly_reason
-    except Exception:
-        logger.warning(
-            "anomaly_check_failed",
-            prediction_id=result["prediction_id"],
-            district=body.district,
-            exc_info=True,
-        )
 
-    # 5. Kota kullanimi artir
-    await _increment_usage(db=db, office_id=str(user.office_id))
+    # 3. Emsal + ilce istatistikleri tahminle paralel (ayri oturumlar);
+    #    price_diff_percent ve anomali fiyat belli olunca hesaplanir
+    pipeline = await run_valuation_pipeline(request, db, body, _quota_then_predict())
+    plan_type, quota_limit, used = quota
+    result = pipeline.prediction
+    comparables = [ComparableResult(**c) for c in pipeline.comparables]
+    anomaly_warning = pipeline.anomaly_warning
+
+    # 4. Kota kullanimi artir
+    await _increment_usage(db=db, office_id=office_id)
 
-    # 6. Kota bilgisi hesapla (used artik artti, +1 ekliyoruz)
+    # 5. Kota bilgisi hesapla (used artik artti, +1 ekliyoruz)
     quota_remaining = -1 if quota_limit == -1 else max(0, quota_limit - (used + 1))
 
     logger.info(
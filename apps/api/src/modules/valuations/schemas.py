@@ -40,10 +40,15 @@ class ValuationRequest(BaseModel):
     heating_type: str = Field(
         ..., min_length=1, max_length=50, description="Isitma tipi"
     )
+    city: str | None = Field(
+        default=None,
+        max_length=50,
+        description="Il — sehre ozel model secer (bos → Istanbul modeli)",
+    )
 
     def to_model_input(self) -> dict:
-        """Pydantic modelini ML model input dict'ine donustur."""
-        return self.model_dump()
+        """Pydantic modelini ML model input dict'ine donustur (city model secimidir, feature degil)."""
+        return self.model_dump(exclude={"city"})
 
 
 class ValuationResponse(BaseModel):
@@ -209,3 +214,23 @@ class AreaPriceComparisonResponse(BaseModel):
     investment_score: float | None = Field(
         default=None, description="Yatirim potansiyeli skoru (0-100)"
     )
+
+
+# =====================================================================
+# Toplu Portfoy Degerleme Schemas
+# =====================================================================
+
+
+class PortfolioValuationRunResponse(BaseModel):
+    """Portfoy degerleme calistirmasi durumu ve ilerlemesi."""
+
+    id: str = Field(description="Calistirma ID")
+    status: str = Field(description="Durum: pending, running, completed, failed")
+    model_version: str | None = Field(default=None, description="Kullanilan model versiyonu")
+    total_count: int = Field(description="Baslangictaki aktif ilan sayisi")
+    processed_count: int = Field(description="Degerlenen ilan sayisi")
+    skipped_count: int = Field(description="Eksik ozellik nedeniyle atlanan ilan sayisi")
+    error: str | None = Field(default=None, description="Hata mesaji (failed)")
+    created_at: datetime = Field(description="Olusturulma zamani")
+    started_at: datetime | None = Field(default=None, description="Baslangic zamani")
+    finished_at: datetime | None = Field(default=None, description="Bitis zamani")
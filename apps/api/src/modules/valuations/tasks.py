@@ -0,0 +1,133 @@
+"""
+Emlak Teknoloji Platformu - Valuations Celery Tasks
+
+Tasks:
+    run_portfolio_valuation — Ofisin tum aktif ilanlarini toplu degerler
+                              (portfolio_valuation.py, snapshot tablosu)
+
+Mimari Kararlar:
+    - run_async() ile async is worker'in kalici loop'unda calisir
+      (src.core.worker_runtime — asyncpg havuzu task'lar arasinda korunur)
+    - Ilerleme: her parca sonrasi Celery task durumu PROGRESS (meta =
+      PortfolioValuationStats) + valuation_snapshot_runs sayaclari
+    - Baslatan kullaniciya WebSocket JOB_PROGRESS event'i (Redis backplane —
+      kullanici hangi uvicorn worker'ina bagliysa oraya ulasir)
+    - Idempotent: yeniden denemede calistirma keyset imlecinden devam eder
+
+Kuyrugu: default
+Retry: max 2, exponential backoff
+"""
+
+from __future__ import annotations
+
+import uuid as uuid_mod
+from typing import Any
+
+import structlog
+
+from src.celery_app import celery_app
+from src.core.worker_runtime import run_async
+from src.modules.realtime.event_emitter import emit_event_sync
+from src.modules.realtime.events import EventType
+from src.tasks.base import BaseTask
+
+logger = structlog.get_logger(__name__)
+
+_JOB_NAME = "portfolio_valuation"
+
+
+def _emit_progress(user_id: str | None, status: str, stats: dict[str, Any]) -> None:
+    """Baslatan kullaniciya ilerleme event'i (fire-and-forget)."""
+    if user_id is None:
+        return
+    emit_event_sync(
+        user_id,
+        EventType.JOB_PROGRESS,
+        {
+            "job": _JOB_NAME,
+            "job_id": stats["run_id"],
+            "status": status,
+            "total_count": stats["total_count"],
+            "processed_count": stats["processed_count"],
+            "skipped_count": stats["skipped_count"],
+        },
+    )
+
+
+async def _run_portfolio_valuation(
+    task: BaseTask,
+    run_id: uuid_mod.UUID,
+    office_id: uuid_mod.UUID,
+    requested_by: str | None,
+) -> dict[str, Any]:
+    """Toplu degerleme (async worker). Parca bazli commit portfolio_valuation icinde."""
+    from src.database import async_session_factory
+    from src.modules.valuations.portfolio_valuation import (
+        PortfolioValuationStats,
+        run_portfolio_valuation,
+    )
+
+    def _report(stats: PortfolioValuationStats) -> None:
+        meta = stats.as_dict()
+        task.update_state(state="PROGRESS", meta=meta)
+        _emit_progress(requested_by, "running", meta)
+
+    async with async_session_factory() as db:
+        stats = await run_portfolio_valuation(db, run_id, office_id, on_progress=_report)
+        return stats.as_dict()
+
+
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    queue="default",
+    name="src.modules.valuations.tasks.run_portfolio_valuation",
+    max_retries=2,
+)
+def run_portfolio_valuation(
+    self: BaseTask,
+    run_id: str,
+    office_id: str,
+    requested_by: str | None = None,
+) -> dict[str, Any]:
+    """
+    Portfoy degerleme Celery task'i.
+
+    POST /valuations/portfolio-runs tarafindan kuyruga atilir.
+
+    Args:
+        run_id: valuation_snapshot_runs kaydi (string — JSON serialization).
+        office_id: Tenant UUID (string — JSON serialization).
+        requested_by: Ilerleme event'lerinin gonderilecegi kullanici (opsiyonel).
+
+    Returns:
+        dict: PortfolioValuationStats alanlari + properties_per_second
+    """
+    self.log.info("portfolio_valuation_task_started", run_id=run_id, office_id=office_id)
+
+    try:
+        result = run_async(
+            _run_portfolio_valuation(
+                self, uuid_mod.UUID(run_id), uuid_mod.UUID(office_id), requested_by,
+            ),
+        )
+    except Exception:
+        # Ara hatalar autoretry ile yeniden denenir; yalnizca son deneme bildirilir
+        if self.request.retries >= self.max_retries:
+            _emit_progress(
+                requested_by,
+                "failed",
+                {"run_id": run_id, "total_count": 0, "processed_count": 0, "skipped_count": 0},
+            )
+        raise
+    _emit_progress(requested_by, "completed", result)
+
+    self.log.info(
+        "portfolio_valuation_task_completed",
+        run_id=run_id,
+        processed_count=result["processed_count"],
+        skipped_count=result["skipped_count"],
+        properties_per_second=result["properties_per_second"],
+        elapsed_ms=result["elapsed_ms"],
+    )
+    return result
@@ -0,0 +1,138 @@
+"""
+Emlak Teknoloji Platformu - Degerleme Sonuc Cache'i
+
+Danismanlar ayni degerlemeyi (ayni ilce, m2, oda, yas, kat) web
+uygulamasindan ve Telegram bot'tan tekrar tekrar calistirir. Model
+deterministiktir: ayni girdi + ayni model → ayni tahmin. Tahmin Redis'te
+saklanir, tekrarinda model calistirilmaz.
+
+Anahtar:
+    valuation:{model_version}:{model_fingerprint}:{input_hash}
+
+    input_hash — model girdisinin kanonik JSON'unun SHA-256'si:
+      - anahtar sirasi onemsiz (sort_keys)
+      - sayilar float'a cevrilir (120 ile 120.0 ayni feature degeri)
+      - None / NaN ayni (ikisi de eksik deger → 0)
+      - metinler OLDUGU GIBI (kategori kodlari buyuk/kucuk harf duyarli;
+        "kadikoy" ile "Kadikoy" farkli tahmin uretebilir)
+
+    model_fingerprint — yuklu model dosyalarinin icerik ozeti
+    (InferenceService). Model degisince (yeniden egitim, hot swap) anahtar
+    degisir; eski kayitlar okunmaz, TTL ile duser — ayrica silme gerekmez.
+
+Redis erisilemezse (VALUATION_CACHE_TIMEOUT_SECONDS) cache atlanir,
+tahmin modelden yapilir (fail-open).
+
+Kullanim:
+    prediction, cache_hit = await InferenceService.get_instance().predict_cached(input_data)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+from typing import Any
+
+import redis.asyncio as aioredis
+import structlog
+
+from src.config import settings
+
+logger = structlog.get_logger()
+
+_KEY_PREFIX = "valuation"
+
+# Client olusturuldugu event loop'a baglidir (FastAPI worker / Celery runtime)
+_client: aioredis.Redis | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _redis() -> aioredis.Redis:
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = aioredis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=settings.VALUATION_CACHE_TIMEOUT_SECONDS,
+            socket_timeout=settings.VALUATION_CACHE_TIMEOUT_SECONDS,
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close() -> None:
+    """Uygulama kapanisinda client'i kapatir (lifespan)."""
+    global _client, _client_loop
+    if _client is not None:
+        client, _client, _client_loop = _client, None, None
+        await client.aclose()
+
+
+# ================================================================
+# Anahtar
+# ================================================================
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, int | float):
+        number = float(value)
+        if math.isnan(number):
+            return None
+        return number + 0.0  # -0.0 → 0.0
+    return value
+
+
+def input_hash(input_data: dict) -> str:
+    """Model girdisinin kanonik ozeti (hex)."""
+    payload = json.dumps(
+        {key: _canonical(value) for key, value in input_data.items()},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cache_key(input_data: dict, model_version: str, model_fingerprint: str) -> str:
+    return f"{_KEY_PREFIX}:{model_version}:{model_fingerprint}:{input_hash(input_data)}"
+
+
+# ================================================================
+# Okuma / Yazma (fail-open)
+# ================================================================
+
+
+async def get_prediction(key: str) -> dict | None:
+    """Cache'teki tahmin; yoksa veya Redis erisilemezse None."""
+    if not settings.VALUATION_CACHE_ENABLED:
+        return None
+    try:
+        raw = await _redis().get(key)
+    except Exception as exc:
+        logger.warning("valuation_cache_get_failed", error=str(exc))
+        return None
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+async def store_prediction(key: str, prediction: dict) -> None:
+    if not settings.VALUATION_CACHE_ENABLED:
+        return
+    try:
+        await _redis().set(
+            key,
+            json.dumps(prediction, separators=(",", ":")),
+            ex=settings.VALUATION_CACHE_TTL_SECONDS,
+        )
+    except Exception as exc:
+        logger.warning("valuation_cache_set_failed", error=str(exc))
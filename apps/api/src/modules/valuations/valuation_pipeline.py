@@ -0,0 +1,147 @@
+"""
+Emlak Teknoloji Platformu - Degerleme Pipeline'i
+
+POST /valuations adimlari onceden sirayla calisiyordu:
+    kota → tahmin → emsal (adaptive radius, 4 sorguya kadar) → anomali (1-2 sorgu)
+
+Emsal aramasi ve ilce m2 istatistikleri yalnizca girdiye bagli; tahmin
+fiyatina ihtiyac duymaz. Pipeline bu asamalari paralel calistirir:
+
+    request oturumu : kota kontrolu → tahmin (+ PredictionLog)
+    ek oturum 1     : emsal satirlari (ComparableService.find_comparable_rows)
+    ek oturum 2     : ilce m2 istatistikleri (get_district_sqm_stats)
+
+Fiyat belli olunca birlestirilir (DB erisimi yok):
+    - price_diff_percent (ComparableService.format_enriched_results)
+    - anomali z-score'u (evaluate_price_anomaly)
+
+AsyncSession ayni anda tek sorgu yurutebildiginden paralel asamalar
+havuzdan ayri oturum alir (tenant_session — ayni RLS baglami). Kota
+asilirsa veya tahmin basarisiz olursa paralel asamalar iptal edilir.
+Anomali asamasi basarisiz olursa degerleme uyarisiz doner; emsal asamasi
+hatasi istegi basarisiz kilar (onceki davranis).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import structlog
+
+from src.database import tenant_session
+from src.modules.valuations.anomaly_service import (
+    DistrictSqmStats,
+    evaluate_price_anomaly,
+    get_district_sqm_stats,
+)
+from src.modules.valuations.comparable_service import ComparableService
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+    from fastapi import Request
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.modules.valuations.schemas import ValuationRequest
+
+logger = structlog.get_logger()
+
+COMPARABLE_LIMIT = 5
+MIN_COMPARABLES = 3
+
+
+@dataclass
+class ValuationPipelineResult:
+    """Pipeline ciktisi: tahmin, fiyatla zenginlestirilmis emsaller, anomali uyarisi."""
+
+    prediction: dict
+    comparables: list[dict]
+    anomaly_warning: str | None
+
+
+async def _comparable_rows(
+    request: Request,
+    db: AsyncSession,
+    body: ValuationRequest,
+) -> list:
+    model_input = body.to_model_input()
+    async with tenant_session(request, sibling=db) as side_db:
+        return await ComparableService(side_db).find_comparable_rows(
+            district=body.district,
+            property_type=body.property_type,
+            net_sqm=body.net_sqm,
+            room_count=body.room_count,
+            building_age=body.building_age,
+            lat=model_input.get("lat"),
+            lon=model_input.get("lon"),
+            limit=COMPARABLE_LIMIT,
+            min_comparables=MIN_COMPARABLES,
+        )
+
+
+async def _district_stats(
+    request: Request,
+    db: AsyncSession,
+    district: str,
+) -> DistrictSqmStats | None:
+    """Ilce istatistikleri; hata durumunda None (anomali kontrolu atlanir)."""
+    try:
+        async with tenant_session(request, sibling=db) as side_db:
+            return await get_district_sqm_stats(district, side_db)
+    except Exception:
+        logger.warning("anomaly_stats_failed", district=district, exc_info=True)
+        return None
+
+
+async def run_valuation_pipeline(
+    request: Request,
+    db: AsyncSession,
+    body: ValuationRequest,
+    predict: Awaitable[dict],
+) -> ValuationPipelineResult:
+    """
+    Tahmini emsal ve ilce istatistigi sorgulariyla paralel calistirir.
+
+    Args:
+        request: Ek oturumlarin RLS baglami icin (TenantMiddleware state).
+        db: Request oturumu — ek oturumlar ayni engine'den acilir.
+        body: Degerleme girdisi.
+        predict: Request oturumunda kota kontrolu + tahmin yapan coroutine.
+            Hata firlatirsa (orn. QuotaExceededError) paralel asamalar
+            iptal edilir ve hata aynen yukari iletilir.
+    """
+    comparables_task = asyncio.create_task(_comparable_rows(request, db, body))
+    stats_task = asyncio.create_task(_district_stats(request, db, body.district))
+    side_tasks = (comparables_task, stats_task)
+
+    try:
+        prediction = await predict
+        rows, stats = await asyncio.gather(*side_tasks)
+    except BaseException:
+        # Kota asimi / tahmin hatasi / emsal hatasi — acik oturumlar birakilir
+        for task in side_tasks:
+            task.cancel()
+        await asyncio.gather(*side_tasks, return_exceptions=True)
+        raise
+
+    estimated_price = prediction["estimated_price"]
+    comparables = ComparableService.format_enriched_results(rows, estimated_price)
+
+    anomaly_warning: str | None = None
+    if stats is not None:
+        anomaly = evaluate_price_anomaly(
+            predicted_price=float(estimated_price),
+            district=body.district,
+            net_sqm=body.net_sqm,
+            stats=stats,
+        )
+        if anomaly.is_anomaly:
+            anomaly_warning = anomaly.anomaly_reason
+
+    return ValuationPipelineResult(
+        prediction=prediction,
+        comparables=comparables,
+        anomaly_warning=anomaly_warning,
+    )
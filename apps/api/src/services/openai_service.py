@@ -24,10 +24,24 @@ No-op Guard:
     API cagrisi yapmadan calismaya devam edilebilir.
 
 Mimari Kararlar:
-    - Sync OpenAI client + asyncio.to_thread() (WeasyPrint pattern ile tutarli)
+    - Async yol (*_async, OpenAIService): AsyncOpenAI + asyncio.sleep backoff.
+      Eskiden sync client asyncio.to_thread() ile sarilir, retry time.sleep ile
+      beklerdi; staging/listing patlamasinda default executor thread'leri
+      onlarca saniye dolu kalir, PDF render gibi diger to_thread kullanicilari
+      ac kalirdi. Artik bekleme event loop'ta, thread tutulmaz.
+    - Operasyon tipi basina surec-ici semaphore (text / vision / image):
+      OPENAI_CONCURRENCY_* — gorsel duzenleme patlamasi text isteklerini
+      bekletmez. Semaphore deneme basina alinir; backoff beklerken slot bos.
+    - Zaman asimi: OPENAI_TIMEOUT_SECONDS (text / vision),
+      OPENAI_IMAGE_TIMEOUT_SECONDS (gorsel). SDK retry'i kapali
+      (max_retries=0) — tek retry katmani bu modul.
+    - OPENAI_BASE_URL: testlerde yerel stub sunucuya yonlendirme.
+    - Sync fonksiyonlar (generate_text, ...) event loop disi kullanim icin
+      korunur (Celery, script); ayni istek olusturma / retry kurallarini paylasir.
     - Lazy import: openai paketi sadece ilk kullanimda import edilir
     - Retry: Kendi retry mekanizmasi (outbox retry_policy'den bagimsiz)
-    - Singleton: Modul-seviyesi _client, GIL korumasi altinda thread-safe
+    - Sync client: modul-seviyesi singleton. Async client ve semaphore'lar
+      olusturulduklari event loop'a baglidir; loop degisirse yeniden kurulur.
 
 Referans: TASK-114 (S8.1)
 """
@@ -65,10 +79,10 @@ from src.services.openai_exceptions import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-    from typing import Any
+    from collections.abc import Awaitable, Callable
+    from typing import Any, NoReturn
 
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
     from openai.types.chat import ChatCompletion
     from openai.types.images_response import ImagesResponse
 
@@ -125,21 +139,85 @@ def _get_client() -> OpenAI | None:
 
     from openai import OpenAI as _OpenAI
 
-    _client = _OpenAI(api_key=api_key)
+    _client = _OpenAI(**_client_options())
     _client_initialized = True
     logger.info("openai_client_initialized")
     return _client
 
 
+def _client_options() -> dict[str, Any]:
+    """Sync ve async client icin ortak ayarlar."""
+    options: dict[str, Any] = {
+        "api_key": settings.OPENAI_API_KEY,
+        "timeout": settings.OPENAI_TIMEOUT_SECONDS,
+        # Retry _retry_operation* icinde — SDK retry'i deneme sayisini katlardi
+        "max_retries": 0,
+    }
+    if settings.OPENAI_BASE_URL:
+        options["base_url"] = settings.OPENAI_BASE_URL
+    return options
+
+
+# AsyncOpenAI (httpx.AsyncClient) ve semaphore'lar olusturulduklari event loop'a
+# baglidir (FastAPI worker / Celery runtime)
+_async_client: AsyncOpenAI | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+def _concurrency_limits() -> dict[str, int]:
+    """Operasyon tipi → surec basina eszamanli istek limiti."""
+    return {
+        "text": settings.OPENAI_CONCURRENCY_TEXT,
+        "vision": settings.OPENAI_CONCURRENCY_VISION,
+        "image": settings.OPENAI_CONCURRENCY_IMAGE,
+    }
+
+
+def _get_async_client() -> AsyncOpenAI | None:
+    """
+    Calisan event loop icin AsyncOpenAI client'i (lazy).
+
+    OPENAI_API_KEY bos ise None dondurur (no-op guard aktif). Loop
+    degismisse client ve operasyon semaphore'lari yeniden olusturulur.
+    """
+    global _async_client, _async_client_loop, _semaphores
+
+    if not settings.OPENAI_API_KEY:
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        from openai import AsyncOpenAI as _AsyncOpenAI
+
+        limits = _concurrency_limits()
+        _async_client = _AsyncOpenAI(**_client_options())
+        _async_client_loop = loop
+        _semaphores = {kind: asyncio.Semaphore(limit) for kind, limit in limits.items()}
+        logger.info("openai_async_client_initialized", concurrency=limits)
+    return _async_client
+
+
+async def close_client() -> None:
+    """Uygulama kapanisinda async client'in baglanti havuzunu kapatir (lifespan)."""
+    global _async_client, _async_client_loop
+    if _async_client is not None:
+        client, _async_client, _async_client_loop = _async_client, None, None
+        await client.close()
+
+
 def reset_client() -> None:
     """
-    Client singleton'i sifirlar — test ve hot-reload icin.
+    Client singleton'larini sifirlar — test ve hot-reload icin.
 
     Production'da kullanilmamali.
     """
-    global _client, _client_initialized
+    global _client, _client_initialized, _async_client, _async_client_loop, _semaphores
     _client = None
     _client_initialized = False
+    _async_client = None
+    _async_client_loop = None
+    _semaphores = {}
     logger.debug("openai_client_reset")
 
 
@@ -239,6 +317,69 @@ def _classify_and_raise_known(
         raise OpenAIInvalidImageError(cause=exc) from exc
 
 
+def _retry_delay(
+    exc: Exception,
+    attempt: int,
+    operation_name: str,
+    **log_context: Any,
+) -> float | None:
+    """
+    Basarisiz denemeyi siniflandirir.
+
+    Returns:
+        Tekrar denenecekse bekleme suresi (saniye), aksi halde None.
+
+    Raises:
+        OpenAIContentFilterError: Icerik filtrelendi (retry yapilmaz).
+        OpenAIInvalidImageError: Gecersiz gorsel (retry yapilmaz).
+    """
+    # Bilinen hatalari ozel exception'lara donustur
+    _classify_and_raise_known(exc, operation_name, **log_context)
+
+    if not _should_retry(exc, attempt):
+        return None
+
+    delay = _calculate_delay(attempt)
+    logger.warning(
+        "openai_retry_scheduled",
+        operation=operation_name,
+        attempt=attempt,
+        delay_seconds=round(delay, 2),
+        error=str(exc),
+        error_type=type(exc).__name__,
+        **log_context,
+    )
+    return delay
+
+
+def _raise_exhausted(
+    last_exception: Exception | None,
+    operation_name: str,
+    **log_context: Any,
+) -> NoReturn:
+    """Tum denemeler basarisiz — hatayi log'lar ve servis exception'ina cevirir."""
+    error_type = type(last_exception).__name__ if last_exception else "Unknown"
+    logger.error(
+        "openai_operation_failed",
+        operation=operation_name,
+        total_attempts=MAX_RETRIES + 1,
+        error=str(last_exception),
+        error_type=error_type,
+        **log_context,
+    )
+
+    # Rate limit ozel exception
+    from openai import RateLimitError
+
+    if isinstance(last_exception, RateLimitError):
+        raise OpenAIRateLimitError(cause=last_exception) from last_exception
+
+    raise OpenAIServiceError(
+        f"OpenAI {operation_name} basarisiz oldu ({error_type}): {last_exception}",
+        cause=last_exception,
+    ) from last_exception
+
+
 def _retry_operation(
     operation: Callable[[], Any],
     *,
@@ -246,7 +387,7 @@ def _retry_operation(
     **log_context: Any,
 ) -> Any:
     """
-    OpenAI API operasyonunu exponential backoff ile retry eder.
+    OpenAI API operasyonunu exponential backoff ile retry eder (sync, time.sleep).
 
     Args:
         operation: Parametresiz callable (closure olarak context tasir).
@@ -293,46 +434,138 @@ def _retry_operation(
 
         except Exception as exc:
             last_exception = exc
+            delay = _retry_delay(exc, attempt, operation_name, **log_context)
+            if delay is None:
+                break
+            time.sleep(delay)
+
+    _raise_exhausted(last_exception, operation_name, **log_context)
+
+
+async def _retry_operation_async(
+    operation: Callable[[], Awaitable[Any]],
+    *,
+    semaphore: asyncio.Semaphore,
+    operation_name: str,
+    **log_context: Any,
+) -> Any:
+    """
+    _retry_operation() async karsiligi — backoff asyncio.sleep ile beklenir.
 
-            # Bilinen hatalari ozel exception'lara donustur
-            _classify_and_raise_known(exc, operation_name, **log_context)
+    Semaphore yalnizca istek suresince tutulur; backoff beklerken baska
+    istekler slotu kullanabilir. Hata siniflandirmasi sync surumle aynidir.
+    """
+    last_exception: Exception | None = None
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            if attempt > 0:
+                logger.info(
+                    "openai_retry_attempt",
+                    operation=operation_name,
+                    attempt=attempt,
+                    max_retries=MAX_RETRIES,
+                    **log_context,
+                )
+
+            async with semaphore:
+                result = await operation()
+
+            if attempt > 0:
+                logger.info(
+                    "openai_retry_success",
+                    operation=operation_name,
+                    succeeded_at_attempt=attempt,
+                    **log_context,
+                )
+
+            return result
+
+        except (OpenAIContentFilterError, OpenAIInvalidImageError):
+            raise
 
-            if not _should_retry(exc, attempt):
+        except Exception as exc:
+            last_exception = exc
+            delay = _retry_delay(exc, attempt, operation_name, **log_context)
+            if delay is None:
                 break
+            await asyncio.sleep(delay)
 
-            delay = _calculate_delay(attempt)
-            logger.warning(
-                "openai_retry_scheduled",
-                operation=operation_name,
-                attempt=attempt,
-                delay_seconds=round(delay, 2),
-                error=str(exc),
-                error_type=type(exc).__name__,
-                **log_context,
-            )
-            time.sleep(delay)
+    _raise_exhausted(last_exception, operation_name, **log_context)
 
-    # Tum denemeler basarisiz
-    error_type = type(last_exception).__name__ if last_exception else "Unknown"
-    logger.error(
-        "openai_operation_failed",
-        operation=operation_name,
-        total_attempts=MAX_RETRIES + 1,
-        error=str(last_exception),
-        error_type=error_type,
-        **log_context,
-    )
 
-    # Rate limit ozel exception
-    from openai import RateLimitError
+# ---------- Request Builders (sync / async ortak) ----------
 
-    if isinstance(last_exception, RateLimitError):
-        raise OpenAIRateLimitError(cause=last_exception) from last_exception
 
-    raise OpenAIServiceError(
-        f"OpenAI {operation_name} basarisiz oldu ({error_type}): {last_exception}",
-        cause=last_exception,
-    ) from last_exception
+def _text_messages(prompt: str, system_prompt: str | None) -> list[dict[str, str]]:
+    messages: list[dict[str, str]] = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+def _vision_messages(image_bytes: bytes, prompt: str, detail: str) -> list[dict]:
+    b64_image = base64.b64encode(image_bytes).decode("utf-8")
+    return [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": prompt},
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"data:image/jpeg;base64,{b64_image}",
+                        "detail": detail,
+                    },
+                },
+            ],
+        }
+    ]
+
+
+def _completion_text(response: ChatCompletion) -> str:
+    content = response.choices[0].message.content or ""
+    return content.strip()
+
+
+def _parse_analysis(response: ChatCompletion) -> dict:
+    """Vision yanitini JSON parse eder; basarisizsa raw_response dondurur."""
+    raw_content = response.choices[0].message.content or "{}"
+    try:
+        return json.loads(raw_content)
+    except json.JSONDecodeError as parse_exc:
+        logger.warning(
+            "openai_json_parse_failed",
+            raw_content=raw_content[:500],
+            error=str(parse_exc),
+        )
+        return {"raw_response": raw_content}
+
+
+def _image_edit_params(
+    image_bytes: bytes,
+    prompt: str,
+    *,
+    model: str,
+    size: str,
+    quality: str,
+    n: int,
+    mask_bytes: bytes | None,
+) -> dict:
+    params: dict = {
+        "model": model,
+        "image": image_bytes,
+        "prompt": prompt,
+        "size": size,
+        "quality": quality,
+        "n": n,
+        "response_format": "b64_json",
+        "timeout": settings.OPENAI_IMAGE_TIMEOUT_SECONDS,
+    }
+    if mask_bytes is not None:
+        params["mask"] = mask_bytes
+    return params
 
 
 # ============================================================
@@ -370,10 +603,7 @@ def generate_text(
         logger.info("openai_mock_text", prompt_length=len(prompt))
         return _MOCK_TEXT
 
-    messages: list[dict[str, str]] = []
-    if system_prompt:
-        messages.append({"role": "system", "content": system_prompt})
-    messages.append({"role": "user", "content": prompt})
+    messages = _text_messages(prompt, system_prompt)
 
     def _call() -> str:
         response: ChatCompletion = client.chat.completions.create(
@@ -382,8 +612,7 @@ def generate_text(
             max_tokens=max_tokens,
             temperature=temperature,
         )
-        content = response.choices[0].message.content or ""
-        return content.strip()
+        return _completion_text(response)
 
     result: str = _retry_operation(
         _call,
@@ -436,23 +665,7 @@ def analyze_image(
         logger.info("openai_mock_analysis", image_size_bytes=len(image_bytes))
         return _MOCK_ANALYSIS.copy()
 
-    b64_image = base64.b64encode(image_bytes).decode("utf-8")
-
-    messages: list[dict] = [
-        {
-            "role": "user",
-            "content": [
-                {"type": "text", "text": prompt},
-                {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/jpeg;base64,{b64_image}",
-                        "detail": detail,
-                    },
-                },
-            ],
-        }
-    ]
+    messages = _vision_messages(image_bytes, prompt, detail)
 
     def _call() -> dict:
         response: ChatCompletion = client.chat.completions.create(
@@ -461,16 +674,7 @@ def analyze_image(
             max_tokens=max_tokens,
             response_format={"type": "json_object"},
         )
-        raw_content = response.choices[0].message.content or "{}"
-        try:
-            return json.loads(raw_content)
-        except json.JSONDecodeError as parse_exc:
-            logger.warning(
-                "openai_json_parse_failed",
-                raw_content=raw_content[:500],
-                error=str(parse_exc),
-            )
-            return {"raw_response": raw_content}
+        return _parse_analysis(response)
 
     result: dict = _retry_operation(
         _call,
@@ -528,6 +732,7 @@ def generate_image(
             quality=quality,  # type: ignore[arg-type]
             n=n,
             response_format="b64_json",
+            timeout=settings.OPENAI_IMAGE_TIMEOUT_SECONDS,
         )
         return _extract_images(response)
 
@@ -587,20 +792,18 @@ def edit_image(
         logger.info("openai_mock_image_edit", image_size_bytes=len(image_bytes))
         return [_MOCK_IMAGE] * n
 
-    def _call() -> list[bytes]:
-        kwargs: dict = {
-            "model": model,
-            "image": image_bytes,
-            "prompt": prompt,
-            "size": size,
-            "quality": quality,  # type: ignore[dict-item]
-            "n": n,
-            "response_format": "b64_json",
-        }
-        if mask_bytes is not None:
-            kwargs["mask"] = mask_bytes
+    params = _image_edit_params(
+        image_bytes,
+        prompt,
+        model=model,
+        size=size,
+        quality=quality,
+        n=n,
+        mask_bytes=mask_bytes,
+    )
 
-        response: ImagesResponse = client.images.edit(**kwargs)  # type: ignore[arg-type]
+    def _call() -> list[bytes]:
+        response: ImagesResponse = client.images.edit(**params)  # type: ignore[arg-type]
         return _extract_images(response)
 
     result: list[bytes] = _retry_operation(
@@ -645,7 +848,7 @@ def _extract_images(response: ImagesResponse) -> list[bytes]:
 
 
 # ============================================================
-#  Async Wrappers (asyncio.to_thread)
+#  Core Operations (Async — AsyncOpenAI)
 # ============================================================
 
 
@@ -657,16 +860,39 @@ async def generate_text_async(
     max_tokens: int = DEFAULT_MAX_TOKENS,
     temperature: float = DEFAULT_TEMPERATURE,
 ) -> str:
-    """generate_text() async wrapper — asyncio.to_thread() ile calisir."""
-    return await asyncio.to_thread(
-        generate_text,
-        prompt,
-        system_prompt=system_prompt,
+    """generate_text() async surumu — thread tutmaz, 'text' semaphore'u ile sinirli."""
+    client = _get_async_client()
+    if client is None:
+        logger.info("openai_mock_text", prompt_length=len(prompt))
+        return _MOCK_TEXT
+
+    messages = _text_messages(prompt, system_prompt)
+
+    async def _call() -> str:
+        response: ChatCompletion = await client.chat.completions.create(
+            model=model,
+            messages=messages,  # type: ignore[arg-type]
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        return _completion_text(response)
+
+    result: str = await _retry_operation_async(
+        _call,
+        semaphore=_semaphores["text"],
+        operation_name="generate_text",
         model=model,
-        max_tokens=max_tokens,
-        temperature=temperature,
+        prompt_length=len(prompt),
     )
 
+    logger.info(
+        "openai_text_generated",
+        model=model,
+        prompt_length=len(prompt),
+        response_length=len(result),
+    )
+    return result
+
 
 async def analyze_image_async(
     image_bytes: bytes,
@@ -676,15 +902,40 @@ async def analyze_image_async(
     detail: str = "high",
     max_tokens: int = DEFAULT_MAX_TOKENS,
 ) -> dict:
-    """analyze_image() async wrapper — asyncio.to_thread() ile calisir."""
-    return await asyncio.to_thread(
-        analyze_image,
-        image_bytes,
-        prompt,
+    """analyze_image() async surumu — thread tutmaz, 'vision' semaphore'u ile sinirli."""
+    client = _get_async_client()
+    if client is None:
+        logger.info("openai_mock_analysis", image_size_bytes=len(image_bytes))
+        return _MOCK_ANALYSIS.copy()
+
+    messages = _vision_messages(image_bytes, prompt, detail)
+
+    async def _call() -> dict:
+        response: ChatCompletion = await client.chat.completions.create(
+            model=model,
+            messages=messages,  # type: ignore[arg-type]
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+        )
+        return _parse_analysis(response)
+
+    result: dict = await _retry_operation_async(
+        _call,
+        semaphore=_semaphores["vision"],
+        operation_name="analyze_image",
+        model=model,
+        image_size_bytes=len(image_bytes),
+        detail=detail,
+    )
+
+    logger.info(
+        "openai_image_analyzed",
         model=model,
+        image_size_bytes=len(image_bytes),
         detail=detail,
-        max_tokens=max_tokens,
+        result_keys=list(result.keys()),
     )
+    return result
 
 
 async def generate_image_async(
@@ -695,16 +946,45 @@ async def generate_image_async(
     quality: str = DEFAULT_IMAGE_QUALITY,
     n: int = DEFAULT_IMAGE_COUNT,
 ) -> list[bytes]:
-    """generate_image() async wrapper — asyncio.to_thread() ile calisir."""
-    return await asyncio.to_thread(
-        generate_image,
-        prompt,
+    """generate_image() async surumu — thread tutmaz, 'image' semaphore'u ile sinirli."""
+    client = _get_async_client()
+    if client is None:
+        logger.info("openai_mock_image_generation", n=n)
+        return [_MOCK_IMAGE] * n
+
+    async def _call() -> list[bytes]:
+        response: ImagesResponse = await client.images.generate(
+            model=model,
+            prompt=prompt,
+            size=size,  # type: ignore[arg-type]
+            quality=quality,  # type: ignore[arg-type]
+            n=n,
+            response_format="b64_json",
+            timeout=settings.OPENAI_IMAGE_TIMEOUT_SECONDS,
+        )
+        return _extract_images(response)
+
+    result: list[bytes] = await _retry_operation_async(
+        _call,
+        semaphore=_semaphores["image"],
+        operation_name="generate_image",
         model=model,
         size=size,
         quality=quality,
         n=n,
+        prompt_length=len(prompt),
     )
 
+    logger.info(
+        "openai_image_generated",
+        model=model,
+        size=size,
+        quality=quality,
+        count=len(result),
+        total_bytes=sum(len(img) for img in result),
+    )
+    return result
+
 
 async def edit_image_async(
     image_bytes: bytes,
@@ -716,9 +996,13 @@ async def edit_image_async(
     n: int = DEFAULT_IMAGE_COUNT,
     mask_bytes: bytes | None = None,
 ) -> list[bytes]:
-    """edit_image() async wrapper — asyncio.to_thread() ile calisir."""
-    return await asyncio.to_thread(
-        edit_image,
+    """edit_image() async surumu — thread tutmaz, 'image' semaphore'u ile sinirli."""
+    client = _get_async_client()
+    if client is None:
+        logger.info("openai_mock_image_edit", image_size_bytes=len(image_bytes))
+        return [_MOCK_IMAGE] * n
+
+    params = _image_edit_params(
         image_bytes,
         prompt,
         model=model,
@@ -728,6 +1012,32 @@ async def edit_image_async(
         mask_bytes=mask_bytes,
     )
 
+    async def _call() -> list[bytes]:
+        response: ImagesResponse = await client.images.edit(**params)  # type: ignore[arg-type]
+        return _extract_images(response)
+
+    result: list[bytes] = await _retry_operation_async(
+        _call,
+        semaphore=_semaphores["image"],
+        operation_name="edit_image",
+        model=model,
+        image_size_bytes=len(image_bytes),
+        has_mask=mask_bytes is not None,
+        size=size,
+        quality=quality,
+        n=n,
+    )
+
+    logger.info(
+        "openai_image_edited",
+        model=model,
+        size=size,
+        quality=quality,
+        count=len(result),
+        total_bytes=sum(len(img) for img in result),
+    )
+    return result
+
 
 # ============================================================
 #  Service Facade (Dependency Injection)
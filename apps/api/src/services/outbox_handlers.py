@@ -0,0 +1,118 @@
+"""
+Emlak Teknoloji Platformu - Outbox Handler Registry
+
+event_type → async handler eslemesi. OutboxWorker claim ettigi her
+event'i kayitli handler'a yonlendirir; handler exception firlatirsa
+RetryPolicy devreye girer (transient → retry, permanent → DLQ).
+
+Handler imzasi:
+    async def handler(event) -> None
+    # event: outbox_events satiri (RETURNING *) — event.id, event.payload, ...
+
+Eszamanlilik:
+    Her event tipinin kendi limiti vardir (concurrency). Yavas bir kanal
+    (orn. rate limit'li bir dis API) diger tiplerin islenmesini bloklamaz.
+
+Kullanim:
+    registry = OutboxHandlerRegistry()
+    registry.register("notification", handle_notification, concurrency=16)
+    worker = OutboxWorker(async_session_factory, handlers=registry)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+
+from src.config import settings
+from src.modules.realtime.event_emitter import emit_event
+from src.modules.realtime.events import EventType
+
+logger = structlog.get_logger(__name__)
+
+OutboxHandler = Callable[[Any], Awaitable[None]]
+
+
+class OutboxHandlerRegistry:
+    """
+    Outbox event handler'larinin merkezi registry'si.
+
+    Thread-safe degildir — kayit baslangicta yapilir, runtime'da
+    yalnizca okunur (ChannelRegistry ile ayni pattern).
+    """
+
+    def __init__(self, default_concurrency: int | None = None) -> None:
+        self._handlers: dict[str, OutboxHandler] = {}
+        self._concurrency: dict[str, int] = {}
+        self.default_concurrency = default_concurrency or settings.OUTBOX_HANDLER_CONCURRENCY
+
+    def register(
+        self,
+        event_type: str,
+        handler: OutboxHandler,
+        concurrency: int | None = None,
+    ) -> None:
+        """
+        Event tipi icin handler kaydeder.
+
+        Args:
+            event_type: outbox_events.event_type degeri (orn. "notification").
+            handler: async def handler(event) -> None.
+            concurrency: Bu tip icin worker basina eszamanli handler siniri.
+                         None → default_concurrency.
+
+        Raises:
+            ValueError: Ayni tipte handler zaten kayitliysa veya limit < 1.
+        """
+        if event_type in self._handlers:
+            raise ValueError(f"'{event_type}' icin outbox handler zaten kayitli")
+        limit = concurrency or self.default_concurrency
+        if limit < 1:
+            raise ValueError(f"Gecersiz concurrency: {limit}")
+
+        self._handlers[event_type] = handler
+        self._concurrency[event_type] = limit
+        logger.info("outbox_handler_registered", event_type=event_type, concurrency=limit)
+
+    def get(self, event_type: str) -> OutboxHandler | None:
+        """Kayitli handler; yoksa None."""
+        return self._handlers.get(event_type)
+
+    def concurrency(self, event_type: str) -> int:
+        """Event tipinin eszamanlilik siniri (kayitsiz tip → varsayilan)."""
+        return self._concurrency.get(event_type, self.default_concurrency)
+
+    def list_event_types(self) -> list[str]:
+        return list(self._handlers)
+
+
+# ================================================================
+# Yerlesik handler'lar
+# ================================================================
+
+
+async def handle_notification(event: Any) -> None:
+    """
+    notification → kullaniciya WebSocket bildirimi.
+
+    emit_event yerel soketlere gonderir ve Redis backplane'e yayar;
+    listener API'de, poll task'i Celery'de calissa da kullanici hangi
+    worker'a bagliysa oraya ulasir. Bagli olmayan kullanici hata degildir.
+
+    Raises:
+        ValueError: payload'da user_id yok (permanent → DLQ).
+    """
+    payload = event.payload or {}
+    user_id = payload.get("user_id")
+    if not user_id:
+        raise ValueError("notification payload'inda user_id yok")
+    await emit_event(str(user_id), EventType.NOTIFICATION, payload)
+
+
+def default_registry() -> OutboxHandlerRegistry:
+    """Uygulamanin (API listener + Celery poll) ortak handler seti."""
+    registry = OutboxHandlerRegistry()
+    registry.register("notification", handle_notification)
+    return registry
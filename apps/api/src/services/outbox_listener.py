@@ -0,0 +1,121 @@
+"""
+Emlak Teknoloji Platformu - Outbox Listener
+
+PostgreSQL LISTEN/NOTIFY ile outbox event'lerini milisaniyeler icinde
+isler. Celery beat poll'u (5 sn) yedek olarak kalir.
+
+Akis:
+    INSERT INTO outbox_events ... COMMIT
+        → trigger (migration 033): pg_notify('outbox_events', '')
+        → bu listener uyanir → OutboxWorker.drain()
+
+    - NOTIFY transaction commit'inde teslim edilir; ayni transaction'daki
+      ayni payload'li bildirimler tek bildirime indirgenir (toplu INSERT
+      tek uyanis).
+    - Bildirim gelmese de her OUTBOX_LISTEN_FALLBACK_SECONDS'ta kuyruk
+      bosaltilir: zamani gelen retry'lar (next_retry_at) bildirim uretmez.
+    - Her uvicorn worker'inda bir listener calisir; claim SKIP LOCKED
+      oldugu icin ayni event iki kez islenmez.
+
+LISTEN icin havuz disi, ayri bir asyncpg baglantisi acilir (havuzdaki
+baglanti sonsuza kadar tutulmaz). Baglanti koparsa ustel bekleme ile
+yeniden baglanir.
+
+Kullanim:
+    # lifespan
+    listener = OutboxListener(OutboxWorker(async_session_factory))
+    listener.start()
+    ...
+    await listener.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+import asyncpg
+import structlog
+
+from src.config import settings
+
+if TYPE_CHECKING:
+    from src.services.outbox_worker import OutboxWorker
+
+logger = structlog.get_logger(__name__)
+
+NOTIFY_CHANNEL = "outbox_events"  # migration 033 trigger'i ile ayni
+_RECONNECT_SECONDS = 1.0
+_MAX_RECONNECT_SECONDS = 30.0
+
+
+def _listen_dsn() -> str:
+    """SQLAlchemy URL'sinden asyncpg DSN'i (driver eki olmadan)."""
+    return settings.DB_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+class OutboxListener:
+    """
+    NOTIFY geldiginde (veya fallback araliginda) outbox kuyrugunu bosaltir.
+
+    Attributes:
+        worker: Claim + dispatch yapan OutboxWorker.
+    """
+
+    def __init__(self, worker: OutboxWorker, dsn: str | None = None) -> None:
+        self.worker = worker
+        self._dsn = dsn or _listen_dsn()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="outbox-listener")
+        logger.info("outbox_listener_started", channel=NOTIFY_CHANNEL)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        logger.info("outbox_listener_stopped")
+
+    def notify(self, *_args: object) -> None:
+        """asyncpg listener callback'i — drain dongusunu uyandirir."""
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        delay = _RECONNECT_SECONDS
+        while True:
+            conn: asyncpg.Connection | None = None
+            try:
+                conn = await asyncpg.connect(self._dsn)
+                await conn.add_listener(NOTIFY_CHANNEL, self.notify)
+                delay = _RECONNECT_SECONDS
+                await self._drain_loop(conn)
+            except Exception:
+                logger.warning("outbox_listener_disconnected", retry_in=delay, exc_info=True)
+            finally:
+                if conn is not None:
+                    with contextlib.suppress(Exception):
+                        await conn.close(timeout=1)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _MAX_RECONNECT_SECONDS)
+
+    async def _drain_loop(self, conn: asyncpg.Connection) -> None:
+        # LISTEN kurulduktan SONRA ilk drain: arada gelen event kacmaz
+        while True:
+            self._wakeup.clear()
+            processed = await self.worker.drain()
+            if processed:
+                logger.debug("outbox_listener_drained", processed=processed)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=settings.OUTBOX_LISTEN_FALLBACK_SECONDS
+                )
+            if conn.is_closed():
+                raise ConnectionError("LISTEN baglantisi kapandi")
@@ -10,6 +10,8 @@ Tasarim kararlari:
     - STUCK_THRESHOLD_SECONDS = 300 (5dk): processing durumunda 5dk'dan
       uzun kalan event'ler stuck kabul edilir.
     - collect_metrics(): Celery beat task tarafindan 60sn'de bir cagirilir.
+      Sorgular yalnizca hot tabloya dokunur: sent satirlar arsive tasinir
+      (services/table_archiver), aktif durumlar partial index kullanir.
     - Tum DB islemleri raw SQL (text()) ile yapilir — ORM overhead yok.
 
 Metrikler:
@@ -19,7 +21,7 @@ Metrikler:
     - outbox_failed_count    (gauge)     → failed event sayisi
     - outbox_dead_letter_count(gauge)    → dead_letter event sayisi
     - outbox_stuck_count     (gauge)     → stuck event sayisi
-    - outbox_processed_total (counter)   → toplam islenen event (kumulatif)
+    - outbox_processed_total (counter)   → hot tablodaki sent event (arsivlenmemis)
     - outbox_errors_total    (counter)   → toplam hata (kumulatif)
 
 Referans: docs/MIMARI-KARARLAR.md
@@ -192,7 +194,7 @@ class OutboxMonitor:
         Outbox metriklerini toplar ve OTel'e raporlar.
 
         Celery beat task tarafindan periyodik cagirilir (60sn).
-        Tek bir DB sorgusu ile tum istatistikleri toplar.
+        Durum sayilari tek round trip'te, durum basina partial index ile.
 
         Returns:
             LagStats: Guncel outbox istatistikleri.
@@ -202,26 +204,27 @@ class OutboxMonitor:
         try:
             async with self._session_factory() as session:
                 # --- Status bazli sayilar ---
+                # Tam tablo GROUP BY yerine durum basina partial index
+                # (migration 034). sent satirlar OUTBOX_ARCHIVE_AFTER_HOURS
+                # sonra arsive tasindigi icin processed_total hot tablodaki
+                # (son pencere) sent sayisidir.
                 result = await session.execute(
                     text(
-                        "SELECT status, COUNT(*) as cnt "
-                        "FROM outbox_events "
-                        "GROUP BY status"
+                        "SELECT "
+                        "  (SELECT COUNT(*) FROM outbox_events WHERE status = 'pending'), "
+                        "  (SELECT COUNT(*) FROM outbox_events WHERE status = 'processing'), "
+                        "  (SELECT COUNT(*) FROM outbox_events WHERE status = 'failed'), "
+                        "  (SELECT COUNT(*) FROM outbox_events WHERE status = 'dead_letter'), "
+                        "  (SELECT COUNT(*) FROM outbox_events WHERE status = 'sent')"
                     )
                 )
-                for row in result.fetchall():
-                    status_val = row[0]
-                    count_val = row[1]
-                    if status_val == "pending":
-                        stats.pending_count = count_val
-                    elif status_val == "processing":
-                        stats.processing_count = count_val
-                    elif status_val == "failed":
-                        stats.failed_count = count_val
-                    elif status_val == "dead_letter":
-                        stats.dead_letter_count = count_val
-                    elif status_val == "sent":
-                        stats.processed_total = count_val
+                (
+                    stats.pending_count,
+                    stats.processing_count,
+                    stats.failed_count,
+                    stats.dead_letter_count,
+                    stats.processed_total,
+                ) = result.one()
 
                 # --- Errors total (failed + dead_letter) ---
                 stats.errors_total = stats.failed_count + stats.dead_letter_count
@@ -1,8 +1,23 @@
 """
 Emlak Teknoloji Platformu - Outbox Worker
 
-Transactional Outbox pattern worker: pending event'leri poll eder,
-FOR UPDATE SKIP LOCKED ile kilitler ve isler.
+Transactional Outbox pattern dispatcher: pending event'leri batch halinde
+FOR UPDATE SKIP LOCKED ile claim eder, event_type'a gore kayitli handler'a
+yonlendirir ve sonuclari tek UPDATE ile yazar.
+
+Akis (poll_and_process):
+    1. Claim — tek transaction: pending → processing (locked_by=worker)
+       ve COMMIT. Handler'lar calisirken satir kilidi tutulmaz.
+    2. Dispatch — handler'lar asyncio.gather ile eszamanli calisir; her
+       event tipi kendi semaforu ile sinirlanir (OutboxHandlerRegistry).
+    3. Sonuc — tum batch icin TEK UPDATE ... FROM unnest(...):
+       sent / pending (retry) / dead_letter.
+    Adim 2-3 arasinda process olurse event'ler 'processing' kalir;
+    OutboxMonitor.force_release_stuck ile geri alinir (at-least-once).
+
+Tetikleme:
+    - OutboxListener (API lifespan): LISTEN outbox_events → milisaniyeler
+    - Celery beat poll_outbox (5 sn): zamani gelen retry'lar + yedek
 
 Retry Politikasi (TASK-041):
     - Event tipi bazinda konfigüre edilebilir RetryPolicy
@@ -17,12 +32,16 @@ Kullanim:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
+from dataclasses import dataclass
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.config import settings
+from src.services.outbox_handlers import OutboxHandlerRegistry, default_registry
 from src.services.retry_policy import (
     RetryPolicy,
     classify_exception,
@@ -31,47 +50,112 @@ from src.services.retry_policy import (
 
 logger = logging.getLogger(__name__)
 
+_APPLY_OUTCOMES_SQL = text(
+    "UPDATE outbox_events AS e "
+    "SET status = r.status, "
+    "    retry_count = r.retry_count, "
+    "    error_message = r.error_message, "
+    "    processed_at = CASE WHEN r.status = 'sent' THEN now() ELSE e.processed_at END, "
+    "    next_retry_at = CASE WHEN r.status = 'pending' "
+    "        THEN now() + interval '1 second' * r.backoff ELSE e.next_retry_at END, "
+    "    locked_at = NULL, "
+    "    locked_by = NULL "
+    "FROM unnest("
+    "    CAST(:ids AS uuid[]), "
+    "    CAST(:statuses AS text[]), "
+    "    CAST(:retry_counts AS integer[]), "
+    "    CAST(:error_messages AS text[]), "
+    "    CAST(:backoffs AS double precision[])"
+    ") AS r(id, status, retry_count, error_message, backoff) "
+    "WHERE e.id = r.id AND e.locked_by = :worker_id"
+)
+
+
+@dataclass(slots=True)
+class EventOutcome:
+    """Tek event'in dispatch sonucu — toplu UPDATE'in bir satiri."""
+
+    event_id: uuid.UUID
+    status: str  # sent | pending | dead_letter
+    retry_count: int
+    error_message: str | None = None
+    backoff_seconds: float = 0.0
+
 
 class OutboxWorker:
     """
-    Outbox event'lerini poll edip isleyen worker.
+    Outbox event'lerini claim edip handler'lara dagitan worker.
 
     FOR UPDATE SKIP LOCKED kullanarak birden fazla worker
     instance'inin ayni anda calismasina olanak tanir.
 
+    Handler'i olmayan event tipleri uyari ile 'sent' isaretlenir
+    (kuyrugu tikamaz).
+
     Error Classification (TASK-041):
         - Transient (ConnectionError, TimeoutError, 5xx) -> retry
         - Permanent (ValidationError, 4xx, AuthError) -> direkt DLQ
     """
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        handlers: OutboxHandlerRegistry | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._handlers = handlers if handlers is not None else default_registry()
         self._worker_id = f"worker-{uuid.uuid4().hex[:8]}"
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
 
-    async def poll_and_process(self, batch_size: int = 10) -> int:
+    async def poll_and_process(self, batch_size: int | None = None) -> int:
         """
-        Pending event'leri poll et ve isle.
+        Pending event'leri claim et, dispatch et, sonuclari yaz.
 
         Returns:
-            Islenen event sayisi.
+            Basariyla islenen (sent) event sayisi.
+        """
+        _, processed = await self._poll(batch_size or settings.OUTBOX_BATCH_SIZE)
+        return processed
+
+    async def drain(self, batch_size: int | None = None, max_batches: int | None = None) -> int:
         """
+        Kuyrugu bosaltir: dolu batch geldikce tekrar poll eder.
+
+        Returns:
+            Toplam basariyla islenen event sayisi.
+        """
+        batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+        max_batches = max_batches or settings.OUTBOX_DRAIN_MAX_BATCHES
+        total = 0
+        for _ in range(max_batches):
+            claimed, processed = await self._poll(batch_size)
+            total += processed
+            if claimed < batch_size:
+                break
+        return total
+
+    async def _poll(self, batch_size: int) -> tuple[int, int]:
+        """Tek batch; (claim edilen, sent) dondurur."""
         async with self._session_factory() as session, session.begin():
             events = await self._acquire_events(session, batch_size)
-            if not events:
-                return 0
-
-            processed = 0
-            for event in events:
-                try:
-                    await self._process_event(session, event)
-                    processed += 1
-                except Exception:
-                    logger.exception(
-                        "Outbox event isleme hatasi: event_id=%s",
-                        event.id,
-                    )
-
-            return processed
+        if not events:
+            return 0, 0
+
+        outcomes = await asyncio.gather(*(self._dispatch(event) for event in events))
+
+        try:
+            async with self._session_factory() as session, session.begin():
+                await self._apply_outcomes(session, outcomes)
+        except Exception:
+            # Event'ler 'processing' kalir → OutboxMonitor.force_release_stuck
+            logger.exception(
+                "Outbox sonuclari yazilamadi: worker=%s events=%d",
+                self._worker_id,
+                len(events),
+            )
+            return len(events), 0
+
+        return len(events), sum(1 for o in outcomes if o.status == "sent")
 
     async def _acquire_events(
         self, session: AsyncSession, batch_size: int
@@ -106,15 +190,48 @@ class OutboxWorker:
         )
         return result.fetchall()
 
-    async def _process_event(self, session: AsyncSession, event) -> None:
+    def _semaphore(self, event_type: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(event_type)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._handlers.concurrency(event_type))
+            self._semaphores[event_type] = semaphore
+        return semaphore
+
+    async def _dispatch(self, event) -> EventOutcome:
+        """
+        Tek event'i handler'ina yonlendirir; exception firlatmaz.
+
+        Handler hatasi RetryPolicy ile siniflandirilir (bkz. _failure_outcome).
         """
-        Tek bir outbox event'ini isle.
+        handler = self._handlers.get(event.event_type)
+        if handler is None:
+            logger.warning(
+                "Outbox event icin handler yok, sent isaretleniyor: type=%s event_id=%s",
+                event.event_type,
+                event.id,
+            )
+            return EventOutcome(event.id, "sent", event.retry_count)
+
+        async with self._semaphore(event.event_type):
+            try:
+                await asyncio.wait_for(
+                    handler(event), timeout=settings.OUTBOX_HANDLER_TIMEOUT_SECONDS
+                )
+            except Exception as e:
+                return self._failure_outcome(event, e)
+
+        logger.debug(
+            "Outbox event islendi: type=%s aggregate=%s/%s worker=%s",
+            event.event_type,
+            event.aggregate_type,
+            event.aggregate_id,
+            self._worker_id,
+        )
+        return EventOutcome(event.id, "sent", event.retry_count)
 
-        Basarili -> status='sent', processed_at=now()
-        Basarisiz ->
-            - Transient hata: retry_count artir, exponential backoff ile next_retry_at
-            - Permanent hata: direkt dead_letter (retry atlanir)
-            - Max retries asildi: dead_letter
+    def _failure_outcome(self, event, e: Exception) -> EventOutcome:
+        """
+        Basarisiz handler → retry veya DLQ karari.
 
         Error Classification (TASK-041):
             1. Exception siniflandirilir (transient/permanent/unknown)
@@ -122,104 +239,64 @@ class OutboxWorker:
             3. Policy.should_retry() ile karar verilir
             4. Policy.calculate_next_retry() ile delay hesaplanir
         """
-        # Event tipine gore retry policy sec
         policy: RetryPolicy = get_policy_for_event(event.event_type)
+        new_retry_count = event.retry_count + 1
+        error_classification = classify_exception(e)
+        error_message = str(e)[:500] or type(e).__name__
 
-        try:
-            # TODO: Event routing — event_type'a gore handler dispatch
-            # Simdilik sadece status guncellemesi yapilir.
-            # Gercek implementasyonda burada event publish (Redis, RabbitMQ vb.) yapilir.
-            logger.info(
-                "Outbox event isleniyor: type=%s aggregate=%s/%s worker=%s",
-                event.event_type,
-                event.aggregate_type,
-                event.aggregate_id,
-                self._worker_id,
+        if not policy.should_retry(new_retry_count, e):
+            # --- DLQ: Max retries asildi VEYA permanent hata ---
+            reason = (
+                "permanent_error"
+                if error_classification == "permanent"
+                else "max_retries_exceeded"
             )
-
-            await session.execute(
-                text(
-                    "UPDATE outbox_events "
-                    "SET status = 'sent', "
-                    "    processed_at = now(), "
-                    "    error_message = NULL "
-                    "WHERE id = :event_id"
-                ),
-                {"event_id": event.id},
+            logger.warning(
+                "Outbox event DLQ'ya gonderiliyor: event_id=%s type=%s "
+                "reason=%s classification=%s retry_count=%d/%d error=%s",
+                event.id,
+                event.event_type,
+                reason,
+                error_classification,
+                new_retry_count,
+                policy.max_retries,
+                error_message[:200],
             )
+            return EventOutcome(event.id, "dead_letter", new_retry_count, error_message)
 
-        except Exception as e:
-            new_retry_count = event.retry_count + 1
-            error_classification = classify_exception(e)
-
-            # Karar: Retry mi DLQ mi?
-            if not policy.should_retry(new_retry_count, e):
-                # --- DLQ: Max retries asildi VEYA permanent hata ---
-                reason = (
-                    "permanent_error"
-                    if error_classification == "permanent"
-                    else "max_retries_exceeded"
-                )
-
-                logger.warning(
-                    "Outbox event DLQ'ya gonderiliyor: event_id=%s type=%s "
-                    "reason=%s classification=%s retry_count=%d/%d error=%s",
-                    event.id,
-                    event.event_type,
-                    reason,
-                    error_classification,
-                    new_retry_count,
-                    policy.max_retries,
-                    str(e)[:200],
-                )
+        # --- RETRY: Transient hata, tekrar dene ---
+        backoff_seconds = policy.calculate_next_retry(new_retry_count)
+        logger.info(
+            "Outbox event retry zamanlanacak: event_id=%s type=%s "
+            "classification=%s retry_count=%d/%d backoff=%.1fs",
+            event.id,
+            event.event_type,
+            error_classification,
+            new_retry_count,
+            policy.max_retries,
+            backoff_seconds,
+        )
+        return EventOutcome(
+            event.id, "pending", new_retry_count, error_message, backoff_seconds
+        )
 
-                await session.execute(
-                    text(
-                        "UPDATE outbox_events "
-                        "SET status = 'dead_letter', "
-                        "    retry_count = :retry_count, "
-                        "    error_message = :error_message, "
-                        "    locked_at = NULL, "
-                        "    locked_by = NULL "
-                        "WHERE id = :event_id"
-                    ),
-                    {
-                        "retry_count": new_retry_count,
-                        "error_message": str(e)[:500],
-                        "event_id": event.id,
-                    },
-                )
-            else:
-                # --- RETRY: Transient hata, tekrar dene ---
-                backoff_seconds = policy.calculate_next_retry(new_retry_count)
-
-                logger.info(
-                    "Outbox event retry zamanlanacak: event_id=%s type=%s "
-                    "classification=%s retry_count=%d/%d backoff=%.1fs",
-                    event.id,
-                    event.event_type,
-                    error_classification,
-                    new_retry_count,
-                    policy.max_retries,
-                    backoff_seconds,
-                )
+    async def _apply_outcomes(
+        self, session: AsyncSession, outcomes: list[EventOutcome]
+    ) -> None:
+        """
+        Batch sonuclarini TEK UPDATE ile yazar (satir basina tur yok).
 
-                await session.execute(
-                    text(
-                        "UPDATE outbox_events "
-                        "SET status = 'pending', "
-                        "    retry_count = :retry_count, "
-                        "    error_message = :error_message, "
-                        "    next_retry_at = now() + interval '1 second' * :backoff, "
-                        "    locked_at = NULL, "
-                        "    locked_by = NULL "
-                        "WHERE id = :event_id"
-                    ),
-                    {
-                        "retry_count": new_retry_count,
-                        "error_message": str(e)[:500],
-                        "backoff": backoff_seconds,
-                        "event_id": event.id,
-                    },
-                )
-            raise
+        locked_by kosulu: bu arada force_release_stuck ile baska worker'a
+        gecmis event'in durumu ezilmez.
+        """
+        await session.execute(
+            _APPLY_OUTCOMES_SQL,
+            {
+                "ids": [o.event_id for o in outcomes],
+                "statuses": [o.status for o in outcomes],
+                "retry_counts": [o.retry_count for o in outcomes],
+                "error_messages": [o.error_message for o in outcomes],
+                "backoffs": [o.backoff_seconds for o in outcomes],
+                "worker_id": self._worker_id,
+            },
+        )
@@ -0,0 +1,267 @@
+"""
+Emlak Teknoloji Platformu - Table Archiver (Archive-and-Prune)
+
+outbox_events, inbox_events ve audit_logs yalnizca buyuyordu. Eski /
+islenmis satirlar aylik partition'li arsiv tablolarina tasinir (migration
+034); hot tablolar kucuk kalir, izleme ve claim sorgulari yalnizca guncel
+veriye dokunur.
+
+    {tablo}_archive           PARTITION BY RANGE (created_at)
+    {tablo}_archive_2026_03   FOR VALUES FROM ('2026-03-01') TO ('2026-04-01')
+
+Tasima (batch basina tek ifade, ayri commit):
+    WITH moved AS (
+        DELETE FROM {tablo} WHERE id IN (
+            SELECT id FROM {tablo}
+            WHERE <kosul> AND created_at < :cutoff
+            ORDER BY created_at LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED)
+        RETURNING *)
+    INSERT INTO {tablo}_archive SELECT * FROM moved
+
+    - Satir ya hot tablodadir ya arsivde — ara durum yok.
+    - SKIP LOCKED: o an guncellenen satir beklenmez, sonraki calismada tasinir.
+    - Batch'ler ayri commit edilir: uzun kilit ve tek dev transaction yok.
+
+Kurallar (archive_policies):
+    outbox_events    status='sent'       OUTBOX_ARCHIVE_AFTER_HOURS
+    inbox_events     status='processed'  INBOX_ARCHIVE_AFTER_DAYS
+    audit_logs       tumu                AUDIT_LOG_ARCHIVE_AFTER_DAYS
+
+    - dead_letter outbox event'leri arsivlenmez (DLQService.purge yonetir).
+    - prediction_logs arsivlenmez: degerleme gecmisi (liste, detay, emsal,
+      PDF) bu tablodan okunur; arsive tasinan tahmin kullaniciya 404 olur
+      (migration 036).
+    - inbox_events.event_id UNIQUE yalnizca hot tabloda gecerlidir;
+      INBOX_ARCHIVE_AFTER_DAYS kaynak sistemin yeniden gonderim
+      penceresinden uzun olmalidir.
+    - Arsiv partition'lari ARCHIVE_DROP_AFTER_MONTHS > 0 ise DROP edilir
+      (DELETE yok); audit_logs en az 24 ay tutulur (KVKK).
+
+Arsiv tablolari uygulama tarafindan okunmaz (RLS / app_user GRANT yok);
+denetim ve analiz icin dogrudan SQL ile sorgulanir.
+
+NOT: Arsiv tablolari kaynak tablonun kolon sirasini kopyalar (LIKE).
+Kaynaga kolon ekleyen migration arsive de ayni kolonu eklemelidir.
+
+Kullanim:
+    with get_sync_session() as session:
+        for policy in archive_policies():
+            moved = archive_table(session, policy)
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import structlog
+from sqlalchemy import text
+
+from src.config import settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+logger = structlog.get_logger(__name__)
+
+AUDIT_LOG_MIN_KEEP_MONTHS = 24  # KVKK — denetim kayitlari en az 2 yil
+
+_PARTITION_SUFFIX = re.compile(r"_(\d{4})_(\d{2})$")
+
+
+@dataclass(frozen=True)
+class ArchivePolicy:
+    """Tek tablonun arsivleme kurali."""
+
+    table: str
+    age: timedelta
+    condition: str = "TRUE"  # ek SQL kosulu (sabit — kullanici girdisi degil)
+    min_keep_months: int = 0
+
+    @property
+    def archive_table(self) -> str:
+        return f"{self.table}_archive"
+
+
+def archive_policies() -> list[ArchivePolicy]:
+    """Ayarlardan guncel kurallar (test'te settings override edilebilir)."""
+    return [
+        ArchivePolicy(
+            "outbox_events",
+            timedelta(hours=settings.OUTBOX_ARCHIVE_AFTER_HOURS),
+            condition="status = 'sent'",
+        ),
+        ArchivePolicy(
+            "inbox_events",
+            timedelta(days=settings.INBOX_ARCHIVE_AFTER_DAYS),
+            condition="status = 'processed'",
+        ),
+        ArchivePolicy(
+            "audit_logs",
+            timedelta(days=settings.AUDIT_LOG_ARCHIVE_AFTER_DAYS),
+            min_keep_months=AUDIT_LOG_MIN_KEEP_MONTHS,
+        ),
+    ]
+
+
+# ================================================================
+# Aylik partition yardimcilari
+# ================================================================
+
+
+def month_start(value: datetime) -> datetime:
+    """Ayin ilk ani (UTC)."""
+    value = value.astimezone(UTC)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(policy: ArchivePolicy, month: datetime) -> str:
+    return f"{policy.archive_table}_{month:%Y_%m}"
+
+
+def ensure_partitions(session: Session, policy: ArchivePolicy, cutoff: datetime) -> int:
+    """
+    Tasinacak satirlarin aylari icin arsiv partition'larini olusturur.
+
+    Returns:
+        Kapsanan ay sayisi (tasinacak satir yoksa 0).
+    """
+    oldest = session.execute(
+        text(
+            f"SELECT min(created_at) FROM {policy.table} "
+            f"WHERE {policy.condition} AND created_at < :cutoff"
+        ),
+        {"cutoff": cutoff},
+    ).scalar()
+    if oldest is None:
+        return 0
+
+    months = 0
+    month = month_start(oldest)
+    while month < cutoff:
+        upper = add_months(month, 1)
+        session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(policy, month)} "
+                f"PARTITION OF {policy.archive_table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+        )
+        month = upper
+        months += 1
+    return months
+
+
+# ================================================================
+# Tasima
+# ================================================================
+
+
+def archive_batch(
+    session: Session, policy: ArchivePolicy, cutoff: datetime, batch_size: int
+) -> int:
+    """Tek batch'i arsive tasir (commit cagirana aittir). Tasinan satir sayisi."""
+    result = session.execute(
+        text(
+            f"WITH moved AS ("
+            f"    DELETE FROM {policy.table} WHERE id IN ("
+            f"        SELECT id FROM {policy.table} "
+            f"        WHERE {policy.condition} AND created_at < :cutoff "
+            f"        ORDER BY created_at "
+            f"        LIMIT :batch_size "
+            f"        FOR UPDATE SKIP LOCKED"
+            f"    ) "
+            f"    RETURNING *"
+            f") "
+            f"INSERT INTO {policy.archive_table} SELECT * FROM moved"
+        ),
+        {"cutoff": cutoff, "batch_size": batch_size},
+    )
+    return result.rowcount or 0
+
+
+def archive_table(
+    session: Session,
+    policy: ArchivePolicy,
+    now: datetime | None = None,
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+) -> int:
+    """
+    Kurala uyan eski satirlari batch'ler halinde arsive tasir.
+
+    Her batch ayri commit edilir; max_batches'e ulasilirsa kalan satirlar
+    sonraki calismada tasinir.
+
+    Returns:
+        Toplam tasinan satir sayisi.
+    """
+    now = now or datetime.now(UTC)
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    max_batches = max_batches or settings.ARCHIVE_MAX_BATCHES
+    cutoff = now - policy.age
+
+    if not ensure_partitions(session, policy, cutoff):
+        return 0
+    session.commit()
+
+    moved = 0
+    for _ in range(max_batches):
+        count = archive_batch(session, policy, cutoff, batch_size)
+        session.commit()
+        moved += count
+        if count < batch_size:
+            break
+
+    if moved:
+        logger.info("table_archived", table=policy.table, moved=moved, cutoff=cutoff.isoformat())
+    return moved
+
+
+def drop_expired_partitions(
+    session: Session, policy: ArchivePolicy, now: datetime | None = None
+) -> list[str]:
+    """
+    ARCHIVE_DROP_AFTER_MONTHS'tan eski arsiv partition'larini DROP eder.
+
+    Satir satir DELETE yerine partition DROP: aninda, WAL/vacuum yuku yok.
+
+    Returns:
+        Silinen partition adlari (ayar 0 ise her zaman bos).
+    """
+    if settings.ARCHIVE_DROP_AFTER_MONTHS <= 0:
+        return []
+    keep = max(settings.ARCHIVE_DROP_AFTER_MONTHS, policy.min_keep_months)
+    boundary = add_months(month_start(now or datetime.now(UTC)), -keep)
+
+    partitions = session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :parent"
+        ),
+        {"parent": policy.archive_table},
+    ).scalars().all()
+
+    dropped: list[str] = []
+    for name in sorted(partitions):
+        match = _PARTITION_SUFFIX.search(name)
+        if match is None:
+            continue
+        month = datetime(int(match[1]), int(match[2]), 1, tzinfo=UTC)
+        if add_months(month, 1) <= boundary:
+            session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            dropped.append(name)
+
+    if dropped:
+        logger.info("archive_partitions_dropped", table=policy.archive_table, partitions=dropped)
+    return dropped
@@ -17,6 +17,7 @@ Beat Schedule Task'lari:
 On-demand Task'lar:
     - trigger_matching_for_property  → Ilan icin eslestirme + bildirim
     - trigger_matching_for_customer  → Musteri icin eslestirme + bildirim
+    - run_portfolio_valuation        → Ofis portfoyunun toplu degerlemesi (valuations/tasks.py)
 
 Tum task'lar BaseTask'tan turetilir:
     - structlog entegrasyonu
@@ -0,0 +1,60 @@
+"""
+Emlak Teknoloji Platformu - Archive-and-Prune Task
+
+Celery Beat tarafindan saatte bir tetiklenir. Eski outbox / inbox /
+audit log satirlarini aylik arsiv partition'larina tasir
+ve suresi dolan arsiv partition'larini DROP eder
+(bkz. src.services.table_archiver).
+
+Tasarim notlari:
+    - Sync psycopg2 kullanir (drift_check ile ayni).
+    - Tablolar birbirinden bagimsizdir: birinin hatasi digerlerini durdurmaz.
+    - Tek calismada tablo basina en fazla ARCHIVE_MAX_BATCHES batch;
+      birikmis backlog birkac calismada erir.
+    - Queue: 'default'.
+"""
+
+from __future__ import annotations
+
+from src.celery_app import celery_app
+from src.core.sync_database import get_sync_session
+from src.services.table_archiver import (
+    archive_policies,
+    archive_table,
+    drop_expired_partitions,
+)
+from src.tasks.base import BaseTask
+
+
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    queue="default",
+    name="src.tasks.archive_prune.archive_old_rows",
+    # Bakim task'i — retry yapmasin, bir sonraki beat'te kaldigi yerden devam eder
+    autoretry_for=(),
+    max_retries=0,
+)
+def archive_old_rows(self) -> dict[str, int]:
+    """
+    Tum arsiv kurallarini uygular.
+
+    Returns:
+        dict: Tablo → tasinan satir sayisi (hata → -1).
+    """
+    self.log.info("archive_prune_started")
+    moved: dict[str, int] = {}
+
+    with get_sync_session() as session:
+        for policy in archive_policies():
+            try:
+                moved[policy.table] = archive_table(session, policy)
+                drop_expired_partitions(session, policy)
+                session.commit()
+            except Exception:
+                session.rollback()
+                moved[policy.table] = -1
+                self.log.exception("archive_prune_table_failed", table=policy.table)
+
+    self.log.info("archive_prune_completed", moved=moved)
+    return moved
@@ -11,7 +11,8 @@ Beat Schedule:
 
 Mimari:
     - Celery worker sync (psycopg2) — async loop YOK
-    - Async API client'lar asyncio.run() ile cagirilir
+    - Async API client'lar run_async() ile worker'in kalici loop'unda cagirilir
+      (HTTP client ilceler ve task'lar arasinda paylasilir)
     - Her ilce icin bagimsiz try/except — bir ilce hatasi digerlerini bloklamaz
     - UPSERT (INSERT ON CONFLICT DO UPDATE) ile idempotent guncelleme
     - Normalizasyon ve UPSERT isleri ayri modullere delege edilir:
@@ -22,7 +23,6 @@ Mimari:
 
 from __future__ import annotations
 
-import asyncio
 import time
 from datetime import UTC, date, datetime
 from typing import Any
@@ -32,6 +32,7 @@ import structlog
 from src.celery_app import celery_app
 from src.config import settings
 from src.core.sync_database import get_sync_session
+from src.core.worker_runtime import run_async
 from src.modules.data_pipeline.district_centers import get_all_districts
 from src.modules.data_pipeline.normalizers import normalize_area_analysis
 from src.modules.data_pipeline.normalizers.provenance_builder import build_provenance_fields
@@ -156,7 +157,7 @@ def refresh_area_data(self: BaseTask) -> dict[str, int]:
             if city not in hpi_cache:
                 plate_code = _CITY_PLATE_CODES.get(city)
                 try:
-                    hpi_result = asyncio.run(_fetch_tcmb_hpi(plate_code))
+                    hpi_result = run_async(_fetch_tcmb_hpi(plate_code))
                     hpi_cache[city] = hpi_result
                 except Exception as exc:
                     self.log.warning(
@@ -175,7 +176,7 @@ def refresh_area_data(self: BaseTask) -> dict[str, int]:
 
             # ── TUIK Nufus ──
             try:
-                pop_result = asyncio.run(_fetch_tuik_population(city, district))
+                pop_result = run_async(_fetch_tuik_population(city, district))
             except Exception as exc:
                 self.log.warning(
                     "area_refresh_population_failed",
@@ -9,7 +9,7 @@ Beat Schedule:
 
 Mimari:
     - DB erisimi: Sync psycopg2 (get_sync_session)
-    - Telegram gonderimi: asyncio.run() ile tek seferlik async cagri
+    - Telegram gonderimi: run_async() ile worker'in kalici loop'unda async cagri
       (aiogram async API — Celery prefork worker'da event loop yok)
     - TelegramAdapter: task basina olusturulur/kapatilir (HTTP session leak yok)
     - Hata izolasyonu: Bir ofis basarisiz olursa diger ofisler etkilenmez
@@ -20,7 +20,6 @@ Referans: TASK-136, drift_check.py (sync DB), matches/tasks.py (Telegram pattern
 
 from __future__ import annotations
 
-import asyncio
 import contextlib
 from typing import Any
 
@@ -29,6 +28,7 @@ import structlog
 from src.celery_app import celery_app
 from src.config import settings
 from src.core.sync_database import get_sync_session
+from src.core.worker_runtime import run_async
 from src.models.user import User
 from src.modules.messaging.schemas import MessageContent
 from src.modules.reporting.daily_report_service import (
@@ -93,7 +93,7 @@ def _send_report_for_office(
 
     for chat_id in admin_chat_ids:
         try:
-            success = asyncio.run(_send_telegram_report(chat_id, telegram_text))
+            success = run_async(_send_telegram_report(chat_id, telegram_text))
             if success:
                 sent_count += 1
             else:
@@ -139,7 +139,7 @@ def send_daily_office_reports(self: BaseTask) -> dict[str, Any]:
     Islem akisi:
         1. Tum aktif ofisler icin rapor verilerini topla (sync DB)
         2. Her ofis icin yonetici(lerin) telegram_chat_id'lerini bul
-        3. Telegram'a gonder (asyncio.run — aiogram)
+        3. Telegram'a gonder (run_async — aiogram)
         4. Sonuclari logla
 
     Hata izolasyonu:
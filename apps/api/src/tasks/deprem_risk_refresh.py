@@ -12,7 +12,7 @@ Beat Schedule:
 
 Mimari:
     - Celery worker sync (psycopg2) — async loop YOK
-    - Async AFAD client asyncio.run() ile cagirilir
+    - Async AFAD client run_async() ile worker'in kalici loop'unda cagirilir
     - Her ilce icin bagimsiz try/except — bir ilce hatasi digerlerini bloklamaz
     - Normalizasyon ve UPSERT isleri ayri modullere delege edilir:
       - normalizers.normalize_deprem_risk() — API response -> dict
@@ -30,7 +30,6 @@ PGA -> Risk Skoru Donusum Tablosu:
 
 from __future__ import annotations
 
-import asyncio
 import time
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -39,6 +38,7 @@ import structlog
 
 from src.celery_app import celery_app
 from src.core.sync_database import get_sync_session
+from src.core.worker_runtime import run_async
 from src.modules.data_pipeline.district_centers import get_all_districts
 from src.modules.data_pipeline.normalizers import normalize_deprem_risk
 from src.modules.data_pipeline.normalizers.area_normalizer import safe_decimal
@@ -116,7 +116,7 @@ def refresh_deprem_risk(self: BaseTask) -> dict[str, int]:
         try:
             # ── AFAD API'den deprem tehlike verisi ──
             try:
-                hazard_data = asyncio.run(
+                hazard_data = run_async(
                     _fetch_earthquake_hazard(lat, lon)
                 )
             except Exception as exc:
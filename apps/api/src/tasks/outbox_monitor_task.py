@@ -7,7 +7,8 @@ Outbox metriklerini toplar, stuck event'leri tespit eder ve structlog ile loglar
 Tasarim notlari:
     - Beat task'lari request_id tasimaz → None-safe handling (BaseTask halleder).
     - Senkron task — Celery worker'da calisir (sync event loop ile async cagri).
-    - OutboxMonitor async metotlari asyncio.run() ile calistirilir.
+    - OutboxMonitor async metotlari run_async() ile worker'in kalici loop'unda
+      calistirilir (DB baglanti havuzu task'lar arasinda korunur).
     - Queue: 'default' (outbox queue sadece poll task'i icindir).
 
 Referans: TASK-040
@@ -15,10 +16,10 @@ Referans: TASK-040
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from src.celery_app import celery_app
+from src.core.worker_runtime import run_async
 from src.database import async_session_factory
 from src.services.outbox_monitor import OutboxMonitor
 from src.tasks.base import BaseTask
@@ -48,10 +49,10 @@ def monitor_outbox_health(self) -> dict[str, Any]:
     monitor = OutboxMonitor(async_session_factory)
 
     # --- Metrikleri topla ---
-    stats = asyncio.run(monitor.collect_metrics())
+    stats = run_async(monitor.collect_metrics())
 
     # --- Stuck event tespiti ---
-    stuck_events = asyncio.run(monitor.check_stuck_events())
+    stuck_events = run_async(monitor.check_stuck_events())
 
     # --- Structlog ile raporla ---
     self.log.info(
@@ -4,9 +4,14 @@ Emlak Teknoloji Platformu - Outbox Polling Task
 Transactional Outbox Pattern implementasyonu.
 
 Celery Beat tarafindan 5 saniyede bir tetiklenir.
-outbox tablosundaki islenmemis event'leri okur,
-ilgili handler'lara dispatch eder ve
-basarili olanlari "processed" olarak isaretler.
+outbox tablosundaki islenmemis event'leri claim eder (FOR UPDATE SKIP
+LOCKED), ilgili handler'lara dispatch eder ve sonuclari toplu yazar
+(bkz. src.services.outbox_worker).
+
+Yeni event'ler normalde API worker'larindaki OutboxListener tarafindan
+NOTIFY ile milisaniyeler icinde islenir. Bu task yedektir:
+    - Zamani gelen retry'lar (next_retry_at) bildirim uretmez
+    - OUTBOX_LISTEN_ENABLED=False veya listener baglantisi kopuk
 
 Bu pattern sayesinde:
     - DB transaction + event publish atomik olur
@@ -15,44 +20,45 @@ Bu pattern sayesinde:
 """
 
 from src.celery_app import celery_app
+from src.core.worker_runtime import run_async
+from src.database import async_session_factory
+from src.services.outbox_worker import OutboxWorker
 from src.tasks.base import BaseTask
 
+# Process basina tek worker: handler semaforlari task'lar arasinda korunur
+_worker: OutboxWorker | None = None
+
+
+def _get_worker() -> OutboxWorker:
+    global _worker
+    if _worker is None:
+        _worker = OutboxWorker(async_session_factory)
+    return _worker
 
-@celery_app.task(bind=True, base=BaseTask, queue="outbox", name="src.tasks.outbox_poll.poll_outbox")
+
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    queue="outbox",
+    name="src.tasks.outbox_poll.poll_outbox",
+    # Basarisiz event'lerin retry'i RetryPolicy'dedir; task bir sonraki beat'te tekrar calisir
+    autoretry_for=(),
+    max_retries=0,
+)
 def poll_outbox(self) -> dict:
     """
-    Outbox tablosundan islenmemis event'leri oku ve dispatch et.
+    Outbox kuyrugunu bosaltir (en fazla OUTBOX_DRAIN_MAX_BATCHES batch).
 
     Celery Beat tarafindan 5 saniyede bir cagirilir.
-    Senkron task — Celery worker'da calisir (async degil).
+    Senkron task — async dispatcher run_async() ile worker'in kalici
+    loop'unda calisir (DB baglanti havuzu task'lar arasinda korunur).
 
     Returns:
-        dict: Islenen event sayisi ve detaylari.
-
-    TODO: Outbox modeli ve dispatch mekanizmasi TASK-029'da implement edilecek.
-          Asagidaki placeholder, Celery altyapisinin dogru calistigini dogrular.
+        dict: Basariyla islenen event sayisi.
     """
     self.log.debug("outbox_poll_started")
 
-    # TODO: Asagidaki kisim outbox modeli hazir olunca implement edilecek:
-    #
-    # 1. Outbox tablosundan status='pending' kayitlari oku (SELECT ... FOR UPDATE SKIP LOCKED)
-    # 2. Her event icin ilgili handler'i cagir
-    # 3. Basarili olanlari status='processed' olarak guncelle
-    # 4. Basarisiz olanlari retry_count++ ile birak
-    #
-    # Ornek:
-    #   from src.database import sync_session_factory
-    #   with sync_session_factory() as session:
-    #       events = session.execute(
-    #           select(OutboxEvent)
-    #           .where(OutboxEvent.status == "pending")
-    #           .with_for_update(skip_locked=True)
-    #           .limit(100)
-    #       ).scalars().all()
-    #       ...
-
-    processed_count = 0
+    processed_count = run_async(_get_worker().drain())
 
     self.log.debug(
         "outbox_poll_completed",
@@ -13,6 +13,12 @@ Akis:
     4. task_postrun: Worker tarafinda calisir,
        contextvars temizler (task izolasyonu, leak onleme)
 
+Worker process yasam dongusu (src.core.worker_runtime):
+    5. worker_process_init: Fork sonrasi her child process'te kalici
+       event loop kurulur (task'lar asyncio.run() yerine run_async kullanir)
+    6. worker_process_shutdown: Paylasilan HTTP client'lar ve DB engine
+       kapatilir
+
 Neden onemli:
     - Bir HTTP request birden fazla async task tetikleyebilir
     - request_id olmadan hangi task'in hangi request'ten geldigini bilemezsiniz
@@ -25,7 +31,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 import structlog
-from celery.signals import before_task_publish, task_postrun, task_prerun
+from celery.signals import (
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    worker_process_init,
+    worker_process_shutdown,
+)
+
+from src.core import worker_runtime
 
 if TYPE_CHECKING:
     from celery import Task
@@ -142,3 +156,29 @@ def clear_request_context(**kwargs: Any) -> None:
         (ornegin worker restart) bile context temiz kalir.
     """
     structlog.contextvars.clear_contextvars()
+
+
+# ---------------------------------------------------------------------------
+# 3) WORKER PROCESS LIFECYCLE — her prefork child process'te calisir
+# ---------------------------------------------------------------------------
+
+
+@worker_process_init.connect
+def start_worker_runtime(**kwargs: Any) -> None:
+    """
+    Child process fork edildikten sonra kalici event loop'u kurar.
+
+    worker_init yerine worker_process_init: loop ve soketler fork'tan
+    sonra, her child'da ayri olusturulmalidir.
+    """
+    worker_runtime.init_worker_process()
+
+
+@worker_process_shutdown.connect
+def stop_worker_runtime(**kwargs: Any) -> None:
+    """Child process kapanirken HTTP client'lari ve DB havuzunu kapatir."""
+    try:
+        worker_runtime.shutdown()
+    except Exception:
+        # Kapanis hatasi process cikisini engellememeli
+        logger.warning("worker_runtime_shutdown_failed", exc_info=True)
@@ -151,31 +151,37 @@ class TestMatchingTriggerFlow:
         assert callable(trigger_matching_after_customer_create)
 
     def test_trigger_property_create_calls_celery_delay(self) -> None:
-        """CROSS-TC-001: Property create trigger Celery .delay() cagirir."""
+        """CROSS-TC-001: Property create trigger Celery .delay() cagirir (debounce kapali)."""
         prop_id = uuid.uuid4()
         office_id = uuid.uuid4()
 
         mock_task = MagicMock()
         mock_task.delay.return_value = MagicMock()
 
-        with patch.dict(
-            "sys.modules",
-            {"src.modules.matches.tasks": MagicMock(trigger_matching_for_property=mock_task)},
+        with (
+            patch("src.config.settings.MATCH_TRIGGER_DEBOUNCE_SECONDS", 0),
+            patch.dict(
+                "sys.modules",
+                {"src.modules.matches.tasks": MagicMock(trigger_matching_for_property=mock_task)},
+            ),
         ):
             trigger_matching_after_property_create(prop_id, office_id)
             mock_task.delay.assert_called_once_with(str(prop_id), str(office_id))
 
     def test_trigger_customer_create_calls_celery_delay(self) -> None:
-        """CROSS-TC-003: Customer create trigger Celery .delay() cagirir."""
+        """CROSS-TC-003: Customer create trigger Celery .delay() cagirir (debounce kapali)."""
         cust_id = uuid.uuid4()
         office_id = uuid.uuid4()
 
         mock_task = MagicMock()
         mock_task.delay.return_value = MagicMock()
 
-        with patch.dict(
-            "sys.modules",
-            {"src.modules.matches.tasks": MagicMock(trigger_matching_for_customer=mock_task)},
+        with (
+            patch("src.config.settings.MATCH_TRIGGER_DEBOUNCE_SECONDS", 0),
+            patch.dict(
+                "sys.modules",
+                {"src.modules.matches.tasks": MagicMock(trigger_matching_for_customer=mock_task)},
+            ),
         ):
             trigger_matching_after_customer_create(cust_id, office_id)
             mock_task.delay.assert_called_once_with(str(cust_id), str(office_id))
@@ -0,0 +1,66 @@
+"""
+Drift günlük özeti — bozuk JSON değerleri rollup'ı düşürmemeli.
+
+prediction_logs.input_data / output_data serbest JSON'dur; sayısal olmayan
+bir değer ("120 m2", "yok") ::float8 cast hatasıyla tüm INSERT ... SELECT'i
+düşürüyordu. Bozuk alan NULL sayılmalı, satırın geri kalanı özete girmelidir.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+from src.ml.drift_stats import rollup_prediction_stats
+from src.models.prediction_daily_stats import PredictionDailyStats
+from src.models.prediction_log import PredictionLog
+from tests.conftest import OFFICE_A_ID
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# Başka testlerin tahminleriyle karışmaması için geçmiş bir gün
+_NOW = datetime(2020, 1, 15, 18, 0, tzinfo=UTC)
+
+# (input_data, output_data)
+_LOGS = [
+    ({"district": "Kadıköy", "net_sqm": 100, "room_count": 3, "living_room_count": 1},
+     {"estimated_price": 5_000_000}),
+    ({"district": "Kadıköy", "net_sqm": "120", "room_count": 2, "living_room_count": 1},
+     {"estimated_price": 4_000_000}),
+    # Bozuk satır: sayısal olmayan alan, "3+1" biçiminde oda sayısı
+    ({"district": "Beşiktaş", "net_sqm": "120 m2", "building_age": "", "room_count": "3+1"},
+     {"estimated_price": "yok"}),
+]
+
+
+class TestRollupMalformedValues:
+    """Sayısal olmayan değerler NULL sayılır, rollup tamamlanır."""
+
+    async def test_bad_row_skipped(self, db_session: AsyncSession, ensure_test_offices) -> None:
+        db_session.add_all(
+            PredictionLog(
+                id=uuid.uuid4(), office_id=OFFICE_A_ID, model_name="valuation",
+                model_version="v1", input_data=input_data, output_data=output_data,
+                created_at=_NOW.replace(hour=12),
+            )
+            for input_data, output_data in _LOGS
+        )
+        await db_session.flush()
+
+        await db_session.run_sync(lambda session: rollup_prediction_stats(session, now=_NOW))
+
+        stats = (
+            await db_session.execute(
+                select(PredictionDailyStats).where(PredictionDailyStats.day == _NOW.date())
+            )
+        ).scalar_one()
+        assert stats.prediction_count == 3
+        assert (stats.net_sqm_count, stats.net_sqm_sum) == (2, 220.0)
+        assert (stats.price_count, stats.price_min, stats.price_max) == (2, 4e6, 5e6)
+        assert stats.building_age_count == 0
+        assert stats.room_histogram == {"3+1": 1, "2+1": 1, "0+0": 1}
+        assert stats.district_histogram == {"Kadıköy": 2, "Beşiktaş": 1}
@@ -0,0 +1,153 @@
+"""
+Eşleştirme aday ön filtresi — tam tarama ile kayıpsızlık testi.
+
+Rastgele müşteri ve ilanlar DB'ye yazılır; her ilan (ve müşteri) için
+calculate_match_score ile tam taramada eşiği geçen her aday, SQL ön
+filtresinin döndürdüğü küme içinde olmalıdır.
+
+Veri kenar durumları: ters girilmiş bütçeler, ±%20 sınırındaki fiyatlar,
+parse edilemeyen oda değerleri ("stüdyo", "\\t2+1\\n"), sayı içeren ilçe
+dizileri, Türkçe büyük/küçük harf farkları (KADIKÖY / Kadıköy / kadikoy).
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+from src.models.customer import Customer
+from src.models.property import Property
+from src.modules.matches.matching_service import SCORE_THRESHOLD, calculate_match_score
+from src.modules.matches.prefilter import (
+    customer_candidate_filter,
+    property_candidate_filter,
+)
+from tests.conftest import OFFICE_A_ID
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+_ROOMS = [None, "", "  ", "1+1", "2+1", "3+1", " 3 + 1 ", "4", "5+2", "10+1", "stüdyo", "\t2+1\n"]
+_DISTRICTS = ["Kadıköy", "KADIKÖY", " kadıköy ", "Beşiktaş", "BEŞİKTAŞ", "Üsküdar", "Sarıyer"]
+_DESIRED = [
+    [], ["Kadıköy"], [" KADIKÖY"], ["beşiktaş ", "Sarıyer"], [42], ["Üsküdar", 7], ["ISPARTAKULE"],
+]
+_BUDGETS = [None, 1_000_000, 2_000_000, 4_000_000, 4_166_667, 5_000_000, 6_000_000]
+_PRICES = [900_000, 1_600_000, 2_400_000, 3_200_000, 5_000_000, 6_000_000, 7_200_000]
+_AREAS = [None, Decimal("48"), Decimal("95"), Decimal("121.25"), Decimal("240")]
+
+
+def _random_customer(rng: random.Random) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        budget_min=rng.choice(_BUDGETS),
+        budget_max=rng.choice(_BUDGETS),
+        desired_rooms=rng.choice(_ROOMS),
+        desired_area_min=rng.choice([None, 60, 100, 150]),
+        desired_area_max=rng.choice([None, 80, 120, 200]),
+        desired_districts=rng.choice(_DESIRED),
+    )
+
+
+def _random_property(rng: random.Random) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        price=Decimal(rng.choice(_PRICES)),
+        district=rng.choice(_DISTRICTS),
+        rooms=rng.choice(_ROOMS),
+        net_area=rng.choice(_AREAS),
+    )
+
+
+async def _seed(db: AsyncSession, customers, properties) -> None:
+    db.add_all(
+        Customer(
+            id=c.id, office_id=OFFICE_A_ID, full_name="Prefilter Test",
+            customer_type="buyer", budget_min=c.budget_min, budget_max=c.budget_max,
+            desired_rooms=c.desired_rooms, desired_area_min=c.desired_area_min,
+            desired_area_max=c.desired_area_max, desired_districts=c.desired_districts,
+        )
+        for c in customers
+    )
+    db.add_all(
+        Property(
+            id=p.id, office_id=OFFICE_A_ID, title="Prefilter Test",
+            property_type="daire", listing_type="sale", price=p.price,
+            city="İstanbul", district=p.district, rooms=p.rooms, net_area=p.net_area,
+        )
+        for p in properties
+    )
+    await db.flush()
+
+
+class TestMatchPrefilterLossless:
+    """Ön filtre eşiği geçen hiçbir eşleşmeyi kaybetmemeli."""
+
+    async def test_no_match_lost(self, db_session: AsyncSession, ensure_test_offices) -> None:
+        rng = random.Random(2026)
+        customers = [_random_customer(rng) for _ in range(300)]
+        properties = [_random_property(rng) for _ in range(300)]
+        await _seed(db_session, customers, properties)
+        customer_ids = {c.id for c in customers}
+        property_ids = {p.id for p in properties}
+
+        pruned = 0
+        for prop in properties[:60]:
+            result = await db_session.execute(
+                select(Customer.id).where(
+                    Customer.office_id == OFFICE_A_ID,
+                    customer_candidate_filter(prop),
+                )
+            )
+            candidates = set(result.scalars()) & customer_ids
+            pruned += len(customer_ids - candidates)
+            for customer in customers:
+                score, _ = calculate_match_score(prop, customer)
+                if score >= SCORE_THRESHOLD:
+                    assert customer.id in candidates, (vars(prop), vars(customer), score)
+
+        for customer in customers[:60]:
+            result = await db_session.execute(
+                select(Property.id).where(
+                    Property.office_id == OFFICE_A_ID,
+                    property_candidate_filter(customer),
+                )
+            )
+            candidates = set(result.scalars()) & property_ids
+            pruned += len(property_ids - candidates)
+            for prop in properties:
+                score, _ = calculate_match_score(prop, customer)
+                if score >= SCORE_THRESHOLD:
+                    assert prop.id in candidates, (vars(prop), vars(customer), score)
+
+        # Filtre gerçekten eleme yapıyor olmalı (aksi halde test anlamsız)
+        assert pruned > 0
+
+
+class TestRoomCountColumn:
+    """Property.room_count generated kolonu — taşan oda değeri yazmayı bozmamalı."""
+
+    async def test_oversized_rooms_still_saves(
+        self, db_session: AsyncSession, ensure_test_offices,
+    ) -> None:
+        values = {"3+1": 3, " 999 + 1 ": 999, "1000": None, "12345678901": None, "12345678901+1": None}
+        ids = {rooms: uuid.uuid4() for rooms in values}
+        db_session.add_all(
+            Property(
+                id=ids[rooms], office_id=OFFICE_A_ID, title="Oda Taşma Testi",
+                property_type="daire", listing_type="sale", price=Decimal(1_000_000),
+                city="İstanbul", district="Kadıköy", rooms=rooms,
+            )
+            for rooms in values
+        )
+        await db_session.flush()
+
+        result = await db_session.execute(
+            select(Property.rooms, Property.room_count).where(Property.id.in_(ids.values()))
+        )
+        assert dict(result.all()) == values
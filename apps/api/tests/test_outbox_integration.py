@@ -2,7 +2,7 @@
 Emlak Teknoloji Platformu - Outbox Integration Tests (TASK-043)
 
 Outbox pattern tam entegrasyon test suite'i:
-    - OutboxWorker: poll_and_process, _acquire_events, _process_event
+    - OutboxWorker: poll_and_process, _acquire_events, handler dispatch
     - RetryPolicy entegrasyonu: transient/permanent hata ayirimi
     - DLQ (Dead Letter Queue): listeleme, retry, purge
     - Messaging entegrasyonu: event → mesaj gonderim akisi (mock)
@@ -21,9 +21,8 @@ from __future__ import annotations
 import uuid
 from unittest.mock import patch
 
-from sqlalchemy import text
-
 from src.services.dlq_service import DLQService
+from src.services.outbox_handlers import OutboxHandlerRegistry
 from src.services.outbox_worker import OutboxWorker
 from src.services.retry_policy import get_policy_for_event
 from tests.conftest import (
@@ -33,6 +32,17 @@ from tests.conftest import (
 )
 
 
+def _worker_raising(event_type: str, exc: Exception) -> OutboxWorker:
+    """Handler'i verilen exception'i firlatan worker."""
+
+    async def _handler(event):
+        raise exc
+
+    registry = OutboxHandlerRegistry()
+    registry.register(event_type, _handler)
+    return OutboxWorker(test_session_factory, handlers=registry)
+
+
 # ================================================================
 # Test Outbox Worker Basic Flow
 # ================================================================
@@ -153,16 +163,16 @@ class TestOutboxRetryPolicy:
     """
     Retry mekanizmasi ve error classification integration testleri.
 
-    Worker'in _process_event metodunda hata olusmasi durumunda
-    retry/DLQ karari dogru verildigini dogrular.
+    Handler'da hata olusmasi durumunda retry/DLQ karari dogru
+    verildigini dogrular.
     """
 
     async def test_transient_error_outer_handler_does_not_crash(self, create_outbox_event):
         """
-        _process_event tamamen basarisiz olursa worker CRASH etmez.
+        Sonuc yazimi tamamen basarisiz olursa worker CRASH etmez.
 
-        poll_and_process'teki outer try/except exception'i yakalar,
-        event 'processing' durumunda kalir (stuck event haline gelir).
+        poll_and_process exception'i yakalar, event 'processing'
+        durumunda kalir (stuck event haline gelir).
         Stuck event recovery OutboxMonitor.force_release_stuck ile yapilir.
         """
         event_id = await create_outbox_event(
@@ -172,14 +182,14 @@ class TestOutboxRetryPolicy:
 
         worker = OutboxWorker(test_session_factory)
 
-        async def _total_failure(session, event):
+        async def _total_failure(session, outcomes):
             raise ConnectionError("Catastrophic failure")
 
-        with patch.object(worker, "_process_event", side_effect=_total_failure):
+        with patch.object(worker, "_apply_outcomes", side_effect=_total_failure):
             # Worker crash ETMEMELI — exception loglayip devam etmeli
             processed = await worker.poll_and_process(batch_size=1)
 
-        # Exception firladigi icin processed sayilmaz
+        # Sonuc yazilamadigi icin processed sayilmaz
         assert processed == 0
 
         # Event 'processing' durumunda kaldi (stuck)
@@ -189,55 +199,16 @@ class TestOutboxRetryPolicy:
 
     async def test_transient_error_retry_via_inner_handler(self, create_outbox_event):
         """
-        Transient hata: _process_event icindeki try/except ile retry.
-
-        Worker'in event processing icindeki UPDATE'i ConnectionError firlatacak
-        sekilde mock'lanir. Retry mantigi devreye girer.
+        Transient hata: handler ConnectionError firlatir, event retry'a alinir.
         """
         event_id = await create_outbox_event(
             event_type="notification",  # max_retries=3
             retry_count=0,
         )
 
-        worker = OutboxWorker(test_session_factory)
-
-        # _process_event icindeki UPDATE basarisiz olsun
-        with patch.object(worker, "_process_event", wraps=worker._process_event) as mock_proc:
-            # Gercek _process_event'i cagirmak yerine, event'in retry'a alinmasini
-            # simule eden bir akis olustur
-            async def _transient_failure(session, event):
-                """Simulated transient failure — event retry'a alinir."""
-                from src.services.retry_policy import get_policy_for_event as _get_policy
-
-                policy = _get_policy(event.event_type)
-                exc = ConnectionError("Simulated network error")
-                new_retry_count = event.retry_count + 1
-                backoff = policy.calculate_next_retry(new_retry_count)
-
-                await session.execute(
-                    text(
-                        "UPDATE outbox_events "
-                        "SET status = 'pending', "
-                        "    retry_count = :retry_count, "
-                        "    error_message = :error_message, "
-                        "    next_retry_at = now() + interval '1 second' * :backoff, "
-                        "    locked_at = NULL, "
-                        "    locked_by = NULL "
-                        "WHERE id = :event_id"
-                    ),
-                    {
-                        "retry_count": new_retry_count,
-                        "error_message": str(exc)[:500],
-                        "backoff": backoff,
-                        "event_id": event.id,
-                    },
-                )
-                raise exc
-
-            mock_proc.side_effect = _transient_failure
-
-            # Exception loglanir ama suppress edilir
-            await worker.poll_and_process(batch_size=1)
+        worker = _worker_raising("notification", ConnectionError("Simulated network error"))
+        processed = await worker.poll_and_process(batch_size=1)
+        assert processed == 0
 
         state = await get_outbox_event_status(event_id)
         assert state is not None
@@ -245,6 +216,7 @@ class TestOutboxRetryPolicy:
         assert state["retry_count"] == 1
         assert state["error_message"] is not None
         assert "network error" in state["error_message"].lower()
+        assert state["locked_by"] is None
 
     async def test_permanent_error_goes_to_dlq(self, create_outbox_event):
         """
@@ -255,35 +227,13 @@ class TestOutboxRetryPolicy:
             retry_count=0,
         )
 
-        worker = OutboxWorker(test_session_factory)
-
-        async def _permanent_failure(session, event):
-            """Simulated permanent failure → direkt DLQ."""
-            exc = ValueError("Invalid payload format")
-            await session.execute(
-                text(
-                    "UPDATE outbox_events "
-                    "SET status = 'dead_letter', "
-                    "    retry_count = :retry_count, "
-                    "    error_message = :error_message, "
-                    "    locked_at = NULL, "
-                    "    locked_by = NULL "
-                    "WHERE id = :event_id"
-                ),
-                {
-                    "retry_count": event.retry_count + 1,
-                    "error_message": str(exc)[:500],
-                    "event_id": event.id,
-                },
-            )
-            raise exc
-
-        with patch.object(worker, "_process_event", side_effect=_permanent_failure):
-            await worker.poll_and_process(batch_size=1)
+        worker = _worker_raising("notification", ValueError("Invalid payload format"))
+        await worker.poll_and_process(batch_size=1)
 
         state = await get_outbox_event_status(event_id)
         assert state is not None
         assert state["status"] == "dead_letter"
+        assert state["retry_count"] == 1
 
     async def test_max_retries_exceeded_goes_to_dlq(self, create_outbox_event):
         """
@@ -297,34 +247,8 @@ class TestOutboxRetryPolicy:
             max_retries=3,
         )
 
-        worker = OutboxWorker(test_session_factory)
-
-        async def _max_retry_failure(session, event):
-            """Max retries asildi → DLQ."""
-            exc = ConnectionError("Still failing")
-            new_count = event.retry_count + 1
-            policy = get_policy_for_event(event.event_type)
-
-            if not policy.should_retry(new_count, exc):
-                await session.execute(
-                    text(
-                        "UPDATE outbox_events "
-                        "SET status = 'dead_letter', "
-                        "    retry_count = :retry_count, "
-                        "    error_message = :error_message, "
-                        "    locked_at = NULL, locked_by = NULL "
-                        "WHERE id = :event_id"
-                    ),
-                    {
-                        "retry_count": new_count,
-                        "error_message": str(exc)[:500],
-                        "event_id": event.id,
-                    },
-                )
-            raise exc
-
-        with patch.object(worker, "_process_event", side_effect=_max_retry_failure):
-            await worker.poll_and_process(batch_size=1)
+        worker = _worker_raising("notification", ConnectionError("Still failing"))
+        await worker.poll_and_process(batch_size=1)
 
         state = await get_outbox_event_status(event_id)
         assert state is not None
@@ -617,9 +541,9 @@ class TestOutboxMessagingIntegration:
     Worker event'i islerken messaging adapter'i cagrilir (mock).
     Gercek Telegram API cagrisi YAPILMAZ.
 
-    NOT: OutboxWorker._process_event'te simdilik sadece status
-    guncelleniyor (TODO: event routing). Bu testler gelecekteki
-    messaging entegrasyonu icin contract test gorevi gorur.
+    NOT: telegram_message icin henuz handler kayitli degil; handler'siz
+    tipler 'sent' isaretlenir. Bu testler gelecekteki messaging
+    entegrasyonu icin contract test gorevi gorur.
     """
 
     async def test_telegram_message_event_sends(
@@ -662,7 +586,7 @@ class TestOutboxMessagingIntegration:
         """
         Messaging adapter basarisiz olursa event retry'a gider.
 
-        Worker'in _process_event'inde ConnectionError firlatilir,
+        telegram_message handler'i ConnectionError firlatir,
         retry mantigi devreye girer.
         """
         event_id = await create_outbox_event(
@@ -670,36 +594,8 @@ class TestOutboxMessagingIntegration:
             retry_count=0,
         )
 
-        worker = OutboxWorker(test_session_factory)
-
-        async def _messaging_failure(session, event):
-            """Messaging adapter'dan gelen transient hata."""
-            exc = ConnectionError("Telegram API unreachable")
-            new_count = event.retry_count + 1
-            policy = get_policy_for_event(event.event_type)
-            backoff = policy.calculate_next_retry(new_count)
-
-            await session.execute(
-                text(
-                    "UPDATE outbox_events "
-                    "SET status = 'pending', "
-                    "    retry_count = :retry_count, "
-                    "    error_message = :error_message, "
-                    "    next_retry_at = now() + interval '1 second' * :backoff, "
-                    "    locked_at = NULL, locked_by = NULL "
-                    "WHERE id = :event_id"
-                ),
-                {
-                    "retry_count": new_count,
-                    "error_message": str(exc)[:500],
-                    "backoff": backoff,
-                    "event_id": event.id,
-                },
-            )
-            raise exc
-
-        with patch.object(worker, "_process_event", side_effect=_messaging_failure):
-            await worker.poll_and_process(batch_size=1)
+        worker = _worker_raising("telegram_message", ConnectionError("Telegram API unreachable"))
+        await worker.poll_and_process(batch_size=1)
 
         state = await get_outbox_event_status(event_id)
         assert state["status"] == "pending"  # Retry icin pending'e dondu
@@ -0,0 +1,176 @@
+"""
+Ofis bazlı toplu eşleştirme — incremental çalıştırmanın doğruluk testi.
+
+Tam bir çalıştırmadan sonra bir ilan ve bir müşteri güncellenir; ikinci
+(incremental) çalıştırma yalnızca bu satırlara dokunan çiftleri skorlamalı,
+sonuç sıfırdan tam hesaplamayla birebir aynı olmalı ve watermark ilerlemeli.
+
+rematch_office parçalar arasında commit ettiğinden test kendi ofisini açar
+ve sonunda tüm verisini siler.
+"""
+
+from __future__ import annotations
+
+import uuid
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import delete, func, select, update
+
+from src.models.customer import Customer
+from src.models.match import MatchRematchState, PropertyCustomerMatch
+from src.models.office import Office
+from src.models.property import Property
+from src.modules.matches import rematch
+from src.modules.matches.rematch import rematch_office
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# (fiyat, ilçe, oda, net alan)
+_PROPERTIES = [
+    (2_500_000, "Kadıköy", "3+1", Decimal("120")),
+    (2_800_000, "Kadıköy", "2+1", Decimal("95")),
+    (8_000_000, "Kadıköy", "3+1", Decimal("120")),
+    (2_400_000, "Beşiktaş", "3+1", Decimal("110")),
+]
+# (bütçe alt, bütçe üst, oda, ilçeler)
+_CUSTOMERS = [
+    (2_000_000, 3_000_000, "3+1", ["Kadıköy"]),
+    (2_000_000, 3_000_000, "2+1", ["Kadıköy", "Beşiktaş"]),
+    (500_000, 600_000, "3+1", ["Kadıköy"]),
+]
+
+
+async def _seed(db: AsyncSession, office_id: uuid.UUID) -> tuple[list, list]:
+    db.add(Office(
+        id=office_id, name="Rematch Test", slug=f"rematch-{office_id.hex[:12]}",
+        city="İstanbul", district="Kadıköy",
+    ))
+    await db.flush()
+    properties = [
+        Property(
+            office_id=office_id, title="Rematch Test", property_type="daire",
+            listing_type="sale", price=Decimal(price), city="İstanbul",
+            district=district, rooms=rooms, net_area=net_area,
+        )
+        for price, district, rooms, net_area in _PROPERTIES
+    ]
+    customers = [
+        Customer(
+            office_id=office_id, full_name="Rematch Test", customer_type="buyer",
+            budget_min=budget_min, budget_max=budget_max, desired_rooms=rooms,
+            desired_districts=districts,
+        )
+        for budget_min, budget_max, rooms, districts in _CUSTOMERS
+    ]
+    db.add_all([*properties, *customers])
+    await db.commit()
+    return [p.id for p in properties], [c.id for c in customers]
+
+
+async def _matches(db: AsyncSession, office_id: uuid.UUID) -> dict[tuple, float]:
+    result = await db.execute(
+        select(
+            PropertyCustomerMatch.property_id,
+            PropertyCustomerMatch.customer_id,
+            PropertyCustomerMatch.score,
+        ).where(PropertyCustomerMatch.office_id == office_id)
+    )
+    return {(pid, cid): round(float(score), 2) for pid, cid, score in result.all()}
+
+
+async def _watermark(db: AsyncSession, office_id: uuid.UUID) -> datetime:
+    result = await db.execute(
+        select(MatchRematchState.watermark).where(MatchRematchState.office_id == office_id)
+    )
+    return result.scalar_one()
+
+
+async def _cleanup(db: AsyncSession, office_id: uuid.UUID) -> None:
+    await db.rollback()
+    for model in (PropertyCustomerMatch, MatchRematchState, Property, Customer):
+        await db.execute(delete(model).where(model.office_id == office_id))
+    await db.execute(delete(Office).where(Office.id == office_id))
+    await db.commit()
+
+
+@pytest.fixture
+def scored_pairs(monkeypatch: pytest.MonkeyPatch) -> set[tuple]:
+    """rematch'in skorladığı (ilan, müşteri) çiftlerini kaydeder."""
+    pairs: set[tuple] = set()
+    by_property = rematch.score_customers_for_property
+    by_customer = rematch.score_properties_for_customer
+
+    def _by_property(prop, customers):
+        pairs.update((prop.id, cid) for cid in customers.ids)
+        return by_property(prop, customers)
+
+    def _by_customer(customer, properties):
+        pairs.update((pid, customer.id) for pid in properties.ids)
+        return by_customer(customer, properties)
+
+    monkeypatch.setattr(rematch, "score_customers_for_property", _by_property)
+    monkeypatch.setattr(rematch, "score_properties_for_customer", _by_customer)
+    return pairs
+
+
+class TestIncrementalRematch:
+    """Incremental çalıştırma = sıfırdan tam hesaplama, sadece değişen çiftlerle."""
+
+    async def test_only_changed_pairs_rescored(
+        self,
+        db_session: AsyncSession,
+        scored_pairs: set[tuple],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(rematch.settings, "MATCH_REMATCH_WATERMARK_LAG_SECONDS", 0)
+        office_id = uuid.uuid4()
+        try:
+            property_ids, customer_ids = await _seed(db_session, office_id)
+
+            first = await rematch_office(db_session, office_id)
+            assert first.mode == "full"
+            assert scored_pairs == {(p, c) for p in property_ids for c in customer_ids}
+            before = await _matches(db_session, office_id)
+            first_watermark = await _watermark(db_session, office_id)
+
+            # updated_at DB saatiyle yazılır — watermark ile aynı saat kaynağı
+            changed_property, changed_customer = property_ids[2], customer_ids[2]
+            await db_session.execute(
+                update(Property)
+                .where(Property.id == changed_property)
+                .values(price=Decimal(2_600_000), updated_at=func.now())
+            )
+            await db_session.execute(
+                update(Customer)
+                .where(Customer.id == changed_customer)
+                .values(budget_min=2_000_000, budget_max=3_000_000, updated_at=func.now())
+            )
+            await db_session.commit()
+            scored_pairs.clear()
+
+            second = await rematch_office(db_session, office_id)
+            assert second.mode == "incremental"
+            assert (second.changed_properties, second.changed_customers) == (1, 1)
+            assert scored_pairs == (
+                {(changed_property, c) for c in customer_ids}
+                | {(p, changed_customer) for p in property_ids}
+            )
+            assert second.pairs_scored == len(customer_ids) + len(property_ids) - 1
+            assert await _watermark(db_session, office_id) > first_watermark
+
+            incremental = await _matches(db_session, office_id)
+            assert incremental != before
+
+            await db_session.execute(
+                delete(PropertyCustomerMatch).where(PropertyCustomerMatch.office_id == office_id)
+            )
+            await db_session.commit()
+            await rematch_office(db_session, office_id, full=True)
+            assert await _matches(db_session, office_id) == incremental
+        finally:
+            await _cleanup(db_session, office_id)
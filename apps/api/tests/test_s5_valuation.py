@@ -8,10 +8,11 @@ Test kategorileri:
   2. Anomali tespiti (confidence interval sinir degerleri) — 5 test
   3. Confidence interval (ConfidencePredictor) — 7 test
   4. Schema dogrulamalari (Pydantic) — 6 test
-  5. InferenceService (predict_quick mock) — 5 test
-  6. Feature engineering (FeatureEngineer) — 6 test
+  5. InferenceService (predict_quick / predict_batch mock) — 7 test
+  6. Feature engineering (FeatureEngineer) — 7 test
+  7. Toplu inference esdegerligi (gercek LightGBM) — 2 test
 
-Toplam: 35 test
+Toplam: 40 test
 """
 
 from __future__ import annotations
@@ -383,6 +384,8 @@ class TestInferenceService:
         mock_fe = MagicMock()
         mock_fe.transform.return_value = pd.DataFrame([[0] * 5])
         mock_trainer.fe = mock_fe
+        # predict_batch: ana model feature matrisi uzerinde bir kez calisir
+        mock_trainer.model.predict.return_value = np.array([5_000_000.0])
         svc.trainer = mock_trainer
 
         # Mock confidence predictor
@@ -393,6 +396,9 @@ class TestInferenceService:
             "high": 5_800_000,
             "confidence_level": 0.80,
         }
+        mock_ci.predict_batch_with_confidence.return_value = [
+            mock_ci.predict_with_confidence.return_value,
+        ]
         svc.confidence_predictor = mock_ci
 
         return svc
@@ -443,6 +449,33 @@ class TestInferenceService:
         svc = self._create_service()
         assert svc._model_version == "v1-test"
 
+    def test_predict_batch_single_feature_pass(self) -> None:
+        """Ana model ve quantile modeller ayni feature matrisini bir kez kullanmali."""
+        svc = self._create_service()
+        svc.trainer.model.predict.return_value = np.array([5_000_000.0, 3_000_000.0])
+        svc.confidence_predictor.predict_batch_with_confidence.return_value = [
+            {"predicted": 5_000_000, "low": 4_200_000, "high": 5_800_000, "confidence_level": 0.80},
+            {"predicted": 3_000_000, "low": 2_500_000, "high": 3_600_000, "confidence_level": 0.80},
+        ]
+
+        results = svc.predict_batch([
+            {"district": "Kadikoy", "net_sqm": 120},
+            {"district": "Uskudar", "net_sqm": 90},
+        ])
+
+        assert [r["estimated_price"] for r in results] == [5_000_000, 3_000_000]
+        assert results[1]["confidence_low"] == 2_500_000
+        svc.trainer.fe.transform.assert_called_once()
+        svc.trainer.model.predict.assert_called_once()
+        _, kwargs = svc.confidence_predictor.predict_batch_with_confidence.call_args
+        assert kwargs["predicted"] is svc.trainer.model.predict.return_value
+
+    def test_predict_batch_empty(self) -> None:
+        """Bos girdi listesi model cagirmadan bos liste donmeli."""
+        svc = self._create_service()
+        assert svc.predict_batch([]) == []
+        svc.trainer.model.predict.assert_not_called()
+
 
 # ================================================================
 # 6. Feature Engineering Testleri
@@ -549,6 +582,29 @@ class TestFeatureEngineering:
 
         assert list(x_new.columns) == fe.feature_columns
 
+    def test_transform_batch_matches_label_encoder(self) -> None:
+        """Vektorel kod sozlugu LabelEncoder.transform ile ayni kodlari uretmeli."""
+        fe = FeatureEngineer()
+        train_df = self._sample_train_df()
+        fe.fit_transform(train_df)
+
+        new_df = train_df.drop(columns=["price"]).copy()
+        new_df.loc[1, "district"] = "Sariyer"
+        new_df.loc[3, "heating_type"] = "Soba"
+        x_batch = fe.transform(new_df)
+
+        for col, le in fe.label_encoders.items():
+            expected = [
+                int(le.transform([v])[0]) if v in set(le.classes_) else -1
+                for v in new_df[col].astype(str)
+            ]
+            assert x_batch[col].tolist() == expected
+
+        # N satir tek seferde == satir satir donusum
+        for i in range(len(new_df)):
+            x_row = fe.transform(new_df.iloc[[i]].reset_index(drop=True))
+            assert x_batch.iloc[i].tolist() == x_row.iloc[0].tolist()
+
     def test_get_feature_names_after_fit(self) -> None:
         """get_feature_names() egitim sonrasi dolu liste donmeli."""
         fe = FeatureEngineer()
@@ -559,3 +615,78 @@ class TestFeatureEngineering:
         assert len(names) > 0
         assert "net_sqm" in names
         assert "price" not in names
+
+
+# ================================================================
+# 7. Toplu Inference Esdegerligi (gercek LightGBM)
+# ================================================================
+
+
+class TestPredictBatchEquivalence:
+    """predict_batch tek tek tahmin yolu ile ayni sonuclari uretmeli."""
+
+    @staticmethod
+    def _train_service(with_confidence: bool):
+        import lightgbm as lgb
+
+        from src.ml.trainer import ModelTrainer
+        from src.modules.valuations.inference_service import InferenceService
+
+        rng = np.random.default_rng(3)
+        n = 300
+        df = pd.DataFrame({
+            "district": rng.choice(["Kadikoy", "Uskudar", "Besiktas", "Atasehir"], n),
+            "neighborhood": rng.choice(["Moda", "Caferaga", "Ortakoy", "Kuzguncuk"], n),
+            "property_type": rng.choice(["Daire", "Villa"], n),
+            "heating_type": rng.choice(["Kombi", "Merkezi"], n),
+            "net_sqm": rng.uniform(50, 250, n),
+            "gross_sqm": rng.uniform(60, 300, n),
+            "room_count": rng.integers(1, 6, n),
+            "living_room_count": rng.integers(1, 3, n),
+            "floor": rng.integers(0, 15, n),
+            "total_floors": rng.integers(1, 20, n),
+            "building_age": rng.integers(0, 40, n),
+        })
+        df["price"] = df["net_sqm"] * 40_000 + rng.normal(0, 300_000, n)
+
+        trainer = ModelTrainer(FeatureEngineer())
+        x_features, y = trainer.fe.fit_transform(df)
+        params = {"n_estimators": 30, "verbose": -1, "random_state": 0}
+        trainer.model = lgb.LGBMRegressor(**params).fit(x_features, y)
+
+        svc = InferenceService()
+        svc.trainer = trainer
+        svc._model_loaded = True
+        svc._has_confidence = with_confidence
+        if with_confidence:
+            predictor = ConfidencePredictor()
+            predictor.main_model = trainer.model
+            predictor.q10_model = lgb.LGBMRegressor(
+                objective="quantile", alpha=0.1, **params,
+            ).fit(x_features, y)
+            predictor.q90_model = lgb.LGBMRegressor(
+                objective="quantile", alpha=0.9, **params,
+            ).fit(x_features, y)
+            predictor._loaded = True
+            svc.confidence_predictor = predictor
+
+        inputs = df.drop(columns=["price"]).head(25).to_dict("records")
+        inputs[0]["district"] = "Sariyer"  # bilinmeyen kategori
+        return svc, inputs
+
+    @pytest.mark.parametrize("with_confidence", [True, False])
+    def test_batch_equals_row_by_row(self, with_confidence: bool) -> None:
+        svc, inputs = self._train_service(with_confidence)
+        batch = svc.predict_batch(inputs)
+
+        for input_data, result in zip(inputs, batch, strict=True):
+            expected_price = svc.trainer.predict(input_data)["estimated_price"]
+            assert result["estimated_price"] == expected_price
+            assert svc.predict_quick(input_data) == result
+
+            if with_confidence:
+                features = svc.trainer.fe.transform(pd.DataFrame([input_data]))
+                ci = svc.confidence_predictor.predict_with_confidence(features)
+                assert (result["confidence_low"], result["confidence_high"]) == (
+                    ci["low"], ci["high"],
+                )
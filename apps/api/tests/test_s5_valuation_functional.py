@@ -15,6 +15,7 @@ Scenarios:
 from __future__ import annotations
 
 import uuid
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -22,7 +23,7 @@ from fastapi import status
 from httpx import AsyncClient
 
 from src.core.exceptions import QuotaExceededError
-from src.modules.valuations.anomaly_service import AnomalyResult
+from src.modules.valuations.anomaly_service import DistrictSqmStats
 
 # ================================================================
 # Mock Data & Helpers
@@ -51,13 +52,13 @@ class TestValuationS5Functional:
 
     @patch("src.modules.valuations.router._check_and_get_quota")
     @patch("src.modules.valuations.inference_service.InferenceService.get_instance")
-    @patch("src.modules.valuations.comparable_service.ComparableService.find_comparables_enriched")
-    @patch("src.modules.valuations.router.check_price_anomaly")
+    @patch("src.modules.valuations.valuation_pipeline._comparable_rows")
+    @patch("src.modules.valuations.valuation_pipeline._district_stats")
     @patch("src.modules.valuations.router._increment_usage")
     async def test_s5_tc_001_happy_path(
         self,
         mock_increment,
-        mock_anomaly,
+        mock_stats,
         mock_comparables,
         mock_inference,
         mock_quota,
@@ -81,22 +82,21 @@ class TestValuationS5Functional:
         })
         mock_inference.return_value = mock_inference_instance
 
-        # Mock Comparables
+        # Mock Comparables (fiyattan bagimsiz emsal satirlari)
         mock_comparables.return_value = [
-            {
-                "property_id": str(uuid.uuid4()),
-                "distance_km": 0.5,
-                "price_diff_percent": 2.5,
-                "similarity_score": 92.0,
-                "address": "Moda, Kadikoy",
-                "price": 6200000,
-                "sqm": 125,
-                "rooms": "3+1"
-            }
+            SimpleNamespace(
+                property_id=uuid.uuid4(),
+                distance_km=0.5,
+                similarity_score=92.0,
+                address="Moda, Kadikoy",
+                price=6150000,
+                net_sqm=125,
+                rooms="3+1",
+            )
         ]
 
-        # Mock Anomaly
-        mock_anomaly.return_value = AnomalyResult(is_anomaly=False, z_score=0.5)
+        # Mock ilce istatistikleri (anomali yok)
+        mock_stats.return_value = DistrictSqmStats(avg_sqm_price=50000, std_sqm_price=5000)
 
         # When: POST /api/v1/valuations
         response = await client.post(
@@ -111,6 +111,7 @@ class TestValuationS5Functional:
         assert data["estimated_price"] == 6000000
         assert data["quota_remaining"] == 0
         assert len(data["comparables"]) == 1
+        assert data["comparables"][0]["price_diff_percent"] == 2.5
         assert data["anomaly_warning"] is None
         
         # Verify calls
@@ -192,28 +193,21 @@ class TestValuationS5Functional:
         # Then: HTTP 422
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-    @patch("src.modules.valuations.anomaly_service.check_price_anomaly")
+    @patch("src.modules.valuations.valuation_pipeline._district_stats")
     async def test_s5_tc_018_anomaly_detected_high(
         self,
-        mock_anomaly,
+        mock_stats,
         client: AsyncClient,
     ) -> None:
         """S5-TC-018: Anomali Var — Yuksek Fiyat (P1)."""
-        # Import moved inside to avoid circular or missing dependencies during discovery
-        from src.modules.valuations.anomaly_service import AnomalyResult
-        
-        # Given: Anomali sonucu yuksek
-        mock_anomaly.return_value = AnomalyResult(
-            is_anomaly=True, 
-            z_score=2.5, 
-            anomaly_reason="yukarida sapma"
-        )
-        
+        # Given: Ilce ortalamasi 50.000 TL/m2, tahmin 75.000 TL/m2 (z = 5)
+        mock_stats.return_value = DistrictSqmStats(avg_sqm_price=50000, std_sqm_price=5000)
+
         # We need to mock other things to reach anomaly check
         with (
             patch("src.modules.valuations.router._check_and_get_quota", return_value=("starter", 50, 0)),
             patch("src.modules.valuations.inference_service.InferenceService.get_instance") as mock_inf,
-            patch("src.modules.valuations.comparable_service.ComparableService.find_comparables_enriched", return_value=[]),
+            patch("src.modules.valuations.valuation_pipeline._comparable_rows", return_value=[]),
             patch("src.modules.valuations.router._increment_usage"),
         ):
             
@@ -230,7 +224,7 @@ class TestValuationS5Functional:
 
             # Then: Response contains anomaly_warning
             assert response.status_code == status.HTTP_200_OK
-            assert response.json()["anomaly_warning"] == "yukarida sapma"
+            assert "yukarida sapma" in response.json()["anomaly_warning"]
 
     @patch("src.modules.valuations.comparable_service.ComparableService.find_comparables")
     @patch("src.modules.valuations.comparable_service.ComparableService.get_area_stats")
@@ -8,14 +8,26 @@ Pure function unit testleri — DB bagimliligi YOK:
   2. build_ts_query() — tsquery string uretimi
   3. _sanitize_input() — Girdi temizleme
   4. Arama kalitesi senaryolari — normalize + tsquery birlikte
+  5. Single-pass hibrit sorgu — derlenmis SQL yapisi
 """
 
 from __future__ import annotations
 
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+
 import pytest
+from sqlalchemy.dialects import postgresql
 
+from src.core.exceptions import ValidationError
+from src.core.pagination import encode_cursor
 from src.core.turkish import normalize_turkish
-from src.modules.properties.search import _sanitize_input, build_ts_query
+from src.modules.properties.search import (
+    _build_single_pass_query,
+    _sanitize_input,
+    build_ts_query,
+)
 
 # ================================================================
 # Test Veri Setleri
@@ -355,6 +367,61 @@ class TestTrigramSimulationSanity:
         )
 
 
+# ================================================================
+# Single-Pass Hibrit Sorgu (SQL derleme — DB gerekmez)
+# ================================================================
+
+
+def _compile_single_pass(
+    query: str, sort: str = "relevance", cursor: str | None = None
+) -> str:
+    stmt, _ = _build_single_pass_query(
+        query, build_ts_query(query), sort=sort, cursor=cursor, status="active"
+    )
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestSinglePassQuery:
+    """FTS + trigram + ILIKE katmanlari tek ifadede derlenmeli."""
+
+    def test_all_tiers_in_one_statement(self) -> None:
+        """Uc katman CTE olarak ayni sorguda yer almali."""
+        sql = _compile_single_pass("kadıköy daire")
+        assert sql.startswith("WITH fts_hits AS")
+        for cte in ("trgm_hits AS", "ilike_hits AS", "tier_choice AS"):
+            assert cte in sql
+        assert sql.count("UNION ALL") == 2
+
+    def test_total_via_window_function(self) -> None:
+        """Toplam sayi ayri count sorgusu yerine count(*) OVER () ile gelmeli."""
+        sql = _compile_single_pass("kadıköy daire")
+        assert "count(*) OVER ()" in sql
+
+    def test_relevance_sort_uses_tier_score(self) -> None:
+        """relevance siralamasi katman skoruna, NULL skorlar sona."""
+        sql = _compile_single_pass("villa")
+        assert "ORDER BY ranked.score DESC NULLS LAST" in sql
+
+    def test_explicit_sort_overrides_score(self) -> None:
+        """price_asc gibi siralamalarda skor kullanilmamali."""
+        sql = _compile_single_pass("villa", sort="price_asc")
+        assert "ORDER BY properties.price ASC" in sql
+
+    def test_cursor_filters_after_window_count(self) -> None:
+        """Keyset kosulu dis sorguda — count(*) OVER () cursor'dan etkilenmemeli."""
+        cursor = encode_cursor("search:price_desc", [Decimal("1500000.00"), uuid.uuid4()])
+        sql = _compile_single_pass("villa", sort="price_desc", cursor=cursor)
+        window_at = sql.index("count(*) OVER ()")
+        keyset_at = sql.index("(properties.price, properties.id) <")
+        assert keyset_at > window_at
+
+    def test_cursor_from_other_sort_rejected(self) -> None:
+        """Baska siralamaya ait cursor ValidationError vermeli."""
+        cursor = encode_cursor("search:newest", [datetime.now(UTC), uuid.uuid4()])
+        with pytest.raises(ValidationError):
+            _compile_single_pass("villa", sort="price_desc", cursor=cursor)
+
+
 # ================================================================
 # Kalite Metrik Raporu
 # ================================================================
@@ -0,0 +1,161 @@
+"""
+Tek geçişli arama — cascade ile eşdeğerlik testi.
+
+Aynı veri üzerinde search_properties(mode="single_pass") ve
+search_properties(mode="cascade") aynı katmanı seçmeli, aynı satırları
+aynı sırada ve aynı toplamla döndürmelidir.
+
+Veri her katman kararını tetikleyecek şekilde seçildi:
+  - FTS eşiği geçiyor (≥ 3 sonuç) → FTS
+  - FTS eşik altında, trigram daha fazla sonuç → trigram
+  - FTS ve trigram boş, alt dize eşleşmesi var → ILIKE
+  - FTS eşik altında, trigram daha fazla değil → FTS
+"""
+
+from __future__ import annotations
+
+import uuid
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import literal_column, update
+
+from src.models.property import Property
+from src.modules.properties.search import (
+    SEARCH_MODE_CASCADE,
+    SEARCH_MODE_SINGLE_PASS,
+    search_properties,
+)
+from tests.conftest import OFFICE_A_ID
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.core.pagination import Page
+
+# Başka testlerin verisinden yalıtmak için tüm aramalar bu ilçeyle filtrelenir
+_DISTRICT = "Eşdeğerlik"
+
+_LONG_DESCRIPTION = (
+    "Karaekizkuyusu mevkiinde geniş bahçeli müstakil ev, okullara ve ulaşıma "
+    "yakın, sessiz bir sokakta, doğalgazlı ve otoparklı, bakımlı bir yapı"
+)
+
+# (başlık, açıklama, fiyat, net alan)
+_LISTINGS = [
+    # FTS katmanı: "lavantakoy" dört başlıkta geçiyor
+    ("Lavantakoy bahçeli villa", None, 7_500_000, Decimal("240")),
+    ("Lavantakoy havuzlu villa", None, 9_000_000, Decimal("310")),
+    ("Lavantakoy köşe daire", "Lavantakoy merkezde", 3_200_000, Decimal("120")),
+    ("Lavantakoy dubleks", None, 4_800_000, None),
+    # Trigram katmanı: "portakallk" yalnızca bir başlıkta birebir, ikisinde yazım farkıyla
+    ("Portakallk", None, 2_100_000, Decimal("95")),
+    ("Portakallık daire", None, 2_600_000, Decimal("105")),
+    ("Portakallik daire", "Site içinde", 2_400_000, Decimal("100")),
+    # ILIKE katmanı: "ekizkuyu" uzun açıklamada kelime içinde
+    ("Müstakil bahçeli ev", _LONG_DESCRIPTION, 5_500_000, Decimal("180")),
+    # FTS (eşik altı) katmanı: tek sonuç, trigram fazlasını bulmuyor
+    ("Zümrütlü rezidans dairesi", None, 6_100_000, Decimal("140")),
+]
+
+_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', COALESCE(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', COALESCE(description, '')), 'B') || "
+    "setweight(to_tsvector('simple', COALESCE(city, '')), 'C') || "
+    "setweight(to_tsvector('simple', COALESCE(district, '')), 'C')"
+)
+
+
+async def _seed(db: AsyncSession) -> dict[str, uuid.UUID]:
+    ids = {title: uuid.uuid4() for title, *_ in _LISTINGS}
+    db.add_all(
+        Property(
+            id=ids[title], office_id=OFFICE_A_ID, title=title, description=description,
+            property_type="daire", listing_type="sale", price=Decimal(price),
+            city="İstanbul", district=_DISTRICT, net_area=net_area,
+        )
+        for title, description, price, net_area in _LISTINGS
+    )
+    await db.flush()
+    # Test şeması create_all ile kurulur; search_vector trigger'ı yok
+    await db.execute(
+        update(Property)
+        .where(Property.id.in_(ids.values()))
+        .values(search_vector=literal_column(_SEARCH_VECTOR))
+    )
+    return ids
+
+
+async def _search(db: AsyncSession, mode: str, query: str, **kwargs) -> Page[Property]:
+    return await search_properties(db, query, district=_DISTRICT, mode=mode, **kwargs)
+
+
+async def _assert_same(db: AsyncSession, query: str, **kwargs) -> list[uuid.UUID]:
+    single = await _search(db, SEARCH_MODE_SINGLE_PASS, query, **kwargs)
+    cascade = await _search(db, SEARCH_MODE_CASCADE, query, **kwargs)
+
+    single_ids = [p.id for p in single.items]
+    assert single_ids == [p.id for p in cascade.items], (query, kwargs)
+    assert single.total == cascade.total, (query, kwargs)
+    assert (single.next_cursor is None) == (cascade.next_cursor is None), (query, kwargs)
+    return single_ids
+
+
+async def _walk_cursor(db: AsyncSession, mode: str, query: str, sort: str) -> list[uuid.UUID]:
+    ids: list[uuid.UUID] = []
+    cursor = None
+    while True:
+        page = await _search(db, mode, query, sort=sort, limit=2, cursor=cursor)
+        ids.extend(p.id for p in page.items)
+        if page.next_cursor is None:
+            return ids
+        cursor = page.next_cursor
+
+
+class TestSinglePassMatchesCascade:
+    """single_pass ve cascade aynı katmanı, satırları ve toplamı döndürmeli."""
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("lavantakoy", {
+                "Lavantakoy bahçeli villa", "Lavantakoy havuzlu villa",
+                "Lavantakoy köşe daire", "Lavantakoy dubleks",
+            }),
+            ("portakallk", {"Portakallk", "Portakallık daire", "Portakallik daire"}),
+            ("ekizkuyu", {"Müstakil bahçeli ev"}),
+            ("zümrütlü", {"Zümrütlü rezidans dairesi"}),
+        ],
+    )
+    async def test_tier_choice(
+        self, db_session: AsyncSession, ensure_test_offices, query: str, expected: set[str],
+    ) -> None:
+        ids = await _seed(db_session)
+
+        found = await _assert_same(db_session, query)
+
+        assert set(found) == {ids[title] for title in expected}
+
+    async def test_no_tier_matches(self, db_session: AsyncSession, ensure_test_offices) -> None:
+        await _seed(db_session)
+
+        assert await _assert_same(db_session, "qqxzyw") == []
+
+    @pytest.mark.parametrize("query", ["lavantakoy", "portakallk"])
+    @pytest.mark.parametrize("sort", ["relevance", "price_asc", "price_desc", "newest", "area"])
+    async def test_pages_match(
+        self, db_session: AsyncSession, ensure_test_offices, query: str, sort: str,
+    ) -> None:
+        await _seed(db_session)
+
+        full = await _assert_same(db_session, query, sort=sort)
+        by_offset = [
+            pid
+            for offset in range(0, len(full), 2)
+            for pid in await _assert_same(db_session, query, sort=sort, limit=2, offset=offset)
+        ]
+        assert by_offset == full
+
+        for mode in (SEARCH_MODE_SINGLE_PASS, SEARCH_MODE_CASCADE):
+            assert await _walk_cursor(db_session, mode, query, sort) == full
@@ -0,0 +1,215 @@
+"""
+Yalin serving artifact testleri (src.ml.serving_model).
+
+Gercek LightGBM modelleri egitilir, export edilir ve mmap ile yuklenen
+agac dizilerinin tahminleri LightGBM ile karsilastirilir.
+
+  1. TreeEnsemble — LightGBM predict ile esdegerlik (missing, early stopping)
+  2. ServingModel.transform — FeatureEngineer.transform ile esdegerlik
+  3. Export + InferenceService — joblib yolu ile ayni API sonucu
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import joblib
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml.feature_engineering import FeatureEngineer
+from src.ml.serving_model import (
+    MANIFEST_FILE,
+    ServingModel,
+    TreeEnsemble,
+    export_serving_artifact,
+)
+from src.ml.trainer import ModelTrainer
+from src.modules.valuations.inference_service import InferenceService
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_PARAMS = {"n_estimators": 40, "verbose": -1, "random_state": 0}
+
+
+def _training_frame(n: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        "district": rng.choice(["Kadikoy", "Uskudar", "Besiktas", "Atasehir"], n),
+        "neighborhood": rng.choice(["Moda", "Caferaga", "Ortakoy", "Kuzguncuk"], n),
+        "property_type": rng.choice(["Daire", "Villa"], n),
+        "heating_type": rng.choice(["Kombi", "Merkezi"], n),
+        "net_sqm": rng.uniform(50, 250, n),
+        "gross_sqm": rng.uniform(60, 300, n),
+        "room_count": rng.integers(1, 6, n),
+        "living_room_count": rng.integers(1, 3, n),
+        "floor": rng.integers(0, 15, n),
+        "total_floors": rng.integers(1, 20, n),
+        "building_age": rng.integers(0, 40, n),
+    })
+    df["price"] = df["net_sqm"] * 40_000 + rng.normal(0, 300_000, n)
+    return df
+
+
+def _inputs(df: pd.DataFrame) -> list[dict]:
+    inputs = df.drop(columns=["price"]).head(40).to_dict("records")
+    inputs[0]["district"] = "Sariyer"  # bilinmeyen kategori
+    inputs[1]["gross_sqm"] = 0  # payda 0 → NaN → 0
+    inputs[2]["floor"] = None  # eksik deger
+    inputs[3]["heating_type"] = None
+    inputs[4]["extra_field"] = "yok sayilir"
+    return inputs
+
+
+@pytest.fixture(scope="module")
+def trained_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Egitim artifact'lari (joblib) + export edilmis serving dizini."""
+    model_dir = tmp_path_factory.mktemp("v1")
+    df = _training_frame()
+
+    fe = FeatureEngineer()
+    x_features, y = fe.fit_transform(df)
+    fe.save(str(model_dir))
+
+    joblib.dump(lgb.LGBMRegressor(**_PARAMS).fit(x_features, y), model_dir / "lgbm_model.joblib")
+    for name, alpha in (("q10", 0.1), ("q90", 0.9)):
+        model = lgb.LGBMRegressor(objective="quantile", alpha=alpha, **_PARAMS)
+        joblib.dump(model.fit(x_features, y), model_dir / f"lgbm_quantile_{name}.joblib")
+
+    export_serving_artifact(model_dir)
+    return model_dir
+
+
+# ================================================================
+# 1. TreeEnsemble
+# ================================================================
+
+
+class TestTreeEnsemble:
+    """Duz agac dizileri LightGBM ile ayni tahmini uretmeli."""
+
+    def test_matches_lightgbm_with_missing_values(self) -> None:
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(500, 6))
+        x[rng.random(x.shape) < 0.1] = np.nan
+        x[rng.random(x.shape) < 0.1] = 0.0
+        y = np.nan_to_num(x[:, 0]) * 3 + rng.normal(size=500)
+
+        model = lgb.LGBMRegressor(n_estimators=50, verbose=-1, zero_as_missing=False).fit(x, y)
+        ensemble = TreeEnsemble.from_booster(model.booster_)
+
+        np.testing.assert_array_equal(ensemble.predict(x), model.predict(x))
+
+    def test_early_stopping_uses_best_iteration(self, tmp_path: Path) -> None:
+        df = _training_frame()
+        fe = FeatureEngineer()
+        x_features, y = fe.fit_transform(df)
+        fe.save(str(tmp_path))
+
+        model = lgb.LGBMRegressor(n_estimators=400, learning_rate=0.3, verbose=-1).fit(
+            x_features.iloc[:200], y.iloc[:200],
+            eval_set=[(x_features.iloc[200:], y.iloc[200:])],
+            callbacks=[lgb.early_stopping(stopping_rounds=5, verbose=False)],
+        )
+        assert model.best_iteration_ < 400
+        joblib.dump(model, tmp_path / "lgbm_model.joblib")
+
+        serving = ServingModel.load(export_serving_artifact(tmp_path))
+
+        assert serving.main.num_trees == model.best_iteration_
+        assert not serving.has_confidence
+        np.testing.assert_array_equal(
+            serving.predict(x_features.to_numpy(dtype=np.float64)),
+            model.predict(x_features),
+        )
+
+    def test_categorical_split_rejected(self) -> None:
+        rng = np.random.default_rng(1)
+        x = pd.DataFrame({"c": pd.Categorical(rng.choice(list("abcd"), 300)), "v": rng.normal(size=300)})
+        y = (x["c"] == "a").astype(float) * 5 + rng.normal(size=300)
+        model = lgb.LGBMRegressor(n_estimators=5, verbose=-1, min_child_samples=5).fit(x, y)
+
+        with pytest.raises(ValueError, match="Kategorik"):
+            TreeEnsemble.from_booster(model.booster_)
+
+    def test_empty_input(self, trained_dir: Path) -> None:
+        serving = ServingModel.load(trained_dir / "serving")
+        assert serving.predict(serving.transform([])).shape == (0,)
+
+
+# ================================================================
+# 2. Feature donusumu + mmap yukleme
+# ================================================================
+
+
+class TestServingModel:
+    """pandas'siz transform ve mmap yukleme."""
+
+    def test_transform_equals_feature_engineer(self, trained_dir: Path) -> None:
+        fe = FeatureEngineer()
+        fe.load(str(trained_dir))
+        serving = ServingModel.load(trained_dir / "serving")
+        inputs = _inputs(_training_frame())
+
+        expected = fe.transform(pd.DataFrame(inputs)).to_numpy(dtype=np.float64)
+
+        assert serving.feature_columns == fe.feature_columns
+        np.testing.assert_array_equal(serving.transform(inputs), expected)
+
+    def test_trees_are_memory_mapped_read_only(self, trained_dir: Path) -> None:
+        serving = ServingModel.load(trained_dir / "serving")
+
+        assert isinstance(serving.main.threshold.base, np.memmap)
+        assert not serving.main.leaf_value.flags.writeable
+
+    def test_unsupported_format_version(self, trained_dir: Path, tmp_path: Path) -> None:
+        (tmp_path / MANIFEST_FILE).write_text('{"format_version": 99}', encoding="utf-8")
+        with pytest.raises(ValueError, match="surumu"):
+            ServingModel.load(tmp_path)
+
+
+# ================================================================
+# 3. InferenceService entegrasyonu
+# ================================================================
+
+
+class TestInferenceServiceServingArtifact:
+    """Serving artifact ile predict_batch, joblib yolu ile ayni sonucu vermeli."""
+
+    def test_predict_batch_equals_joblib_path(self, trained_dir: Path) -> None:
+        from src.ml.confidence_interval import ConfidencePredictor
+
+        inputs = _inputs(_training_frame())
+
+        legacy = InferenceService()
+        legacy.trainer = ModelTrainer(FeatureEngineer())
+        legacy.trainer.load_model(str(trained_dir))
+        legacy.confidence_predictor = ConfidencePredictor()
+        legacy.confidence_predictor.load(str(trained_dir))
+        legacy._has_confidence = True
+        legacy._model_loaded = True
+
+        lean = InferenceService()
+        lean._serving = ServingModel.load(trained_dir / "serving")
+        lean._has_confidence = lean._serving.has_confidence
+        lean._model_loaded = True
+
+        assert lean._has_confidence
+        assert lean.predict_batch(inputs) == legacy.predict_batch(inputs)
+
+    def test_load_model_prefers_serving_artifact(
+        self, trained_dir: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(
+            "src.modules.valuations.inference_service.SERVING_DIR_V1",
+            str(trained_dir / "serving"),
+        )
+        svc = InferenceService()
+        svc._load_model()
+
+        assert svc._serving is not None
+        assert svc._model_version == "v1"
+        assert svc.trainer.model is None  # joblib modelleri yuklenmedi
@@ -0,0 +1,53 @@
+"""
+Değerleme geçmişi — eski tahminler arşivlemeden etkilenmemeli.
+
+Liste, detay ve PDF endpoint'leri prediction_logs'tan okur; arşiv
+kurallarının en uzun penceresinden eski bir tahmin hâlâ listelenmeli ve
+detayı getirilebilmelidir.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from src.models.prediction_log import PredictionLog
+from src.modules.valuations.router import get_valuation, list_valuations
+from src.services.table_archiver import archive_policies
+from tests.conftest import OFFICE_A_ID
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class TestOldValuationsStayReadable:
+    """Arşiv penceresinden eski tahmin liste ve detayda kalmalı."""
+
+    async def test_older_than_archive_cutoff(
+        self, db_session: AsyncSession, ensure_test_offices,
+    ) -> None:
+        oldest_cutoff = max(policy.age for policy in archive_policies())
+        created_at = datetime.now(UTC) - oldest_cutoff - timedelta(days=30)
+        log = PredictionLog(
+            id=uuid.uuid4(), office_id=OFFICE_A_ID, model_name="valuation",
+            model_version="v1", input_data={"district": "Kadıköy", "net_sqm": 120},
+            output_data={"estimated_price": 6_000_000, "min_price": 5_500_000,
+                         "max_price": 6_500_000},
+            created_at=created_at,
+        )
+        db_session.add(log)
+        await db_session.flush()
+        user = SimpleNamespace(id=uuid.uuid4(), office_id=OFFICE_A_ID)
+
+        detail = await get_valuation(log.id, db_session, user)
+        listed = await list_valuations(
+            db_session, user, limit=100, offset=0,
+            date_from=created_at - timedelta(seconds=1),
+            date_to=created_at + timedelta(seconds=1),
+        )
+
+        assert detail.id == str(log.id)
+        assert detail.predicted_price == 6_000_000
+        assert [item.id for item in listed.items] == [str(log.id)]
@@ -0,0 +1,69 @@
+"""Adaptive radius emsal aramasi — tek sorgu + ilce fallback."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.modules.valuations.comparable_service import ComparableService
+
+_ARGS = {
+    "district": "Kadikoy",
+    "property_type": "Daire",
+    "net_sqm": 100,
+    "room_count": 3,
+    "building_age": 10,
+    "limit": 5,
+    "min_comparables": 3,
+}
+
+
+def _session(*results: list) -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[MagicMock(all=MagicMock(return_value=rows)) for rows in results],
+    )
+    return session
+
+
+def _sql(session: MagicMock, call: int = 0) -> str:
+    stmt = session.execute.call_args_list[call].args[0]
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class TestAdaptiveRadius:
+    async def test_single_query_when_radius_satisfies(self) -> None:
+        rows = [SimpleNamespace(radius_km=3.0) for _ in range(3)]
+        session = _session(rows)
+
+        result = await ComparableService(session).find_comparable_rows(**_ARGS, lat=41.0, lon=29.0)
+
+        assert result == rows
+        assert session.execute.await_count == 1
+        sql = _sql(session)
+        assert "ST_DWithin(properties.location, ST_GeogFromText('SRID=4326;POINT(29.0 41.0)'), 5000.0)" in sql
+        assert "ORDER BY properties.location <-> ST_GeogFromText" in sql
+        # Indeksli generated kolonlar (migration 030) — satir bazli ifade yok
+        assert "properties.district_key = lower(translate(btrim('Kadikoy')" in sql
+        assert "properties.room_count >= 2" in sql
+        assert "split_part" not in sql
+
+    async def test_falls_back_to_district_query(self) -> None:
+        district_rows = [SimpleNamespace(radius_km=None)]
+        session = _session([], district_rows)
+
+        result = await ComparableService(session).find_comparable_rows(**_ARGS, lat=41.0, lon=29.0)
+
+        assert result == district_rows
+        assert session.execute.await_count == 2
+        assert "ST_DWithin" not in _sql(session, call=1)
+
+    async def test_no_location_single_district_query(self) -> None:
+        session = _session([])
+
+        await ComparableService(session).find_comparable_rows(**_ARGS)
+
+        assert session.execute.await_count == 1
+        assert "ST_DWithin" not in _sql(session)
@@ -0,0 +1,185 @@
+"""Drift raporu — gunluk ozetlerden moment/histogram hesaplari ve alarm kurallari."""
+
+from __future__ import annotations
+
+import re
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.ml.drift_monitor import (
+    build_drift_report,
+    confidence_trend_report,
+    input_distribution_report,
+    prediction_stats_report,
+)
+from src.ml.drift_stats import (
+    _NUMBER_RE,
+    _ROOM_RE,
+    ROLLUP_SQL,
+    histogram_stmt,
+    moment_stats,
+    window_start,
+)
+from src.models.prediction_daily_stats import PredictionDailyStats
+
+
+def _totals(values: list[float] | None = None, **overrides) -> SimpleNamespace:
+    values = values if values is not None else [80.0, 100.0, 120.0, 150.0]
+    fields = {
+        "prediction_count": len(values),
+        "confidence_count": len(values),
+        "confidence_sum": 0.8 * len(values),
+        "latency_count": len(values),
+        "latency_sum": 40.0 * len(values),
+        "net_sqm_count": len(values),
+        "net_sqm_sum": sum(values),
+        "net_sqm_sumsq": sum(v * v for v in values),
+        "net_sqm_min": min(values, default=None),
+        "net_sqm_max": max(values, default=None),
+        "building_age_count": len(values),
+        "building_age_sum": 20.0 * len(values),
+        "building_age_sumsq": 400.0 * len(values),
+        "price_count": len(values),
+        "price_sum": 5_000_000.0 * len(values),
+        "price_min": 3_000_000.0,
+        "price_max": 7_000_000.0,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _hist(**counts: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(key=k.replace("_", "+"), count=c)
+        for k, c in sorted(counts.items(), key=lambda kv: -kv[1])
+    ]
+
+
+class TestMomentStats:
+    def test_matches_sample_statistics(self) -> None:
+        values = [80.0, 100.0, 120.0, 150.0, 61.5]
+        n = len(values)
+        mean = sum(values) / n
+        std = (sum((x - mean) ** 2 for x in values) / (n - 1)) ** 0.5
+
+        result = moment_stats(n, sum(values), sum(v * v for v in values), min(values), max(values))
+
+        assert result == {"mean": round(mean, 2), "std": round(std, 2), "min": 61.5, "max": 150.0}
+
+    def test_single_value_and_empty(self) -> None:
+        assert moment_stats(1, 42.0, 1764.0, include_minmax=False) == {"mean": 42.0, "std": 0.0}
+        assert moment_stats(0, None, None) == {}
+
+
+class TestReports:
+    def test_input_distribution_from_aggregates(self) -> None:
+        rooms = _hist(**{"3_1": 6, "2_1": 3, "5+": 1})
+        districts = _hist(Kadikoy=5, Besiktas=3, Sisli=1, Uskudar=1, Maltepe=1, Kartal=1)
+
+        report = input_distribution_report(7, _totals(), rooms, districts)
+
+        assert report["sample_count"] == 4
+        assert report["net_sqm"]["mean"] == 112.5
+        assert report["room_distribution"] == {"2+1": 0.3, "3+1": 0.6, "5+": 0.1}
+        assert list(report["room_distribution"]) == sorted(report["room_distribution"])
+        assert len(report["district_distribution"]) == 5
+        assert report["district_distribution"]["Kadikoy"] == round(5 / 12, 4)
+        assert report["psi"]["status"] in {"stable", "moderate_drift", "severe_drift"}
+
+    def test_empty_window_is_no_data(self) -> None:
+        report = input_distribution_report(7, _totals([]), [], [])
+        stats = prediction_stats_report(7, _totals([]), [])
+
+        assert report["status"] == "no_data"
+        assert stats == {"status": "no_data", "days": 7, "total_predictions": 0}
+
+    def test_prediction_stats(self) -> None:
+        stats = prediction_stats_report(7, _totals(), _hist(Kadikoy=3, Besiktas=1))
+
+        assert stats["total_predictions"] == 4
+        assert (stats["avg_latency_ms"], stats["avg_confidence"]) == (40, 0.8)
+        assert (stats["avg_price"], stats["min_price"], stats["max_price"]) == (
+            5_000_000, 3_000_000, 7_000_000,
+        )
+        assert stats["top_districts"][0] == {"district": "Kadikoy", "count": 3}
+
+    @pytest.mark.parametrize(
+        ("confidence", "level"), [(0.9, None), (0.6, "WARNING"), (0.4, "ALARM")],
+    )
+    def test_confidence_trend_alert(self, confidence: float, level: str | None) -> None:
+        rows = [
+            SimpleNamespace(day=date(2026, 3, d), avg_confidence=confidence, count=10)
+            for d in range(1, 11)
+        ]
+
+        report = confidence_trend_report(30, rows)
+
+        assert len(report["daily"]) == 10
+        assert report["moving_avg_7d"] == confidence
+        assert report["alert_level"] == level
+
+
+class TestBuildDriftReport:
+    def test_green_when_stable(self) -> None:
+        report = build_drift_report(
+            {"psi": {"total_psi": 0.01}}, {"alert_level": None}, {"total_predictions": 10},
+        )
+
+        assert (report["overall_status"], report["alerts"]) == ("GREEN", [])
+
+    def test_red_overrides_yellow(self) -> None:
+        report = build_drift_report(
+            {"psi": {"total_psi": 0.15}},
+            {"alert_level": "ALARM", "moving_avg_7d": 0.4},
+            {"total_predictions": 10},
+        )
+
+        assert report["overall_status"] == "RED"
+        assert [a["metric"] for a in report["alerts"]] == ["psi", "confidence_7d_avg"]
+
+    def test_no_predictions_warns(self) -> None:
+        report = build_drift_report({}, {}, {"total_predictions": 0})
+
+        assert report["overall_status"] == "YELLOW"
+        assert report["alerts"][0]["metric"] == "total_predictions"
+
+
+class TestQueries:
+    def test_window_includes_today(self) -> None:
+        assert window_start(7, today=date(2026, 3, 10)) == date(2026, 3, 4)
+        assert window_start(1, today=date(2026, 3, 10)) == date(2026, 3, 10)
+
+    def test_histogram_reads_only_daily_rows(self) -> None:
+        stmt = histogram_stmt(PredictionDailyStats.district_histogram, date(2026, 3, 4), limit=5)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "jsonb_each_text(prediction_daily_stats.district_histogram)" in sql
+        assert "prediction_logs" not in sql
+        assert "LIMIT" in sql
+
+    @pytest.mark.parametrize(
+        ("value", "numeric"),
+        [("120", True), ("-3.5", True), (".5", True), ("1.2e6", True), ("120.", True),
+         ("120 m2", False), ("", False), ("yok", False), ("NaN", False), ("1e999", False),
+         ("1" * 20, False)],
+    )
+    def test_rollup_number_guard(self, value: str, numeric: bool) -> None:
+        # PostgreSQL ~ ile ayni POSIX alt kumesi; eslesmeyen deger ::float8'e gitmez
+        assert (re.match(_NUMBER_RE, value) is not None) is numeric
+
+    @pytest.mark.parametrize(
+        ("value", "numeric"),
+        [("3", True), ("3.0", True), ("3+1", False), ("-1", False), ("3.5", False), ("99999", False)],
+    )
+    def test_rollup_room_guard(self, value: str, numeric: bool) -> None:
+        assert (re.match(_ROOM_RE, value) is not None) is numeric
+
+    def test_rollup_casts_are_guarded(self) -> None:
+        sql = str(ROLLUP_SQL.compile(dialect=postgresql.dialect()))
+
+        # Her sayisal cast bir regex kontrolunun THEN dalinda
+        assert sql.count("::float8") == sql.count("::float8 END") == 3
+        assert sql.count("::numeric::int") == sql.count("::numeric::int END") == 2
@@ -0,0 +1,87 @@
+"""Ozellik matrisi onbellegi — surumleme, fit_transform esdegerligi, mmap alt kume."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml import feature_cache
+from src.ml.feature_cache import frame_from_arrays, load_arrays, load_feature_matrix
+from src.ml.feature_engineering import FeatureEngineer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture()
+def csv_path(tmp_path: Path) -> Path:
+    rng = np.random.default_rng(0)
+    n = 40
+    df = pd.DataFrame({
+        "district": rng.choice(["Kadikoy", "Besiktas", "Sisli"], n),
+        "neighborhood": rng.choice(["A", "B", "C", "D"], n),
+        "property_type": "Daire",
+        "gross_sqm": rng.integers(60, 200, n),
+        "net_sqm": rng.integers(50, 180, n),
+        "room_count": rng.integers(1, 5, n),
+        "living_room_count": 1,
+        "floor": rng.integers(0, 10, n),
+        "total_floors": 10,
+        "building_age": rng.integers(0, 40, n),
+        "heating_type": rng.choice(["Kombi", "Merkezi"], n),
+        "lat": rng.uniform(40.9, 41.1, n),
+        "price": rng.integers(1_000_000, 9_000_000, n),
+    })
+    path = tmp_path / "city_training_data.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_matches_fit_transform(csv_path: Path, tmp_path: Path) -> None:
+    X, y = FeatureEngineer().fit_transform(pd.read_csv(csv_path))
+
+    fm = load_feature_matrix(csv_path, cache_root=tmp_path / "cache")
+
+    pd.testing.assert_frame_equal(fm.X, X)
+    pd.testing.assert_series_equal(fm.y, y)
+    assert fm.fe.get_feature_names() == X.columns.tolist()
+    assert list(fm.districts) == pd.read_csv(csv_path)["district"].tolist()
+
+
+def test_written_once_per_version(
+    csv_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    writes: list[Path] = []
+    write = feature_cache._write_cache
+    monkeypatch.setattr(
+        feature_cache, "_write_cache", lambda csv, d: (writes.append(d), write(csv, d)),
+    )
+    root = tmp_path / "cache"
+
+    first = load_feature_matrix(csv_path, cache_root=root)
+    second = load_feature_matrix(csv_path, cache_root=root)
+    assert len(writes) == 1
+    assert first.version == second.version
+
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write("Sisli,A,Daire,100,90,2,1,3,10,5,Kombi,41.0,4000000\n")
+    changed = load_feature_matrix(csv_path, cache_root=root)
+
+    assert len(writes) == 2
+    assert changed.version != first.version
+    assert len(changed.X) == len(first.X) + 1
+
+
+def test_mmap_row_subset(csv_path: Path, tmp_path: Path) -> None:
+    fm = load_feature_matrix(csv_path, cache_root=tmp_path / "cache")
+    rows = np.array([7, 3, 21])
+
+    X, y, columns, dtypes = load_arrays(fm.path, mmap=True)
+    subset = frame_from_arrays(X, columns, dtypes, rows=rows)
+
+    assert isinstance(X, np.memmap)
+    pd.testing.assert_frame_equal(subset, fm.X.loc[rows], check_index_type=False)
+    assert y[rows].tolist() == fm.y.loc[rows].tolist()
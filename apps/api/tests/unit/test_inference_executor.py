@@ -0,0 +1,173 @@
+"""Inference executor + mikro-batcher — event loop disi tahmin ve batch toplama."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.modules.valuations import inference_executor
+from src.modules.valuations.inference_executor import InferenceExecutor, MicroBatcher
+from src.modules.valuations.inference_service import InferenceService
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _FakeService:
+    """predict_batch cagrilarini ve calistigi thread'i kaydeden sahte servis."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[dict]] = []
+        self.threads: list[int] = []
+
+    def predict_batch(self, inputs: list[dict]) -> list[dict]:
+        self.calls.append(list(inputs))
+        self.threads.append(threading.get_ident())
+        for item in inputs:
+            if item.get("bad"):
+                raise ValueError("gecersiz girdi")
+        return [{"estimated_price": item["net_sqm"] * 1000} for item in inputs]
+
+
+@pytest.fixture()
+def thread_executor() -> Iterator[InferenceExecutor]:
+    executor = InferenceExecutor(kind="thread", max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture()
+def fresh_service(monkeypatch: pytest.MonkeyPatch) -> Iterator[InferenceService]:
+    """Model yuklenmis gibi davranan, predict_batch'i sahte InferenceService."""
+    fake = _FakeService()
+    svc = InferenceService.__new__(InferenceService)
+    svc._model_loaded = True
+    svc._batcher = None
+    svc._batcher_loop = None
+    svc.predict_batch = fake.predict_batch  # type: ignore[method-assign]
+    svc.fake = fake  # type: ignore[attr-defined]
+
+    executor = InferenceExecutor(kind="thread", max_workers=1)
+    monkeypatch.setattr(inference_executor, "_executor", executor)
+    yield svc
+    executor.shutdown()
+
+
+class TestInferenceExecutor:
+    """Thread havuzu — tahmin event loop thread'inde calismamali."""
+
+    async def test_runs_off_event_loop_thread(
+        self, thread_executor: InferenceExecutor,
+    ) -> None:
+        fake = _FakeService()
+        result = await thread_executor.run(fake, [{"net_sqm": 100}])
+
+        assert result == [{"estimated_price": 100_000}]
+        assert fake.threads[0] != threading.get_ident()
+
+    def test_invalid_kind_raises(self) -> None:
+        with pytest.raises(ValueError, match="INFERENCE_EXECUTOR"):
+            InferenceExecutor(kind="gpu", max_workers=1)
+
+
+class TestMicroBatcher:
+    """Eszamanli istekler tek batch'te, sonuc sirasi korunarak."""
+
+    async def test_concurrent_submits_share_one_batch(self) -> None:
+        fake = _FakeService()
+
+        async def _run(inputs: list[dict]) -> list[dict]:
+            return fake.predict_batch(inputs)
+
+        batcher = MicroBatcher(_run, window_ms=20, max_batch_size=32)
+        results = await asyncio.gather(
+            *(batcher.submit({"net_sqm": n}) for n in (50, 80, 120)),
+        )
+
+        assert len(fake.calls) == 1
+        assert [r["estimated_price"] for r in results] == [50_000, 80_000, 120_000]
+
+    async def test_full_batch_flushes_without_waiting_window(self) -> None:
+        fake = _FakeService()
+
+        async def _run(inputs: list[dict]) -> list[dict]:
+            return fake.predict_batch(inputs)
+
+        # Pencere cok uzun — sadece boyut siniri tetikleyebilir
+        batcher = MicroBatcher(_run, window_ms=60_000, max_batch_size=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit({"net_sqm": 1}), batcher.submit({"net_sqm": 2})),
+            timeout=1,
+        )
+
+        assert [r["estimated_price"] for r in results] == [1000, 2000]
+        assert fake.calls == [[{"net_sqm": 1}, {"net_sqm": 2}]]
+
+    async def test_failing_input_does_not_fail_others(self) -> None:
+        fake = _FakeService()
+
+        async def _run(inputs: list[dict]) -> list[dict]:
+            return fake.predict_batch(inputs)
+
+        batcher = MicroBatcher(_run, window_ms=10, max_batch_size=32)
+        ok, bad = await asyncio.gather(
+            batcher.submit({"net_sqm": 90}),
+            batcher.submit({"net_sqm": 0, "bad": True}),
+            return_exceptions=True,
+        )
+
+        assert ok == {"estimated_price": 90_000}
+        assert isinstance(bad, ValueError)
+
+
+class TestPredictAsync:
+    """InferenceService.predict_async — executor + batcher entegrasyonu."""
+
+    async def test_batches_concurrent_requests(
+        self, fresh_service: InferenceService, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("src.config.settings.INFERENCE_BATCH_WINDOW_MS", 20)
+
+        results = await asyncio.gather(
+            *(fresh_service.predict_async({"net_sqm": n}) for n in (10, 20, 30, 40)),
+        )
+
+        assert [r["estimated_price"] for r in results] == [10_000, 20_000, 30_000, 40_000]
+        assert len(fresh_service.fake.calls) == 1  # type: ignore[attr-defined]
+
+    async def test_window_zero_runs_each_request_directly(
+        self, fresh_service: InferenceService, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("src.config.settings.INFERENCE_BATCH_WINDOW_MS", 0)
+
+        await asyncio.gather(
+            *(fresh_service.predict_async({"net_sqm": n}) for n in (10, 20)),
+        )
+
+        assert len(fresh_service.fake.calls) == 2  # type: ignore[attr-defined]
+        assert fresh_service._batcher is None
+
+    async def test_batcher_survives_executor_shutdown(
+        self, fresh_service: InferenceService, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("src.config.settings.INFERENCE_BATCH_WINDOW_MS", 5)
+        await fresh_service.predict_async({"net_sqm": 10})
+        batcher = fresh_service._batcher
+
+        inference_executor.shutdown_inference_executor()  # lifespan yeniden baslatma
+        monkeypatch.setattr("src.config.settings.INFERENCE_EXECUTOR", "thread")
+        try:
+            result = await fresh_service.predict_async({"net_sqm": 20})
+        finally:
+            inference_executor.shutdown_inference_executor()
+
+        assert fresh_service._batcher is batcher
+        assert result["estimated_price"] == 20_000
+
+    async def test_not_loaded_raises(self, fresh_service: InferenceService) -> None:
+        fresh_service._model_loaded = False
+        with pytest.raises(RuntimeError, match="Model yuklenmedi"):
+            await fresh_service.predict_async({"net_sqm": 100})
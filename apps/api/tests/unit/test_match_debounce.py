@@ -0,0 +1,202 @@
+"""Eşleştirme tetikleyici debounce / ofis batch — Redis bağımsız unit testler."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from src.modules.matches import debounce
+from src.modules.matches.matching_service import (
+    trigger_matching_after_customer_create,
+    trigger_matching_after_property_create,
+)
+
+OFFICE_ID = uuid.UUID("a0000000-0000-0000-0000-000000000001")
+
+
+# ================================================================
+# In-memory Redis (sadece debounce'un kullandığı komutlar)
+# ================================================================
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool | None:
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(k, None) is not None for k in keys)
+
+    def sadd(self, key: str, *members: str) -> int:
+        current = self.data.setdefault(key, set())
+        before = len(current)
+        current.update(members)
+        return len(current) - before
+
+    def expire(self, key: str, seconds: int) -> bool:
+        return key in self.data
+
+    def smembers(self, key: str) -> set[str]:
+        return set(self.data.get(key, set()))
+
+    def pipeline(self) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client: _FakeRedis) -> None:
+        self._client = client
+        self._calls: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        def _queue(*args: Any, **kwargs: Any) -> None:
+            self._calls.append((name, args, kwargs))
+        return _queue
+
+    def execute(self) -> list[Any]:
+        return [getattr(self._client, n)(*a, **kw) for n, a, kw in self._calls]
+
+
+class _DownRedis:
+    def __getattr__(self, name: str):
+        def _fail(*args: Any, **kwargs: Any) -> None:
+            raise redis.ConnectionError("down")
+        return _fail
+
+
+@pytest.fixture
+def fake_redis() -> _FakeRedis:
+    client = _FakeRedis()
+    with patch.object(debounce, "_client", client):
+        yield client
+
+
+@pytest.fixture
+def mock_tasks() -> MagicMock:
+    tasks = MagicMock()
+    with patch.dict("sys.modules", {"src.modules.matches.tasks": tasks}):
+        yield tasks
+
+
+# ================================================================
+# Debounce / Batch primitive'leri
+# ================================================================
+
+
+class TestEntityDebounce:
+    """Pencere içindeki tekrar tetikler tek çalıştırmaya iner."""
+
+    def test_claim_release_cycle(self, fake_redis: _FakeRedis) -> None:
+        entity_id = uuid.uuid4()
+        assert debounce.claim("property", entity_id, 15) is True
+        assert debounce.claim("property", entity_id, 15) is False
+        # Farklı varlık bağımsız
+        assert debounce.claim("customer", entity_id, 15) is True
+
+        debounce.release("property", entity_id)
+        assert debounce.claim("property", entity_id, 15) is True
+
+    def test_redis_down_fails_open(self) -> None:
+        with patch.object(debounce, "_client", _DownRedis()):
+            assert debounce.claim("property", uuid.uuid4(), 15) is None
+            assert debounce.enqueue_office_property(OFFICE_ID, uuid.uuid4(), 15) is None
+            debounce.release("property", uuid.uuid4())  # hata yutulur
+
+
+class TestOfficeBatch:
+    """Ofisin yeni ilanları tek batch task'ta toplanır."""
+
+    def test_enqueue_and_drain(self, fake_redis: _FakeRedis) -> None:
+        first, second = uuid.uuid4(), uuid.uuid4()
+        assert debounce.enqueue_office_property(OFFICE_ID, first, 15) is True
+        assert debounce.enqueue_office_property(OFFICE_ID, second, 15) is False
+        assert debounce.enqueue_office_property(OFFICE_ID, first, 15) is False
+
+        assert debounce.drain_office_properties(OFFICE_ID) == sorted([first, second])
+        assert debounce.drain_office_properties(OFFICE_ID) == []
+
+        # Boşaltmadan sonraki tetik yeni task planlar
+        assert debounce.enqueue_office_property(OFFICE_ID, first, 15) is True
+
+    def test_restore_after_failure(self, fake_redis: _FakeRedis) -> None:
+        ids = [uuid.uuid4(), uuid.uuid4()]
+        for pid in ids:
+            debounce.enqueue_office_property(OFFICE_ID, pid, 15)
+        drained = debounce.drain_office_properties(OFFICE_ID)
+
+        debounce.restore_office_properties(OFFICE_ID, drained)
+        assert debounce.drain_office_properties(OFFICE_ID) == sorted(ids)
+
+
+# ================================================================
+# Trigger helper'ları
+# ================================================================
+
+
+class TestTriggerHelpers:
+    """trigger_matching_after_* debounce/batch yönlendirmesi."""
+
+    def test_property_burst_schedules_one_batch(
+        self, fake_redis: _FakeRedis, mock_tasks: MagicMock,
+    ) -> None:
+        with (
+            patch("src.config.settings.MATCH_TRIGGER_DEBOUNCE_SECONDS", 15),
+            patch("src.config.settings.MATCH_TRIGGER_BATCH_PROPERTIES", True),
+        ):
+            property_id = uuid.uuid4()
+            for _ in range(5):
+                trigger_matching_after_property_create(property_id, OFFICE_ID)
+            trigger_matching_after_property_create(uuid.uuid4(), OFFICE_ID)
+
+        batch_task = mock_tasks.trigger_matching_for_office_properties
+        batch_task.apply_async.assert_called_once_with((str(OFFICE_ID),), countdown=15)
+        mock_tasks.trigger_matching_for_property.delay.assert_not_called()
+        assert len(debounce.drain_office_properties(OFFICE_ID)) == 2
+
+    def test_property_debounce_without_batching(
+        self, fake_redis: _FakeRedis, mock_tasks: MagicMock,
+    ) -> None:
+        property_id = uuid.uuid4()
+        with (
+            patch("src.config.settings.MATCH_TRIGGER_DEBOUNCE_SECONDS", 15),
+            patch("src.config.settings.MATCH_TRIGGER_BATCH_PROPERTIES", False),
+        ):
+            for _ in range(3):
+                trigger_matching_after_property_create(property_id, OFFICE_ID)
+
+        mock_tasks.trigger_matching_for_property.apply_async.assert_called_once_with(
+            (str(property_id), str(OFFICE_ID)), countdown=15,
+        )
+
+    def test_customer_burst_schedules_one_task(
+        self, fake_redis: _FakeRedis, mock_tasks: MagicMock,
+    ) -> None:
+        customer_id = uuid.uuid4()
+        with patch("src.config.settings.MATCH_TRIGGER_DEBOUNCE_SECONDS", 15):
+            assert trigger_matching_after_customer_create(customer_id, OFFICE_ID) is not None
+            assert trigger_matching_after_customer_create(customer_id, OFFICE_ID) is None
+
+        mock_tasks.trigger_matching_for_customer.apply_async.assert_called_once_with(
+            (str(customer_id), str(OFFICE_ID)), countdown=15,
+        )
+
+    def test_redis_down_enqueues_immediately(self, mock_tasks: MagicMock) -> None:
+        customer_id = uuid.uuid4()
+        with (
+            patch.object(debounce, "_client", _DownRedis()),
+            patch("src.config.settings.MATCH_TRIGGER_DEBOUNCE_SECONDS", 15),
+        ):
+            trigger_matching_after_customer_create(customer_id, OFFICE_ID)
+
+        mock_tasks.trigger_matching_for_customer.delay.assert_called_once_with(
+            str(customer_id), str(OFFICE_ID),
+        )
@@ -0,0 +1,144 @@
+"""Sehir bazli model yonlendirme — anahtar normalizasyonu, lazy yukleme, bayt butceli LRU."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.exceptions import ValidationError
+from src.modules.valuations import model_router
+from src.modules.valuations.model_router import ModelRouter, city_key
+
+DEFAULT = SimpleNamespace(_model_version="v1", city=None)
+
+
+@pytest.fixture()
+def root(tmp_path: Path) -> Path:
+    """Sehir basina 100 baytlik joblib artifact'i; dev → butceden buyuk."""
+    for city, size in (("ankara", 100), ("izmir", 100), ("bursa", 100), ("dev", 1000)):
+        (tmp_path / city).mkdir()
+        (tmp_path / city / "lgbm_model.joblib").write_bytes(b"x" * size)
+    return tmp_path
+
+
+@pytest.fixture()
+def loads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """from_artifact yerine sahte servis; yuklenen dizin adlari kaydedilir."""
+    loaded: list[str] = []
+
+    def from_artifact(model_dir, version):
+        loaded.append(Path(model_dir).name)
+        time.sleep(0.01)
+        return SimpleNamespace(
+            model_dir=Path(model_dir), _serving=None, _model_version=version, city=None,
+        )
+
+    monkeypatch.setattr(model_router.InferenceService, "from_artifact", staticmethod(from_artifact))
+    monkeypatch.setattr(model_router.InferenceService, "get_instance", staticmethod(lambda: DEFAULT))
+    return loaded
+
+
+class TestCityKey:
+    @pytest.mark.parametrize(
+        ("city", "expected"),
+        [(None, "istanbul"), ("  ", "istanbul"), ("İstanbul", "istanbul"),
+         ("İzmir", "izmir"), ("ANKARA", "ankara"), ("Şanlıurfa", "sanliurfa")],
+    )
+    def test_normalized(self, city: str | None, expected: str) -> None:
+        assert city_key(city) == expected
+
+    @pytest.mark.parametrize("city", ["../v1", "izmir/serving", "35"])
+    def test_path_like_rejected(self, city: str) -> None:
+        with pytest.raises(ValidationError):
+            city_key(city)
+
+
+class TestModelRouter:
+    def test_default_city_uses_singleton(self, root: Path, loads: list[str]) -> None:
+        router = ModelRouter(root, budget_bytes=1000)
+
+        assert router.get_service("İstanbul") is DEFAULT
+        assert router.get_service(None) is DEFAULT
+        assert loads == []
+
+    def test_lazy_load_once(self, root: Path, loads: list[str]) -> None:
+        router = ModelRouter(root, budget_bytes=1000)
+
+        first = router.get_service("Ankara")
+        second = router.get_service("ankara")
+
+        assert first is second
+        assert loads == ["ankara"]
+        assert (first._model_version, first.city) == ("ankara-v1", "ankara")
+        assert router.loaded_bytes == 100
+
+    def test_lru_eviction_under_budget(self, root: Path, loads: list[str]) -> None:
+        router = ModelRouter(root, budget_bytes=250)
+
+        router.get_service("ankara")
+        router.get_service("izmir")
+        router.get_service("ankara")  # izmir en eski
+        router.get_service("bursa")
+
+        assert router.loaded_cities() == ["ankara", "bursa"]
+        router.get_service("izmir")
+        assert loads == ["ankara", "izmir", "bursa", "izmir"]
+
+    def test_oversized_model_still_served(self, root: Path, loads: list[str]) -> None:
+        router = ModelRouter(root, budget_bytes=250)
+        router.get_service("ankara")
+
+        router.get_service("dev")
+
+        assert router.loaded_cities() == ["dev"]
+
+    def test_concurrent_first_requests_load_once(self, root: Path, loads: list[str]) -> None:
+        router = ModelRouter(root, budget_bytes=1000)
+        results: list = []
+        threads = [
+            threading.Thread(target=lambda: results.append(router.get_service("izmir")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert loads == ["izmir"]
+        assert len({id(r) for r in results}) == 1
+
+    def test_missing_city_lists_supported(self, root: Path, loads: list[str]) -> None:
+        router = ModelRouter(root, budget_bytes=1000)
+
+        with pytest.raises(ValidationError) as exc_info:
+            router.get_service("Antalya")
+
+        assert "ankara, bursa, dev, istanbul, izmir" in exc_info.value.detail
+        assert loads == []
+
+    def test_unknown_cities_leave_no_locks(
+        self, root: Path, loads: list[str], monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        router = ModelRouter(root, budget_bytes=1000)
+        scans: list[int] = []
+        iterdir = Path.iterdir
+        monkeypatch.setattr(Path, "iterdir", lambda self: scans.append(1) or iterdir(self))
+
+        for city in ("antalya", "mugla", "van"):
+            with pytest.raises(ValidationError):
+                router.get_service(city)
+
+        assert router._load_locks == {}
+        assert len(scans) == 1  # desteklenen sehir listesi cache'lendi
+
+    async def test_async_loads_off_loop(self, root: Path, loads: list[str]) -> None:
+        router = ModelRouter(root, budget_bytes=1000)
+
+        service = await router.get_service_async("Bursa")
+
+        assert service is await router.get_service_async("bursa")
+        assert loads == ["bursa"]
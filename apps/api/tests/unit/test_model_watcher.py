@@ -0,0 +1,183 @@
+"""Model registry hot swap + shadow — watcher, atomik swap, shadow fark logu."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.modules.valuations import model_watcher
+from src.modules.valuations.inference_service import InferenceService
+from src.modules.valuations.model_watcher import ModelRegistryWatcher, resolve_artifact_dir
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_INPUT = {"district": "Kadikoy", "net_sqm": 120, "room_count": 3}
+
+
+def _entry(version: str, artifact_url: str, status: str = "active") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        version=version,
+        artifact_url=artifact_url,
+        status=status,
+        updated_at=datetime.now(UTC),
+    )
+
+
+def _service(version: str, model_dir: Path, price: float = 5_000_000) -> InferenceService:
+    svc = InferenceService()
+    svc._model_loaded = True
+    svc._model_version = version
+    svc._model_fingerprint = f"fp-{version}"
+    svc.model_dir = model_dir.resolve()
+    svc.predict_async = AsyncMock(return_value={"estimated_price": price})  # type: ignore[method-assign]
+    return svc
+
+
+@pytest.fixture(autouse=True)
+def _restore_singleton():
+    instance, shadow = InferenceService._instance, InferenceService._shadow
+    yield
+    InferenceService._instance, InferenceService._shadow = instance, shadow
+
+
+@pytest.fixture()
+def loads(monkeypatch: pytest.MonkeyPatch) -> list[tuple[Path, str]]:
+    """load_candidate yerine: cagrilari kaydeder, 'bozuk' dizinlerde hata firlatir."""
+    calls: list[tuple[Path, str]] = []
+
+    def fake_load(model_dir: Path, version: str) -> InferenceService:
+        calls.append((model_dir, version))
+        if "bozuk" in model_dir.name:
+            raise RuntimeError("gecersiz isitma tahmini")
+        return _service(version, model_dir)
+
+    monkeypatch.setattr(model_watcher, "load_candidate", fake_load)
+    return calls
+
+
+def _watcher(monkeypatch: pytest.MonkeyPatch, entries: list) -> ModelRegistryWatcher:
+    watcher = ModelRegistryWatcher(poll_seconds=1)
+
+    async def fetch():
+        return entries[0], entries[1]
+
+    monkeypatch.setattr(watcher, "_fetch_entries", fetch)
+    return watcher
+
+
+class TestResolveArtifactDir:
+    def test_relative_to_src(self) -> None:
+        assert resolve_artifact_dir("ml/models/v1/") == model_watcher.SRC_DIR / "ml" / "models" / "v1"
+
+    def test_absolute(self, tmp_path: Path) -> None:
+        assert resolve_artifact_dir(str(tmp_path)) == tmp_path.resolve()
+
+    def test_remote_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Uzak"):
+            resolve_artifact_dir("s3://models/v2/")
+
+
+class TestSwapInstance:
+    def test_returns_previous_and_replaces(self, tmp_path: Path) -> None:
+        old, new = _service("v1", tmp_path / "v1"), _service("v2", tmp_path / "v2")
+        InferenceService._instance = old
+
+        assert InferenceService.swap_instance(new) is old
+        assert InferenceService.get_instance() is new
+
+
+class TestWatcherPoll:
+    async def test_active_change_swaps_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, loads: list,
+    ) -> None:
+        InferenceService._instance = _service("v1", tmp_path / "v1")
+        entries = [_entry("v2", str(tmp_path / "v2")), None]
+        watcher = _watcher(monkeypatch, entries)
+
+        await watcher.poll_once()
+        await watcher.poll_once()  # ayni kayit → tekrar yuklenmez
+
+        assert InferenceService.get_instance()._model_version == "v2"
+        assert loads == [((tmp_path / "v2").resolve(), "v2")]
+
+    async def test_already_loaded_model_not_reloaded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, loads: list,
+    ) -> None:
+        current = _service("v1", tmp_path / "v1")
+        InferenceService._instance = current
+
+        await _watcher(monkeypatch, [_entry("v1", str(tmp_path / "v1")), None]).poll_once()
+
+        assert loads == []
+        assert InferenceService.get_instance() is current
+
+    async def test_failed_load_keeps_current_model(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, loads: list,
+    ) -> None:
+        current = _service("v1", tmp_path / "v1")
+        InferenceService._instance = current
+
+        await _watcher(monkeypatch, [_entry("v2", str(tmp_path / "bozuk")), None]).poll_once()
+
+        assert len(loads) == 1
+        assert InferenceService.get_instance() is current
+
+    async def test_shadow_set_and_cleared(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, loads: list,
+    ) -> None:
+        InferenceService._instance = _service("v1", tmp_path / "v1")
+        entries = [None, _entry("v2", str(tmp_path / "v2"), status="shadow")]
+        watcher = _watcher(monkeypatch, entries)
+
+        await watcher.poll_once()
+        assert InferenceService._shadow._model_version == "v2"
+
+        entries[1] = None
+        await watcher.poll_once()
+        assert InferenceService._shadow is None
+
+
+class TestShadowScoring:
+    async def test_shadow_diff_logged_without_changing_response(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("src.config.settings.VALUATION_CACHE_ENABLED", False)
+        monkeypatch.setattr("src.config.settings.MODEL_SHADOW_SAMPLE_RATE", 1.0)
+        primary = _service("v1", tmp_path / "v1", price=5_000_000)
+        shadow = _service("v2", tmp_path / "v2", price=5_500_000)
+        InferenceService.set_shadow(shadow)
+        logged: list[dict] = []
+        monkeypatch.setattr(
+            "src.modules.valuations.inference_service.logger.info",
+            lambda event, **kw: logged.append({"event": event, **kw}),
+        )
+
+        prediction, _ = await primary.predict_cached(dict(_INPUT))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert prediction == {"estimated_price": 5_000_000}
+        shadow.predict_async.assert_awaited_once_with(_INPUT)
+        diff = next(log for log in logged if log["event"] == "inference_shadow_diff")
+        assert (diff["diff"], diff["diff_pct"]) == (500_000, 10.0)
+
+    async def test_sample_rate_zero_skips_shadow(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("src.config.settings.VALUATION_CACHE_ENABLED", False)
+        monkeypatch.setattr("src.config.settings.MODEL_SHADOW_SAMPLE_RATE", 0.0)
+        shadow = _service("v2", tmp_path / "v2")
+        InferenceService.set_shadow(shadow)
+
+        await _service("v1", tmp_path / "v1").predict_cached(dict(_INPUT))
+        await asyncio.sleep(0)
+
+        shadow.predict_async.assert_not_awaited()
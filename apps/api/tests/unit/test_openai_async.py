@@ -0,0 +1,209 @@
+"""OpenAI async yol — yerel stub sunucu ile retry, zaman asimi, operasyon semaphore'lari."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from src.services import openai_service
+from src.services.openai_exceptions import (
+    OpenAIContentFilterError,
+    OpenAIRateLimitError,
+    OpenAIServiceError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+def _completion(content: str) -> dict[str, Any]:
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "stub",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+    }
+
+
+class _StubServer:
+    """
+    OpenAI HTTP API'sini taklit eden minimal asyncio sunucusu.
+
+    Her istek icin `responses` kuyrugundan (status, body, delay) alinir;
+    kuyruk bossa `default` kullanilir. Eszamanli istek tepe degeri tutulur.
+    """
+
+    def __init__(self) -> None:
+        self.responses: list[tuple[int, dict, float]] = []
+        self.default: tuple[int, dict, float] = (200, _completion("ok"), 0.0)
+        self.paths: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self.port = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    @staticmethod
+    async def _read_body(reader: asyncio.StreamReader, headers: dict[str, str]) -> None:
+        if headers.get("transfer-encoding") != "chunked":
+            await reader.readexactly(int(headers.get("content-length", 0)))
+            return
+        # multipart (images/edits) chunked gonderilir
+        while size := int((await reader.readline()).strip(), 16):
+            await reader.readexactly(size + 2)
+        await reader.readline()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.lower()] = value.strip()
+                await self._read_body(reader, headers)
+                self.paths.append(request_line.split()[1].decode())
+
+                status, body, delay = self.responses.pop(0) if self.responses else self.default
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                try:
+                    await asyncio.sleep(delay)
+                finally:
+                    self.active -= 1
+
+                payload = json.dumps(body).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def stub(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[_StubServer]:
+    server = _StubServer()
+    await server.start()
+    monkeypatch.setattr(openai_service.settings, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(openai_service.settings, "OPENAI_BASE_URL", f"http://127.0.0.1:{server.port}/v1")
+    monkeypatch.setattr(openai_service, "_calculate_delay", lambda attempt: 0.0)
+    openai_service.reset_client()
+    try:
+        yield server
+    finally:
+        await openai_service.close_client()
+        openai_service.reset_client()
+        await server.stop()
+
+
+class TestAsyncOperations:
+    async def test_generate_text(self, stub: _StubServer) -> None:
+        stub.default = (200, _completion("  Merhaba  "), 0.0)
+
+        assert await openai_service.generate_text_async("selam", system_prompt="emlak") == "Merhaba"
+        assert stub.paths == ["/v1/chat/completions"]
+
+    async def test_analyze_image_parses_json(self, stub: _StubServer) -> None:
+        stub.default = (200, _completion('{"room_type": "salon"}'), 0.0)
+
+        assert await openai_service.analyze_image_async(b"img", "analiz") == {"room_type": "salon"}
+
+    async def test_edit_image_decodes_b64(self, stub: _StubServer) -> None:
+        png = b"\x89PNG-stub"
+        stub.default = (200, {"created": 0, "data": [{"b64_json": base64.b64encode(png).decode()}]}, 0.0)
+
+        assert await openai_service.edit_image_async(b"img", "bahce", mask_bytes=b"mask") == [png]
+        assert stub.paths == ["/v1/images/edits"]
+
+    async def test_mock_without_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(openai_service.settings, "OPENAI_API_KEY", "")
+        openai_service.reset_client()
+
+        assert await openai_service.generate_text_async("x") == openai_service._MOCK_TEXT
+
+
+class TestRetry:
+    async def test_retries_rate_limit_and_server_errors(self, stub: _StubServer) -> None:
+        stub.responses = [
+            (429, {"error": {"message": "slow down"}}, 0.0),
+            (500, {"error": {"message": "boom"}}, 0.0),
+        ]
+
+        assert await openai_service.generate_text_async("x") == "ok"
+        assert len(stub.paths) == 3
+
+    async def test_rate_limit_exhausted(self, stub: _StubServer) -> None:
+        stub.default = (429, {"error": {"message": "slow down"}}, 0.0)
+
+        with pytest.raises(OpenAIRateLimitError):
+            await openai_service.generate_text_async("x")
+        assert len(stub.paths) == openai_service.MAX_RETRIES + 1
+
+    async def test_content_filter_not_retried(self, stub: _StubServer) -> None:
+        stub.default = (400, {"error": {"message": "rejected by content_policy"}}, 0.0)
+
+        with pytest.raises(OpenAIContentFilterError):
+            await openai_service.generate_text_async("x")
+        assert len(stub.paths) == 1
+
+    async def test_request_timeout(self, stub: _StubServer, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(openai_service.settings, "OPENAI_TIMEOUT_SECONDS", 0.05)
+        monkeypatch.setattr(openai_service, "MAX_RETRIES", 1)
+        stub.default = (200, _completion("late"), 0.5)
+
+        with pytest.raises(OpenAIServiceError, match="APITimeoutError"):
+            await openai_service.generate_text_async("x")
+
+
+class TestConcurrency:
+    async def test_per_operation_limits(self, stub: _StubServer, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(openai_service.settings, "OPENAI_CONCURRENCY_TEXT", 2)
+        stub.default = (200, _completion("ok"), 0.05)
+
+        results = await asyncio.gather(*(openai_service.generate_text_async("x") for _ in range(6)))
+
+        assert results == ["ok"] * 6
+        assert stub.peak == 2
+
+    async def test_image_burst_does_not_block_text(
+        self, stub: _StubServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(openai_service.settings, "OPENAI_CONCURRENCY_IMAGE", 1)
+        image = {"created": 0, "data": [{"b64_json": base64.b64encode(b"x").decode()}]}
+        stub.responses = [(200, image, 0.3)]
+
+        edits = asyncio.create_task(openai_service.edit_image_async(b"img", "a"))
+        while not stub.active:  # gorsel istegi sunucuda, slotu tutuyor
+            await asyncio.sleep(0.01)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        assert await openai_service.generate_text_async("x") == "ok"
+        assert loop.time() - started < 0.2
+        assert await edits == [b"x"]
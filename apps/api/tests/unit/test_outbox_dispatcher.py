@@ -0,0 +1,188 @@
+"""Outbox dispatcher — handler registry, dispatch sonuclari, tip bazli eszamanlilik, listener."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.services import outbox_handlers
+from src.services.outbox_handlers import OutboxHandlerRegistry, handle_notification
+from src.services.outbox_listener import OutboxListener
+from src.services.outbox_worker import OutboxWorker
+
+
+def _event(event_type: str = "notification", retry_count: int = 0, **payload: Any) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        event_type=event_type,
+        aggregate_type="Test",
+        aggregate_id=uuid.uuid4(),
+        payload=payload,
+        retry_count=retry_count,
+    )
+
+
+async def _settle() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def _worker(registry: OutboxHandlerRegistry) -> OutboxWorker:
+    # Dispatch DB'ye dokunmaz; session factory kullanilmaz
+    return OutboxWorker(session_factory=None, handlers=registry)  # type: ignore[arg-type]
+
+
+class TestRegistry:
+    def test_register_and_limits(self) -> None:
+        registry = OutboxHandlerRegistry(default_concurrency=4)
+
+        async def handler(event: Any) -> None:
+            pass
+
+        registry.register("a", handler, concurrency=2)
+        registry.register("b", handler)
+
+        assert registry.get("a") is handler
+        assert registry.get("missing") is None
+        assert (registry.concurrency("a"), registry.concurrency("b")) == (2, 4)
+        assert registry.list_event_types() == ["a", "b"]
+
+        with pytest.raises(ValueError):
+            registry.register("a", handler)
+
+    def test_default_registry_routes_notifications(self) -> None:
+        assert outbox_handlers.default_registry().get("notification") is handle_notification
+
+
+class TestDispatch:
+    async def test_outcomes(self) -> None:
+        registry = OutboxHandlerRegistry()
+
+        async def ok(event: Any) -> None:
+            pass
+
+        async def flaky(event: Any) -> None:
+            raise ConnectionError("down")
+
+        async def bad(event: Any) -> None:
+            raise ValueError("invalid payload")
+
+        registry.register("ok", ok)
+        registry.register("notification", flaky)
+        registry.register("bad", bad)
+        worker = _worker(registry)
+
+        sent = await worker._dispatch(_event("ok"))
+        unhandled = await worker._dispatch(_event("unknown"))
+        retry = await worker._dispatch(_event("notification"))
+        exhausted = await worker._dispatch(_event("notification", retry_count=2))  # max_retries=3
+        dead = await worker._dispatch(_event("bad"))
+
+        assert (sent.status, unhandled.status) == ("sent", "sent")
+        assert (retry.status, retry.retry_count, retry.error_message) == ("pending", 1, "down")
+        assert retry.backoff_seconds > 0
+        assert (exhausted.status, exhausted.retry_count) == ("dead_letter", 3)
+        assert (dead.status, dead.error_message) == ("dead_letter", "invalid payload")
+
+    async def test_timeout_is_retried(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("src.services.outbox_worker.settings.OUTBOX_HANDLER_TIMEOUT_SECONDS", 0.01)
+        registry = OutboxHandlerRegistry()
+
+        async def hang(event: Any) -> None:
+            await asyncio.sleep(1)
+
+        registry.register("notification", hang)
+
+        outcome = await _worker(registry)._dispatch(_event("notification"))
+
+        assert (outcome.status, outcome.error_message) == ("pending", "TimeoutError")
+
+    async def test_per_type_concurrency(self) -> None:
+        registry = OutboxHandlerRegistry()
+        active: dict[str, int] = {"slow": 0, "fast": 0}
+        peak: dict[str, int] = {"slow": 0, "fast": 0}
+
+        def tracking(kind: str):
+            async def handler(event: Any) -> None:
+                active[kind] += 1
+                peak[kind] = max(peak[kind], active[kind])
+                await asyncio.sleep(0.01)
+                active[kind] -= 1
+
+            return handler
+
+        registry.register("slow", tracking("slow"), concurrency=2)
+        registry.register("fast", tracking("fast"), concurrency=10)
+        worker = _worker(registry)
+
+        events = [_event("slow") for _ in range(8)] + [_event("fast") for _ in range(8)]
+        outcomes = await asyncio.gather(*(worker._dispatch(e) for e in events))
+
+        assert all(o.status == "sent" for o in outcomes)
+        assert peak == {"slow": 2, "fast": 8}
+
+
+class TestNotificationHandler:
+    async def test_emits_to_user(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[tuple] = []
+
+        async def fake_emit(user_id: str, event_type: Any, payload: dict) -> bool:
+            calls.append((user_id, event_type, payload))
+            return False  # bagli degil → hata degil
+
+        monkeypatch.setattr(outbox_handlers, "emit_event", fake_emit)
+
+        await handle_notification(_event(user_id="u1", title="Yeni mesaj"))
+
+        assert calls[0][0] == "u1"
+        assert calls[0][2]["title"] == "Yeni mesaj"
+
+    async def test_missing_user_is_permanent(self) -> None:
+        with pytest.raises(ValueError):
+            await handle_notification(_event(title="x"))
+
+
+class _Worker:
+    def __init__(self) -> None:
+        self.drains = 0
+
+    async def drain(self) -> int:
+        self.drains += 1
+        return 0
+
+
+class _Conn:
+    def is_closed(self) -> bool:
+        return False
+
+
+class TestListener:
+    async def test_notify_wakes_drain(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("src.services.outbox_listener.settings.OUTBOX_LISTEN_FALLBACK_SECONDS", 60.0)
+        worker = _Worker()
+        listener = OutboxListener(worker, dsn="postgresql://unused")  # type: ignore[arg-type]
+        task = asyncio.create_task(listener._drain_loop(_Conn()))
+        try:
+            await _settle()
+            assert worker.drains == 1  # LISTEN sonrasi ilk bosaltma
+
+            listener.notify(None, 0, "outbox_events", "")
+            await _settle()
+            assert worker.drains == 2
+        finally:
+            task.cancel()
+
+    async def test_fallback_drains_without_notify(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("src.services.outbox_listener.settings.OUTBOX_LISTEN_FALLBACK_SECONDS", 0.01)
+        worker = _Worker()
+        listener = OutboxListener(worker, dsn="postgresql://unused")  # type: ignore[arg-type]
+        task = asyncio.create_task(listener._drain_loop(_Conn()))
+        try:
+            await asyncio.sleep(0.05)
+            assert worker.drains >= 3
+        finally:
+            task.cancel()
@@ -0,0 +1,246 @@
+"""Keyset (cursor) pagination yardimcilari unit testleri."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.core.exceptions import ValidationError
+from src.core.pagination import (
+    CountStrategy,
+    Page,
+    SortKey,
+    _Explain,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    order_by_keys,
+    resolve_count_strategy,
+    trim_page,
+)
+from src.models.customer import Customer
+from src.models.property import Property
+
+# ---------- Yardimci ----------
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+# ---------- encode_cursor / decode_cursor ----------
+
+
+class TestCursorRoundTrip:
+    """Cursor encode/decode tip korumasi ve dogrulama."""
+
+    def test_typed_values_round_trip(self) -> None:
+        """UUID, datetime, Decimal, float, str ve None tipleri korunmali."""
+        values = [
+            uuid.uuid4(),
+            datetime(2026, 3, 1, 12, 30, tzinfo=UTC),
+            Decimal("2450000.00"),
+            0.4375,
+            "Ayşe Yılmaz",
+            None,
+        ]
+        cursor = encode_cursor("scope", values)
+        assert decode_cursor(cursor, "scope", len(values)) == values
+
+    def test_cursor_is_url_safe(self) -> None:
+        """Cursor query string'de escape gerektirmemeli."""
+        cursor = encode_cursor("search:newest", [datetime.now(UTC), uuid.uuid4()])
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    def test_scope_mismatch_rejected(self) -> None:
+        """Baska siralama icin uretilmis cursor reddedilmeli."""
+        cursor = encode_cursor("search:price_asc", [Decimal("1"), uuid.uuid4()])
+        with pytest.raises(ValidationError):
+            decode_cursor(cursor, "search:price_desc", 2)
+
+    def test_size_mismatch_rejected(self) -> None:
+        """Anahtar sayisi uyusmayan cursor reddedilmeli."""
+        cursor = encode_cursor("appointments", [uuid.uuid4()])
+        with pytest.raises(ValidationError):
+            decode_cursor(cursor, "appointments", 2)
+
+    @pytest.mark.parametrize("garbage", ["", "abc", "!!!", "eyJzIjoxfQ"])
+    def test_garbage_rejected(self, garbage: str) -> None:
+        """Bozuk cursor 422 (ValidationError) vermeli, 500 degil."""
+        with pytest.raises(ValidationError):
+            decode_cursor(garbage, "appointments", 2)
+
+
+# ---------- keyset_after ----------
+
+
+class TestKeysetAfter:
+    """Keyset WHERE kosulu uretimi."""
+
+    def test_uniform_direction_uses_row_comparison(self) -> None:
+        """Ayni yonlu, NOT NULL anahtarlar row-value karsilastirmasi kullanmali."""
+        keys = [SortKey(Property.price), SortKey(Property.id)]
+        sql = _sql(keyset_after(keys, [Decimal("100"), uuid.uuid4()]))
+        assert sql.startswith("(properties.price, properties.id) <")
+
+    def test_ascending_uses_greater_than(self) -> None:
+        """Artan siralamada sonraki satirlar buyuktur."""
+        keys = [
+            SortKey(Property.price, descending=False),
+            SortKey(Property.id, descending=False),
+        ]
+        sql = _sql(keyset_after(keys, [Decimal("100"), uuid.uuid4()]))
+        assert "(properties.price, properties.id) >" in sql
+
+    def test_nullable_nulls_last_includes_nulls(self) -> None:
+        """NULLS LAST siralamada NULL satirlar her zaman sonra gelir."""
+        keys = [SortKey(Property.net_area, nullable=True, nulls_last=True), SortKey(Property.id)]
+        sql = _sql(keyset_after(keys, [Decimal("90"), uuid.uuid4()]))
+        assert "properties.net_area IS NULL" in sql
+        assert "properties.net_area <" in sql
+
+    def test_null_cursor_value_nulls_last(self) -> None:
+        """Cursor NULL bolgesindeyse sadece NULL + daha kucuk id kalir."""
+        keys = [SortKey(Property.net_area, nullable=True, nulls_last=True), SortKey(Property.id)]
+        sql = _sql(keyset_after(keys, [None, uuid.uuid4()]))
+        assert sql.startswith("properties.net_area IS NULL AND properties.id <")
+
+    def test_nulls_first_default_for_desc(self) -> None:
+        """DESC nullable kolon (PG varsayilani NULLS FIRST) icin NULL cursor sonrasi = NOT NULL."""
+        keys = [SortKey(Customer.last_contact_at, nullable=True), SortKey(Customer.id)]
+        sql = _sql(keyset_after(keys, [None, uuid.uuid4()]))
+        assert "customers.last_contact_at IS NOT NULL" in sql
+        orders = [_sql(o) for o in order_by_keys(keys)]
+        assert orders[0] == "customers.last_contact_at DESC NULLS FIRST"
+
+
+# ---------- trim_page ----------
+
+
+class TestTrimPage:
+    """limit + 1 satirdan sayfa + cursor uretimi."""
+
+    def test_extra_row_produces_cursor(self) -> None:
+        rows = [(i, uuid.uuid4()) for i in range(4)]
+        items, cursor = trim_page(rows, 3, "x", lambda r: [r[0], r[1]])
+        assert items == rows[:3]
+        assert cursor is not None
+        assert decode_cursor(cursor, "x", 2) == [2, rows[2][1]]
+
+    def test_last_page_has_no_cursor(self) -> None:
+        rows = [(i, uuid.uuid4()) for i in range(3)]
+        items, cursor = trim_page(rows, 3, "x", lambda r: [r[0], r[1]])
+        assert items == rows
+        assert cursor is None
+
+
+# ---------- count_rows ----------
+
+
+class _FakeSession:
+    """execute() cagrilarini kaydeden, sirayla scalar donduren sahte session."""
+
+    def __init__(self, *scalars: object) -> None:
+        self._scalars = list(scalars)
+        self.statements: list[object] = []
+
+    async def execute(self, stmt: object) -> MagicMock:
+        self.statements.append(stmt)
+        result = MagicMock()
+        result.scalar_one.return_value = self._scalars.pop(0)
+        return result
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+
+_CUSTOMER_IDS = select(Customer.id).where(Customer.office_id == uuid.uuid4())
+
+
+class TestCountRows:
+    """Sayim stratejileri: kac sorgu atildigi ve total_exact bayragi."""
+
+    async def test_exact_single_count(self) -> None:
+        db = _FakeSession(12345)
+        total, exact = await count_rows(db, _CUSTOMER_IDS, strategy=CountStrategy.EXACT)
+        assert (total, exact) == (12345, True)
+        assert len(db.statements) == 1
+
+    async def test_estimate_below_threshold_is_exact(self) -> None:
+        """Esik altinda sinirli sayim zaten kesin — EXPLAIN calismaz."""
+        db = _FakeSession(42)
+        total, exact = await count_rows(
+            db, _CUSTOMER_IDS, strategy=CountStrategy.ESTIMATE, threshold=100
+        )
+        assert (total, exact) == (42, True)
+        assert len(db.statements) == 1
+        assert "LIMIT" in _sql(db.statements[0])
+
+    async def test_estimate_above_threshold_uses_planner(self) -> None:
+        plan = json.dumps([{"Plan": {"Plan Rows": 25000}}])
+        db = _FakeSession(101, plan)
+        total, exact = await count_rows(
+            db, _CUSTOMER_IDS, strategy=CountStrategy.ESTIMATE, threshold=100
+        )
+        assert (total, exact) == (25000, False)
+        assert isinstance(db.statements[1], _Explain)
+
+    async def test_estimate_never_below_capped_count(self) -> None:
+        """Planner eski istatistikle dusuk tahmin verirse alt sinir korunur."""
+        db = _FakeSession(101, [{"Plan": {"Plan Rows": 7}}])
+        total, exact = await count_rows(
+            db, _CUSTOMER_IDS, strategy=CountStrategy.ESTIMATE, threshold=100
+        )
+        assert (total, exact) == (101, False)
+
+    async def test_has_more_returns_lower_bound(self) -> None:
+        db = _FakeSession(101)
+        total, exact = await count_rows(
+            db, _CUSTOMER_IDS, strategy=CountStrategy.HAS_MORE, threshold=100
+        )
+        assert (total, exact) == (101, False)
+        assert len(db.statements) == 1
+
+    def test_explain_compiles_with_binds(self) -> None:
+        sql = _sql(_Explain(_CUSTOMER_IDS))
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT customers.id")
+        assert "%(office_id_1)s" in sql
+
+
+class TestCountStrategyConfig:
+    """Endpoint bazli strateji secimi."""
+
+    def test_endpoint_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from src.core import pagination
+
+        monkeypatch.setattr(pagination.settings, "COUNT_STRATEGIES", {"customers": "has_more"})
+        monkeypatch.setattr(pagination.settings, "COUNT_STRATEGY_DEFAULT", "estimate")
+        assert resolve_count_strategy("customers") is CountStrategy.HAS_MORE
+        assert resolve_count_strategy("notes") is CountStrategy.ESTIMATE
+
+    def test_default_is_exact(self) -> None:
+        # Opt-in olmayan endpoint'ler toplami kesin dondurmeye devam eder
+        assert resolve_count_strategy("appointments") is CountStrategy.EXACT
+        assert resolve_count_strategy("customers") is CountStrategy.ESTIMATE
+
+    def test_invalid_falls_back_to_exact(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from src.core import pagination
+
+        monkeypatch.setattr(pagination.settings, "COUNT_STRATEGIES", {"notes": "guess"})
+        assert resolve_count_strategy("notes") is CountStrategy.EXACT
+
+    def test_page_has_more_from_cursor(self) -> None:
+        assert Page(items=[], total=0, next_cursor="abc").has_more is True
+        assert Page(items=[], total=0).has_more is False
@@ -0,0 +1,368 @@
+"""Toplu portfoy degerleme — ilan → model girdisi, parca dongusu, imlec/ilerleme."""
+
+from __future__ import annotations
+
+import uuid
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.models.property import parse_rooms
+from src.modules.valuations import portfolio_valuation as pv
+from src.modules.valuations.portfolio_valuation import property_to_model_input
+
+OFFICE = uuid.uuid4()
+RUN = uuid.uuid4()
+
+
+def _prop(**overrides) -> SimpleNamespace:
+    values = {
+        "id": uuid.uuid4(),
+        "price": Decimal("5000000"),
+        "rooms": "3+1",
+        "net_area": Decimal("100"),
+        "gross_area": Decimal("120"),
+        "floor_number": 2,
+        "total_floors": 6,
+        "building_age": 10,
+        "heating_type": "Dogalgaz Kombi",
+        "city": "İstanbul",
+        "district": "Kadikoy",
+        "neighborhood": "Caferaga",
+        "property_type": "Daire",
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestModelInput:
+    @pytest.mark.parametrize(
+        ("rooms", "expected"),
+        [("3+1", (3, 1)), (" 2 + 0 ", (2, 0)), ("4", (4, None)), ("1000", None),
+         ("stüdyo", None), ("", None), (None, None)],
+    )
+    def test_parse_rooms(self, rooms: str | None, expected: tuple | None) -> None:
+        assert parse_rooms(rooms) == expected
+
+    def test_matches_valuation_request_fields(self) -> None:
+        from src.modules.valuations.schemas import ValuationRequest
+
+        model_input = property_to_model_input(_prop())
+
+        assert model_input == ValuationRequest(**model_input).to_model_input()
+        assert (model_input["room_count"], model_input["living_room_count"]) == (3, 1)
+
+    def test_missing_optional_fields_filled(self) -> None:
+        model_input = property_to_model_input(
+            _prop(gross_area=None, floor_number=None, total_floors=None, building_age=None,
+                  heating_type=None, neighborhood=None),
+        )
+
+        assert model_input["gross_sqm"] == 100.0
+        assert (model_input["floor"], model_input["total_floors"]) == (0, 1)
+        assert (model_input["building_age"], model_input["heating_type"]) == (0, "")
+
+    def test_single_number_assumes_one_living_room(self) -> None:
+        model_input = property_to_model_input(_prop(rooms=" 4 "))
+
+        assert (model_input["room_count"], model_input["living_room_count"]) == (4, 1)
+
+    @pytest.mark.parametrize("overrides", [{"net_area": None}, {"rooms": "dubleks"}])
+    def test_unusable_property_skipped(self, overrides: dict) -> None:
+        assert property_to_model_input(_prop(**overrides)) is None
+
+
+class _Executor:
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    async def run(self, service, inputs: list[dict]) -> list[dict]:
+        self.batches.append(len(inputs))
+        return [
+            {"estimated_price": int(i["net_sqm"] * 50_000), "confidence_low": 1,
+             "confidence_high": 2, "confidence": 0.8}
+            for i in inputs
+        ]
+
+
+@pytest.fixture()
+def job(monkeypatch: pytest.MonkeyPatch):
+    """DB ve model yerine sahte nesneler; parcalar keyset'e gore listeden verilir."""
+    props = sorted(
+        [_prop() for _ in range(5)] + [_prop(rooms=None), _prop(net_area=None)],
+        key=lambda p: p.id,
+    )
+    run = SimpleNamespace(
+        office_id=OFFICE, status="pending", started_at=None, total_count=0,
+        processed_count=0, skipped_count=0, cursor_property_id=None,
+        model_version=None, error=None,
+    )
+    db = MagicMock()
+    db.get = AsyncMock(return_value=run)
+    db.execute = AsyncMock(return_value=MagicMock(scalar_one=MagicMock(return_value=len(props))))
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
+    executor = _Executor()
+    fetches: list[uuid.UUID | None] = []
+
+    async def fetch(db, office_id, *, after, chunk_size):
+        fetches.append(after)
+        remaining = [p for p in props if after is None or p.id > after]
+        return remaining[:chunk_size]
+
+    monkeypatch.setattr(pv, "_fetch_chunk", fetch)
+    monkeypatch.setattr(pv, "get_inference_executor", lambda: executor)
+    monkeypatch.setattr(
+        pv.InferenceService, "get_instance", classmethod(lambda cls: SimpleNamespace(_model_version="v1")),
+    )
+    return SimpleNamespace(props=props, run=run, db=db, executor=executor, fetches=fetches)
+
+
+def _inserted(db: MagicMock) -> list[dict]:
+    return [
+        row
+        for call in db.execute.call_args_list
+        if len(call.args) == 2
+        for row in call.args[1]
+    ]
+
+
+class TestRunPortfolioValuation:
+    async def test_chunks_predicted_and_bulk_inserted(self, job) -> None:
+        progress: list[int] = []
+
+        stats = await pv.run_portfolio_valuation(
+            job.db, RUN, OFFICE, chunk_size=3,
+            on_progress=lambda s: progress.append(s.processed_count + s.skipped_count),
+        )
+
+        assert (stats.total_count, stats.processed_count, stats.skipped_count) == (7, 5, 2)
+        assert sum(job.executor.batches) == 5
+        assert progress == [3, 6, 7]
+        assert job.fetches == [None, job.props[2].id, job.props[5].id]
+
+        rows = _inserted(job.db)
+        assert {r["property_id"] for r in rows} == {p.id for p in job.props if p.rooms and p.net_area}
+        assert all(r["run_id"] == RUN and r["office_id"] == OFFICE for r in rows)
+        assert rows[0]["estimated_price"] == 5_000_000
+        assert job.run.status == "running"  # tamamlanma UPDATE ile yazilir
+        assert job.db.commit.await_count == 1 + 3 + 1  # baslangic + parca basina + bitis
+
+    async def test_resumes_from_cursor(self, job) -> None:
+        job.run.started_at = "2026-03-12"
+        job.run.status = "failed"
+        job.run.total_count = 7
+        job.run.processed_count = 3
+        job.run.cursor_property_id = job.props[2].id
+
+        stats = await pv.run_portfolio_valuation(job.db, RUN, OFFICE, chunk_size=10)
+
+        assert job.fetches == [job.props[2].id]
+        assert stats.processed_count + stats.skipped_count == 7
+        assert stats.resumed_count == 3
+        assert job.run.error is None
+
+    async def test_completed_run_not_rerun(self, job) -> None:
+        job.run.status = "completed"
+
+        await pv.run_portfolio_valuation(job.db, RUN, OFFICE)
+
+        assert job.fetches == []
+        job.db.commit.assert_not_awaited()
+
+    async def test_routes_by_city_and_skips_unsupported(
+        self, job, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        usable = [p for p in job.props if p.rooms and p.net_area]
+        usable[0].city = "İzmir"
+        usable[1].city = "Ankara"
+        izmir = SimpleNamespace(_model_version="izmir-v1")
+        batches: list[tuple[str, int]] = []
+        run = job.executor.run
+
+        async def run_recording(service, inputs):
+            batches.append((service._model_version, len(inputs)))
+            return await run(service, inputs)
+
+        async def route(city):
+            if city == "Ankara":
+                raise pv.ValidationError(detail="Ankara icin degerleme modeli yok")
+            return izmir if city == "İzmir" else pv.InferenceService.get_instance()
+
+        job.executor.run = run_recording
+        monkeypatch.setattr(pv, "get_model_router", lambda: SimpleNamespace(get_service_async=route))
+
+        stats = await pv.run_portfolio_valuation(job.db, RUN, OFFICE, chunk_size=10)
+
+        assert (stats.processed_count, stats.skipped_count) == (4, 3)
+        assert sorted(batches) == [("izmir-v1", 1), ("v1", 3)]
+        assert {r["property_id"] for r in _inserted(job.db)} == {
+            p.id for p in usable if p.city != "Ankara"
+        }
+
+    async def test_failure_marks_run_failed(self, job, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def broken(service, inputs):
+            raise RuntimeError("model hatasi")
+
+        job.executor.run = broken
+
+        with pytest.raises(RuntimeError):
+            await pv.run_portfolio_valuation(job.db, RUN, OFFICE, chunk_size=3)
+
+        job.db.rollback.assert_awaited_once()
+        failed = job.db.execute.call_args_list[-1].args[0]
+        assert failed.compile().params["status"] == "failed"
+
+    async def test_superseded_run_stops_without_writing(self, job) -> None:
+        # Takilmis sayilip kapatilan calistirma: ilerleme UPDATE'i satir bulamaz
+        job.db.execute = AsyncMock(
+            return_value=MagicMock(scalar_one=MagicMock(return_value=7), rowcount=0),
+        )
+
+        stats = await pv.run_portfolio_valuation(job.db, RUN, OFFICE, chunk_size=3)
+
+        assert job.fetches == [None, job.props[2].id]  # ilk parca + on-okuma, sonra durur
+        assert job.db.commit.await_count == 1  # yalnizca baslangic
+        job.db.rollback.assert_awaited_once()
+        assert stats.processed_count + stats.skipped_count == 3
+
+    async def test_expired_before_completion_stays_failed(self, job) -> None:
+        # Son parcadan sonra takilmis sayilip kapatildi: tamamlanma UPDATE'i satir bulamaz
+        execute = job.db.execute
+
+        async def guarded(stmt, *args):
+            params = getattr(stmt, "compile", None) and stmt.compile().params
+            if params and params.get("status") == "completed":
+                assert params.get("status_1") == "running"
+                return MagicMock(rowcount=0)
+            return await execute(stmt, *args)
+
+        job.db.execute = AsyncMock(side_effect=guarded)
+
+        await pv.run_portfolio_valuation(job.db, RUN, OFFICE, chunk_size=10)
+
+        assert job.db.commit.await_count == 1 + 1  # baslangic + tek parca, bitis yok
+        job.db.rollback.assert_awaited_once()
+
+
+class _Nested:
+    def __init__(self, exc: Exception | None = None) -> None:
+        self.exc = exc
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *args) -> bool:
+        if self.exc is not None and args[0] is None:
+            raise self.exc
+        return False
+
+
+class TestStartPortfolioValuation:
+    """POST /portfolio-runs — tek aktif calistirma, catisma, kuyruk hatasi."""
+
+    @pytest.fixture()
+    def api(self, monkeypatch: pytest.MonkeyPatch):
+        from src.modules.valuations import portfolio_router, tasks
+
+        user = SimpleNamespace(id=uuid.uuid4(), office_id=OFFICE)
+        db = MagicMock()
+        db.add = MagicMock()
+        db.flush = AsyncMock()
+        db.commit = AsyncMock()
+        db.begin_nested = MagicMock(return_value=_Nested())
+
+        async def refresh(run) -> None:
+            run.id = RUN
+            run.status = "pending"
+            run.total_count = run.processed_count = run.skipped_count = 0
+            run.created_at = "2026-03-16T00:00:00Z"
+
+        db.refresh = AsyncMock(side_effect=refresh)
+        state = SimpleNamespace(active=[None], expired=0, failed=[], delay=MagicMock())
+
+        async def active_run(db, office_id):
+            return state.active.pop(0) if state.active else None
+
+        async def expire_stale_runs(db, office_id):
+            state.expired += 1
+            return 0
+
+        async def mark_run_failed(db, run_id, office_id, error):
+            state.failed.append((run_id, error))
+
+        monkeypatch.setattr(portfolio_router, "active_run", active_run)
+        monkeypatch.setattr(portfolio_router, "expire_stale_runs", expire_stale_runs)
+        monkeypatch.setattr(portfolio_router, "mark_run_failed", mark_run_failed)
+        monkeypatch.setattr(tasks.run_portfolio_valuation, "delay", state.delay)
+        return SimpleNamespace(
+            start=portfolio_router.start_portfolio_valuation, db=db, user=user, state=state,
+        )
+
+    @staticmethod
+    def _run(**overrides) -> SimpleNamespace:
+        values = {
+            "id": uuid.uuid4(), "status": "running", "model_version": "v1", "total_count": 10,
+            "processed_count": 4, "skipped_count": 0, "error": None,
+            "created_at": "2026-03-16T00:00:00Z", "started_at": None, "finished_at": None,
+        }
+        values.update(overrides)
+        return SimpleNamespace(**values)
+
+    async def test_creates_and_enqueues(self, api) -> None:
+        response = await api.start(api.db, api.user)
+
+        assert response.id == str(RUN)
+        assert api.state.expired == 1  # takilmis kayitlar once kapatilir
+        api.state.delay.assert_called_once_with(str(RUN), str(OFFICE), str(api.user.id))
+
+    async def test_returns_existing_active_run(self, api) -> None:
+        existing = self._run()
+        api.state.active = [existing]
+
+        response = await api.start(api.db, api.user)
+
+        assert response.id == str(existing.id)
+        api.db.add.assert_not_called()
+        api.state.delay.assert_not_called()
+
+    async def test_concurrent_insert_returns_winner(self, api) -> None:
+        from sqlalchemy.exc import IntegrityError
+
+        winner = self._run(status="pending")
+        api.state.active = [None, winner]
+        api.db.begin_nested.return_value = _Nested(IntegrityError("INSERT", {}, Exception("uq")))
+
+        response = await api.start(api.db, api.user)
+
+        assert response.id == str(winner.id)
+        api.db.commit.assert_not_awaited()
+        api.state.delay.assert_not_called()
+
+    async def test_enqueue_failure_marks_run_failed(self, api) -> None:
+        api.state.delay.side_effect = ConnectionError("broker yok")
+
+        with pytest.raises(ConnectionError):
+            await api.start(api.db, api.user)
+
+        assert api.state.failed == [(RUN, "Kuyruga eklenemedi: broker yok")]
+
+
+class TestStaleRuns:
+    async def test_expires_only_old_active_runs(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        monkeypatch.setattr(pv.settings, "PORTFOLIO_VALUATION_STALE_MINUTES", 15)
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+
+        assert await pv.expire_stale_runs(db, OFFICE) == 1
+
+        compiled = db.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "valuation_snapshot_runs.updated_at < now() - " in sql
+        assert "valuation_snapshot_runs.status IN" in sql
+        assert compiled.params["status"] == "failed"
+        assert "15 dakikadir" in compiled.params["error"]
@@ -0,0 +1,44 @@
+"""Ofis bazli toplu eslestirme — surum ozeti ve metrik unit testleri."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.modules.matches import rematch
+from src.modules.matches.rematch import RematchStats, scoring_version
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class TestScoringVersion:
+    """Agirlik/esik degisince tam yeniden hesaplama tetiklenmeli."""
+
+    def test_stable_across_calls(self) -> None:
+        assert scoring_version() == scoring_version()
+        assert len(scoring_version()) == 64
+
+    def test_changes_with_threshold(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        before = scoring_version()
+        monkeypatch.setattr(rematch, "SCORE_THRESHOLD", 65)
+        assert scoring_version() != before
+
+    def test_changes_with_weights(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        before = scoring_version()
+        monkeypatch.setattr(
+            rematch, "DEFAULT_WEIGHTS",
+            {"price": 0.40, "location": 0.30, "room": 0.15, "area": 0.15},
+        )
+        assert scoring_version() != before
+
+
+class TestRematchStats:
+    """Throughput metrigi."""
+
+    def test_pairs_per_second(self) -> None:
+        stats = RematchStats(office_id="x", mode="full", pairs_scored=50_000, elapsed_ms=2_000)
+        assert stats.pairs_per_second == 25_000.0
+        assert stats.as_dict()["pairs_per_second"] == 25_000.0
+
+    def test_zero_elapsed(self) -> None:
+        assert RematchStats(office_id="x", mode="incremental").pairs_per_second == 0.0
@@ -0,0 +1,153 @@
+"""Table archiver — aylik partition hesaplari, batch dongusu, partition DROP kurallari."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, ClassVar
+
+from src.services import table_archiver
+from src.services.table_archiver import (
+    ArchivePolicy,
+    add_months,
+    archive_policies,
+    archive_table,
+    drop_expired_partitions,
+    month_start,
+    partition_name,
+)
+
+if TYPE_CHECKING:
+    import pytest
+
+NOW = datetime(2026, 3, 15, 12, 30, tzinfo=UTC)
+
+
+class _Result:
+    def __init__(self, value=None, rows=None, rowcount=0) -> None:
+        self._value = value
+        self._rows = rows or []
+        self.rowcount = rowcount
+
+    def scalar(self):
+        return self._value
+
+    def scalars(self) -> _Result:
+        return self
+
+    def all(self) -> list:
+        return self._rows
+
+
+class _Session:
+    """SQL metnine gore sahte sonuc doner; calistirilan ifadeleri kaydeder."""
+
+    def __init__(self, oldest=None, batches=(), partitions=()) -> None:
+        self.oldest = oldest
+        self.batches = list(batches)
+        self.partitions = list(partitions)
+        self.statements: list[str] = []
+        self.commits = 0
+
+    def execute(self, statement, params=None) -> _Result:
+        sql = str(statement)
+        self.statements.append(sql)
+        if sql.startswith("SELECT min(created_at)"):
+            return _Result(self.oldest)
+        if sql.startswith("WITH moved"):
+            return _Result(rowcount=self.batches.pop(0) if self.batches else 0)
+        if "pg_inherits" in sql:
+            return _Result(rows=self.partitions)
+        return _Result()
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+class TestMonths:
+    def test_month_arithmetic(self) -> None:
+        assert month_start(NOW) == datetime(2026, 3, 1, tzinfo=UTC)
+        assert add_months(datetime(2026, 11, 1, tzinfo=UTC), 2) == datetime(2027, 1, 1, tzinfo=UTC)
+        assert add_months(datetime(2026, 1, 1, tzinfo=UTC), -1) == datetime(2025, 12, 1, tzinfo=UTC)
+
+    def test_partition_name(self) -> None:
+        policy = ArchivePolicy("audit_logs", timedelta(days=1))
+        assert partition_name(policy, datetime(2026, 3, 1, tzinfo=UTC)) == "audit_logs_archive_2026_03"
+
+
+class TestPolicies:
+    def test_only_finished_queue_rows(self) -> None:
+        policies = {p.table: p for p in archive_policies()}
+
+        assert set(policies) == {"outbox_events", "inbox_events", "audit_logs"}
+        assert policies["outbox_events"].condition == "status = 'sent'"
+        assert policies["inbox_events"].condition == "status = 'processed'"
+        assert policies["audit_logs"].min_keep_months >= 24
+
+    def test_prediction_logs_not_archived(self) -> None:
+        # Degerleme gecmisi / detay / PDF prediction_logs'tan okunur
+        assert all(p.table != "prediction_logs" for p in archive_policies())
+
+
+class TestArchiveTable:
+    def test_nothing_to_move(self) -> None:
+        session = _Session(oldest=None)
+        policy = ArchivePolicy("inbox_events", timedelta(days=90))
+
+        assert archive_table(session, policy, now=NOW) == 0
+        assert not any(s.startswith("WITH moved") for s in session.statements)
+
+    def test_creates_partitions_and_stops_on_short_batch(self) -> None:
+        session = _Session(oldest=datetime(2025, 11, 20, tzinfo=UTC), batches=[100, 100, 40, 100])
+        policy = ArchivePolicy("inbox_events", timedelta(days=90))  # cutoff 2025-12-15
+
+        moved = archive_table(session, policy, now=NOW, batch_size=100, max_batches=10)
+
+        creates = [s for s in session.statements if s.startswith("CREATE TABLE")]
+        assert moved == 240
+        assert [c.split()[5] for c in creates] == [
+            "inbox_events_archive_2025_11",
+            "inbox_events_archive_2025_12",
+        ]
+        assert session.commits == 4  # partition'lar + 3 batch
+
+    def test_max_batches_bounds_single_run(self) -> None:
+        session = _Session(oldest=NOW - timedelta(days=2), batches=[10] * 5)
+        policy = ArchivePolicy("outbox_events", timedelta(hours=24), condition="status = 'sent'")
+
+        assert archive_table(session, policy, now=NOW, batch_size=10, max_batches=2) == 20
+
+
+class TestDropPartitions:
+    PARTITIONS: ClassVar[list[str]] = [
+        "inbox_events_archive_2025_10",
+        "inbox_events_archive_2025_11",
+        "inbox_events_archive_2025_12",
+        "inbox_events_archive_2026_01",
+    ]
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(table_archiver.settings, "ARCHIVE_DROP_AFTER_MONTHS", 0)
+        session = _Session(partitions=self.PARTITIONS)
+
+        policy = ArchivePolicy("inbox_events", timedelta(days=90))
+
+        assert drop_expired_partitions(session, policy, now=NOW) == []
+        assert session.statements == []
+
+    def test_drops_whole_months_past_retention(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(table_archiver.settings, "ARCHIVE_DROP_AFTER_MONTHS", 3)
+        session = _Session(partitions=self.PARTITIONS)
+        policy = ArchivePolicy("inbox_events", timedelta(days=90))
+
+        # sinir 2025-12-01: Kasim ve oncesi tamamen disarida
+        assert drop_expired_partitions(session, policy, now=NOW) == [
+            "inbox_events_archive_2025_10",
+            "inbox_events_archive_2025_11",
+        ]
+
+    def test_audit_logs_floor(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(table_archiver.settings, "ARCHIVE_DROP_AFTER_MONTHS", 1)
+        session = _Session(partitions=["audit_logs_archive_2024_02", "audit_logs_archive_2024_04"])
+        policy = next(p for p in archive_policies() if p.table == "audit_logs")
+
+        assert drop_expired_partitions(session, policy, now=NOW) == ["audit_logs_archive_2024_02"]
@@ -0,0 +1,156 @@
+"""Degerleme sonuc cache'i — kanonik anahtar, hit/miss, fail-open, PredictionLog bayragi."""
+
+from __future__ import annotations
+
+import math
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.valuations import valuation_cache
+from src.modules.valuations.inference_service import InferenceService
+
+_INPUT = {
+    "district": "Kadikoy",
+    "net_sqm": 120,
+    "room_count": 3,
+    "building_age": 10,
+    "floor": 2,
+}
+
+_PREDICTION = {
+    "estimated_price": 5_000_000,
+    "confidence_low": 4_200_000,
+    "confidence_high": 5_800_000,
+    "confidence_level": 0.8,
+    "confidence": 0.84,
+}
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.ttl: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.store[key] = value
+        self.ttl[key] = ex
+
+
+class _DownRedis:
+    async def get(self, key: str) -> str | None:
+        raise ConnectionError("redis down")
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        raise ConnectionError("redis down")
+
+
+@pytest.fixture()
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    fake = _FakeRedis()
+    monkeypatch.setattr(valuation_cache, "_redis", lambda: fake)
+    return fake
+
+
+@pytest.fixture()
+def service() -> InferenceService:
+    svc = InferenceService()
+    svc._model_loaded = True
+    svc._model_version = "v1"
+    svc._model_fingerprint = "abc123"
+    svc.predict_async = AsyncMock(return_value=dict(_PREDICTION))  # type: ignore[method-assign]
+    return svc
+
+
+class TestCacheKey:
+    """Ayni model girdisi → ayni anahtar; tahmini degistirebilecek her fark → farkli."""
+
+    def test_key_order_and_numeric_type_ignored(self) -> None:
+        reordered = dict(reversed(list(_INPUT.items())))
+        as_float = {**_INPUT, "net_sqm": 120.0, "room_count": 3.0}
+
+        assert valuation_cache.input_hash(reordered) == valuation_cache.input_hash(_INPUT)
+        assert valuation_cache.input_hash(as_float) == valuation_cache.input_hash(_INPUT)
+
+    def test_missing_values_equivalent(self) -> None:
+        assert valuation_cache.input_hash({**_INPUT, "floor": None}) == (
+            valuation_cache.input_hash({**_INPUT, "floor": math.nan})
+        )
+
+    def test_category_case_is_significant(self) -> None:
+        assert valuation_cache.input_hash({**_INPUT, "district": "kadikoy"}) != (
+            valuation_cache.input_hash(_INPUT)
+        )
+
+    def test_model_change_changes_key(self) -> None:
+        base = valuation_cache.cache_key(_INPUT, "v1", "abc123")
+
+        assert valuation_cache.cache_key(_INPUT, "v1", "def456") != base
+        assert valuation_cache.cache_key(_INPUT, "v0", "abc123") != base
+
+
+class TestPredictCached:
+    """InferenceService.predict_cached — model sadece miss'te calisir."""
+
+    async def test_miss_then_hit(self, service: InferenceService, fake_redis: _FakeRedis) -> None:
+        first, first_hit = await service.predict_cached(dict(_INPUT))
+        second, second_hit = await service.predict_cached({**_INPUT, "net_sqm": 120.0})
+
+        assert (first_hit, second_hit) == (False, True)
+        assert first == second == _PREDICTION
+        assert service.predict_async.await_count == 1
+        assert list(fake_redis.ttl.values()) == [86400]
+
+    async def test_model_swap_invalidates(
+        self, service: InferenceService, fake_redis: _FakeRedis,
+    ) -> None:
+        await service.predict_cached(dict(_INPUT))
+        service._model_fingerprint = "retrained"
+
+        _, cache_hit = await service.predict_cached(dict(_INPUT))
+
+        assert cache_hit is False
+        assert service.predict_async.await_count == 2
+
+    async def test_redis_down_falls_back_to_model(
+        self, service: InferenceService, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(valuation_cache, "_redis", _DownRedis)
+
+        prediction, cache_hit = await service.predict_cached(dict(_INPUT))
+
+        assert prediction == _PREDICTION
+        assert cache_hit is False
+
+    async def test_disabled_skips_redis(
+        self, service: InferenceService, fake_redis: _FakeRedis, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("src.config.settings.VALUATION_CACHE_ENABLED", False)
+
+        await service.predict_cached(dict(_INPUT))
+        _, cache_hit = await service.predict_cached(dict(_INPUT))
+
+        assert cache_hit is False
+        assert fake_redis.store == {}
+
+
+class TestPredictLogsCacheHit:
+    """Cache hit'te de PredictionLog yazilir (kota + audit), bayrakli."""
+
+    async def test_prediction_log_flagged(
+        self, service: InferenceService, fake_redis: _FakeRedis,
+    ) -> None:
+        session = MagicMock()
+        session.flush = AsyncMock()
+
+        await service.predict(dict(_INPUT), session=session, office_id="office-1")
+        result = await service.predict(dict(_INPUT), session=session, office_id="office-1")
+
+        logs = [call.args[0] for call in session.add.call_args_list]
+        assert [log.cache_hit for log in logs] == [False, True]
+        assert logs[1].output_data["estimated_price"] == _PREDICTION["estimated_price"]
+        assert result["estimated_price"] == _PREDICTION["estimated_price"]
+        assert service.predict_async.await_count == 1
@@ -0,0 +1,149 @@
+"""Degerleme pipeline'i — tahmin ile emsal/istatistik asamalarinin paralel calismasi."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.exceptions import QuotaExceededError
+from src.modules.valuations import valuation_pipeline
+from src.modules.valuations.anomaly_service import DistrictSqmStats, evaluate_price_anomaly
+from src.modules.valuations.schemas import ValuationRequest
+
+_BODY = ValuationRequest(
+    district="Kadikoy",
+    neighborhood="Caferaga",
+    property_type="Daire",
+    net_sqm=100,
+    gross_sqm=120,
+    room_count=3,
+    living_room_count=1,
+    floor=2,
+    total_floors=6,
+    building_age=10,
+    heating_type="Dogalgaz Kombi",
+)
+
+
+def _row(price: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        property_id="p1", distance_km=1.23, similarity_score=88.04,
+        address="Moda", price=price, net_sqm=105, rooms="3+1",
+    )
+
+
+async def _run(predict) -> valuation_pipeline.ValuationPipelineResult:
+    return await valuation_pipeline.run_valuation_pipeline(MagicMock(), MagicMock(), _BODY, predict)
+
+
+class TestRunValuationPipeline:
+    async def test_side_stages_run_while_predicting(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        comparables_started = asyncio.Event()
+        stats_started = asyncio.Event()
+
+        async def rows(request, db, body):
+            comparables_started.set()
+            return [_row(5_500_000)]
+
+        async def stats(request, db, district):
+            stats_started.set()
+            return DistrictSqmStats(avg_sqm_price=50_000, std_sqm_price=5_000)
+
+        async def predict() -> dict:
+            # Emsal ve istatistik asamalari tahmin bitmeden baslamis olmali
+            await asyncio.wait_for(comparables_started.wait(), timeout=1)
+            await asyncio.wait_for(stats_started.wait(), timeout=1)
+            return {"estimated_price": 5_000_000}
+
+        monkeypatch.setattr(valuation_pipeline, "_comparable_rows", rows)
+        monkeypatch.setattr(valuation_pipeline, "_district_stats", stats)
+
+        result = await _run(predict())
+
+        assert result.prediction == {"estimated_price": 5_000_000}
+        assert result.comparables[0]["price_diff_percent"] == 10.0
+        assert result.comparables[0]["distance_km"] == 1.23
+        assert result.anomaly_warning is None
+
+    async def test_anomaly_uses_prediction_price(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def rows(request, db, body):
+            return []
+
+        async def stats(request, db, district):
+            return DistrictSqmStats(avg_sqm_price=50_000, std_sqm_price=5_000)
+
+        async def predict() -> dict:
+            return {"estimated_price": 9_000_000}  # 90.000 TL/m2 → z = 8
+
+        monkeypatch.setattr(valuation_pipeline, "_comparable_rows", rows)
+        monkeypatch.setattr(valuation_pipeline, "_district_stats", stats)
+
+        result = await _run(predict())
+
+        assert result.comparables == []
+        assert "yukarida" in result.anomaly_warning
+
+    async def test_quota_error_cancels_side_stages(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cancelled: list[str] = []
+
+        async def slow(name: str):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+
+        async def rows(request, db, body):
+            return await slow("comparables")
+
+        async def stats(request, db, district):
+            return await slow("stats")
+
+        async def predict() -> dict:
+            await asyncio.sleep(0)
+            raise QuotaExceededError(limit=50, used=50, plan="starter")
+
+        monkeypatch.setattr(valuation_pipeline, "_comparable_rows", rows)
+        monkeypatch.setattr(valuation_pipeline, "_district_stats", stats)
+
+        with pytest.raises(QuotaExceededError):
+            await _run(predict())
+        assert sorted(cancelled) == ["comparables", "stats"]
+
+    async def test_stats_failure_skips_anomaly(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def broken_session(request, sibling=None):
+            raise ConnectionError("pool exhausted")
+
+        async def rows(request, db, body):
+            return [_row(5_000_000)]
+
+        async def predict() -> dict:
+            return {"estimated_price": 50_000_000}
+
+        monkeypatch.setattr(valuation_pipeline, "tenant_session", broken_session)
+        monkeypatch.setattr(valuation_pipeline, "_comparable_rows", rows)
+
+        result = await _run(predict())
+
+        assert result.anomaly_warning is None
+        assert result.comparables[0]["price_diff_percent"] == -90.0
+
+
+class TestEvaluatePriceAnomaly:
+    def test_without_std_uses_percent_deviation(self) -> None:
+        stats = DistrictSqmStats(avg_sqm_price=50_000, std_sqm_price=None, source="prediction_log")
+
+        normal = evaluate_price_anomaly(6_000_000, "Kadikoy", 100, stats)
+        high = evaluate_price_anomaly(20_000_000, "Kadikoy", 100, stats)
+
+        assert (normal.is_anomaly, normal.z_score) == (False, 0.4)
+        assert high.is_anomaly
+
+    def test_no_data(self) -> None:
+        result = evaluate_price_anomaly(6_000_000, "Kadikoy", 100, DistrictSqmStats())
+
+        assert not result.is_anomaly
+        assert result.district_avg_sqm_price == 0.0
@@ -0,0 +1,146 @@
+"""Vektörel eşleştirme skorlayıcısı — skaler calculate_match_score ile eşdeğerlik."""
+
+from __future__ import annotations
+
+import itertools
+import random
+import uuid
+from decimal import Decimal
+from types import SimpleNamespace
+
+from src.modules.matches.matching_service import SCORE_THRESHOLD, calculate_match_score
+from src.modules.matches.vector_scorer import (
+    CustomerColumns,
+    PropertyColumns,
+    score_customers_for_property,
+    score_properties_for_customer,
+)
+
+# ---------- Yardimci ----------
+
+_ROOMS = [None, "", "1+1", "2+1", "3+1", "3 + 1", "4", "5+2", "stüdyo"]
+_DISTRICTS = ["Kadikoy", "Besiktas", "Uskudar", "Sariyer"]
+
+
+def _random_property(rng: random.Random) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        price=Decimal(rng.choice([900_000, 1_750_000, 2_400_000, 5_000_000, 6_100_000])),
+        district=rng.choice([*_DISTRICTS, " kadikoy ", "BESIKTAS"]),
+        rooms=rng.choice(_ROOMS),
+        net_area=rng.choice([None, Decimal("55.5"), Decimal("95"), Decimal("121.25"), 180.0]),
+    )
+
+
+def _random_customer(rng: random.Random) -> SimpleNamespace:
+    bounds = [None, 1_000_000, 2_000_000, 4_000_000, 6_000_000]
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        budget_min=rng.choice(bounds),
+        budget_max=rng.choice(bounds),  # ters (min > max) girilmis butceler dahil
+        desired_rooms=rng.choice(_ROOMS),
+        desired_area_min=rng.choice([None, 60, 100, 150]),
+        desired_area_max=rng.choice([None, 80, 120, 200]),
+        desired_districts=rng.choice(
+            [[], None, ["Kadikoy"], ["besiktas ", "Sariyer"], [42], ["Uskudar", 7]]
+        ),
+    )
+
+
+def _customer_rows(customers: list[SimpleNamespace]) -> list[tuple]:
+    return [
+        (
+            c.id, c.budget_min, c.budget_max, c.desired_rooms,
+            c.desired_area_min, c.desired_area_max, c.desired_districts,
+        )
+        for c in customers
+    ]
+
+
+def _property_rows(props: list[SimpleNamespace]) -> list[tuple]:
+    return [(p.id, p.price, p.rooms, p.net_area, p.district) for p in props]
+
+
+def _expected(pairs, threshold: float = SCORE_THRESHOLD) -> dict:
+    out = {}
+    for key, prop, customer in pairs:
+        score, details = calculate_match_score(prop, customer)
+        if score >= threshold:
+            out[key] = (score, details)
+    return out
+
+
+# ---------- Esdegerlik ----------
+
+
+class TestVectorScorerEquivalence:
+    """Vektörel yol skaler yol ile aynı skor ve details üretmeli."""
+
+    def test_property_against_customers(self) -> None:
+        rng = random.Random(7)
+        customers = [_random_customer(rng) for _ in range(400)]
+        columns = CustomerColumns.from_rows(_customer_rows(customers))
+
+        for _ in range(25):
+            prop = _random_property(rng)
+            for threshold in (SCORE_THRESHOLD, 0):
+                got = {
+                    cid: (score, details)
+                    for cid, score, details in score_customers_for_property(
+                        prop, columns, threshold,
+                    )
+                }
+                expected = _expected(((c.id, prop, c) for c in customers), threshold)
+                assert got == expected
+
+    def test_customer_against_properties(self) -> None:
+        rng = random.Random(11)
+        props = [_random_property(rng) for _ in range(400)]
+        columns = PropertyColumns.from_rows(_property_rows(props))
+
+        for _ in range(25):
+            customer = _random_customer(rng)
+            for threshold in (SCORE_THRESHOLD, 0):
+                got = {
+                    pid: (score, details)
+                    for pid, score, details in score_properties_for_customer(
+                        customer, columns, threshold,
+                    )
+                }
+                expected = _expected(((p.id, p, customer) for p in props), threshold)
+                assert got == expected
+
+    def test_price_interpolation_grid(self) -> None:
+        """Fiyat/alan sinir bolgelerinde (±%20) lineer interpolasyon birebir ayni."""
+        customers = [
+            SimpleNamespace(
+                id=uuid.uuid4(), budget_min=bmin, budget_max=bmax,
+                desired_rooms=None, desired_area_min=None, desired_area_max=None,
+                desired_districts=[],
+            )
+            for bmin, bmax in itertools.product([None, 1_000_000], [None, 1_500_000])
+        ]
+        columns = CustomerColumns.from_rows(_customer_rows(customers))
+        for price in range(700_000, 1_900_000, 12_500):
+            prop = SimpleNamespace(price=price, district="X", rooms=None, net_area=None)
+            got = {cid: s for cid, s, _ in score_customers_for_property(prop, columns, 0)}
+            expected = _expected(((c.id, prop, c) for c in customers), 0)
+            assert got == {k: score for k, (score, _) in expected.items()}
+
+
+class TestCandidateColumns:
+    """Kolon yukleme kenar durumlari."""
+
+    def test_empty_candidates(self) -> None:
+        prop = SimpleNamespace(price=1, district="X", rooms="2+1", net_area=None)
+        assert score_customers_for_property(prop, CustomerColumns.from_rows([])) == []
+
+        customer = _random_customer(random.Random(1))
+        assert score_properties_for_customer(customer, PropertyColumns.from_rows([])) == []
+
+    def test_district_match_is_case_insensitive(self) -> None:
+        columns = CustomerColumns.from_rows(
+            [(uuid.uuid4(), None, None, None, None, None, [" KADIKOY"])]
+        )
+        assert columns.location_scores("kadikoy ").tolist() == [100.0]
+        assert columns.location_scores("Besiktas").tolist() == [0.0]
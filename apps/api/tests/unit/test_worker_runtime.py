@@ -0,0 +1,98 @@
+"""Celery worker async runtime — kalici loop, iptal ve paylasilan HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from src.core import worker_runtime
+from src.core.worker_runtime import run_async, shared_http_client
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True)
+def _fresh_runtime() -> Iterator[None]:
+    worker_runtime.shutdown()
+    yield
+    worker_runtime.shutdown()
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+class TestRunAsync:
+    """asyncio.run() yerine kalici loop."""
+
+    def test_loop_reused_across_calls(self) -> None:
+        first = run_async(_current_loop())
+        second = run_async(_current_loop())
+        assert first is second
+        assert not first.is_closed()
+
+    def test_exception_propagates_and_loop_survives(self) -> None:
+        async def _boom() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_async(_boom())
+        assert run_async(_current_loop()) is worker_runtime.start()
+
+    def test_interrupt_cancels_pending_task(self) -> None:
+        cancelled = []
+
+        async def _slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def _interrupt() -> None:
+            # SoftTimeLimitExceeded benzeri: loop disindan yukselen hata
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.01, _raise_interrupt)
+            await _slow()
+
+        def _raise_interrupt() -> None:
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            run_async(_interrupt())
+        assert cancelled == [True]
+        assert not asyncio.all_tasks(worker_runtime.start())
+
+    def test_nested_call_rejected(self) -> None:
+        async def _nested() -> None:
+            run_async(_current_loop())
+
+        with pytest.raises(RuntimeError, match="await"):
+            run_async(_nested())
+
+
+class TestSharedHttpClient:
+    """HTTP client sadece kalici loop icinde paylasilir."""
+
+    def test_shared_within_runtime(self) -> None:
+        async def _get() -> httpx.AsyncClient | None:
+            return shared_http_client("tcmb", httpx.AsyncClient)
+
+        first = run_async(_get())
+        assert first is not None
+        assert run_async(_get()) is first
+
+        worker_runtime.shutdown()
+        assert first.is_closed
+
+    def test_not_shared_on_foreign_loop(self) -> None:
+        async def _get() -> httpx.AsyncClient | None:
+            return shared_http_client("tcmb", httpx.AsyncClient)
+
+        worker_runtime.start()
+        assert asyncio.run(_get()) is None
+        assert shared_http_client("tcmb", httpx.AsyncClient) is None
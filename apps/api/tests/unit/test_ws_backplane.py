@@ -0,0 +1,213 @@
+"""WebSocket Redis backplane — yerel fast path, yayin zarfi, abone esitleme ve teslim."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+import redis
+
+from src.modules.realtime import backplane, event_emitter
+from src.modules.realtime.backplane import BackplaneSubscriber, decode, encode
+from src.modules.realtime.events import EventType
+from src.modules.realtime.websocket_manager import ConnectionManager
+
+
+class _Socket:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(json.loads(text))
+
+
+class _PubSub:
+    def __init__(self) -> None:
+        self.channels: set[str] = set()
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels: str) -> None:
+        self.channels.difference_update(channels)
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _Redis:
+    """Yayin (publish) + abone (pubsub) icin ortak sahte client."""
+
+    def __init__(self, receivers: int = 0, fail: bool = False) -> None:
+        self.published: list[tuple[str, str]] = []
+        self.receivers = receivers
+        self.fail = fail
+        self.pubsub_client = _PubSub()
+
+    async def publish(self, channel: str, message: str) -> int:
+        if self.fail:
+            raise redis.ConnectionError("down")
+        self.published.append((channel, message))
+        return self.receivers
+
+    def pubsub(self, **kwargs: Any) -> _PubSub:
+        return self.pubsub_client
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.fixture()
+def manager(monkeypatch: pytest.MonkeyPatch) -> ConnectionManager:
+    mgr = ConnectionManager()
+    monkeypatch.setattr(event_emitter, "_manager", mgr)
+    return mgr
+
+
+def _use_redis(monkeypatch: pytest.MonkeyPatch, client: _Redis) -> _Redis:
+    monkeypatch.setattr(backplane, "_redis", lambda: client)
+    return client
+
+
+async def _settle() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class TestEnvelope:
+    def test_roundtrip_carries_origin(self) -> None:
+        envelope = decode(encode("u1", {"type": "notification", "payload": {"title": "Ş"}}))
+
+        assert envelope["origin"] == backplane.worker_id()
+        assert envelope["user_id"] == "u1"
+        assert envelope["event"]["payload"]["title"] == "Ş"
+
+    @pytest.mark.parametrize("raw", ["", "not json", "[]", '{"origin": "x"}'])
+    def test_malformed_rejected(self, raw: str) -> None:
+        assert decode(raw) is None
+
+
+class TestEmitEvent:
+    async def test_local_fast_path_and_publish(
+        self, manager: ConnectionManager, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        client = _use_redis(monkeypatch, _Redis(receivers=1))
+        ws = _Socket()
+        await manager.connect("u1", ws)
+
+        ok = await event_emitter.emit_event("u1", EventType.NOTIFICATION, {"title": "x"})
+        await _settle()
+
+        assert ok is True
+        assert ws.sent[0]["payload"] == {"title": "x"}
+        channel, message = client.published[0]
+        assert channel == "ws:user:u1"
+        assert json.loads(message)["event"] == ws.sent[0]
+
+    async def test_remote_only_user(
+        self, manager: ConnectionManager, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _use_redis(monkeypatch, _Redis(receivers=1))
+
+        assert await event_emitter.emit_event("u2", EventType.MATCH_UPDATE) is True
+
+    async def test_nobody_connected(
+        self, manager: ConnectionManager, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _use_redis(monkeypatch, _Redis(receivers=0))
+
+        assert await event_emitter.emit_event("u2", EventType.MATCH_UPDATE) is False
+
+    async def test_redis_down_still_delivers_locally(
+        self, manager: ConnectionManager, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _use_redis(monkeypatch, _Redis(fail=True))
+        ws = _Socket()
+        await manager.connect("u1", ws)
+
+        assert await event_emitter.emit_event("u1", EventType.NOTIFICATION) is True
+        await _settle()
+        assert len(ws.sent) == 1
+        assert await event_emitter.broadcast_event(EventType.SYSTEM) == 1
+
+    async def test_disabled_is_local_only(
+        self, manager: ConnectionManager, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        client = _use_redis(monkeypatch, _Redis(receivers=1))
+        monkeypatch.setattr(backplane.settings, "WS_BACKPLANE_ENABLED", False)
+
+        assert await event_emitter.emit_event("u2", EventType.NOTIFICATION) is False
+        assert client.published == []
+
+    def test_sync_publish_for_celery(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        published: list[tuple[str, str]] = []
+
+        class _SyncRedis:
+            def publish(self, channel: str, message: str) -> int:
+                published.append((channel, message))
+                return 2
+
+        monkeypatch.setattr(backplane, "_redis_sync", lambda: _SyncRedis())
+
+        assert event_emitter.emit_event_sync("u3", EventType.JOB_PROGRESS, {"job": "j"}) is True
+        assert event_emitter.broadcast_event_sync(EventType.SYSTEM) == 2
+        assert [channel for channel, _ in published] == ["ws:user:u3", "ws:broadcast"]
+
+
+class TestSubscriber:
+    async def test_subscriptions_follow_presence(self) -> None:
+        manager = ConnectionManager()
+        client = _Redis()
+        subscriber = BackplaneSubscriber(manager, client=client)
+        subscriber.start()
+        try:
+            a, b = _Socket(), _Socket()
+            await manager.connect("u1", a)
+            await manager.connect("u1", b)
+            await _settle()
+            assert client.pubsub_client.channels == {"ws:broadcast", "ws:user:u1"}
+
+            manager.disconnect("u1", a)
+            await _settle()
+            assert "ws:user:u1" in client.pubsub_client.channels
+
+            manager.disconnect("u1", b)
+            await _settle()
+            assert client.pubsub_client.channels == {"ws:broadcast"}
+        finally:
+            await subscriber.stop()
+        assert manager.presence_hook is None
+
+    async def test_remote_events_delivered_own_skipped(self) -> None:
+        manager = ConnectionManager()
+        client = _Redis()
+        subscriber = BackplaneSubscriber(manager, client=client)
+        subscriber.start()
+        try:
+            ws = _Socket()
+            await manager.connect("u1", ws)
+            remote = {"origin": "other:1", "user_id": "u1", "event": {"type": "notification"}}
+            broadcast = {"origin": "other:1", "user_id": None, "event": {"type": "system"}}
+            for envelope in (remote, broadcast):
+                await client.pubsub_client.messages.put(
+                    {"type": "message", "data": json.dumps(envelope)},
+                )
+            # Bu process'in kendi yayini yerelde zaten gonderildi
+            await client.pubsub_client.messages.put(
+                {"type": "message", "data": encode("u1", {"type": "own"})},
+            )
+            await _settle()
+
+            assert [event["type"] for event in ws.sent] == ["notification", "system"]
+        finally:
+            await subscriber.stop()
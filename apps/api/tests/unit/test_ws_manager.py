@@ -0,0 +1,198 @@
+"""WebSocket ConnectionManager — gonderim kuyruklari, yavas tuketici, heartbeat, sayaclar."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from src.modules.realtime.websocket_manager import (
+    CLOSE_GOING_AWAY,
+    CLOSE_INTERNAL_ERROR,
+    CLOSE_TRY_AGAIN_LATER,
+    PING,
+    ConnectionManager,
+)
+
+
+class _Socket:
+    """Sahte WebSocket; block=True → send_text serbest birakilana kadar bekler."""
+
+    def __init__(self, block: bool = False, fail: bool = False) -> None:
+        self.sent: list[str] = []
+        self.closed: int | None = None
+        self.fail = fail
+        self.release = asyncio.Event()
+        if not block:
+            self.release.set()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        if self.fail:
+            raise RuntimeError("connection reset")
+        await self.release.wait()
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.closed = code
+
+
+async def _settle() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def _manager(**overrides) -> ConnectionManager:
+    options = {
+        "queue_size": 4,
+        "slow_consumer_policy": "close",
+        "send_timeout": 5.0,
+        "heartbeat_interval": 30.0,
+        "heartbeat_timeout": 75.0,
+    }
+    options.update(overrides)
+    return ConnectionManager(**options)
+
+
+class TestCounters:
+    async def test_counts_track_connect_disconnect(self) -> None:
+        manager = _manager()
+        a, b, c = _Socket(), _Socket(), _Socket()
+        await manager.connect("u1", a)
+        await manager.connect("u1", b)
+        await manager.connect("u2", c)
+
+        assert (manager.total_connections, manager.connected_users) == (3, 2)
+
+        manager.disconnect("u1", a)
+        manager.disconnect("u1", a)  # idempotent
+        assert (manager.total_connections, manager.connected_users) == (2, 2)
+
+        manager.disconnect("u1", b)
+        assert not manager.is_connected("u1")
+        assert (manager.total_connections, manager.connected_users) == (1, 1)
+        await manager.stop()
+        assert manager.total_connections == 0
+
+    def test_invalid_policy_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            _manager(slow_consumer_policy="block")
+
+
+class TestSend:
+    async def test_slow_socket_does_not_stall_others(self) -> None:
+        manager = _manager()
+        slow, fast = _Socket(block=True), _Socket()
+        await manager.connect("slow", slow)
+        await manager.connect("fast", fast)
+
+        assert await manager.broadcast({"type": "system", "payload": {"n": 1}}) == 2
+        await _settle()
+
+        assert [json.loads(t)["payload"] for t in fast.sent] == [{"n": 1}]
+        assert slow.sent == []
+        slow.release.set()
+        await _settle()
+        assert len(slow.sent) == 1
+        await manager.stop()
+
+    async def test_slow_consumer_closed_when_queue_full(self) -> None:
+        manager = _manager(queue_size=2)
+        slow = _Socket(block=True)
+        await manager.connect("u1", slow)
+        await manager.send_personal("u1", {"n": 0})
+        await _settle()  # yazici ilk mesajda bloklanir
+
+        results = [await manager.send_personal("u1", {"n": n}) for n in range(1, 4)]
+        await _settle()
+
+        assert results == [1, 1, 0]
+        assert slow.closed == CLOSE_TRY_AGAIN_LATER
+        assert not manager.is_connected("u1")
+
+    async def test_drop_policy_keeps_connection(self) -> None:
+        manager = _manager(queue_size=2, slow_consumer_policy="drop")
+        slow = _Socket(block=True)
+        conn = await manager.connect("u1", slow)
+        await manager.send_personal("u1", {"n": 0})
+        await _settle()
+
+        results = [await manager.send_personal("u1", {"n": n}) for n in range(1, 5)]
+        slow.release.set()
+        await _settle()
+
+        assert results == [1, 1, 0, 0]
+        assert conn.dropped == 2
+        assert [json.loads(t)["n"] for t in slow.sent] == [0, 1, 2]
+        assert manager.is_connected("u1")
+        await manager.stop()
+
+    async def test_send_timeout_reaps_socket(self) -> None:
+        manager = _manager(send_timeout=0.01)
+        stuck = _Socket(block=True)
+        await manager.connect("u1", stuck)
+
+        await manager.send_personal("u1", {"n": 1})
+        await asyncio.sleep(0.05)
+
+        assert stuck.closed == CLOSE_INTERNAL_ERROR
+        assert manager.total_connections == 0
+
+    async def test_broken_socket_cleaned_up(self) -> None:
+        manager = _manager()
+        broken, ok = _Socket(fail=True), _Socket()
+        await manager.connect("u1", broken)
+        await manager.connect("u1", ok)
+
+        await manager.send_personal("u1", {"n": 1})
+        await _settle()
+
+        assert manager.total_connections == 1
+        assert len(ok.sent) == 1
+        await manager.stop()
+
+
+class TestHeartbeat:
+    async def test_idle_pinged_then_reaped(self) -> None:
+        manager = _manager()
+        idle, quiet, active = _Socket(), _Socket(), _Socket()
+        idle_conn = await manager.connect("u1", idle)
+        quiet_conn = await manager.connect("u2", quiet)
+        active_conn = await manager.connect("u3", active)
+        now = active_conn.last_seen
+        idle_conn.last_seen = now - 80
+        quiet_conn.last_seen = now - 40
+
+        assert manager.sweep(now=now) == (1, 1)
+        await _settle()
+
+        assert idle.closed == CLOSE_GOING_AWAY
+        assert quiet.sent == [PING]
+        assert active.sent == []
+        assert manager.total_connections == 2
+
+        quiet_conn.touch()
+        assert manager.sweep(now=quiet_conn.last_seen) == (0, 0)
+        await manager.stop()
+
+
+class TestLoad:
+    async def test_ten_thousand_idle_sockets(self) -> None:
+        """Worker basina 10k bosta baglanti: tek broadcast, tek sweep, temiz kapanis."""
+        manager = _manager()
+        sockets = [_Socket() for _ in range(10_000)]
+        for i, ws in enumerate(sockets):
+            await manager.connect(f"u{i % 2500}", ws)
+
+        assert (manager.total_connections, manager.connected_users) == (10_000, 2500)
+        assert manager.sweep() == (0, 0)
+
+        assert await manager.broadcast({"type": "system"}) == 10_000
+        await _settle()
+        assert all(len(ws.sent) == 1 for ws in sockets)
+
+        await manager.stop()
+        assert (manager.total_connections, manager.connected_users) == (0, 0)
@@ -179,6 +179,12 @@ export function useWebSocket(
         // pong mesajlarını ignore et
         if (event.data === "pong") return;
 
+        // Sunucu heartbeat'i: sessiz bağlantıya "ping" → "pong" ile yanıtla
+        if (event.data === "ping") {
+          ws.send("pong");
+          return;
+        }
+
         try {
           const parsed = JSON.parse(event.data) as WebSocketEvent;
           setLastEvent(parsed);
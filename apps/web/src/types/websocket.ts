@@ -16,6 +16,7 @@ export enum EventType {
   NOTIFICATION = "notification",
   MATCH_UPDATE = "match_update",
   VALUATION_COMPLETE = "valuation_complete",
+  JOB_PROGRESS = "job_progress",
   SYSTEM = "system",
 }
 
@@ -43,6 +44,15 @@ export interface ValuationCompletePayload {
   confidence?: number;
 }
 
+export interface JobProgressPayload {
+  job: string;
+  job_id: string;
+  status: "running" | "completed" | "failed";
+  total_count: number;
+  processed_count: number;
+  skipped_count: number;
+}
+
 export interface SystemPayload {
   message: string;
   [key: string]: unknown;
@@ -56,6 +66,7 @@ export type WebSocketEventPayload =
   | { type: EventType.NOTIFICATION; payload: NotificationPayload }
   | { type: EventType.MATCH_UPDATE; payload: MatchUpdatePayload }
   | { type: EventType.VALUATION_COMPLETE; payload: ValuationCompletePayload }
+  | { type: EventType.JOB_PROGRESS; payload: JobProgressPayload }
   | { type: EventType.SYSTEM; payload: SystemPayload };
 
 // ---------------------------------------------------------------------------